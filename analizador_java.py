@@ -0,0 +1,435 @@
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+# Analizador léxico: una sola expresión con una alternativa por tipo de token. Cada alternativa
+# consume sin retroceso, así que tokenizar es lineal en el tamaño del archivo. El modificador
+# non-sealed es la única palabra clave con guion y se reconoce como un solo identificador.
+PATRON_TOKEN = re.compile(r'''
+    (?P<espacio>\s+)
+  | (?P<comentario>//[^\n]*|/\*.*?\*/)
+  | (?P<bloque>"""[\s\S]*?""")
+  | (?P<cadena>"(?:[^"\\\n]|\\.)*")
+  | (?P<caracter>'(?:[^'\\\n]|\\.)*')
+  | (?P<identificador>non-sealed(?![\w$])|[^\W\d][\w$]*|\$[\w$]*)
+  | (?P<numero>\.?\d[\w.]*)
+  | (?P<simbolo>\.\.\.|::|->|[{}()\[\];,.@=<>?:&|!~+\-*/%^])
+  | (?P<desconocido>.)
+''', re.VERBOSE | re.DOTALL)
+
+# Tipos de token que no llegan al analizador sintáctico
+TOKENS_IGNORADOS = {"espacio", "comentario", "desconocido"}
+
+MODIFICADORES = {
+    "public", "protected", "private", "static", "final", "abstract", "transient", "volatile",
+    "synchronized", "native", "strictfp", "default", "sealed", "non-sealed",
+}
+DECLARACIONES_TIPO = {"class", "interface", "enum", "record"}
+
+# Parejas de apertura y cierre que se saltan como un bloque
+CIERRES = {"(": ")", "{": "}", "[": "]"}
+
+
+@dataclass
+class Anotacion:
+    """
+    Anotación con sus argumentos como texto ({"name": "patients"}; un argumento sin nombre se
+    guarda como "value") y las anotaciones anidadas en ellos (por ejemplo, los @Index de @Table).
+    Los literales de cadena se guardan sin comillas.
+    """
+    nombre: str
+    argumentos: dict = field(default_factory=dict)
+    anidadas: list = field(default_factory=list)
+
+
+@dataclass
+class Campo:
+    """
+    Atributo declarado en el cuerpo de la clase.
+    """
+    nombre: str
+    tipo: str
+    modificadores: set = field(default_factory=set)
+    anotaciones: list = field(default_factory=list)
+    inicializador: str = None
+
+    @property
+    def estatico(self):
+        return "static" in self.modificadores
+
+    def anotacion(self, nombre):
+        return next((anotacion for anotacion in self.anotaciones if anotacion.nombre == nombre), None)
+
+
+@dataclass
+class ClaseJava:
+    """
+    Modelo de un archivo Java: paquete, importaciones y la clase principal con sus anotaciones,
+    atributos y tipos anidados [(class|interface|enum|record, nombre)].
+    """
+    paquete: str = None
+    importaciones: list = field(default_factory=list)
+    nombre: str = None
+    tipo: str = None
+    anotaciones: list = field(default_factory=list)
+    campos: list = field(default_factory=list)
+    tipos_anidados: list = field(default_factory=list)
+
+    def anotacion(self, nombre):
+        return next((anotacion for anotacion in self.anotaciones if anotacion.nombre == nombre), None)
+
+
+def tokenizar(codigo_java):
+    """
+    Divide el código en tokens (tipo, texto) sin espacios ni comentarios.
+    Los caracteres que no forman ningún token se descartan.
+    """
+    return [
+        (match.lastgroup, match.group())
+        for match in PATRON_TOKEN.finditer(codigo_java)
+        if match.lastgroup not in TOKENS_IGNORADOS
+    ]
+
+def unir_tokens(tokens):
+    """
+    Texto de una secuencia de tokens con espacios solo donde Java los necesita (entre palabras
+    y tras las comas): ["Map", "<", "String", ",", "List", "<", "Long", ">", ">"] -> "Map<String, List<Long>>".
+    """
+    partes = []
+    anterior = None
+    for tipo, texto in tokens:
+        if anterior is not None:
+            palabra_previa = anterior[0] in ("identificador", "numero") or anterior[1] == "?"
+            if anterior[1] == "," or (palabra_previa and tipo in ("identificador", "numero")):
+                partes.append(" ")
+        partes.append(texto)
+        anterior = (tipo, texto)
+    return "".join(partes)
+
+def valor_argumento(tokens):
+    """
+    Texto del valor de un argumento de anotación; un único literal de cadena se devuelve sin comillas.
+    """
+    if len(tokens) == 1 and tokens[0][0] == "cadena":
+        return tokens[0][1][1:-1]
+    return unir_tokens(tokens)
+
+
+class _Analizador:
+    """
+    Analizador sintáctico de una sola pasada sobre la lista de tokens. Solo reconoce lo que
+    necesitan los generadores (paquete, importaciones, anotaciones y atributos de la clase
+    principal); los cuerpos de métodos, bloques y clases anidadas se saltan sin analizarlos.
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.posicion = 0
+
+    def actual(self, desplazamiento=0):
+        indice = self.posicion + desplazamiento
+        return self.tokens[indice][1] if indice < len(self.tokens) else None
+
+    def tipo_actual(self, desplazamiento=0):
+        indice = self.posicion + desplazamiento
+        return self.tokens[indice][0] if indice < len(self.tokens) else None
+
+    def avanzar(self):
+        # Un archivo truncado no debe romper el análisis: fuera de rango se devuelve un token vacío
+        token = self.tokens[self.posicion] if self.posicion < len(self.tokens) else ("", "")
+        self.posicion += 1
+        return token
+
+    def saltar_bloque(self):
+        """
+        Salta desde un (, { o [ hasta su cierre, incluido.
+        """
+        profundidad = 0
+        while self.posicion < len(self.tokens):
+            texto = self.avanzar()[1]
+            if texto in CIERRES:
+                profundidad += 1
+            elif texto in (")", "}", "]"):
+                profundidad -= 1
+                if profundidad == 0:
+                    return
+
+    def saltar_genericos(self):
+        """
+        Salta desde un < hasta su > correspondiente (los >> y >>> llegan como > sueltos).
+        """
+        profundidad = 0
+        while self.posicion < len(self.tokens):
+            texto = self.avanzar()[1]
+            if texto == "<":
+                profundidad += 1
+            elif texto == ">":
+                profundidad -= 1
+                if profundidad == 0:
+                    return
+
+    def leer_nombre_cualificado(self):
+        partes = [self.avanzar()[1]]
+        while self.actual() == "." and self.tipo_actual(1) == "identificador":
+            self.avanzar()
+            partes.append(self.avanzar()[1])
+        return ".".join(partes)
+
+    def leer_hasta_punto_y_coma(self):
+        inicio = self.posicion
+        while self.posicion < len(self.tokens) and self.actual() != ";":
+            self.posicion += 1
+        tokens = self.tokens[inicio:self.posicion]
+        self.posicion += 1
+        return tokens
+
+    def leer_anotacion(self):
+        """
+        Lee una anotación desde la @, incluidos sus argumentos y las anotaciones anidadas.
+        """
+        self.avanzar()
+        anotacion = Anotacion(self.leer_nombre_cualificado().rsplit(".", 1)[-1])
+        if self.actual() != "(":
+            return anotacion
+        self.avanzar()
+        clave = "value"
+        valor = []
+        profundidad = 0
+        while self.posicion < len(self.tokens):
+            texto = self.actual()
+            if profundidad == 0 and texto in (",", ")"):
+                self.avanzar()
+                if valor:
+                    anotacion.argumentos[clave] = valor_argumento(valor)
+                if texto == ")":
+                    break
+                clave, valor = "value", []
+                continue
+            if texto == "@":
+                anidada = self.leer_anotacion()
+                anotacion.anidadas.append(anidada)
+                valor.append(("identificador", f"@{anidada.nombre}"))
+                continue
+            if profundidad == 0 and not valor and self.tipo_actual() == "identificador" and self.actual(1) == "=":
+                clave = self.avanzar()[1]
+                self.avanzar()
+                continue
+            if texto in CIERRES:
+                profundidad += 1
+            elif texto in (")", "}", "]"):
+                profundidad -= 1
+            valor.append(self.avanzar())
+        return anotacion
+
+    def leer_tipo(self):
+        """
+        Lee un tipo con sus argumentos genéricos y corchetes de array y retorna su texto.
+        """
+        inicio = self.posicion
+        self.leer_nombre_cualificado()
+        while True:
+            if self.actual() == "<":
+                self.saltar_genericos()
+            elif self.actual() == "." and self.tipo_actual(1) == "identificador":
+                self.avanzar()
+                self.avanzar()
+            elif self.actual() == "[" and self.actual(1) == "]":
+                self.avanzar()
+                self.avanzar()
+            elif self.actual() == "...":
+                self.avanzar()
+            else:
+                break
+        return unir_tokens(self.tokens[inicio:self.posicion])
+
+    def leer_inicializador(self):
+        """
+        Lee la expresión de inicialización de un atributo hasta el ; o la , que separa el
+        siguiente declarador (una coma seguida de "nombre =", "nombre," o "nombre;").
+        """
+        inicio = self.posicion
+        profundidad = 0
+        while self.posicion < len(self.tokens):
+            texto = self.actual()
+            if profundidad == 0 and texto == ";":
+                break
+            if (profundidad == 0 and texto == "," and self.tipo_actual(1) == "identificador"
+                    and self.actual(2) in ("=", ",", ";", "[")):
+                break
+            if texto in CIERRES:
+                profundidad += 1
+            elif texto in (")", "}", "]"):
+                profundidad -= 1
+            self.posicion += 1
+        return unir_tokens(self.tokens[inicio:self.posicion])
+
+    def leer_declaracion_tipo(self):
+        """
+        Lee "class Nombre ... {" y deja la posición tras la llave de apertura.
+        Retorna (tipo de declaración, nombre).
+        """
+        tipo = self.avanzar()[1]
+        nombre = self.avanzar()[1]
+        while self.posicion < len(self.tokens) and self.actual() != "{":
+            if self.actual() == "(":
+                self.saltar_bloque()
+            elif self.actual() == "<":
+                self.saltar_genericos()
+            else:
+                self.posicion += 1
+        self.posicion += 1
+        return tipo, nombre
+
+    def leer_cuerpo(self, clase):
+        """
+        Lee los miembros del cuerpo de la clase hasta su llave de cierre y añade los atributos.
+        """
+        if clase.tipo == "enum" and not self.saltar_constantes_enum():
+            return
+        anotaciones = []
+        modificadores = set()
+        while self.posicion < len(self.tokens):
+            texto = self.actual()
+            if texto == "}":
+                self.avanzar()
+                return
+            if texto == "@" and self.actual(1) != "interface":
+                anotaciones.append(self.leer_anotacion())
+                continue
+            if texto in MODIFICADORES:
+                modificadores.add(self.avanzar()[1])
+                continue
+            if texto in (";", "{") or texto in DECLARACIONES_TIPO or texto == "@":
+                # Bloques de inicialización, clases anidadas y miembros vacíos
+                if texto == ";":
+                    self.avanzar()
+                else:
+                    if texto in DECLARACIONES_TIPO and self.tipo_actual(1) == "identificador":
+                        clase.tipos_anidados.append((texto, self.actual(1)))
+                    while self.posicion < len(self.tokens) and self.actual() != "{":
+                        self.posicion += 1
+                    self.saltar_bloque()
+                anotaciones, modificadores = [], set()
+                continue
+            if texto == "<":
+                self.saltar_genericos()
+                continue
+            if self.tipo_actual() != "identificador":
+                self.avanzar()
+                continue
+
+            tipo = self.leer_tipo()
+            if self.actual() == "(":
+                # Constructor
+                self.saltar_metodo()
+            elif self.tipo_actual() == "identificador" and self.actual(1) == "(":
+                self.avanzar()
+                self.saltar_metodo()
+            else:
+                self.leer_declaradores(clase, tipo, modificadores, anotaciones)
+            anotaciones, modificadores = [], set()
+
+    def saltar_constantes_enum(self):
+        """
+        Salta las constantes de un enum, con sus argumentos y cuerpos, hasta el ; que las separa
+        de los miembros o hasta la llave de cierre del enum si no lo hay.
+        Retorna True si quedan miembros por leer.
+        """
+        while self.posicion < len(self.tokens):
+            texto = self.actual()
+            if texto == ";":
+                self.avanzar()
+                return True
+            if texto == "}":
+                self.avanzar()
+                return False
+            if texto in CIERRES:
+                self.saltar_bloque()
+            else:
+                self.avanzar()
+        return False
+
+    def saltar_metodo(self):
+        """
+        Salta la lista de parámetros y el cuerpo (o el ; de un método abstracto).
+        """
+        self.saltar_bloque()
+        while self.posicion < len(self.tokens) and self.actual() not in ("{", ";"):
+            self.posicion += 1
+        if self.actual() == "{":
+            self.saltar_bloque()
+        else:
+            self.posicion += 1
+
+    def leer_declaradores(self, clase, tipo, modificadores, anotaciones):
+        """
+        Lee "nombre [= valor] (, nombre [= valor])* ;" y añade un Campo por declarador.
+        """
+        while self.posicion < len(self.tokens):
+            if self.tipo_actual() != "identificador":
+                self.leer_hasta_punto_y_coma()
+                return
+            nombre = self.avanzar()[1]
+            tipo_campo = tipo
+            while self.actual() == "[" and self.actual(1) == "]":
+                self.avanzar()
+                self.avanzar()
+                tipo_campo += "[]"
+            inicializador = None
+            if self.actual() == "=":
+                self.avanzar()
+                inicializador = self.leer_inicializador()
+            clase.campos.append(Campo(nombre, tipo_campo, set(modificadores), list(anotaciones), inicializador))
+            separador = self.actual()
+            self.posicion += 1
+            if separador != ",":
+                return
+
+    def analizar(self):
+        """
+        Recorre el nivel superior del archivo. La clase principal es la primera declaración
+        pública o, si no hay ninguna, la primera declaración de tipo.
+        """
+        clase = ClaseJava()
+        clase_publica = False
+        anotaciones = []
+        modificadores = set()
+        while self.posicion < len(self.tokens):
+            texto = self.actual()
+            if texto == "package":
+                self.avanzar()
+                clase.paquete = unir_tokens(self.leer_hasta_punto_y_coma())
+            elif texto == "import":
+                self.avanzar()
+                clase.importaciones.append(unir_tokens(self.leer_hasta_punto_y_coma()))
+            elif texto == "@" and self.actual(1) != "interface":
+                anotaciones.append(self.leer_anotacion())
+            elif texto in MODIFICADORES:
+                modificadores.add(self.avanzar()[1])
+            elif texto in DECLARACIONES_TIPO or texto == "@":
+                if texto == "@":
+                    self.avanzar()
+                principal = clase.nombre is None or ("public" in modificadores and not clase_publica)
+                tipo, nombre = self.leer_declaracion_tipo()
+                if principal:
+                    clase.nombre, clase.tipo, clase.anotaciones = nombre, tipo, anotaciones
+                    clase.campos, clase.tipos_anidados = [], []
+                    clase_publica = "public" in modificadores
+                    self.leer_cuerpo(clase)
+                else:
+                    self.posicion -= 1
+                    self.saltar_bloque()
+                anotaciones, modificadores = [], set()
+            else:
+                self.avanzar()
+        return clase
+
+
+@lru_cache(maxsize=64)
+def parsear_java(codigo_java):
+    """
+    Analiza un archivo Java en una sola pasada lineal (tokenizar y recorrer los tokens una vez).
+    El resultado se cachea por contenido para que varias consultas sobre el mismo código no lo
+    vuelvan a analizar; debe tratarse como de solo lectura.
+    """
+    return _Analizador(tokenizar(codigo_java)).analizar()
@@ -0,0 +1,866 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from gen.controller import (
+    generar_get_controller,
+    generar_post_controller,
+    generar_delete_controller,
+    generar_patch_controller,
+)
+
+from gen.service import (
+    generar_create_service,
+    generar_delete_service,
+    generar_find_service,
+    generar_patch_service,
+    generar_search_service
+)
+from gen.repository import (
+    atributos_patch_directo,
+    generar_repository,
+    generar_repository_custom,
+    generar_repository_impl,
+)
+from extract_data import cargar_entidad
+from gen.dto import generar_dto
+from gen.pojo import generar_pojo
+from gen.mapper import campos_dto, generar_mapper
+from gen.search import generar_search_model
+from gen.factories import renderizar_factories
+from gen.cache import (
+    anotar_entidad_l2,
+    configurar_cache,
+    generar_cache_config,
+    generar_propiedades_l2,
+    nombre_cache,
+)
+from gen.auditoria import (
+    generar_async_audit_annotation,
+    generar_async_audit_aspect,
+    generar_async_audit_config,
+    generar_audit_event,
+    generar_audit_event_handler,
+    generar_audit_event_listener,
+    generar_propiedades_audit,
+    generar_propiedades_hilos_virtuales,
+    generar_virtual_thread_config,
+)
+from gen.benchmark import generar_benchmark, generar_benchmark_runner, generar_pom_jmh
+from gen.carga import (
+    configurar_carga,
+    consultas_busqueda,
+    cuerpo_peticion,
+    generar_docker_compose_carga,
+    generar_script_k6,
+)
+from gen.bulk import generar_bulk_controller, generar_bulk_service, generar_propiedades_bulk
+from gen.lectura import (
+    FETCH_SIZE,
+    configurar_hints,
+    generar_anotacion_replica,
+    generar_propiedades_replica,
+    generar_routing_config,
+    generar_routing_datasource,
+)
+from gen.cursor import generar_cursor
+from gen.export import columnas_csv, generar_export_controller, generar_export_service
+from gen.proyeccion import campos_proyeccion, generar_proyeccion
+from gen.relaciones import analizar_relaciones
+from gen.reactive import (
+    TARGETS,
+    columnas_reactivas,
+    generar_create_service_reactivo,
+    generar_criteria_factory,
+    generar_delete_controller_reactivo,
+    generar_delete_service_reactivo,
+    generar_entidad_reactiva,
+    generar_find_service_reactivo,
+    generar_get_controller_reactivo,
+    generar_patch_controller_reactivo,
+    generar_patch_service_reactivo,
+    generar_post_controller_reactivo,
+    generar_propiedades_r2dbc,
+    generar_reactive_web_config,
+    generar_repository_reactivo,
+    generar_search_service_reactivo,
+)
+from gen.indice import INDICE_FILE, cargar_indice, guardar_indice
+from gen.indices import generar_migracion_indices
+from gen.nombres import extraer_base_paquete
+from gen.plantillas import cargar_plantillas
+from gen.manifest import (
+    cargar_manifest,
+    guardar_manifest,
+    hash_entidad,
+    entidad_actualizada,
+    registrar_entidad,
+)
+from gen.salida import FORMATOS_SALIDA, SalidaArtefactos, diff_unificado
+
+# Código de salida de --simular/--diff cuando algún archivo cambiaría (1 queda para los errores)
+SALIDA_CAMBIOS = 2
+
+
+def cargar_seleccion(seleccion_file):
+    """
+    Lee el fichero JSON de selección. Formato esperado:
+
+        {
+          "por_defecto": {"con": 40, "pojo": "*", "dto": "*", "search": [], "mapper": "jackson"},
+          "entidades": {
+            "PatientEntity": {"con": 41, "pojo": ["name"], "dto": ["id", "address"], "search": ["name"]}
+          }
+        }
+
+    "*" selecciona todos los atributos de la entidad. Las claves que falten en una entidad se
+    toman de "por_defecto". Opciones de cada entidad (o de "por_defecto"):
+      - "con": constante numérica de los controllers (obligatoria).
+      - "pojo", "dto", "search": atributos del POJO, del DTO y del SearchModel ("*" para todos).
+      - "mapper": "jackson" (por defecto), "manual" o "mapstruct".
+      - "paginacion": "page" (por defecto), "slice" (sin SELECT COUNT) o "keyset" (cursor sobre
+        el @Id y, opcionalmente, la columna no nula indicada en "orden_keyset").
+      - "indices": false desactiva la migración Flyway con los índices de los filtros de búsqueda.
+      - "indice_compuesto": lista de atributos de búsqueda que se filtran siempre juntos; añade su
+        índice compuesto.
+      - "bulk": true añade los endpoints masivos /batch (POST, PATCH y DELETE), que auditan cada
+        fila con un AuditEvent.
+      - "patch": "criteria" actualiza solo las columnas no nulas con un único UPDATE, sin el
+        SELECT previo (por defecto "merge").
+      - "delete": "jpql" borra con un DELETE JPQL, sin el SELECT previo (por defecto "find").
+      - "solo_lectura": false desactiva las transacciones de solo lectura y los hints de Hibernate
+        de las consultas (find y search).
+      - "fetch_size" (por defecto 100) y "cache_consultas": hints de Hibernate de las consultas.
+      - "replica": true enruta las consultas a la réplica de lectura.
+      - "proyeccion": true hace que la búsqueda lea solo las columnas del DTO en un record
+        {X}Projection (no disponible con "keyset").
+      - "cache": true (o {"tamano", "ttl_segundos", "hibernate"}) añade Find{X}Service.findDto,
+        que cachea el DTO por id con Caffeine (no la entidad), e invalida las claves afectadas en
+        PATCH, DELETE y /batch; "hibernate": true añade además la caché de segundo nivel a la
+        copia de la entidad.
+      - "export": true añade GET /1.0/<ruta>/export (NDJSON o CSV en streaming); necesita
+        atributos de búsqueda.
+      - "target": "reactive" genera la entidad con WebFlux + R2DBC (Mono/Flux, R2dbcRepository y
+        {X}CriteriaFactory) en lugar de Spring MVC + JPA ("servlet", por defecto); en ese destino
+        no se aplican las opciones propias de JPA.
+      - "auditoria": "async" anota los controllers con @AsyncAudit, que publica un AuditEvent
+        procesado tras el commit en un executor acotado, en lugar de @Audit ("sync", por defecto).
+      - "benchmark": true genera un benchmark JMH de toDto, toEntity y la factory del SearchModel.
+      - "carga": true (o {"perfil": "constante" | "rampa" | "pico", "vus", "duracion_segundos"})
+        genera un escenario de k6 en loadtests/ que recorre POST, GET, PATCH y DELETE.
+    Las relaciones @ManyToOne/@OneToOne del DTO se cargan con un @EntityGraph y se avisa de las
+    que provocarán una consulta por fila. Opciones al nivel de "entidades":
+      - "paquete_base": paquete de los artefactos comunes (por defecto com.inycom.cws).
+      - "hilos_virtuales": true genera la configuración de hilos virtuales de Java 21.
+      - "plantillas": directorio (relativo al fichero de selección) con plantillas Jinja2 que
+        sustituyen a los artefactos generados (ver gen/plantillas.py).
+    """
+    with open(seleccion_file, "r", encoding="utf-8") as f:
+        seleccion = json.load(f)
+    seleccion.setdefault("por_defecto", None)
+    seleccion.setdefault("entidades", {})
+    if seleccion.get("plantillas"):
+        seleccion["plantillas"] = os.path.join(os.path.dirname(os.path.abspath(seleccion_file)), seleccion["plantillas"])
+    return seleccion
+
+
+def seleccion_entidad(seleccion, nombre_entidad):
+    """
+    Combina la configuración por defecto con la de la entidad.
+    Retorna None si la entidad no tiene configuración ni existe un "por_defecto".
+    """
+    por_defecto = seleccion.get("por_defecto")
+    propia = seleccion["entidades"].get(nombre_entidad)
+    if propia is None and por_defecto is None:
+        return None
+    config = dict(por_defecto or {})
+    config.update(propia or {})
+    return config
+
+
+def filtrar_atributos(atributos, nombres):
+    """
+    Filtra una lista de tuplas cuyo segundo elemento es el nombre del atributo,
+    conservando el orden de la entidad. "*" selecciona todos.
+    """
+    if nombres == "*":
+        return list(atributos)
+    nombres = set(nombres or [])
+    return [attr for attr in atributos if attr[1] in nombres]
+
+
+def constante_con(config, nombre_entidad):
+    """
+    Valida y retorna la constante "con" de la entidad como texto.
+    """
+    con_value = str(config.get("con", ""))
+    if not con_value.isdigit():
+        raise ValueError(f"La constante 'con' de {nombre_entidad} debe ser un número válido")
+    return con_value
+
+
+def listar_entidades(entidad_dir, seleccion):
+    """
+    Lista los archivos *Entity.java del directorio junto con los que aparezcan
+    explícitamente en la selección, ordenados por nombre.
+    """
+    archivos = []
+    for archivo in sorted(os.listdir(entidad_dir)):
+        nombre = archivo[:-len(".java")]
+        if archivo.endswith("Entity.java") or nombre in seleccion["entidades"]:
+            archivos.append(os.path.join(entidad_dir, archivo))
+    return archivos
+
+
+def aplicar_plantillas(plantillas, artefactos, entidad, config, enums=None):
+    """
+    Sustituye los artefactos de la entidad que tienen plantilla propia en el proyecto.
+    Las plantillas reciben entidad (el modelo de extract_data), config, enums, nombre_entidad,
+    nombre_simple, paquete, base, ruta y codigo (el artefacto generado).
+    """
+    if not plantillas:
+        return artefactos
+    contexto = {
+        "entidad": entidad,
+        "config": config,
+        "enums": enums or [],
+        "nombre_entidad": entidad.nombre,
+        "nombre_simple": entidad.nombre_simple,
+        "paquete": entidad.paquete,
+        "base": extraer_base_paquete(entidad.paquete),
+    }
+    return plantillas.aplicar(artefactos, contexto, entidad.nombre_simple)
+
+
+def renderizar_entidad(entidad_file, config, enums=None, plantillas=None, tipos=None, importaciones=None):
+    """
+    Genera en memoria todos los artefactos de una entidad sin solicitar nada por consola.
+    enums son los tipos de sus atributos que el índice del proyecto resuelve como enums
+    (None usa la heurística de gen/specification.py:es_enum), plantillas, las plantillas
+    propias del proyecto (ver gen/plantillas.py), tipos, los tipos de sus atributos declarados
+    en el proyecto (ver gen/indice.py:tipos_entidad), e importaciones, las de esos tipos (ver
+    gen/indice.py:importaciones_entidad).
+    Los avisos no se imprimen: se devuelven para que el proceso principal los muestre en orden.
+    Retorna ({ruta relativa a la salida: contenido}, [avisos]).
+    """
+    entidad = cargar_entidad(entidad_file)
+    if not entidad:
+        raise ValueError(f"No se pudo extraer el nombre de la entidad de {entidad_file}")
+    entidad.tipos_proyecto = tipos or {}
+    entidad.importaciones_proyecto = importaciones or {}
+
+    target = config.get("target", "servlet")
+    if target not in TARGETS:
+        raise ValueError(f"Target desconocido para {entidad.nombre}: {target}. Opciones: {', '.join(TARGETS)}")
+    avisos = []
+    if target == "reactive":
+        artefactos = renderizar_entidad_reactiva(entidad_file, entidad, config, avisos, enums)
+    else:
+        artefactos = renderizar_entidad_servlet(entidad_file, entidad, config, avisos, enums)
+    return aplicar_plantillas(plantillas, artefactos, entidad, config, enums), avisos
+
+
+def opciones_servlet(entidad, config, avisos):
+    """
+    Lee y valida las opciones de la selección del destino servlet, resolviendo las combinaciones
+    que no se admiten (con su aviso).
+    Retorna un diccionario con las opciones efectivas.
+    """
+    nombre_entidad = entidad.nombre
+    opciones = {
+        "paginacion": config.get("paginacion", "page"),
+        "patch": config.get("patch", "merge"),
+        "delete": config.get("delete", "find"),
+        "solo_lectura": config.get("solo_lectura", True),
+        "replica": config.get("replica", False),
+        "hints": None,
+        "proyeccion": config.get("proyeccion", False),
+        "exportar": bool(config.get("export")),
+        "cache": configurar_cache(config.get("cache")),
+        "con": constante_con(config, nombre_entidad),
+        "auditoria": config.get("auditoria", "sync"),
+    }
+    if opciones["solo_lectura"]:
+        opciones["hints"] = configurar_hints(config.get("fetch_size", FETCH_SIZE), config.get("cache_consultas", False))
+    if opciones["exportar"] and not config.get("search"):
+        avisos.append("la exportación usa el modelo de búsqueda y no hay atributos de búsqueda. Se omite.")
+        opciones["exportar"] = False
+    if opciones["proyeccion"] and opciones["paginacion"] == "keyset":
+        avisos.append("la proyección no admite paginación keyset. Se busca con la entidad completa.")
+        opciones["proyeccion"] = False
+    if opciones["replica"] and opciones["delete"] == "find":
+        avisos.append(f"DELETE carga la entidad con Find{entidad.nombre_simple}Service, que lee de la réplica; "
+                      f"usar \"delete\": \"jpql\" para evitar lecturas desfasadas.")
+    if (opciones["patch"] == "criteria" or opciones["delete"] == "jpql") and not entidad.id_atributo:
+        raise ValueError(f"Los modos patch/delete sin SELECT de {nombre_entidad} necesitan un atributo anotado con @Id")
+    return opciones
+
+
+def renderizar_entidad_servlet(entidad_file, entidad, config, avisos, enums=None):
+    """
+    Genera en memoria los artefactos del destino servlet (Spring MVC + JPA) de una entidad.
+    Los avisos se añaden a avisos.
+    Retorna un diccionario {ruta relativa a la salida: contenido}.
+    """
+    opciones = opciones_servlet(entidad, config, avisos)
+
+    codigo_entidad = entidad.codigo
+    if opciones["cache"] and opciones["cache"]["hibernate"]:
+        codigo_entidad = anotar_entidad_l2(codigo_entidad)
+    artefactos = {
+        os.path.join("models", "entities", os.path.basename(entidad_file)): codigo_entidad,
+    }
+
+    # 1. Controllers y services (también los masivos y el cursor keyset)
+    artefactos.update(renderizar_endpoints(entidad, config, opciones, avisos))
+
+    # 2. Repository y, si hace falta, su fragmento con métodos propios, la exportación y la proyección
+    atributos_pojo = filtrar_atributos(entidad.atributos_pojo, config.get("pojo"))
+    atributos_dto = filtrar_atributos(entidad.atributos, config.get("dto"))
+    artefactos.update(renderizar_repositorio(entidad, config, opciones, atributos_pojo, atributos_dto, avisos))
+
+    # 3. POJO, DTO y Mapper
+    artefactos.update(renderizar_modelos(entidad, config, atributos_pojo, atributos_dto))
+
+    # 4. SearchModel, Specifications, Factories e índices con los mismos atributos seleccionados
+    atributos_search = filtrar_atributos(entidad.atributos, config.get("search"))
+    if atributos_search:
+        artefactos.update(renderizar_busqueda(entidad, config, atributos_search, avisos, enums))
+    else:
+        avisos.append("no se seleccionaron atributos de búsqueda. Se omiten SearchModel, Specifications y Factories.")
+
+    # 5. Benchmark JMH del mapper y de la factory
+    if config.get("benchmark"):
+        artefactos[os.path.join("benchmarks", f"{entidad.nombre_simple}Benchmark.java")] = generar_benchmark(
+            entidad, entidad.atributos, atributos_pojo, atributos_search, enums=enums
+        )
+
+    # 6. Escenario de carga de k6
+    artefactos.update(renderizar_carga(entidad, config, atributos_pojo, atributos_search, avisos, opciones["paginacion"], enums))
+
+    return artefactos
+
+
+def renderizar_endpoints(entidad, config, opciones, avisos):
+    """
+    Genera los controllers y services CRUD de la entidad y, según la selección, el cursor de la
+    paginación keyset y las operaciones masivas (/batch). GET no utiliza la constante.
+    Retorna un diccionario {ruta relativa a la salida: contenido}.
+    """
+    nombre_entidad = entidad.nombre
+    paquete = entidad.paquete
+    nombre_simple = entidad.nombre_simple
+    id_tipo = entidad.id_tipo
+    con_value = opciones["con"]
+    auditoria = opciones["auditoria"]
+    paginacion = opciones["paginacion"]
+    cache = nombre_cache(nombre_entidad) if opciones["cache"] else None
+    artefactos = {}
+
+    controllers_dir = "controllers"
+    artefactos[os.path.join(controllers_dir, f"Post{nombre_simple}Controller.java")] = generar_post_controller(nombre_entidad, paquete, con_value, auditoria)
+    artefactos[os.path.join(controllers_dir, f"Get{nombre_simple}Controller.java")] = generar_get_controller(nombre_entidad, paquete, paginacion)
+    artefactos[os.path.join(controllers_dir, f"Patch{nombre_simple}Controller.java")] = generar_patch_controller(nombre_entidad, paquete, con_value, id_tipo, auditoria)
+    artefactos[os.path.join(controllers_dir, f"Delete{nombre_simple}Controller.java")] = generar_delete_controller(nombre_entidad, paquete, con_value, id_tipo, auditoria)
+
+    services_dir = "services"
+    solo_lectura = opciones["solo_lectura"]
+    replica = opciones["replica"]
+    artefactos[os.path.join(services_dir, f"Create{nombre_simple}Service.java")] = generar_create_service(nombre_entidad, paquete, id_tipo)
+    artefactos[os.path.join(services_dir, f"Find{nombre_simple}Service.java")] = generar_find_service(nombre_entidad, paquete, id_tipo, solo_lectura, replica, cache)
+    artefactos[os.path.join(services_dir, f"Patch{nombre_simple}Service.java")] = generar_patch_service(nombre_entidad, paquete, id_tipo, opciones["patch"], cache)
+    artefactos[os.path.join(services_dir, f"Delete{nombre_simple}Service.java")] = generar_delete_service(nombre_entidad, paquete, id_tipo, opciones["delete"], cache)
+    artefactos[os.path.join(services_dir, f"Search{nombre_simple}Service.java")] = generar_search_service(
+        nombre_entidad, paquete, paginacion, solo_lectura, replica, opciones["proyeccion"]
+    )
+
+    if paginacion == "keyset":
+        orden_keyset = config.get("orden_keyset")
+        orden_atributo = None
+        if orden_keyset:
+            orden_atributo = next((attr for attr in entidad.atributos if attr[1] == orden_keyset), None)
+            if not orden_atributo:
+                raise ValueError(f"La columna de orden keyset '{orden_keyset}' no existe en {nombre_entidad}")
+            if orden_keyset not in entidad.no_nulos:
+                avisos.append(f"la columna de orden keyset '{orden_keyset}' admite nulos y el cursor no puede "
+                              "compararlos. Se ordena solo por el @Id.")
+                orden_atributo = None
+        artefactos[os.path.join("search", f"{nombre_simple}Cursor.java")] = generar_cursor(
+            nombre_entidad, paquete, entidad.id_atributo, orden_atributo
+        )
+
+    # Operaciones masivas (/batch)
+    if config.get("bulk"):
+        artefactos[os.path.join(controllers_dir, f"Bulk{nombre_simple}Controller.java")] = generar_bulk_controller(nombre_entidad, paquete, id_tipo)
+        artefactos[os.path.join(services_dir, f"Bulk{nombre_simple}Service.java")] = generar_bulk_service(nombre_entidad, paquete, entidad.id_atributo, con_value, cache)
+        if "GenerationType.IDENTITY" in entidad.codigo:
+            avisos.append("usa GenerationType.IDENTITY; Hibernate no agrupará los INSERT de createAll.")
+    return artefactos
+
+
+def renderizar_repositorio(entidad, config, opciones, atributos_pojo, atributos_dto, avisos):
+    """
+    Genera el repository de la entidad y, si hace falta, su fragmento con métodos propios
+    (slice, hints, @EntityGraph, stream de la exportación, proyección y PATCH con criteria),
+    junto con el controller y el service de la exportación y el record de la proyección.
+    Retorna un diccionario {ruta relativa a la salida: contenido}.
+    """
+    nombre_entidad = entidad.nombre
+    paquete = entidad.paquete
+    nombre_simple = entidad.nombre_simple
+    paginacion = opciones["paginacion"]
+    artefactos = {}
+
+    grafo, avisos_relaciones = analizar_relaciones(entidad, atributos_dto, config.get("mapper", "jackson"))
+    avisos.extend(avisos_relaciones)
+    fragmento = {
+        "slice": paginacion == "slice" and not opciones["proyeccion"],
+        "id_atributo": entidad.id_atributo,
+        "hints": opciones["hints"],
+        "grafo": grafo,
+    }
+    if opciones["exportar"]:
+        fragmento["stream"] = configurar_hints(config.get("fetch_size", FETCH_SIZE))
+        columnas, omitidas = columnas_csv(entidad, campos_dto(atributos_pojo, atributos_dto))
+        for atributo in omitidas:
+            avisos.append(f"'{atributo}' (embebido o relación) no se incluye en el CSV de exportación.")
+        artefactos[os.path.join("controllers", f"Export{nombre_simple}Controller.java")] = generar_export_controller(nombre_entidad, paquete)
+        artefactos[os.path.join("services", f"Export{nombre_simple}Service.java")] = generar_export_service(nombre_entidad, paquete, columnas)
+    if opciones["proyeccion"]:
+        fragmento["proyeccion"], omitidos = campos_proyeccion(entidad, atributos_pojo, atributos_dto)
+        for atributo in omitidos:
+            avisos.append(f"la colección '{atributo}' no se puede proyectar y quedará vacía en el DTO de búsqueda.")
+        artefactos[os.path.join("models", "projections", f"{nombre_simple}Projection.java")] = generar_proyeccion(
+            nombre_entidad, paquete, fragmento["proyeccion"], entidad.importaciones_proyecto
+        )
+    if opciones["patch"] == "criteria":
+        fragmento["patch"], omitidos = atributos_patch_directo(entidad, atributos_pojo)
+        for _, atributo in omitidos:
+            avisos.append(f"el atributo '{atributo}' no se actualiza en el PATCH con criteria (primitivo, embebido o relación).")
+    custom_code = generar_repository_custom(nombre_entidad, paquete, **fragmento)
+    if custom_code:
+        artefactos[os.path.join("repositories", f"{nombre_simple}RepositoryCustom.java")] = custom_code
+        artefactos[os.path.join("repositories", f"{nombre_simple}RepositoryCustomImpl.java")] = generar_repository_impl(
+            nombre_entidad, paquete, importaciones_proyecto=entidad.importaciones_proyecto, **fragmento
+        )
+    artefactos[os.path.join("repositories", f"{nombre_simple}Repository.java")] = generar_repository(
+        nombre_entidad, paquete, entidad.id_tipo, custom_code is not None,
+        entidad.id_atributo if opciones["delete"] == "jpql" else None, paginacion, opciones["hints"], grafo,
+        opciones["proyeccion"]
+    )
+    return artefactos
+
+
+def renderizar_modelos(entidad, config, atributos_pojo, atributos_dto, embebidos=True):
+    """
+    Genera el POJO, el DTO y el Mapper con los atributos seleccionados. El POJO siempre se genera,
+    por lo que el DTO siempre lo extiende; sin embebidos, los atributos embebidos del DTO se
+    tratan como atributos normales (el destino reactive ya los ha descartado).
+    Retorna un diccionario {ruta relativa a la salida: contenido}.
+    """
+    nombre_entidad = entidad.nombre
+    paquete = entidad.paquete
+    nombre_simple = entidad.nombre_simple
+    constantes_usadas = {nombre: valor for nombre, valor in entidad.constantes.items() if nombre in [attr[2] for attr in atributos_pojo]}
+    embedded_nombres = entidad.embedded_nombres if embebidos else set()
+    atributos_seleccionados = [attr for attr in atributos_dto if attr[1] not in embedded_nombres]
+    embedded_seleccionados = [attr for attr in atributos_dto if attr[1] in embedded_nombres]
+    return {
+        os.path.join("models", "pojos", f"{nombre_simple}.java"): generar_pojo(
+            nombre_entidad, paquete, atributos_pojo, constantes_usadas, entidad.importaciones_proyecto
+        ),
+        os.path.join("models", "dtos", f"{nombre_simple}Dto.java"): generar_dto(
+            nombre_entidad, paquete, atributos_seleccionados, embedded_seleccionados, nombre_simple, entidad.id_atributo,
+            entidad.importaciones_proyecto
+        ),
+        os.path.join("mappers", f"{nombre_simple}Mapper.java"): generar_mapper(
+            nombre_entidad, paquete, config.get("mapper", "jackson"), atributos_pojo, atributos_dto
+        ),
+    }
+
+
+def renderizar_busqueda(entidad, config, atributos_search, avisos, enums=None):
+    """
+    Genera el SearchModel, las Specifications y la Factory de la búsqueda, y la migración con los
+    índices de los filtros. Las Factories se generan a partir del SearchModel recién renderizado,
+    por eso van a continuación.
+    Retorna un diccionario {ruta relativa a la salida: contenido}.
+    """
+    nombre_entidad = entidad.nombre
+    paquete = entidad.paquete
+    importaciones = entidad.importaciones_proyecto
+    search_code = generar_search_model(nombre_entidad, paquete, atributos_search, entidad.id_atributo, enums, importaciones)
+    artefactos = {os.path.join("search", f"{entidad.nombre_simple}SearchModel.java"): search_code}
+    resultado = renderizar_factories(nombre_entidad, paquete, search_code, atributos_search, entidad.id_atributo, enums, importaciones)
+    if resultado:
+        nombre_spec, spec_code, nombre_factory, factory_code = resultado
+        artefactos[os.path.join("specifications", f"{nombre_spec}.java")] = spec_code
+        artefactos[os.path.join("factories", f"{nombre_factory}.java")] = factory_code
+    artefactos.update(renderizar_indices(entidad, config, atributos_search, avisos))
+    return artefactos
+
+
+def renderizar_indices(entidad, config, atributos_search, avisos):
+    """
+    Genera la migración Flyway con los índices de los filtros de búsqueda (salvo con "indices": false)
+    y avisa de los filtros que no cubre ningún índice declarado en la entidad.
+    Retorna un diccionario {ruta relativa a la salida: contenido}, vacío si no hay migración.
+    """
+    if not config.get("indices", True):
+        return {}
+    migracion = generar_migracion_indices(entidad, atributos_search, config.get("indice_compuesto"))
+    if not migracion:
+        return {}
+    nombre_migracion, sql, no_cubiertos = migracion
+    for atributo, columna in no_cubiertos:
+        avisos.append(f"el filtro '{atributo}' (columna {columna}) no está cubierto por ningún índice declarado en la entidad.")
+    return {os.path.join("db", "migration", nombre_migracion): sql}
+
+
+def renderizar_carga(entidad, config, atributos_pojo, atributos_search, avisos, paginacion="page", enums=None):
+    """
+    Genera el escenario de k6 de la entidad si la selección lo pide ("carga").
+    Retorna un diccionario {ruta relativa a la salida: contenido}, vacío si no se pide.
+    """
+    opciones = configurar_carga(config.get("carga"))
+    if not opciones:
+        return {}
+    id_nombre = entidad.id_atributo[1] if entidad.id_atributo else None
+    campos, omitidos = cuerpo_peticion(atributos_pojo, entidad.constantes, id_nombre)
+    for atributo in omitidos:
+        avisos.append(f"'{atributo}' no tiene un generador de valores y no se envía en la prueba de carga.")
+    script = generar_script_k6(
+        entidad.nombre, entidad.id_atributo, campos, consultas_busqueda(atributos_search, entidad.id_atributo, enums), opciones, paginacion
+    )
+    return {os.path.join("loadtests", f"{entidad.nombre_simple}.js"): script}
+
+
+# Opciones de la selección que solo tienen sentido con JPA
+OPCIONES_SOLO_SERVLET = ("bulk", "replica", "proyeccion", "cache", "export", "cache_consultas")
+
+
+def renderizar_entidad_reactiva(entidad_file, entidad, config, avisos, enums=None):
+    """
+    Genera en memoria los artefactos del destino reactivo (WebFlux + R2DBC) de una entidad.
+    El POJO, el DTO, el Mapper, el SearchModel y la migración de índices son los mismos que en
+    el destino servlet, pero solo con los atributos que R2DBC puede mapear. Los avisos se añaden a avisos.
+    Retorna un diccionario {ruta relativa a la salida: contenido}.
+    """
+    nombre_entidad = entidad.nombre
+    paquete = entidad.paquete
+    nombre_simple = entidad.nombre_simple
+    id_tipo = entidad.id_tipo
+    con_value = constante_con(config, nombre_entidad)
+
+    for opcion in OPCIONES_SOLO_SERVLET:
+        if config.get(opcion):
+            avisos.append(f"la opción \"{opcion}\" no se aplica al target reactive.")
+    if config.get("auditoria", "sync") != "sync":
+        avisos.append("la auditoría asíncrona no se aplica al target reactive; se usa @Audit.")
+    if config.get("paginacion", "page") != "page":
+        avisos.append("el target reactive pagina con LIMIT/OFFSET; se ignora \"paginacion\".")
+    if "GenerationType.SEQUENCE" in entidad.codigo:
+        avisos.append("R2DBC no usa la secuencia de @GeneratedValue; la columna del id necesita un DEFAULT en la base de datos.")
+
+    columnas, omitidos = columnas_reactivas(entidad)
+    for atributo in omitidos:
+        avisos.append(f"'{atributo}' (embebido o relación) no se mapea con R2DBC y se omite.")
+    mapeables = {nombre for _, nombre, _ in columnas}
+
+    artefactos = {
+        os.path.join("models", "entities", os.path.basename(entidad_file)): generar_entidad_reactiva(entidad, columnas),
+    }
+
+    # 1. Controllers y services con Mono/Flux
+    atributos_search = [attr for attr in filtrar_atributos(entidad.atributos, config.get("search")) if attr[1] in mapeables]
+    con_busqueda = bool(atributos_search)
+    controllers_dir = "controllers"
+    artefactos[os.path.join(controllers_dir, f"Post{nombre_simple}Controller.java")] = generar_post_controller_reactivo(nombre_entidad, paquete, con_value)
+    artefactos[os.path.join(controllers_dir, f"Get{nombre_simple}Controller.java")] = generar_get_controller_reactivo(nombre_entidad, paquete, con_busqueda)
+    artefactos[os.path.join(controllers_dir, f"Patch{nombre_simple}Controller.java")] = generar_patch_controller_reactivo(nombre_entidad, paquete, con_value, id_tipo)
+    artefactos[os.path.join(controllers_dir, f"Delete{nombre_simple}Controller.java")] = generar_delete_controller_reactivo(nombre_entidad, paquete, con_value, id_tipo)
+    services_dir = "services"
+    artefactos[os.path.join(services_dir, f"Create{nombre_simple}Service.java")] = generar_create_service_reactivo(nombre_entidad, paquete)
+    artefactos[os.path.join(services_dir, f"Find{nombre_simple}Service.java")] = generar_find_service_reactivo(nombre_entidad, paquete, id_tipo)
+    artefactos[os.path.join(services_dir, f"Patch{nombre_simple}Service.java")] = generar_patch_service_reactivo(nombre_entidad, paquete, id_tipo)
+    artefactos[os.path.join(services_dir, f"Delete{nombre_simple}Service.java")] = generar_delete_service_reactivo(nombre_entidad, paquete, id_tipo)
+    artefactos[os.path.join(services_dir, f"Search{nombre_simple}Service.java")] = generar_search_service_reactivo(nombre_entidad, paquete, con_busqueda)
+
+    # 2. Repository R2DBC
+    artefactos[os.path.join("repositories", f"{nombre_simple}Repository.java")] = generar_repository_reactivo(nombre_entidad, paquete, id_tipo)
+
+    # 3. POJO, DTO y Mapper con los atributos mapeables
+    atributos_pojo = [attr for attr in filtrar_atributos(entidad.atributos_pojo, config.get("pojo")) if attr[1] in mapeables]
+    atributos_dto = [attr for attr in filtrar_atributos(entidad.atributos, config.get("dto")) if attr[1] in mapeables]
+    artefactos.update(renderizar_modelos(entidad, config, atributos_pojo, atributos_dto, embebidos=False))
+
+    # 4. SearchModel, Criteria Factory e índices de los filtros
+    if con_busqueda:
+        artefactos[os.path.join("search", f"{nombre_simple}SearchModel.java")] = generar_search_model(
+            nombre_entidad, paquete, atributos_search, entidad.id_atributo, enums, entidad.importaciones_proyecto
+        )
+        nombre_factory, factory_code = generar_criteria_factory(nombre_entidad, paquete, atributos_search, entidad.id_atributo, enums)
+        artefactos[os.path.join("factories", f"{nombre_factory}.java")] = factory_code
+        artefactos.update(renderizar_indices(entidad, config, atributos_search, avisos))
+    else:
+        avisos.append("no se seleccionaron atributos de búsqueda. GET /1.0/<ruta> pagina toda la tabla.")
+
+    if config.get("benchmark"):
+        artefactos[os.path.join("benchmarks", f"{nombre_simple}Benchmark.java")] = generar_benchmark(
+            entidad, [attr for attr in entidad.atributos if attr[1] in mapeables], atributos_pojo, atributos_search, reactivo=True, enums=enums
+        )
+    artefactos.update(renderizar_carga(entidad, config, atributos_pojo, atributos_search, avisos, enums=enums))
+
+    return artefactos
+
+
+def renderizar_compartidos(seleccion):
+    """
+    Genera los artefactos comunes a todas las entidades según las opciones de la selección.
+    Se regeneran en cada ejecución a partir de la selección completa.
+    """
+    configs = [seleccion_entidad(seleccion, nombre) for nombre in seleccion["entidades"]]
+    if seleccion.get("por_defecto") is not None:
+        configs.append(seleccion["por_defecto"])
+
+    artefactos = {}
+    if any(config.get("bulk") for config in configs):
+        artefactos[os.path.join("resources", "application-bulk.properties")] = generar_propiedades_bulk()
+    base = seleccion.get("paquete_base", "com.inycom.cws")
+    auditoria_async = any(config.get("auditoria") == "async" and config.get("target") != "reactive" for config in configs)
+    if auditoria_async:
+        artefactos[os.path.join("annotations", "AsyncAudit.java")] = generar_async_audit_annotation(base)
+        artefactos[os.path.join("aspects", "AsyncAuditAspect.java")] = generar_async_audit_aspect(base)
+    # Los servicios masivos auditan cada fila con AuditEvent, también con auditoría síncrona
+    if auditoria_async or any(config.get("bulk") and config.get("target") != "reactive" for config in configs):
+        artefactos[os.path.join("events", "AuditEvent.java")] = generar_audit_event(base)
+        artefactos[os.path.join("events", "AuditEventHandler.java")] = generar_audit_event_handler(base)
+        artefactos[os.path.join("events", "AuditEventListener.java")] = generar_audit_event_listener(base)
+        artefactos[os.path.join("config", "AsyncAuditConfig.java")] = generar_async_audit_config(base, seleccion.get("hilos_virtuales", False))
+        artefactos[os.path.join("resources", "application-audit.properties")] = generar_propiedades_audit()
+    if seleccion.get("hilos_virtuales"):
+        artefactos[os.path.join("config", "VirtualThreadConfig.java")] = generar_virtual_thread_config(base)
+        artefactos[os.path.join("resources", "application-virtual-threads.properties")] = generar_propiedades_hilos_virtuales()
+    if any(config.get("benchmark") for config in configs):
+        artefactos[os.path.join("benchmarks", "BenchmarkRunner.java")] = generar_benchmark_runner(base)
+        artefactos[os.path.join("resources", "jmh-pom-snippet.xml")] = generar_pom_jmh()
+    if any(config.get("carga") for config in configs):
+        artefactos[os.path.join("loadtests", "docker-compose.yml")] = generar_docker_compose_carga()
+    if any(config.get("target") == "reactive" for config in configs):
+        artefactos[os.path.join("config", "ReactiveWebConfig.java")] = generar_reactive_web_config(base)
+        artefactos[os.path.join("resources", "application-r2dbc.properties")] = generar_propiedades_r2dbc()
+    if any(config.get("replica") for config in configs):
+        artefactos[os.path.join("annotations", "ReadOnlyTransactional.java")] = generar_anotacion_replica(base)
+        artefactos[os.path.join("config", "ReadOnlyRoutingDataSource.java")] = generar_routing_datasource(base)
+        artefactos[os.path.join("config", "DataSourceRoutingConfig.java")] = generar_routing_config(base)
+        artefactos[os.path.join("resources", "application-replica.properties")] = generar_propiedades_replica()
+
+    # Una caché de Caffeine por entidad con su tamaño y TTL; las de "por_defecto" usan la configuración común
+    caches = {}
+    for nombre in seleccion["entidades"]:
+        opciones = configurar_cache(seleccion_entidad(seleccion, nombre).get("cache"))
+        if opciones:
+            caches[nombre_cache(nombre)] = opciones
+    por_defecto = configurar_cache((seleccion.get("por_defecto") or {}).get("cache"))
+    if caches or por_defecto:
+        artefactos[os.path.join("config", "CacheConfig.java")] = generar_cache_config(base, caches, por_defecto)
+    if any(opciones["hibernate"] for opciones in list(caches.values()) + [por_defecto or {"hibernate": False}]):
+        artefactos[os.path.join("resources", "application-cache.properties")] = generar_propiedades_l2()
+    return artefactos
+
+
+def renderizar_trabajo(trabajo):
+    """
+    Renderiza una entidad completa dentro de un proceso del pool. Todos los artefactos de una
+    entidad se generan en el mismo proceso para respetar el orden SearchModel -> Factories.
+    Retorna (nombre, artefactos, avisos, duración en segundos, error).
+    """
+    nombre, entidad_file, config, enums, plantillas, tipos, importaciones = trabajo
+    inicio = time.perf_counter()
+    try:
+        artefactos, avisos = renderizar_entidad(entidad_file, config, enums, plantillas, tipos, importaciones)
+    except (ValueError, OSError) as e:
+        return nombre, None, [], time.perf_counter() - inicio, str(e)
+    return nombre, artefactos, avisos, time.perf_counter() - inicio, None
+
+
+def procesar_lote(entidad_dir, seleccion, salida_dir="output", jobs=1, forzar=False, formato=None, simular=False):
+    """
+    Genera todas las entidades del directorio sin interacción, informando del
+    tiempo por entidad y del rendimiento total. Los avisos, errores y el progreso se escriben en
+    stderr, de modo que stdout solo lleva el diff de --diff; los avisos de cada entidad se
+    imprimen aquí, en orden de entidad, y no desde los procesos del pool.
+    Con jobs > 1 las entidades se renderizan en un pool de procesos; los artefactos se reúnen
+    en el proceso principal y en orden de entidad en una única SalidaArtefactos (gen/salida.py),
+    que los escribe todos al final, por lo que la salida es la misma que en modo secuencial.
+    El formato de salida (directorio, zip, tar o arbol) se deduce de salida_dir si no se indica;
+    en zip y tar se generan siempre todas las entidades y no se guardan manifest ni índice.
+    Las entidades cuyo hash (código, selección y versión del generador) coincide con el
+    del manifest se omiten, salvo que se indique forzar.
+    Los tipos de otros archivos (enums, embeddables, entidades relacionadas) se resuelven con el
+    índice del directorio de entidades, que se guarda en la salida y se actualiza de forma incremental.
+    Con simular se renderizan todas las entidades, sin consultar el manifest, y no se escribe nada:
+    los artefactos quedan en la SalidaArtefactos para compararlos con el destino.
+    Retorna (número de entidades con error, SalidaArtefactos); la salida es None si no se pudo preparar.
+    """
+    try:
+        plantillas = cargar_plantillas(seleccion["plantillas"]) if seleccion.get("plantillas") else None
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1, None
+    try:
+        salida = SalidaArtefactos(salida_dir, formato, seleccion.get("paquete_base", "com.inycom.cws"))
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1, None
+    if simular and salida.archivo:
+        print(f"❌ La simulación compara con un directorio; {salida_dir} es un archivo {salida.formato}.", file=sys.stderr)
+        return 1, None
+    forzar = forzar or simular
+    if salida.archivo:
+        manifest, indice_file, forzar = {"entidades": {}}, None, True
+    else:
+        manifest = cargar_manifest(salida_dir)
+        indice_file = os.path.join(salida_dir, INDICE_FILE)
+    indice = cargar_indice(entidad_dir, indice_file)
+    hashes = {}
+    omitidas = 0
+    trabajos = []
+    for entidad_file in listar_entidades(entidad_dir, seleccion):
+        nombre = os.path.basename(entidad_file)[:-len(".java")]
+        config = seleccion_entidad(seleccion, nombre)
+        if config is None:
+            print(f"⚠ {nombre}: sin configuración en la selección. Se omite.", file=sys.stderr)
+            continue
+        enums = indice.enums_entidad(nombre)
+        tipos = indice.tipos_entidad(nombre)
+        importaciones = indice.importaciones_entidad(nombre)
+        hashes[nombre] = hash_entidad(entidad_file, config, enums, plantillas.version if plantillas else None, tipos, importaciones)
+        if not forzar and entidad_actualizada(manifest, salida_dir, nombre, hashes[nombre]):
+            omitidas += 1
+            continue
+        trabajos.append((nombre, entidad_file, config, enums, plantillas, tipos, importaciones))
+
+    procesadas = 0
+    errores = 0
+    total_archivos = 0
+    total_escritos = 0
+    inicio_lote = time.perf_counter()
+
+    if jobs > 1 and len(trabajos) > 1:
+        chunksize = max(1, len(trabajos) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            resultados = list(executor.map(renderizar_trabajo, trabajos, chunksize=chunksize))
+    else:
+        resultados = map(renderizar_trabajo, trabajos)
+
+    for nombre, artefactos, avisos, duracion, error in resultados:
+        for aviso in avisos:
+            print(f"⚠ {nombre}: {aviso}", file=sys.stderr)
+        if error:
+            print(f"❌ {nombre}: {error}", file=sys.stderr)
+            errores += 1
+            continue
+        escritos = salida.agregar_todos(artefactos)
+        registrar_entidad(manifest, nombre, hashes[nombre], [salida.destinos[ruta] for ruta in artefactos])
+
+        procesadas += 1
+        total_archivos += len(artefactos)
+        total_escritos += escritos
+        print(f"✅ {nombre}: {len(artefactos)} archivos ({escritos} modificados) en {duracion * 1000:.1f} ms", file=sys.stderr)
+
+    compartidos = renderizar_compartidos(seleccion)
+    if plantillas:
+        try:
+            compartidos = plantillas.aplicar(compartidos, {"base": seleccion.get("paquete_base", "com.inycom.cws"), "seleccion": seleccion})
+        except ValueError as e:
+            print(f"❌ Artefactos comunes: {e}", file=sys.stderr)
+            errores += 1
+            compartidos = {}
+    total_archivos += len(compartidos)
+    total_escritos += salida.agregar_todos(compartidos)
+    if not simular:
+        try:
+            salida.volcar()
+        except OSError as e:
+            print(f"❌ No se pudo escribir la salida en {salida_dir}: {e}", file=sys.stderr)
+            return errores + 1, salida
+        if not salida.archivo:
+            guardar_manifest(salida_dir, manifest)
+            guardar_indice(indice, indice_file)
+
+    duracion_lote = time.perf_counter() - inicio_lote
+    rendimiento = procesadas / duracion_lote if duracion_lote > 0 else 0.0
+    print(f"📊 {procesadas} entidades, {total_archivos} archivos ({total_escritos} modificados) en {duracion_lote:.2f} s "
+          f"({rendimiento:.1f} entidades/s, {jobs} procesos). Sin cambios: {omitidas}. Errores: {errores}.", file=sys.stderr)
+    return errores, salida
+
+
+def generar_lote(entidad_dir, seleccion, salida_dir="output", jobs=1, forzar=False, formato=None):
+    """
+    Genera y escribe el lote (ver procesar_lote). Retorna el número de entidades con error.
+    """
+    errores, _ = procesar_lote(entidad_dir, seleccion, salida_dir, jobs, forzar, formato)
+    return errores
+
+
+def informar_cambios(salida, diff=False):
+    """
+    Compara los artefactos renderizados con el destino sin escribir nada. Imprime en stderr un
+    resumen (nuevos, modificados y sin cambios, con sus bytes) y, con diff, el diff unificado de
+    cada archivo que cambiaría en stdout, que se puede aplicar con patch -p1 desde el destino.
+    Retorna el número de archivos que cambiarían.
+    """
+    cambios = salida.cambios()
+    if diff:
+        for destino, anterior, contenido in cambios:
+            print("".join(diff_unificado(destino, anterior, contenido)), end="")
+    nuevos = [contenido for _, anterior, contenido in cambios if anterior is None]
+    modificados = [contenido for _, anterior, contenido in cambios if anterior is not None]
+    bytes_nuevos = sum(len(contenido.encode("utf-8")) for contenido in nuevos)
+    bytes_modificados = sum(len(contenido.encode("utf-8")) for contenido in modificados)
+    print(f"📊 Simulación sobre {salida.destino}: {len(nuevos)} nuevos ({bytes_nuevos} bytes), "
+          f"{len(modificados)} modificados ({bytes_modificados} bytes), "
+          f"{len(salida.identicos)} sin cambios ({sum(salida.identicos.values())} bytes).", file=sys.stderr)
+    return len(cambios)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera en lote todas las entidades de un directorio sin interacción.")
+    parser.add_argument("entidad_dir", help="Directorio que contiene las entidades")
+    parser.add_argument("seleccion", help="Fichero JSON con los atributos seleccionados por entidad")
+    parser.add_argument("--salida", default="output", help="Directorio de salida, o archivo .zip/.tar/.tar.gz (por defecto: output)")
+    parser.add_argument("--formato", choices=FORMATOS_SALIDA,
+                        help="Formato de salida; arbol escribe en src/main/java/<paquete> de un proyecto existente "
+                             "(por defecto se deduce de la extensión de --salida)")
+    parser.add_argument("--forzar", action="store_true", help="Regenera todas las entidades ignorando el manifest")
+    parser.add_argument("--jobs", type=int, default=1, help="Número de procesos para generar en paralelo (por defecto: 1)")
+    parser.add_argument("--simular", action="store_true",
+                        help="No escribe nada: compara con la salida existente e informa de los archivos que cambiarían. "
+                             f"Código de salida {SALIDA_CAMBIOS} si hay cambios, 1 si hay errores y 0 si está al día")
+    parser.add_argument("--diff", action="store_true", help="Como --simular, escribiendo además en stdout el diff unificado de cada cambio "
+                             "(aplicable con patch -p1 desde el directorio de salida)")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.entidad_dir):
+        print(f"❌ El directorio '{args.entidad_dir}' no existe.", file=sys.stderr)
+        return 1
+
+    seleccion = cargar_seleccion(args.seleccion)
+    if args.simular or args.diff:
+        errores, salida = procesar_lote(args.entidad_dir, seleccion, args.salida, max(1, args.jobs), formato=args.formato, simular=True)
+        if salida is None:
+            return 1
+        cambios = informar_cambios(salida, args.diff)
+        if errores:
+            return 1
+        return SALIDA_CAMBIOS if cambios else 0
+    errores = generar_lote(args.entidad_dir, seleccion, args.salida, max(1, args.jobs), args.forzar, args.formato)
+    return 1 if errores else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,15 +1,245 @@
-import re
+from dataclasses import dataclass, field
+
+from analizador_java import parsear_java
+
+# Anotaciones de relación de JPA
+RELACIONES = ("ManyToOne", "OneToOne", "OneToMany", "ManyToMany")
+
+# FetchType por defecto de cada relación según la especificación JPA
+FETCH_POR_DEFECTO = {"ManyToOne": "EAGER", "OneToOne": "EAGER", "OneToMany": "LAZY", "ManyToMany": "LAZY"}
+
+# Tipos que nunca son nulos y anotaciones que lo impiden en el atributo
+TIPOS_PRIMITIVOS = {"boolean", "byte", "char", "short", "int", "long", "float", "double"}
+ANOTACIONES_NO_NULO = {"Id", "NotNull", "NonNull", "NotBlank", "NotEmpty"}
+
+
+def campos_instancia(codigo_java):
+    """
+    Atributos no estáticos de la clase principal, de cualquier visibilidad, en orden de declaración.
+    """
+    return [campo for campo in parsear_java(codigo_java).campos if not campo.estatico]
+
 def extraer_nombre_entidad(codigo_java):
     """
-    Busca la clase que contenga 'public class' y retorna el nombre.
-    Por ejemplo, 'PatientEntity'.
+    Retorna el nombre de la clase principal del archivo (la primera pública), o None si el
+    archivo declara un enum, una interfaz o un record. Por ejemplo, 'PatientEntity'.
     """
-    match = re.search(r'public\s+class\s+(\w+)', codigo_java)
-    return match.group(1) if match else None
+    clase = parsear_java(codigo_java)
+    return clase.nombre if clase.tipo == "class" and clase.nombre else None
 
 def extraer_paquete(codigo_java):
     """
-    Busca la línea 'package com.xxx.yyy;' para extraer el nombre del paquete.
+    Retorna el paquete declarado en el archivo ('package com.xxx.yyy;').
+    """
+    return parsear_java(codigo_java).paquete or "com.example"
+
+def extraer_importaciones(codigo_java):
+    """
+    Retorna las importaciones del archivo sin "import" ni ";" (por ejemplo, 'java.time.LocalDate').
+    """
+    return list(parsear_java(codigo_java).importaciones)
+
+def extraer_atributos(codigo_java):
+    """
+    Extrae todos los atributos de la clase Java.
+    Retorna una lista de tuplas (tipo, nombre).
+    """
+    return [(campo.tipo, campo.nombre) for campo in campos_instancia(codigo_java)]
+
+def extraer_constantes_estaticas(codigo_java):
+    """
+    Extrae las constantes estáticas enteras de la clase Java y las devuelve en un diccionario.
+    """
+    return {
+        campo.nombre: int(campo.inicializador)
+        for campo in parsear_java(codigo_java).campos
+        if campo.estatico and "final" in campo.modificadores and campo.tipo == "int"
+        and campo.inicializador and campo.inicializador.isdigit()
+    }
+
+def extraer_atributos_para_pojo(codigo_java, constantes):
+    """
+    Extrae todos los atributos de la clase Java, incluyendo los que tienen validación de longitud.
+    Retorna una lista de tuplas (tipo, nombre, constante) donde constante es el valor de
+    @Column(length = ...) (el nombre de una constante de la clase o un literal) o None si no hay longitud.
+    Los atributos con longitud van primero, como en el POJO que se generaba hasta ahora.
+    """
+    atributos = []
+    for campo in campos_instancia(codigo_java):
+        column = campo.anotacion("Column")
+        longitud = column.argumentos.get("length") if column else None
+        if longitud not in constantes and not (longitud or "").isdigit():
+            longitud = None
+        atributos.append((campo.tipo, campo.nombre, longitud))
+    return sorted(atributos, key=lambda attr: attr[2] is None)
+
+def extraer_embedded_atributos(codigo_java):
+    """
+    Extrae de la entidad los atributos que están anotados con @Embedded.
+    Retorna una lista de tuplas (tipo, nombre).
+    """
+    return [(campo.tipo, campo.nombre) for campo in campos_instancia(codigo_java) if campo.anotacion("Embedded")]
+
+def extraer_id_atributo(codigo_java):
+    """
+    Extrae el atributo que está anotado con @Id, tenga o no otras anotaciones.
+    Retorna una tupla (tipo, nombre) si se encuentra, o None en caso contrario.
+    """
+    return next(
+        ((campo.tipo, campo.nombre) for campo in campos_instancia(codigo_java) if campo.anotacion("Id")),
+        None,
+    )
+
+def extraer_anotaciones(codigo_java):
+    """
+    Extrae los nombres de las anotaciones que preceden a cada atributo.
+    Retorna un diccionario {nombre del atributo: [anotaciones]}.
+    """
+    return {
+        campo.nombre: [anotacion.nombre for anotacion in campo.anotaciones]
+        for campo in campos_instancia(codigo_java)
+    }
+
+def extraer_no_nulos(codigo_java):
+    """
+    Extrae los atributos que no admiten nulos: los primitivos, el @Id, los anotados con
+    @NotNull (o equivalentes) y los que declaran @Column(nullable = false) o @Basic(optional = false).
+    Retorna el conjunto de nombres.
+    """
+    no_nulos = set()
+    for campo in campos_instancia(codigo_java):
+        column = campo.anotacion("Column")
+        basic = campo.anotacion("Basic")
+        if (campo.tipo in TIPOS_PRIMITIVOS
+                or any(anotacion.nombre in ANOTACIONES_NO_NULO for anotacion in campo.anotaciones)
+                or (column and column.argumentos.get("nullable") == "false")
+                or (basic and basic.argumentos.get("optional") == "false")):
+            no_nulos.add(campo.nombre)
+    return no_nulos
+
+def extraer_tabla(codigo_java):
+    """
+    Extrae de la cabecera de la clase el nombre de la tabla (@Table(name = "...")) y las
+    columnas de los índices declarados (@Index(columnList = "a, b")).
+    Retorna (tabla o None, [[columnas del índice], ...]).
+    """
+    table = parsear_java(codigo_java).anotacion("Table")
+    if not table:
+        return None, []
+    indices = []
+    for index in table.anidadas:
+        columnas = index.argumentos.get("columnList") if index.nombre == "Index" else None
+        if columnas:
+            indices.append([columna.split()[0] for columna in columnas.split(",") if columna.strip()])
+    return table.argumentos.get("name"), indices
+
+def extraer_columnas(codigo_java):
+    """
+    Extrae los nombres de columna explícitos (@Column(name = ...) o @JoinColumn(name = ...)).
+    Retorna un diccionario {nombre del atributo: nombre de la columna}.
+    """
+    columnas = {}
+    for campo in campos_instancia(codigo_java):
+        for anotacion in campo.anotaciones:
+            if anotacion.nombre in ("Column", "JoinColumn") and anotacion.argumentos.get("name"):
+                columnas[campo.nombre] = anotacion.argumentos["name"]
+    return columnas
+
+def extraer_relaciones(codigo_java):
+    """
+    Extrae las relaciones (@ManyToOne, @OneToOne, @OneToMany, @ManyToMany) con su FetchType,
+    explícito o el que fija JPA por defecto.
+    Retorna un diccionario {nombre del atributo: (relación, fetch)}.
+    """
+    relaciones = {}
+    for campo in campos_instancia(codigo_java):
+        relacion = next((anotacion for anotacion in campo.anotaciones if anotacion.nombre in RELACIONES), None)
+        if relacion:
+            fetch = relacion.argumentos.get("fetch", "").rsplit(".", 1)[-1]
+            relaciones[campo.nombre] = (relacion.nombre, fetch if fetch in ("LAZY", "EAGER") else FETCH_POR_DEFECTO[relacion.nombre])
+    return relaciones
+
+
+@dataclass
+class Entidad:
+    """
+    Modelo de una entidad Java, construido una sola vez por archivo y compartido
+    por todos los generadores.
+    """
+    archivo: str
+    codigo: str
+    nombre: str
+    paquete: str
+    atributos: list = field(default_factory=list)
+    atributos_pojo: list = field(default_factory=list)
+    constantes: dict = field(default_factory=dict)
+    id_atributo: tuple = None
+    embedded: list = field(default_factory=list)
+    anotaciones: dict = field(default_factory=dict)
+    tabla: str = None
+    indices: list = field(default_factory=list)
+    columnas: dict = field(default_factory=dict)
+    relaciones: dict = field(default_factory=dict)
+    no_nulos: set = field(default_factory=set)
+    importaciones: list = field(default_factory=list)
+    # Tipos de los atributos declarados en otros archivos del proyecto (ver gen/indice.py:tipos_entidad)
+    tipos_proyecto: dict = field(default_factory=dict)
+    # Importaciones de esos tipos (ver gen/indice.py:importaciones_entidad)
+    importaciones_proyecto: dict = field(default_factory=dict)
+
+    @property
+    def nombre_simple(self):
+        return self.nombre.replace("Entity", "")
+
+    @property
+    def id_tipo(self):
+        return self.id_atributo[0] if self.id_atributo else "Long"
+
+    @property
+    def embedded_nombres(self):
+        """
+        Atributos embebidos: los anotados con @Embedded y, según el índice del proyecto, los de un
+        tipo @Embeddable, que JPA embebe aunque no lleven la anotación.
+        """
+        return {nombre for _, nombre in self.embedded} | {
+            nombre for tipo, nombre in self.atributos if self.tipos_proyecto.get(tipo) == "embeddable"
+        }
+
+
+def parsear_entidad(codigo_java, archivo=None):
+    """
+    Construye el modelo de la entidad a partir de su código fuente. El archivo se analiza una
+    sola vez: todas las extracciones comparten el resultado cacheado de parsear_java.
+    Retorna None si no se encuentra la clase.
+    """
+    nombre = extraer_nombre_entidad(codigo_java)
+    if not nombre:
+        return None
+    constantes = extraer_constantes_estaticas(codigo_java)
+    tabla, indices = extraer_tabla(codigo_java)
+    return Entidad(
+        archivo=archivo,
+        codigo=codigo_java,
+        nombre=nombre,
+        paquete=extraer_paquete(codigo_java),
+        atributos=extraer_atributos(codigo_java),
+        atributos_pojo=extraer_atributos_para_pojo(codigo_java, constantes),
+        constantes=constantes,
+        id_atributo=extraer_id_atributo(codigo_java),
+        embedded=extraer_embedded_atributos(codigo_java),
+        anotaciones=extraer_anotaciones(codigo_java),
+        tabla=tabla,
+        indices=indices,
+        columnas=extraer_columnas(codigo_java),
+        relaciones=extraer_relaciones(codigo_java),
+        no_nulos=extraer_no_nulos(codigo_java),
+        importaciones=extraer_importaciones(codigo_java),
+    )
+
+def cargar_entidad(entidad_file):
+    """
+    Lee el archivo de la entidad una única vez y construye su modelo.
     """
-    match = re.search(r'package\s+([\w\.]+);', codigo_java)
-    return match.group(1) if match else "com.example"
\ No newline at end of file
+    with open(entidad_file, "r", encoding="utf-8") as f:
+        codigo_java = f.read()
+    return parsear_entidad(codigo_java, entidad_file)
@@ -0,0 +1,233 @@
+from gen.nombres import extraer_base_paquete
+
+# Modos de auditoría de los controllers: el aspecto @Audit del proyecto (síncrono) o eventos asíncronos
+MODOS_AUDITORIA = ("sync", "async")
+
+
+def anotacion_auditoria(modo="sync"):
+    """
+    Nombre de la anotación de auditoría de los controllers según el modo:
+    "sync" usa @Audit (el aspecto existente, en el hilo de la petición) y "async" usa
+    @AsyncAudit, que solo publica un AuditEvent (ver generar_async_audit_aspect).
+    """
+    if modo not in MODOS_AUDITORIA:
+        raise ValueError(f"Modo de auditoría desconocido: {modo}. Opciones: {', '.join(MODOS_AUDITORIA)}")
+    return "AsyncAudit" if modo == "async" else "Audit"
+
+def generar_async_audit_annotation(base):
+    """
+    Anotación @AsyncAudit con los mismos atributos que @Audit.
+    """
+    return f"""package {base}.annotations;
+
+import {base}.enums.AuditAction;
+
+import java.lang.annotation.ElementType;
+import java.lang.annotation.Retention;
+import java.lang.annotation.RetentionPolicy;
+import java.lang.annotation.Target;
+
+@Target(ElementType.METHOD)
+@Retention(RetentionPolicy.RUNTIME)
+public @interface AsyncAudit {{
+    long controllerId();
+
+    AuditAction action();
+}}
+"""
+
+def generar_audit_event(base):
+    """
+    Evento de auditoría. Lleva los argumentos del endpoint para que el handler los serialice
+    fuera del hilo de la petición.
+    """
+    return f"""package {base}.events;
+
+import {base}.enums.AuditAction;
+
+import java.time.Instant;
+import java.util.List;
+
+public record AuditEvent(
+        long controllerId,
+        AuditAction action,
+        List<Object> arguments,
+        Instant timestamp
+) {{
+}}
+"""
+
+def generar_audit_event_handler(base):
+    """
+    Punto de extensión que persiste los eventos (por ejemplo, con el mismo almacenamiento que
+    el aspecto @Audit). Lo implementa el proyecto; si no hay ninguno, el listener los registra en el log.
+    """
+    return f"""package {base}.events;
+
+public interface AuditEventHandler {{
+    void handle(AuditEvent event);
+}}
+"""
+
+def generar_async_audit_aspect(base):
+    """
+    Aspecto de @AsyncAudit: tras una respuesta correcta publica un AuditEvent con
+    ApplicationEventPublisher y no hace ninguna E/S en el hilo de la petición.
+    """
+    return f"""package {base}.aspects;
+
+import {base}.annotations.AsyncAudit;
+import {base}.events.AuditEvent;
+import lombok.RequiredArgsConstructor;
+import org.aspectj.lang.JoinPoint;
+import org.aspectj.lang.annotation.AfterReturning;
+import org.aspectj.lang.annotation.Aspect;
+import org.springframework.context.ApplicationEventPublisher;
+import org.springframework.stereotype.Component;
+
+import java.time.Instant;
+import java.util.Arrays;
+
+@Aspect
+@Component
+@RequiredArgsConstructor
+public class AsyncAuditAspect {{
+
+    private final ApplicationEventPublisher publisher;
+
+    @AfterReturning("@annotation(asyncAudit)")
+    public void publish(final JoinPoint joinPoint, final AsyncAudit asyncAudit) {{
+        publisher.publishEvent(new AuditEvent(
+                asyncAudit.controllerId(),
+                asyncAudit.action(),
+                Arrays.asList(joinPoint.getArgs()),
+                Instant.now()));
+    }}
+}}
+"""
+
+def generar_audit_event_listener(base):
+    """
+    Listener de los AuditEvent: se ejecuta tras el commit (o directamente si el evento se
+    publicó fuera de una transacción, como ocurre desde los controllers) en el executor
+    acotado auditExecutor (ver generar_async_audit_config).
+    """
+    return f"""package {base}.events;
+
+import lombok.RequiredArgsConstructor;
+import lombok.extern.slf4j.Slf4j;
+import org.springframework.beans.factory.ObjectProvider;
+import org.springframework.scheduling.annotation.Async;
+import org.springframework.stereotype.Component;
+import org.springframework.transaction.event.TransactionPhase;
+import org.springframework.transaction.event.TransactionalEventListener;
+
+@Slf4j
+@Component
+@RequiredArgsConstructor
+public class AuditEventListener {{
+
+    private final ObjectProvider<AuditEventHandler> handler;
+
+    @Async("auditExecutor")
+    @TransactionalEventListener(phase = TransactionPhase.AFTER_COMMIT, fallbackExecution = true)
+    public void on(final AuditEvent event) {{
+        handler.ifAvailable(
+                h -> h.handle(event),
+                () -> log.info("Audit {{}} {{}} {{}}", event.controllerId(), event.action(), event.timestamp()));
+    }}
+}}
+"""
+
+def generar_async_audit_config(base, hilos_virtuales=False):
+    """
+    Executor de la auditoría asíncrona con cola acotada. Si la cola se llena, el evento se
+    procesa en el hilo que lo publica (CallerRunsPolicy): la auditoría no se pierde y la
+    saturación se traslada a la latencia en lugar de a la memoria.
+    Con hilos_virtuales los hilos del executor son virtuales (Java 21).
+    """
+    factoria = ""
+    if hilos_virtuales:
+        factoria = '\n        executor.setThreadFactory(Thread.ofVirtual().name("audit-", 0).factory());'
+    return f"""package {base}.config;
+
+import org.springframework.beans.factory.annotation.Value;
+import org.springframework.context.annotation.Bean;
+import org.springframework.context.annotation.Configuration;
+import org.springframework.scheduling.annotation.EnableAsync;
+import org.springframework.scheduling.concurrent.ThreadPoolTaskExecutor;
+
+import java.util.concurrent.ThreadPoolExecutor;
+
+@EnableAsync
+@Configuration
+public class AsyncAuditConfig {{
+
+    @Bean
+    public ThreadPoolTaskExecutor auditExecutor(@Value("${{cws.audit.pool-size:2}}") final int poolSize,
+                                                @Value("${{cws.audit.queue-capacity:1000}}") final int queueCapacity) {{
+        final ThreadPoolTaskExecutor executor = new ThreadPoolTaskExecutor();
+        executor.setCorePoolSize(poolSize);
+        executor.setMaxPoolSize(poolSize);
+        executor.setQueueCapacity(queueCapacity);
+        executor.setThreadNamePrefix("audit-");{factoria}
+        executor.setRejectedExecutionHandler(new ThreadPoolExecutor.CallerRunsPolicy());
+        executor.setWaitForTasksToCompleteOnShutdown(true);
+        executor.setAwaitTerminationSeconds(30);
+        return executor;
+    }}
+}}
+"""
+
+def generar_propiedades_audit():
+    """
+    Fragmento de application.properties para la auditoría asíncrona.
+    """
+    return """# Auditoría asíncrona (@AsyncAudit y filas de los endpoints /batch): hilos y tamaño de la cola del executor auditExecutor.
+# Con la cola llena los eventos se procesan en el hilo de la petición.
+cws.audit.pool-size=2
+cws.audit.queue-capacity=1000
+"""
+
+def generar_virtual_thread_config(base):
+    """
+    Configuración de hilos virtuales (Java 21) para Tomcat y para el executor de @Async.
+    En Spring Boot 3.2+ equivale a spring.threads.virtual.enabled=true; se genera para poder
+    usarlo también en 3.0 y 3.1.
+    """
+    return f"""package {base}.config;
+
+import org.springframework.boot.autoconfigure.task.TaskExecutionAutoConfiguration;
+import org.springframework.boot.web.embedded.tomcat.TomcatProtocolHandlerCustomizer;
+import org.springframework.context.annotation.Bean;
+import org.springframework.context.annotation.Configuration;
+import org.springframework.core.task.AsyncTaskExecutor;
+import org.springframework.core.task.support.TaskExecutorAdapter;
+
+import java.util.concurrent.Executors;
+
+@Configuration
+public class VirtualThreadConfig {{
+
+    @Bean
+    public TomcatProtocolHandlerCustomizer<?> virtualThreadProtocolHandlerCustomizer() {{
+        return protocolHandler -> protocolHandler.setExecutor(Executors.newVirtualThreadPerTaskExecutor());
+    }}
+
+    @Bean(TaskExecutionAutoConfiguration.APPLICATION_TASK_EXECUTOR_BEAN_NAME)
+    public AsyncTaskExecutor applicationTaskExecutor() {{
+        return new TaskExecutorAdapter(Executors.newVirtualThreadPerTaskExecutor());
+    }}
+}}
+"""
+
+def generar_propiedades_hilos_virtuales():
+    """
+    Fragmento de application.properties para los hilos virtuales.
+    """
+    return """# Hilos virtuales (Java 21). En Spring Boot 3.2+ basta con esta propiedad; VirtualThreadConfig cubre 3.0 y 3.1.
+spring.threads.virtual.enabled=true
+# Con hilos virtuales el límite real de concurrencia es el pool de conexiones: ajustar su tamaño
+# y evitar bloques synchronized alrededor de E/S (fijan el hilo virtual a su portador).
+spring.datasource.hikari.maximum-pool-size=50
+"""
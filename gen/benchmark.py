@@ -0,0 +1,237 @@
+from gen.nombres import extraer_base_paquete, importaciones_tipos, setter
+from gen.specification import operadores_seleccionados
+
+# Valores de ejemplo de los tipos escalares, como expresiones Java
+VALORES_EJEMPLO = {
+    "String": '"{nombre}-0001"',
+    "Integer": "42", "int": "42",
+    "Long": "1001L", "long": "1001L",
+    "Short": "(short) 7", "short": "(short) 7",
+    "Byte": "(byte) 1", "byte": "(byte) 1",
+    "Double": "123.45", "double": "123.45",
+    "Float": "12.5f", "float": "12.5f",
+    "Boolean": "Boolean.TRUE", "boolean": "true",
+    "Character": "'A'", "char": "'A'",
+    "BigDecimal": 'new BigDecimal("1234.56")',
+    "BigInteger": 'new BigInteger("123456789")',
+    "LocalDate": "LocalDate.of(2024, 1, 15)",
+    "LocalDateTime": "LocalDateTime.of(2024, 1, 15, 10, 30)",
+    "LocalTime": "LocalTime.of(10, 30)",
+    "OffsetDateTime": "OffsetDateTime.of(2024, 1, 15, 10, 30, 0, 0, ZoneOffset.UTC)",
+    "ZonedDateTime": "ZonedDateTime.of(2024, 1, 15, 10, 30, 0, 0, ZoneOffset.UTC)",
+    "Instant": 'Instant.parse("2024-01-15T10:30:00Z")',
+    "UUID": 'UUID.fromString("3f2504e0-4f89-11d3-9a0c-0305e82c3301")',
+}
+
+# Colecciones mutables para las entidades
+COLECCIONES_EJEMPLO = {
+    "List": ("new ArrayList<>()", "import java.util.ArrayList;"),
+    "Set": ("new HashSet<>()", "import java.util.HashSet;"),
+    "Map": ("new HashMap<>()", "import java.util.HashMap;"),
+}
+
+
+def paquetes_importados(entidad):
+    """
+    Retorna {nombre simple: importación} de las importaciones de clase de la entidad.
+    """
+    return {
+        importacion.rsplit(".", 1)[1]: f"import {importacion};"
+        for importacion in entidad.importaciones
+        if "." in importacion and not importacion.startswith("static ") and importacion.rsplit(".", 1)[1][:1].isupper()
+    }
+
+def valor_ejemplo(tipo, nombre, entidad):
+    """
+    Expresión Java con un valor realista para el atributo según su tipo. Los tipos del proyecto
+    (enums, relaciones y embebidos) se importan desde la entidad o, si no aparecen, desde su paquete.
+    Retorna (expresión, importaciones).
+    """
+    if tipo in VALORES_EJEMPLO:
+        importaciones = importaciones_tipos([tipo])
+        if tipo in ("OffsetDateTime", "ZonedDateTime"):
+            importaciones.add("import java.time.ZoneOffset;")
+        return VALORES_EJEMPLO[tipo].format(nombre=nombre), importaciones
+    contenedor = tipo.split("<")[0]
+    if contenedor in COLECCIONES_EJEMPLO:
+        expresion, importacion = COLECCIONES_EJEMPLO[contenedor]
+        return expresion, {importacion}
+    if "[" in tipo:
+        return "null", set()
+    importacion = paquetes_importados(entidad).get(tipo, f"import {entidad.paquete}.{tipo};")
+    if entidad.tipos_proyecto.get(tipo, "entidad" if tipo.endswith(("Entity", "Embeddable")) else "enum") != "enum":
+        return f"new {tipo}()", {importacion}
+    # Enums: el primer valor declarado
+    return f"{tipo}.values()[0]", {importacion}
+
+def valor_busqueda(tipo, nombre, entidad):
+    """
+    Valor de ejemplo de un campo del SearchModel; las listas de los filtros In llevan un elemento.
+    Retorna (expresión, importaciones).
+    """
+    if tipo.startswith("List<"):
+        expresion, importaciones = valor_ejemplo(tipo[len("List<"):-1], nombre, entidad)
+        return f"List.of({expresion})", importaciones | {"import java.util.List;"}
+    return valor_ejemplo(tipo, nombre, entidad)
+
+def asignaciones(variable, atributos, entidad, valor=valor_ejemplo):
+    """
+    Líneas con los setters de los atributos (tipo, nombre, ...) sobre la variable.
+    Retorna (líneas, importaciones).
+    """
+    lineas = []
+    importaciones = set()
+    for attr in atributos:
+        expresion, importaciones_valor = valor(attr[0], attr[1], entidad)
+        importaciones |= importaciones_valor
+        lineas.append(f"        {variable}.{setter(attr[1])}({expresion});")
+    return lineas, importaciones
+
+def generar_benchmark(entidad, atributos_entidad, atributos_pojo, atributos_search=None, reactivo=False, enums=None):
+    """
+    Benchmark JMH de la entidad con el coste por fila de {X}Mapper.toDto y {X}Mapper.toEntity y,
+    si hay atributos de búsqueda, de la factory del SearchModel (mapToSpecification o, en el target
+    reactive, mapToCriteria). Las instancias se rellenan con valores realistas de cada tipo y todos
+    los filtros del SearchModel informados, que es el peor caso de la factory.
+    atributos_entidad son los atributos de la entidad generada (en el target reactive, solo los mapeables).
+    Los métodos devuelven el resultado para que JMH no elimine el trabajo como código muerto.
+    """
+    base = extraer_base_paquete(entidad.paquete)
+    nombre_entidad = entidad.nombre
+    nombre_simple = entidad.nombre_simple
+    importaciones = {
+        f"import {base}.mappers.{nombre_simple}Mapper;",
+        f"import {base}.models.dtos.{nombre_simple}Dto;",
+        f"import {base}.models.pojos.{nombre_simple};",
+        f"import {entidad.paquete}.{nombre_entidad};",
+        "import org.openjdk.jmh.annotations.*;",
+    }
+    lineas_entidad, importaciones_entidad = asignaciones("entity", atributos_entidad, entidad)
+    lineas_pojo, importaciones_pojo = asignaciones("pojo", atributos_pojo, entidad)
+    importaciones |= importaciones_entidad | importaciones_pojo
+
+    campos = [f"    private {nombre_entidad} entity;", f"    private {nombre_simple} pojo;"]
+    preparacion = [f"        entity = new {nombre_entidad}();", *lineas_entidad,
+                   f"        pojo = new {nombre_simple}();", *lineas_pojo]
+    metodos = [f"""    @Benchmark
+    public {nombre_simple}Dto toDto() {{
+        return {nombre_simple}Mapper.toDto(entity);
+    }}""", f"""    @Benchmark
+    public {nombre_entidad} toEntity() {{
+        return {nombre_simple}Mapper.toEntity(pojo);
+    }}"""]
+
+    if atributos_search:
+        campos_search = [(tipo, campo) for campo, tipo, _, _ in operadores_seleccionados(atributos_search, entidad.id_atributo, enums)]
+        lineas_search, importaciones_search = asignaciones("searchModel", campos_search, entidad, valor_busqueda)
+        importaciones |= importaciones_search
+        importaciones.add(f"import {base}.search.{nombre_simple}SearchModel;")
+        campos.append(f"    private {nombre_simple}SearchModel searchModel;")
+        preparacion += [f"        searchModel = new {nombre_simple}SearchModel();", *lineas_search]
+        if reactivo:
+            importaciones.add(f"import {base}.factories.{nombre_simple}CriteriaFactory;")
+            importaciones.add("import org.springframework.data.relational.core.query.Criteria;")
+            metodos.append(f"""    @Benchmark
+    public Criteria mapToCriteria() {{
+        return {nombre_simple}CriteriaFactory.mapToCriteria(searchModel);
+    }}""")
+        else:
+            importaciones.add(f"import {base}.factories.{nombre_simple}SpecificationFactory;")
+            importaciones.add("import org.springframework.data.jpa.domain.Specification;")
+            metodos.append(f"""    @Benchmark
+    public Specification<{nombre_entidad}> mapToSpecification() {{
+        return {nombre_simple}SpecificationFactory.mapToSpecification(searchModel);
+    }}""")
+
+    importaciones.add("import java.util.concurrent.TimeUnit;")
+    propias = sorted(i for i in importaciones if not i.startswith("import java."))
+    java = sorted(i for i in importaciones if i.startswith("import java."))
+    return f"""package {base}.benchmarks;
+
+{chr(10).join(propias)}
+
+{chr(10).join(java)}
+
+@State(Scope.Benchmark)
+@BenchmarkMode(Mode.AverageTime)
+@OutputTimeUnit(TimeUnit.NANOSECONDS)
+@Warmup(iterations = 3, time = 1)
+@Measurement(iterations = 5, time = 1)
+@Fork(1)
+public class {nombre_simple}Benchmark {{
+
+{chr(10).join(campos)}
+
+    @Setup
+    public void setup() {{
+{chr(10).join(preparacion)}
+    }}
+
+{(chr(10) * 2).join(metodos)}
+}}
+"""
+
+def generar_benchmark_runner(base):
+    """
+    Punto de entrada de los benchmarks para CI: ejecuta todas las clases *Benchmark del paquete
+    y escribe los resultados en JSON (jmh-result.json) para compararlos entre ejecuciones.
+    """
+    return f"""package {base}.benchmarks;
+
+import org.openjdk.jmh.results.format.ResultFormatType;
+import org.openjdk.jmh.runner.Runner;
+import org.openjdk.jmh.runner.RunnerException;
+import org.openjdk.jmh.runner.options.Options;
+import org.openjdk.jmh.runner.options.OptionsBuilder;
+
+public final class BenchmarkRunner {{
+
+    private BenchmarkRunner() {{
+    }}
+
+    public static void main(final String[] args) throws RunnerException {{
+        final Options options = new OptionsBuilder()
+                .include(BenchmarkRunner.class.getPackageName() + ".*Benchmark")
+                .resultFormat(ResultFormatType.JSON)
+                .result(args.length > 0 ? args[0] : "jmh-result.json")
+                .build();
+        new Runner(options).run();
+    }}
+}}
+"""
+
+def generar_pom_jmh():
+    """
+    Fragmento de pom.xml con las dependencias de JMH (ámbito test) y la ejecución de BenchmarkRunner.
+    Los benchmarks se copian en src/test/java.
+    """
+    return """<!-- Benchmarks JMH de los mappers y factories generados (copiar en src/test/java/.../benchmarks). -->
+<!-- Ejecutar en CI con: mvn test-compile exec:java -Dexec.classpathScope=test -Dexec.mainClass=<paquete>.benchmarks.BenchmarkRunner -->
+<properties>
+    <jmh.version>1.37</jmh.version>
+</properties>
+
+<dependencies>
+    <dependency>
+        <groupId>org.openjdk.jmh</groupId>
+        <artifactId>jmh-core</artifactId>
+        <version>${jmh.version}</version>
+        <scope>test</scope>
+    </dependency>
+    <dependency>
+        <groupId>org.openjdk.jmh</groupId>
+        <artifactId>jmh-generator-annprocess</artifactId>
+        <version>${jmh.version}</version>
+        <scope>test</scope>
+    </dependency>
+</dependencies>
+
+<!-- Dentro de maven-compiler-plugin, junto al procesador de Lombok: -->
+<annotationProcessorPaths>
+    <path>
+        <groupId>org.openjdk.jmh</groupId>
+        <artifactId>jmh-generator-annprocess</artifactId>
+        <version>${jmh.version}</version>
+    </path>
+</annotationProcessorPaths>
+"""
@@ -0,0 +1,206 @@
+from gen.nombres import envolver, extraer_base_paquete, getter
+
+# Filas por flush/clear; debe coincidir con hibernate.jdbc.batch_size
+TAMANO_LOTE = 50
+
+
+def generar_bulk_controller(nombre_entidad, paquete, id_tipo="Long"):
+    """
+    Controller que maneja las operaciones masivas sobre /1.0/<ruta>/batch:
+      - POST con una lista de POJOs,
+      - PATCH con un mapa {id: POJO},
+      - DELETE con una lista de ids.
+    Los endpoints no llevan @Audit: la auditoría es por fila y la publica Bulk{X}Service
+    (ver generar_bulk_service).
+    """
+    base = extraer_base_paquete(paquete)
+    nombre_simple = nombre_entidad.replace("Entity", "")
+    ruta = nombre_simple.lower() + "s"
+    id_tipo = envolver(id_tipo)
+    return f"""package {base}.controllers;
+
+import {base}.models.dtos.{nombre_simple}Dto;
+import {base}.models.pojos.{nombre_simple};
+import {base}.services.Bulk{nombre_simple}Service;
+import jakarta.validation.Valid;
+import lombok.RequiredArgsConstructor;
+import org.springframework.http.HttpStatus;
+import org.springframework.http.ResponseEntity;
+import org.springframework.validation.annotation.Validated;
+import org.springframework.web.bind.annotation.*;
+
+import java.util.List;
+import java.util.Map;
+
+@Validated
+@RequiredArgsConstructor
+@RestController
+@RequestMapping("/1.0/{ruta}/batch")
+public class Bulk{nombre_simple}Controller {{
+    private final Bulk{nombre_simple}Service service;
+
+    @PostMapping
+    public ResponseEntity<List<{nombre_simple}Dto>> createAll(@RequestBody final List<@Valid {nombre_simple}> newObjects) {{
+        return new ResponseEntity<>(service.createAll(newObjects), HttpStatus.CREATED);
+    }}
+
+    @PatchMapping
+    public ResponseEntity<Void> patchAll(@RequestBody final Map<{id_tipo}, {nombre_simple}> patches) {{
+        service.patchAll(patches);
+        return ResponseEntity.noContent().build();
+    }}
+
+    @DeleteMapping
+    public ResponseEntity<Void> deleteAll(@RequestBody final List<{id_tipo}> ids) {{
+        service.deleteAll(ids);
+        return ResponseEntity.noContent().build();
+    }}
+}}
+"""
+
+def generar_bulk_service(nombre_entidad, paquete, id_atributo, con_value, cache=None):
+    """
+    Servicio de operaciones masivas. Todo se ejecuta en una única transacción y por lotes de
+    TAMANO_LOTE filas: saveAll/deleteAll agrupan las sentencias con el JDBC batching de
+    Hibernate y flush/clear tras cada lote mantiene acotado el contexto de persistencia.
+    PATCH y DELETE cargan cada lote con un único findAllById (IN) y fallan si falta algún id.
+    id_atributo es la tupla (tipo, nombre) del atributo anotado con @Id.
+    Cada fila publica un AuditEvent (ver gen/auditoria.py) con la constante con_value, la acción
+    y los mismos argumentos que el endpoint unitario: (POJO) en POST, (id, POJO) en PATCH y (id)
+    en DELETE. AuditEventListener los procesa tras el commit, así que una petición revertida no
+    deja auditoría; el proyecto los persiste implementando AuditEventHandler.
+    cache, el nombre de la caché de Find{X}Service (ver gen/cache.py), invalida las claves de los
+    ids modificados o eliminados; con el CacheManager transaccional se aplica tras el commit.
+    """
+    if not id_atributo:
+        raise ValueError(f"Las operaciones masivas de {nombre_entidad} necesitan un atributo anotado con @Id")
+    id_nombre = id_atributo[1]
+    id_tipo = envolver(id_atributo[0])
+    base = extraer_base_paquete(paquete)
+    nombre_simple = nombre_entidad.replace("Entity", "")
+    nombre_simple_upper = nombre_simple.upper()
+    import_cache = campo_cache = evict = metodo_evict = ""
+    import_collection = ""
+    if cache:
+        import_cache = "import org.springframework.cache.Cache;\nimport org.springframework.cache.CacheManager;\n"
+        import_collection = "import java.util.Collection;\n"
+        campo_cache = f'    private static final String CACHE = "{cache}";\n'
+        campo_cache_manager = "    private final CacheManager cacheManager;\n"
+        evict = "\n        evict(ids);"
+        metodo_evict = f"""
+
+    private void evict(final Collection<{id_tipo}> ids) {{
+        final Cache cache = cacheManager.getCache(CACHE);
+        if (cache != null) {{
+            ids.forEach(cache::evict);
+        }}
+    }}"""
+    else:
+        campo_cache_manager = ""
+    return f"""package {base}.services;
+
+import {base}.enums.AuditAction;
+import {base}.events.AuditEvent;
+import {base}.exceptions.CwsException;
+import {base}.mappers.{nombre_simple}Mapper;
+import {base}.models.dtos.{nombre_simple}Dto;
+import {base}.models.entities.{nombre_entidad};
+import {base}.models.pojos.{nombre_simple};
+import {base}.repositories.{nombre_simple}Repository;
+import {base}.utils.PatchUtils;
+import jakarta.persistence.EntityManager;
+import lombok.RequiredArgsConstructor;
+{import_cache}import org.springframework.context.ApplicationEventPublisher;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+import java.time.Instant;
+import java.util.ArrayList;
+import java.util.Arrays;
+{import_collection}import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+
+@RequiredArgsConstructor
+@Service
+public class Bulk{nombre_simple}Service {{
+    private static final int CHUNK_SIZE = {TAMANO_LOTE};
+    private static final long CON_{nombre_simple_upper} = {con_value};
+{campo_cache}
+    private final {nombre_simple}Repository repository;
+    private final EntityManager entityManager;
+    private final ApplicationEventPublisher publisher;
+{campo_cache_manager}
+    @Transactional
+    public List<{nombre_simple}Dto> createAll(final List<{nombre_simple}> newObjects) {{
+        final List<{nombre_simple}Dto> created = new ArrayList<>(newObjects.size());
+        for (int from = 0; from < newObjects.size(); from += CHUNK_SIZE) {{
+            final List<{nombre_entidad}> chunk = newObjects.subList(from, Math.min(from + CHUNK_SIZE, newObjects.size()))
+                    .stream()
+                    .map({nombre_simple}Mapper::toEntity)
+                    .toList();
+            repository.saveAll(chunk).forEach(entity -> created.add({nombre_simple}Mapper.toDto(entity)));
+            flushAndClear();
+        }}
+        newObjects.forEach(newObject -> audit(AuditAction.POST, newObject));
+        return created;
+    }}
+
+    @Transactional
+    public void patchAll(final Map<{id_tipo}, {nombre_simple}> patches) {{
+        final List<{id_tipo}> ids = new ArrayList<>(patches.keySet());
+        for (int from = 0; from < ids.size(); from += CHUNK_SIZE) {{
+            final List<{nombre_entidad}> patched = new ArrayList<>();
+            for (final Map.Entry<{id_tipo}, {nombre_entidad}> existing : findAll(ids.subList(from, Math.min(from + CHUNK_SIZE, ids.size()))).entrySet()) {{
+                final {nombre_entidad} patchedEntity = {nombre_simple}Mapper.toEntity(patches.get(existing.getKey()));
+                patched.add(PatchUtils.merge(existing.getValue(), patchedEntity));
+            }}
+            repository.saveAll(patched);
+            flushAndClear();
+        }}
+        patches.forEach((id, patch) -> audit(AuditAction.PATCH, id, patch));{evict}
+    }}
+
+    @Transactional
+    public void deleteAll(final List<{id_tipo}> ids) {{
+        for (int from = 0; from < ids.size(); from += CHUNK_SIZE) {{
+            repository.deleteAll(findAll(ids.subList(from, Math.min(from + CHUNK_SIZE, ids.size()))).values());
+            flushAndClear();
+        }}
+        ids.forEach(id -> audit(AuditAction.DELETE, id));{evict}
+    }}
+
+    private Map<{id_tipo}, {nombre_entidad}> findAll(final List<{id_tipo}> ids) {{
+        final Map<{id_tipo}, {nombre_entidad}> found = new HashMap<>();
+        repository.findAllById(ids).forEach(entity -> found.put(entity.{getter(id_atributo[0], id_nombre)}(), entity));
+        for (final {id_tipo} id : ids) {{
+            if (!found.containsKey(id)) {{
+                throw new CwsException("Not found " + id);
+            }}
+        }}
+        return found;
+    }}
+
+    private void flushAndClear() {{
+        entityManager.flush();
+        entityManager.clear();
+    }}
+
+    private void audit(final AuditAction action, final Object... arguments) {{
+        publisher.publishEvent(new AuditEvent(CON_{nombre_simple_upper}, action, Arrays.asList(arguments), Instant.now()));
+    }}{metodo_evict}
+}}
+"""
+
+def generar_propiedades_bulk():
+    """
+    Fragmento de application.properties con el JDBC batching que necesitan los servicios masivos.
+    """
+    return f"""# Configuración de JDBC batching para los endpoints /batch generados.
+# Con @GeneratedValue(strategy = GenerationType.IDENTITY) Hibernate no puede agrupar los INSERT;
+# para aprovechar el batching en altas masivas, usar SEQUENCE con allocationSize >= {TAMANO_LOTE}.
+spring.jpa.properties.hibernate.jdbc.batch_size={TAMANO_LOTE}
+spring.jpa.properties.hibernate.order_inserts=true
+spring.jpa.properties.hibernate.order_updates=true
+spring.jpa.properties.hibernate.jdbc.batch_versioned_data=true
+"""
@@ -0,0 +1,138 @@
+import re
+
+# Valores por defecto de cada caché de Caffeine
+CACHE_TAMANO = 1000
+CACHE_TTL_SEGUNDOS = 600
+
+
+def nombre_cache(nombre_entidad):
+    """
+    Nombre de la caché de una entidad; coincide con su ruta REST: "PatientEntity" -> "patients".
+    """
+    return nombre_entidad.replace("Entity", "").lower() + "s"
+
+def configurar_cache(valor):
+    """
+    Normaliza la opción "cache" de la selección: false/None desactiva la caché, true usa los
+    valores por defecto y un diccionario admite "tamano", "ttl_segundos" e "hibernate".
+    Retorna {"tamano", "ttl_segundos", "hibernate"} o None.
+    """
+    if not valor:
+        return None
+    opciones = valor if isinstance(valor, dict) else {}
+    return {
+        "tamano": int(opciones.get("tamano", CACHE_TAMANO)),
+        "ttl_segundos": int(opciones.get("ttl_segundos", CACHE_TTL_SEGUNDOS)),
+        "hibernate": bool(opciones.get("hibernate", False)),
+    }
+
+def anotacion_cacheable(cache):
+    """
+    Anotación de lectura cacheada por id (primer parámetro).
+    Retorna (importación, anotación).
+    """
+    return (
+        "import org.springframework.cache.annotation.Cacheable;\n",
+        f'    @Cacheable(cacheNames = "{cache}", key = "#p0")\n',
+    )
+
+def anotacion_evict(cache):
+    """
+    Anotación de escritura que invalida solo la clave del id (primer parámetro) antes y después de
+    la operación: la primera evita servir la versión antigua mientras dura la escritura y la segunda
+    descarta la que se haya cacheado entretanto. Con TransactionAwareCacheManagerProxy
+    (ver generar_cache_config) la segunda se aplica tras el commit.
+    Retorna (importaciones, anotación).
+    """
+    return (
+        "import org.springframework.cache.annotation.CacheEvict;\nimport org.springframework.cache.annotation.Caching;\n",
+        f"""    @Caching(evict = {{
+            @CacheEvict(cacheNames = "{cache}", key = "#p0", beforeInvocation = true),
+            @CacheEvict(cacheNames = "{cache}", key = "#p0")
+    }})
+""",
+    )
+
+def generar_cache_config(base, caches, por_defecto=None):
+    """
+    Configuración de Caffeine con una caché por entidad.
+    caches es un diccionario {nombre de la caché: opciones de configurar_cache} y por_defecto, las
+    opciones de las cachés que no estén registradas explícitamente.
+    El CacheManager se envuelve en un TransactionAwareCacheManagerProxy para que las
+    invalidaciones hechas dentro de una transacción se apliquen tras el commit.
+    """
+    por_defecto = por_defecto or configurar_cache(True)
+    registros = "".join(
+        f'\n        cacheManager.registerCustomCache("{nombre}", Caffeine.newBuilder()'
+        f'\n                .maximumSize({opciones["tamano"]})'
+        f'\n                .expireAfterWrite(Duration.ofSeconds({opciones["ttl_segundos"]}))'
+        f'\n                .build());'
+        for nombre, opciones in sorted(caches.items())
+    )
+    return f"""package {base}.config;
+
+import com.github.benmanes.caffeine.cache.Caffeine;
+import org.springframework.cache.CacheManager;
+import org.springframework.cache.annotation.EnableCaching;
+import org.springframework.cache.caffeine.CaffeineCacheManager;
+import org.springframework.cache.transaction.TransactionAwareCacheManagerProxy;
+import org.springframework.context.annotation.Bean;
+import org.springframework.context.annotation.Configuration;
+
+import java.time.Duration;
+
+@EnableCaching
+@Configuration
+public class CacheConfig {{
+
+    @Bean
+    public CacheManager cacheManager() {{
+        final CaffeineCacheManager cacheManager = new CaffeineCacheManager();
+        cacheManager.setCaffeine(Caffeine.newBuilder()
+                .maximumSize({por_defecto["tamano"]})
+                .expireAfterWrite(Duration.ofSeconds({por_defecto["ttl_segundos"]})));{registros}
+        return new TransactionAwareCacheManagerProxy(cacheManager);
+    }}
+}}
+"""
+
+def anotar_entidad_l2(codigo_java):
+    """
+    Añade a la copia de la entidad las anotaciones de la caché de segundo nivel de Hibernate
+    (@Cacheable y @Cache READ_WRITE) justo antes de la declaración de la clase.
+    Si la entidad ya tiene @Cache, se devuelve sin cambios.
+    """
+    if re.search(r'@Cache\b', codigo_java):
+        return codigo_java
+    importaciones = ("import jakarta.persistence.Cacheable;\n"
+                     "import org.hibernate.annotations.Cache;\n"
+                     "import org.hibernate.annotations.CacheConcurrencyStrategy;\n")
+    primera = re.search(r'^import\s', codigo_java, re.MULTILINE)
+    if primera:
+        codigo_java = codigo_java[:primera.start()] + importaciones + codigo_java[primera.start():]
+    else:
+        paquete = re.search(r'package\s+[\w\.]+;\s*\n', codigo_java)
+        posicion = paquete.end() if paquete else 0
+        codigo_java = codigo_java[:posicion] + "\n" + importaciones + "\n" + codigo_java[posicion:]
+    return re.sub(
+        r'^([ \t]*)(public\s+class\s)',
+        r'\1@Cacheable\n\1@Cache(usage = CacheConcurrencyStrategy.READ_WRITE)\n\1\2',
+        codigo_java,
+        count=1,
+        flags=re.MULTILINE,
+    )
+
+def generar_propiedades_l2():
+    """
+    Fragmento de application.properties para la caché de segundo nivel de Hibernate con Caffeine (JCache).
+    """
+    return """# Caché de segundo nivel de Hibernate para las entidades anotadas con @Cache.
+# Requiere las dependencias org.hibernate.orm:hibernate-jcache y com.github.ben-manes.caffeine:jcache.
+spring.jpa.properties.hibernate.cache.use_second_level_cache=true
+spring.jpa.properties.hibernate.cache.region.factory_class=jcache
+spring.jpa.properties.hibernate.javax.cache.provider=com.github.benmanes.caffeine.jcache.spi.CaffeineCachingProvider
+spring.jpa.properties.hibernate.javax.cache.missing_cache_strategy=create
+spring.jpa.properties.jakarta.persistence.sharedCache.mode=ENABLE_SELECTIVE
+# Necesario solo si alguna entidad usa "cache_consultas"
+spring.jpa.properties.hibernate.cache.use_query_cache=true
+"""
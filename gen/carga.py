@@ -0,0 +1,251 @@
+from gen.nombres import envolver
+from gen.specification import operadores_atributo
+
+# Perfiles de carga: etapas de k6 como fracciones (duración, VUs) de la duración y los VUs configurados
+PERFILES_CARGA = {
+    "constante": [(0.1, 1.0), (0.8, 1.0), (0.1, 0.0)],
+    "rampa": [(0.3, 1.0), (0.6, 1.0), (0.1, 0.0)],
+    "pico": [(0.2, 0.2), (0.1, 1.0), (0.2, 1.0), (0.1, 0.2), (0.3, 0.2), (0.1, 0.0)],
+}
+CARGA_VUS = 20
+CARGA_DURACION_SEGUNDOS = 120
+LONGITUD_TEXTO = 20
+
+# Generadores de valores del script por tipo Java (funciones definidas en la cabecera del script)
+GENERADORES_JS = {
+    "String": "texto({longitud})",
+    "Integer": "entero(1, 1000)", "int": "entero(1, 1000)",
+    "Long": "entero(1, 100000)", "long": "entero(1, 100000)",
+    "Short": "entero(1, 100)", "short": "entero(1, 100)",
+    "Byte": "entero(1, 100)", "byte": "entero(1, 100)",
+    "Double": "decimal()", "double": "decimal()",
+    "Float": "decimal()", "float": "decimal()",
+    "BigDecimal": "decimal()",
+    "BigInteger": "entero(1, 100000)",
+    "Boolean": "Math.random() < 0.5", "boolean": "Math.random() < 0.5",
+    "LocalDate": "fecha()",
+    "LocalDateTime": "fechaHora()",
+    "OffsetDateTime": "fechaHora() + 'Z'",
+    "ZonedDateTime": "fechaHora() + 'Z'",
+    "Instant": "fechaHora() + 'Z'",
+    "UUID": "uuidv4()",
+}
+
+# Funciones de la cabecera del script que solo se incluyen si algún generador las usa.
+# entero() se incluye siempre: la usa también la elección de la consulta de búsqueda.
+FUNCIONES_JS = {
+    "decimal": """function decimal() {
+  return Math.round(Math.random() * 100000) / 100;
+}""",
+    "texto": """function texto(longitud) {
+  const caracteres = 'abcdefghijklmnopqrstuvwxyz';
+  const total = entero(1, longitud);
+  let resultado = '';
+  for (let i = 0; i < total; i++) {
+    resultado += caracteres.charAt(entero(0, caracteres.length - 1));
+  }
+  return resultado;
+}""",
+    "fecha": """function fecha() {
+  return new Date(Date.UTC(entero(1950, 2024), entero(0, 11), entero(1, 28))).toISOString().substring(0, 10);
+}""",
+    "fechaHora": """function fechaHora() {
+  return new Date(Date.UTC(entero(2000, 2024), entero(0, 11), entero(1, 28), entero(0, 23), entero(0, 59))).toISOString().substring(0, 19);
+}""",
+}
+IMPORTACION_UUID_JS = "import { uuidv4 } from 'https://jslib.k6.io/k6-utils/1.4.0/index.js';"
+
+
+def configurar_carga(valor):
+    """
+    Normaliza la opción "carga" de la selección: true usa los valores por defecto y un diccionario
+    admite "perfil" (constante, rampa o pico), "vus" y "duracion_segundos".
+    Retorna {"perfil", "vus", "duracion_segundos"} o None.
+    """
+    if not valor:
+        return None
+    opciones = valor if isinstance(valor, dict) else {}
+    perfil = opciones.get("perfil", "rampa")
+    if perfil not in PERFILES_CARGA:
+        raise ValueError(f"Perfil de carga desconocido: {perfil}. Opciones: {', '.join(PERFILES_CARGA)}")
+    return {
+        "perfil": perfil,
+        "vus": int(opciones.get("vus", CARGA_VUS)),
+        "duracion_segundos": int(opciones.get("duracion_segundos", CARGA_DURACION_SEGUNDOS)),
+    }
+
+def etapas_carga(opciones):
+    """
+    Etapas de k6 (ramping-vus) del perfil escalado a la duración y los VUs configurados.
+    """
+    return [
+        {"duration": f"{max(1, round(fraccion * opciones['duracion_segundos']))}s", "target": round(vus * opciones["vus"])}
+        for fraccion, vus in PERFILES_CARGA[opciones["perfil"]]
+    ]
+
+def generador_valor(tipo, longitud=None):
+    """
+    Expresión JavaScript que genera un valor aleatorio válido para el tipo Java, respetando la
+    longitud máxima de @Size en los String. Retorna None si el tipo no se puede generar
+    (enums, relaciones, embebidos y colecciones).
+    """
+    if tipo not in GENERADORES_JS:
+        return None
+    return GENERADORES_JS[tipo].format(longitud=longitud or LONGITUD_TEXTO)
+
+def cuerpo_peticion(atributos_pojo, constantes, id_nombre=None):
+    """
+    Campos del cuerpo JSON de POST y PATCH a partir de los atributos del POJO (tipo, nombre, constante).
+    Retorna (campos, omitidos) con campos como tuplas (nombre, expresión JavaScript).
+    """
+    campos = []
+    omitidos = []
+    for tipo, nombre, constante in atributos_pojo:
+        if nombre == id_nombre:
+            continue
+        longitud = int(constante) if constante and constante.isdigit() else constantes.get(constante)
+        expresion = generador_valor(tipo, longitud)
+        if expresion is None:
+            omitidos.append(nombre)
+        else:
+            campos.append((nombre, expresion))
+    return campos, omitidos
+
+def consultas_busqueda(atributos_search, id_atributo=None, enums=None):
+    """
+    Consultas de GET /1.0/<ruta>: una por atributo de búsqueda con su filtro más selectivo que se
+    pueda generar (prefijo en String, rango abierto en números y fechas, igualdad en el resto).
+    Retorna una lista de tuplas (nombre de la consulta, [(parámetro, expresión JavaScript)]).
+    """
+    id_nombre = id_atributo[1] if id_atributo else None
+    consultas = []
+    for tipo, nombre in atributos_search:
+        propios = {operador: (campo, tipo_campo) for campo, tipo_campo, operador, _
+                   in operadores_atributo(tipo, nombre, nombre == id_nombre, enums)}
+        if "startsWith" in propios:
+            parametros = [(propios["startsWith"][0], "texto(3)")]
+        elif "from" in propios:
+            parametros = [(propios["from"][0], generador_valor(envolver(tipo)))]
+        else:
+            expresion = generador_valor(envolver(tipo))
+            parametros = [(nombre, expresion)] if expresion else []
+        if parametros:
+            consultas.append((nombre, parametros))
+    return consultas
+
+def generar_script_k6(nombre_entidad, id_atributo, campos, consultas, opciones, paginacion="page"):
+    """
+    Escenario de k6 que recorre el ciclo de vida completo de la entidad en cada iteración:
+    POST, GET con una consulta de búsqueda aleatoria, PATCH y DELETE del registro creado.
+    Cada petición se etiqueta con su endpoint para obtener percentiles por operación, y los
+    umbrales (p95 y tasa de errores) hacen fallar la ejecución si se supera la línea base.
+    La cabecera solo define las funciones auxiliares (y la importación remota de uuidv4) que
+    usan los campos y las consultas.
+    """
+    nombre_simple = nombre_entidad.replace("Entity", "")
+    ruta = nombre_simple.lower() + "s"
+    id_nombre = id_atributo[1] if id_atributo else "id"
+    cuerpo = ",\n".join(f"        {nombre}: {expresion}" for nombre, expresion in campos)
+    lista_consultas = ",\n".join(
+        "    () => `" + "&".join(f"{parametro}=${{encodeURIComponent({expresion})}}" for parametro, expresion in parametros) + "`"
+        for _, parametros in consultas
+    ) or "    () => ''"
+    pagina = "size=20" if paginacion == "keyset" else "page=0&size=20"
+    expresiones = [expresion for _, expresion in campos] + [
+        expresion for _, parametros in consultas for _, expresion in parametros
+    ]
+    funciones = "".join(
+        f"\n\n{codigo}" for nombre, codigo in FUNCIONES_JS.items()
+        if any(f"{nombre}(" in expresion for expresion in expresiones)
+    )
+    importacion_uuid = f"\n{IMPORTACION_UUID_JS}" if any("uuidv4(" in expresion for expresion in expresiones) else ""
+    etapas = "".join(
+        f"\n        {{ duration: '{etapa['duration']}', target: {etapa['target']} }}," for etapa in etapas_carga(opciones)
+    )
+    return f"""// Prueba de carga de /1.0/{ruta} (generada). Perfil "{opciones['perfil']}" con {opciones['vus']} VUs.
+// Ejecutar con: k6 run -e BASE_URL=http://localhost:8080 {nombre_simple}.js
+import http from 'k6/http';
+import {{ check }} from 'k6';{importacion_uuid}
+
+const BASE_URL = __ENV.BASE_URL || 'http://localhost:8080';
+const URL = `${{BASE_URL}}/1.0/{ruta}`;
+const HEADERS = {{ 'Content-Type': 'application/json' }};
+
+export const options = {{
+  scenarios: {{
+    {ruta}: {{
+      executor: 'ramping-vus',
+      startVUs: 0,
+      stages: [{etapas}
+      ],
+    }},
+  }},
+  thresholds: {{
+    http_req_failed: ['rate<0.01'],
+    'http_req_duration{{name:POST /1.0/{ruta}}}': ['p(95)<500'],
+    'http_req_duration{{name:GET /1.0/{ruta}}}': ['p(95)<300'],
+    'http_req_duration{{name:PATCH /1.0/{ruta}/{{id}}}}': ['p(95)<500'],
+    'http_req_duration{{name:DELETE /1.0/{ruta}/{{id}}}}': ['p(95)<500'],
+  }},
+}};
+
+function entero(min, max) {{
+  return Math.floor(Math.random() * (max - min + 1)) + min;
+}}{funciones}
+
+function cuerpo() {{
+  return JSON.stringify({{
+{cuerpo}
+  }});
+}}
+
+const CONSULTAS = [
+{lista_consultas}
+];
+
+export default function () {{
+  const creado = http.post(URL, cuerpo(), {{ headers: HEADERS, tags: {{ name: 'POST /1.0/{ruta}' }} }});
+  check(creado, {{ 'POST 201': (r) => r.status === 201 }});
+
+  const consulta = CONSULTAS[entero(0, CONSULTAS.length - 1)]();
+  const busqueda = http.get(`${{URL}}?{pagina}&${{consulta}}`, {{ tags: {{ name: 'GET /1.0/{ruta}' }} }});
+  check(busqueda, {{ 'GET 200': (r) => r.status === 200 }});
+
+  if (creado.status !== 201) {{
+    return;
+  }}
+  const id = creado.json('{id_nombre}');
+  const parcheado = http.patch(`${{URL}}/${{id}}`, cuerpo(), {{ headers: HEADERS, tags: {{ name: 'PATCH /1.0/{ruta}/{{id}}' }} }});
+  check(parcheado, {{ 'PATCH 204': (r) => r.status === 204 }});
+  const borrado = http.del(`${{URL}}/${{id}}`, null, {{ tags: {{ name: 'DELETE /1.0/{ruta}/{{id}}' }} }});
+  check(borrado, {{ 'DELETE 204': (r) => r.status === 204 }});
+}}
+"""
+
+def generar_docker_compose_carga():
+    """
+    docker-compose con una base de datos PostgreSQL local para ejecutar las pruebas de carga
+    contra la aplicación arrancada en local, y k6 montando los scripts.
+    """
+    return """# Base de datos local para las pruebas de carga (generado).
+# 1. docker compose up -d postgres
+# 2. Arrancar la aplicación con SPRING_DATASOURCE_URL=jdbc:postgresql://localhost:5432/cws
+# 3. docker compose run --rm k6 run /scripts/<Entidad>.js
+services:
+  postgres:
+    image: postgres:16
+    environment:
+      POSTGRES_DB: cws
+      POSTGRES_USER: cws
+      POSTGRES_PASSWORD: cws
+    ports:
+      - "5432:5432"
+  k6:
+    image: grafana/k6:latest
+    environment:
+      BASE_URL: http://host.docker.internal:8080
+    extra_hosts:
+      - "host.docker.internal:host-gateway"
+    volumes:
+      - ./:/scripts
+"""
@@ -2,35 +2,57 @@ import os
 import re
 import inquirer
 
-def extraer_base_paquete(paquete):
-    """
-    Extrae la base del package, por ejemplo:
-    de "com.inycom.cws.models.entities" retorna "com.inycom.cws"
-    """
-    parts = paquete.split('.')
-    if len(parts) >= 3:
-        return '.'.join(parts[:3])
-    return paquete
+from gen.auditoria import anotacion_auditoria
+from gen.nombres import extraer_base_paquete
 
-def generar_get_controller(nombre_entidad, paquete):
+def generar_get_controller(nombre_entidad, paquete, paginacion="page"):
     """
     Controller que maneja GET /1.0/<ruta> con paginación y un modelo de búsqueda.
     (No utiliza la constante compartida).
+    Con paginacion="slice" no hay consulta de conteo: se devuelve el contenido y la
+    cabecera X-Has-Next indica si existe una página siguiente.
+    Con paginacion="keyset" se reciben los parámetros cursor y size, y la cabecera
+    X-Next-Cursor devuelve el cursor de la página siguiente.
     """
     base = extraer_base_paquete(paquete)
     nombre_simple = nombre_entidad.replace("Entity", "")
     ruta = nombre_simple.lower() + "s"
+    import_cursor = ""
+    import_request_param = ""
+    parametros = f"""final {nombre_simple}SearchModel searchModel,
+                                                              final Pageable pageable"""
+    if paginacion == "slice":
+        importaciones = "import org.springframework.data.domain.Pageable;\nimport org.springframework.data.domain.Slice;\n"
+        cuerpo = f"""final Slice<{nombre_simple}Dto> slice = service.search(searchModel, pageable);
+        return ResponseEntity.ok()
+                .header("X-Has-Next", String.valueOf(slice.hasNext()))
+                .body(slice.getContent());"""
+    elif paginacion == "keyset":
+        import_cursor = f"import {base}.search.{nombre_simple}Cursor;\n"
+        importaciones = "import org.springframework.data.domain.Window;\n"
+        import_request_param = "import org.springframework.web.bind.annotation.RequestParam;\n"
+        parametros = f"""final {nombre_simple}SearchModel searchModel,
+                                                              @RequestParam(required = false) final String cursor,
+                                                              @RequestParam(defaultValue = "20") final int size"""
+        cuerpo = f"""final Window<{nombre_simple}Dto> window = service.search(searchModel, {nombre_simple}Cursor.decode(cursor), size);
+        final ResponseEntity.BodyBuilder response = ResponseEntity.ok();
+        if (window.hasNext() && !window.isEmpty()) {{
+            response.header("X-Next-Cursor", {nombre_simple}Cursor.encode(window.positionAt(window.size() - 1)));
+        }}
+        return response.body(window.getContent());"""
+    else:
+        importaciones = "import org.springframework.data.domain.Pageable;\n"
+        cuerpo = "return ResponseEntity.ok(service.search(searchModel, pageable));"
     return f"""package {base}.controllers;
 
 import {base}.models.dtos.{nombre_simple}Dto;
-import {base}.search.{nombre_simple}SearchModel;
+{import_cursor}import {base}.search.{nombre_simple}SearchModel;
 import {base}.services.Search{nombre_simple}Service;
 import lombok.RequiredArgsConstructor;
-import org.springframework.data.domain.Pageable;
-import org.springframework.http.ResponseEntity;
+{importaciones}import org.springframework.http.ResponseEntity;
 import org.springframework.web.bind.annotation.GetMapping;
 import org.springframework.web.bind.annotation.RequestMapping;
-import org.springframework.web.bind.annotation.RestController;
+{import_request_param}import org.springframework.web.bind.annotation.RestController;
 
 import java.util.Collection;
 
@@ -42,25 +64,26 @@ public class Get{nombre_simple}Controller {{
     private final Search{nombre_simple}Service service;
 
     @GetMapping
-    public ResponseEntity<Collection<{nombre_simple}Dto>> get(final {nombre_simple}SearchModel searchModel,
-                                                              final Pageable pageable) {{
-        return ResponseEntity.ok(service.search(searchModel, pageable));
+    public ResponseEntity<Collection<{nombre_simple}Dto>> get({parametros}) {{
+        {cuerpo}
     }}
 }}
 """
 
-def generar_post_controller(nombre_entidad, paquete, con_value):
+def generar_post_controller(nombre_entidad, paquete, con_value, auditoria="sync"):
     """
     Controller que maneja POST /1.0/<ruta>, usando un DTO, un POJO y auditoría.
     Usa la constante compartida que se asigna desde consola.
+    Con auditoria="async" se anota con @AsyncAudit en lugar de @Audit (ver gen/auditoria.py).
     """
     base = extraer_base_paquete(paquete)
     nombre_simple = nombre_entidad.replace("Entity", "")
     ruta = nombre_simple.lower() + "s"
     nombre_simple_upper = nombre_simple.upper()
+    anotacion = anotacion_auditoria(auditoria)
     return f"""package {base}.controllers;
 
-import {base}.annotations.Audit;
+import {base}.annotations.{anotacion};
 import {base}.enums.AuditAction;
 import {base}.models.dtos.{nombre_simple}Dto;
 import {base}.models.pojos.{nombre_simple};
@@ -79,7 +102,7 @@ public class Post{nombre_simple}Controller {{
 
     private final Create{nombre_simple}Service service;
 
-    @Audit(controllerId = CON_{nombre_simple_upper}, action = AuditAction.POST)
+    @{anotacion}(controllerId = CON_{nombre_simple_upper}, action = AuditAction.POST)
     @PostMapping
     public ResponseEntity<{nombre_simple}Dto> create(@Valid @RequestBody {nombre_simple} newObject) {{
         return new ResponseEntity<>(service.create(newObject), HttpStatus.CREATED);
@@ -87,19 +110,21 @@ public class Post{nombre_simple}Controller {{
 }}
 """
 
-def generar_patch_controller(nombre_entidad, paquete, con_value):
+def generar_patch_controller(nombre_entidad, paquete, con_value, id_tipo="Long", auditoria="sync"):
     """
     Controller que maneja PATCH /1.0/<ruta> usando auditoría y responde sin contenido.
     Usa la constante compartida asignada desde consola.
+    Con auditoria="async" se anota con @AsyncAudit en lugar de @Audit.
     """
     base = extraer_base_paquete(paquete)
     nombre_simple = nombre_entidad.replace("Entity", "")
     ruta = nombre_simple.lower() + "s"
     nombre_simple_upper = nombre_simple.upper()
+    anotacion = anotacion_auditoria(auditoria)
     nombre_var = nombre_simple[0].lower() + nombre_simple[1:]
     return f"""package {base}.controllers;
 
-import {base}.annotations.Audit;
+import {base}.annotations.{anotacion};
 import {base}.enums.AuditAction;
 import {base}.models.pojos.{nombre_simple};
 import {base}.services.Patch{nombre_simple}Service;
@@ -118,28 +143,30 @@ public class Patch{nombre_simple}Controller {{
     private static final long CON_{nombre_simple_upper} = {con_value};
     private final Patch{nombre_simple}Service service;
 
-    @Audit(controllerId = CON_{nombre_simple_upper}, action = AuditAction.PATCH)
+    @{anotacion}(controllerId = CON_{nombre_simple_upper}, action = AuditAction.PATCH)
     @PatchMapping("/{{{nombre_var}Id}}")
-    public ResponseEntity<Void> patch(@PathVariable final Long {nombre_var}Id, @RequestBody final {nombre_simple} {nombre_var}) {{
+    public ResponseEntity<Void> patch(@PathVariable final {id_tipo} {nombre_var}Id, @RequestBody final {nombre_simple} {nombre_var}) {{
         service.patch({nombre_var}Id, {nombre_var});
         return ResponseEntity.noContent().build();
     }}
 }}
 """
 
-def generar_delete_controller(nombre_entidad, paquete, con_value):
+def generar_delete_controller(nombre_entidad, paquete, con_value, id_tipo="Long", auditoria="sync"):
     """
     Controller que maneja DELETE /1.0/<ruta> usando auditoría y responde sin contenido.
     Usa la constante compartida asignada desde consola.
+    Con auditoria="async" se anota con @AsyncAudit en lugar de @Audit.
     """
     base = extraer_base_paquete(paquete)
     nombre_simple = nombre_entidad.replace("Entity", "")
     ruta = nombre_simple.lower() + "s"
     nombre_simple_upper = nombre_simple.upper()
+    anotacion = anotacion_auditoria(auditoria)
     nombre_var = nombre_simple[0].lower() + nombre_simple[1:]
     return f"""package {base}.controllers;
 
-import {base}.annotations.Audit;
+import {base}.annotations.{anotacion};
 import {base}.enums.AuditAction;
 import {base}.services.Delete{nombre_simple}Service;
 import lombok.RequiredArgsConstructor;
@@ -156,9 +183,9 @@ public class Delete{nombre_simple}Controller {{
     private static final long CON_{nombre_simple_upper} = {con_value};
     private final Delete{nombre_simple}Service service;
 
-    @Audit(controllerId = CON_{nombre_simple_upper}, action = AuditAction.DELETE)
+    @{anotacion}(controllerId = CON_{nombre_simple_upper}, action = AuditAction.DELETE)
     @DeleteMapping("/{{{nombre_var}Id}}")
-    public ResponseEntity<Void> delete(@PathVariable final Long {nombre_var}Id) {{
+    public ResponseEntity<Void> delete(@PathVariable final {id_tipo} {nombre_var}Id) {{
         service.delete({nombre_var}Id);
         return ResponseEntity.noContent().build();
     }}
@@ -0,0 +1,100 @@
+from gen.nombres import extraer_base_paquete
+
+# Conversión del texto del cursor al tipo Java de cada columna de la clave
+CONVERSORES_CURSOR = {
+    "Long": ("Long.valueOf({valor})", None),
+    "long": ("Long.valueOf({valor})", None),
+    "Integer": ("Integer.valueOf({valor})", None),
+    "int": ("Integer.valueOf({valor})", None),
+    "Short": ("Short.valueOf({valor})", None),
+    "Double": ("Double.valueOf({valor})", None),
+    "Float": ("Float.valueOf({valor})", None),
+    "String": ("{valor}", None),
+    "BigDecimal": ("new BigDecimal({valor})", "import java.math.BigDecimal;"),
+    "BigInteger": ("new BigInteger({valor})", "import java.math.BigInteger;"),
+    "LocalDate": ("LocalDate.parse({valor})", "import java.time.LocalDate;"),
+    "LocalDateTime": ("LocalDateTime.parse({valor})", "import java.time.LocalDateTime;"),
+    "OffsetDateTime": ("OffsetDateTime.parse({valor})", "import java.time.OffsetDateTime;"),
+    "Instant": ("Instant.parse({valor})", "import java.time.Instant;"),
+    "UUID": ("UUID.fromString({valor})", "import java.util.UUID;"),
+}
+
+
+def generar_cursor(nombre_entidad, paquete, id_atributo, orden_atributo=None):
+    """
+    Genera {X}Cursor, que traduce entre el token opaco del cursor (Base64 URL-safe) y el
+    KeysetScrollPosition de Spring Data usado en la paginación keyset.
+    La clave es el @Id o, si se indica una columna de orden, (columna, @Id); el @Id se
+    codifica primero para que el valor de la columna pueda contener cualquier carácter.
+    Los atributos son tuplas (tipo, nombre). La columna de orden no debe admitir nulos.
+    """
+    if not id_atributo:
+        raise ValueError(f"La paginación keyset de {nombre_entidad} necesita un atributo anotado con @Id")
+    base = extraer_base_paquete(paquete)
+    nombre_simple = nombre_entidad.replace("Entity", "")
+
+    importaciones = {
+        "import lombok.experimental.UtilityClass;",
+        "import org.springframework.data.domain.KeysetScrollPosition;",
+        "import org.springframework.data.domain.ScrollPosition;",
+        "import org.springframework.data.domain.Sort;",
+        "import java.nio.charset.StandardCharsets;",
+        "import java.util.Base64;",
+        "import java.util.LinkedHashMap;",
+        "import java.util.Map;",
+    }
+
+    claves = [id_atributo] + ([orden_atributo] if orden_atributo else [])
+    for tipo, nombre in claves:
+        if tipo not in CONVERSORES_CURSOR:
+            raise ValueError(f"Tipo no soportado en la clave keyset de {nombre_entidad}: {tipo} {nombre}")
+        importacion = CONVERSORES_CURSOR[tipo][1]
+        if importacion:
+            importaciones.add(importacion)
+
+    id_tipo, id_nombre = id_atributo
+    orden_sort = f'"{orden_atributo[1]}", "{id_nombre}"' if orden_atributo else f'"{id_nombre}"'
+    conversion_id = CONVERSORES_CURSOR[id_tipo][0].format(valor="values[0]")
+    if orden_atributo:
+        orden_tipo, orden_nombre = orden_atributo
+        conversion_orden = CONVERSORES_CURSOR[orden_tipo][0].format(valor="values[1]")
+        decode_claves = f"""        keys.put("{orden_nombre}", {conversion_orden});
+        keys.put("{id_nombre}", {conversion_id});"""
+        encode_valor = f'keys.get("{id_nombre}") + "|" + keys.get("{orden_nombre}")'
+        partes = 2
+    else:
+        decode_claves = f"""        keys.put("{id_nombre}", {conversion_id});"""
+        encode_valor = f'String.valueOf(keys.get("{id_nombre}"))'
+        partes = 1
+
+    propias = sorted(i for i in importaciones if not i.startswith("import java."))
+    java = sorted(i for i in importaciones if i.startswith("import java."))
+
+    return f"""package {base}.search;
+
+{chr(10).join(propias)}
+
+{chr(10).join(java)}
+
+@UtilityClass
+public class {nombre_simple}Cursor {{
+
+    public static final Sort SORT = Sort.by({orden_sort});
+
+    public static ScrollPosition decode(final String cursor) {{
+        if (cursor == null || cursor.isBlank()) {{
+            return ScrollPosition.keyset();
+        }}
+        final String[] values = new String(Base64.getUrlDecoder().decode(cursor), StandardCharsets.UTF_8).split("\\\\|", {partes});
+        final Map<String, Object> keys = new LinkedHashMap<>();
+{decode_claves}
+        return ScrollPosition.forward(keys);
+    }}
+
+    public static String encode(final ScrollPosition position) {{
+        final Map<String, Object> keys = ((KeysetScrollPosition) position).getKeys();
+        final String value = {encode_valor};
+        return Base64.getUrlEncoder().withoutPadding().encodeToString(value.getBytes(StandardCharsets.UTF_8));
+    }}
+}}
+"""
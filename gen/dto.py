@@ -1,64 +1,23 @@
 import os
-import re
 import inquirer
 
-def extraer_atributos(codigo_java):
-    """
-    Extrae todos los atributos de la clase Java.
-    Retorna una lista de tuplas (tipo, nombre).
-    """
-    return re.findall(r'private\s+([\w<>]+)\s+(\w+);', codigo_java)
-
-def extraer_embedded_atributos(codigo_java):
-    """
-    Extrae de la entidad los atributos que están anotados con @Embedded.
-    Retorna una lista de tuplas (tipo, nombre).
-    """
-    return re.findall(r'@Embedded\s+private\s+([\w<>]+)\s+(\w+);', codigo_java)
-
-def extraer_id_atributo(codigo_java):
-    """
-    Extrae el atributo que está anotado con @Id, incluso si tiene anotaciones intermedias.
-    Retorna una tupla (tipo, nombre) si se encuentra, o None en caso contrario.
-    Se permite que entre @Id y "private" haya anotaciones que contengan cualquier carácter.
-    """
-    pattern = r'@Id(?:\s*\n\s*@.*?)*\s*private\s+([\w<>]+)\s+(\w+);'
-    match = re.search(pattern, codigo_java, re.DOTALL)
-    if match:
-        return (match.group(1), match.group(2))
-    return None
+from gen.nombres import importaciones_tipos
 
-def buscar_embeddable_classes(entidades_path):
+def buscar_pojo(salida, nombre_clase):
     """
-    Busca clases anotadas con @Embeddable en la carpeta models/entities.
+    Busca el POJO de la clase entre los artefactos generados en esta ejecución, sin consultar el disco.
     """
-    embeddable_classes = set()
-    for archivo in os.listdir(entidades_path):
-        if archivo.endswith(".java"):
-            with open(os.path.join(entidades_path, archivo), "r", encoding="utf-8") as f:
-                contenido = f.read()
-                if "@Embeddable" in contenido:
-                    match = re.search(r'public\s+class\s+(\w+)', contenido)
-                    if match:
-                        embeddable_classes.add(match.group(1))
-    return embeddable_classes
+    return nombre_clase if salida.generado(os.path.join("models", "pojos", f"{nombre_clase}.java")) else None
 
-def buscar_pojo(pojos_path, nombre_clase):
-    """
-    Busca una clase en el directorio de POJOs.
-    """
-    pojo_file = os.path.join(pojos_path, f"{nombre_clase}.java")
-    if os.path.exists(pojo_file):
-        return nombre_clase
-    return None
-
-def generar_dto(nombre_entidad, paquete, atributos_seleccionados, embedded_seleccionados, pojo_clase, id_atributo):
+def generar_dto(nombre_entidad, paquete, atributos_seleccionados, embedded_seleccionados, pojo_clase, id_atributo,
+                importaciones_proyecto=None):
     """
     Genera el código del DTO en base a:
       - Los atributos seleccionados.
       - Los atributos embebidos (con @Embedded) seleccionados.
       - Extiende del POJO, importándolo desde el package derivado de la entidad.
     Solo se añade @NotNull al atributo que corresponde al id (según la anotación @Id en la entidad).
+    Los tipos de java.* y del proyecto (importaciones_proyecto) se importan.
     Cada línea (anotación y atributo) se indenta con un tabulador.
     """
     nombre_simple = nombre_entidad.replace("Entity", "")
@@ -74,6 +33,9 @@ def generar_dto(nombre_entidad, paquete, atributos_seleccionados, embedded_selec
         "import lombok.experimental.SuperBuilder;"
     ])
     
+    importaciones |= importaciones_tipos(
+        (tipo for tipo, _ in atributos_seleccionados + embedded_seleccionados), importaciones_proyecto
+    )
     if pojo_clase:
         importaciones.add(f"import {paquete.replace('models.entities', 'models.pojos')}.{pojo_clase};")
     
@@ -110,36 +72,23 @@ public class {nombre_dto}{extends_str} {{
 """
     return dto_code
 
-def generar_dto_archivo(entidad_file, dtos_path, entidades_path, pojos_path):
+def generar_dto_archivo(entidad, salida):
     """
-    Genera el DTO a partir de una entidad Java.
-    Se extraen todos los atributos y se combinan en un solo prompt:
+    Genera el DTO a partir del modelo de la entidad.
+    Se combinan todos los atributos en un solo prompt:
       - Los atributos que estén anotados con @Embedded se muestran con la etiqueta "(embedded)".
       - La selección se procesa para separar atributos normales y embebidos.
     El DTO extiende del POJO (si se encuentra) e importa dicho POJO desde el package derivado de la entidad.
+    El DTO se añade a la salida (gen/salida.py:SalidaArtefactos) en models/dtos.
     Solo se añade @NotNull al atributo que en la entidad está anotado con @Id.
     """
-    with open(entidad_file, "r", encoding="utf-8") as f:
-        codigo_java = f.read()
-    
-    nombre_entidad_match = re.search(r'public\s+class\s+(\w+)', codigo_java)
-    nombre_entidad = nombre_entidad_match.group(1) if nombre_entidad_match else None
-    
-    paquete_match = re.search(r'package\s+([\w\.]+);', codigo_java)
-    paquete = paquete_match.group(1) if paquete_match else "com.example.models.entities"
-    
-    atributos = extraer_atributos(codigo_java)
-    if not nombre_entidad or not atributos:
+    atributos = entidad.atributos
+    if not atributos:
         print("❌ Error: No se pudo extraer el nombre de la entidad o los atributos.")
         return
     
-    id_atributo = extraer_id_atributo(codigo_java)
-    
-    nombre_pojo = nombre_entidad.replace("Entity", "")
-    pojo_clase = buscar_pojo(pojos_path, nombre_pojo)
-    
-    embedded_atributos = extraer_embedded_atributos(codigo_java)
-    embedded_nombres = {nombre for _, nombre in embedded_atributos}
+    pojo_clase = buscar_pojo(salida, entidad.nombre_simple)
+    embedded_nombres = entidad.embedded_nombres
     
     choices = []
     for tipo, nombre in atributos:
@@ -169,11 +118,10 @@ def generar_dto_archivo(entidad_file, dtos_path, entidades_path, pojos_path):
                 tipo, nombre = attr.split(" ")
                 atributos_seleccionados.append((tipo, nombre))
     
-    dto_code = generar_dto(nombre_entidad, paquete, atributos_seleccionados, embedded_seleccionados, pojo_clase, id_atributo)
+    dto_code = generar_dto(entidad.nombre, entidad.paquete, atributos_seleccionados, embedded_seleccionados, pojo_clase, entidad.id_atributo,
+                           entidad.importaciones_proyecto)
     
-    os.makedirs(dtos_path, exist_ok=True)
-    dto_file = os.path.join(dtos_path, f"{nombre_entidad.replace('Entity', '')}Dto.java")
-    with open(dto_file, "w", encoding="utf-8") as f:
-        f.write(dto_code)
+    dto_file = os.path.join("models", "dtos", f"{entidad.nombre_simple}Dto.java")
+    salida.agregar(dto_file, dto_code)
     
     print(f"✅ DTO generado: {dto_file}")
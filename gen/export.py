@@ -0,0 +1,147 @@
+from gen.nombres import extraer_base_paquete, getter
+
+
+def columnas_csv(entidad, campos):
+    """
+    Columnas del CSV: los campos del DTO salvo los embebidos y las relaciones, que no tienen
+    una representación plana.
+    Retorna (columnas, omitidas) con columnas como tuplas (tipo, nombre).
+    """
+    columnas = []
+    omitidas = []
+    for tipo, nombre in campos:
+        if nombre in entidad.embedded_nombres or nombre in entidad.relaciones:
+            omitidas.append(nombre)
+        else:
+            columnas.append((tipo, nombre))
+    return columnas, omitidas
+
+def generar_export_controller(nombre_entidad, paquete):
+    """
+    Controller que maneja GET /1.0/<ruta>/export?format=ndjson|csv con el mismo modelo de búsqueda
+    que GET /1.0/<ruta>. El cuerpo se escribe con StreamingResponseBody en el hilo asíncrono de
+    Spring MVC, por lo que la transacción se abre dentro de Export{X}Service.export.
+    El tiempo máximo de la descarga lo fija spring.mvc.async.request-timeout.
+    """
+    base = extraer_base_paquete(paquete)
+    nombre_simple = nombre_entidad.replace("Entity", "")
+    ruta = nombre_simple.lower() + "s"
+    return f"""package {base}.controllers;
+
+import {base}.search.{nombre_simple}SearchModel;
+import {base}.services.Export{nombre_simple}Service;
+import lombok.RequiredArgsConstructor;
+import org.springframework.http.HttpHeaders;
+import org.springframework.http.MediaType;
+import org.springframework.http.ResponseEntity;
+import org.springframework.web.bind.annotation.GetMapping;
+import org.springframework.web.bind.annotation.RequestMapping;
+import org.springframework.web.bind.annotation.RequestParam;
+import org.springframework.web.bind.annotation.RestController;
+import org.springframework.web.servlet.mvc.method.annotation.StreamingResponseBody;
+
+@RequiredArgsConstructor
+@RestController
+@RequestMapping("/1.0/{ruta}")
+public class Export{nombre_simple}Controller {{
+    private static final MediaType TEXT_CSV = MediaType.parseMediaType("text/csv");
+
+    private final Export{nombre_simple}Service service;
+
+    @GetMapping("/export")
+    public ResponseEntity<StreamingResponseBody> export(final {nombre_simple}SearchModel searchModel,
+                                                        @RequestParam(defaultValue = "ndjson") final String format) {{
+        final boolean csv = "csv".equalsIgnoreCase(format);
+        if (!csv && !"ndjson".equalsIgnoreCase(format)) {{
+            return ResponseEntity.badRequest().build();
+        }}
+        final StreamingResponseBody body = outputStream -> service.export(searchModel, csv, outputStream);
+        return ResponseEntity.ok()
+                .contentType(csv ? TEXT_CSV : MediaType.APPLICATION_NDJSON)
+                .header(HttpHeaders.CONTENT_DISPOSITION, "attachment; filename=\\"{ruta}." + (csv ? "csv" : "ndjson") + "\\"")
+                .body(body);
+    }}
+}}
+"""
+
+def generar_export_service(nombre_entidad, paquete, columnas):
+    """
+    Servicio de exportación: recorre el Stream de streamAll (cursor en servidor con fetch size, ver
+    generar_repository_impl) dentro de una transacción de solo lectura y escribe cada fila como
+    una línea JSON o CSV. Cada entidad se desacopla tras escribirla, así que la memoria no
+    depende del número de filas.
+    columnas son las tuplas (tipo, nombre) del DTO que se escriben en el CSV (ver columnas_csv).
+    """
+    base = extraer_base_paquete(paquete)
+    nombre_simple = nombre_entidad.replace("Entity", "")
+    cabecera = ",".join(nombre for _, nombre in columnas)
+    valores = ",".join(f"\n                escape(dto.{getter(tipo, nombre)}())" for tipo, nombre in columnas)
+    return f"""package {base}.services;
+
+import com.fasterxml.jackson.databind.ObjectMapper;
+import {base}.factories.ObjectMapperFactory;
+import {base}.factories.{nombre_simple}SpecificationFactory;
+import {base}.mappers.{nombre_simple}Mapper;
+import {base}.models.dtos.{nombre_simple}Dto;
+import {base}.models.entities.{nombre_entidad};
+import {base}.repositories.{nombre_simple}Repository;
+import {base}.search.{nombre_simple}SearchModel;
+import jakarta.persistence.EntityManager;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+import java.io.BufferedWriter;
+import java.io.IOException;
+import java.io.OutputStream;
+import java.io.OutputStreamWriter;
+import java.io.Writer;
+import java.nio.charset.StandardCharsets;
+import java.util.Iterator;
+import java.util.stream.Stream;
+
+@RequiredArgsConstructor
+@Service
+public class Export{nombre_simple}Service {{
+    private static final ObjectMapper OBJECT_MAPPER = ObjectMapperFactory.create();
+    private static final String CSV_HEADER = "{cabecera}";
+
+    private final {nombre_simple}Repository repository;
+    private final EntityManager entityManager;
+
+    @Transactional(readOnly = true)
+    public void export(final {nombre_simple}SearchModel searchModel, final boolean csv, final OutputStream outputStream) throws IOException {{
+        final Writer writer = new BufferedWriter(new OutputStreamWriter(outputStream, StandardCharsets.UTF_8));
+        if (csv) {{
+            writer.write(CSV_HEADER);
+            writer.write('\\n');
+        }}
+        try (Stream<{nombre_entidad}> entities = repository.streamAll({nombre_simple}SpecificationFactory.mapToSpecification(searchModel))) {{
+            final Iterator<{nombre_entidad}> iterator = entities.iterator();
+            while (iterator.hasNext()) {{
+                final {nombre_entidad} entity = iterator.next();
+                final {nombre_simple}Dto dto = {nombre_simple}Mapper.toDto(entity);
+                writer.write(csv ? toCsv(dto) : OBJECT_MAPPER.writeValueAsString(dto));
+                writer.write('\\n');
+                entityManager.detach(entity);
+            }}
+        }}
+        writer.flush();
+    }}
+
+    private static String toCsv(final {nombre_simple}Dto dto) {{
+        return String.join(",",{valores});
+    }}
+
+    private static String escape(final Object value) {{
+        if (value == null) {{
+            return "";
+        }}
+        final String text = String.valueOf(value);
+        if (text.indexOf(',') < 0 && text.indexOf('"') < 0 && text.indexOf('\\n') < 0 && text.indexOf('\\r') < 0) {{
+            return text;
+        }}
+        return '"' + text.replace("\\"", "\\"\\"") + '"';
+    }}
+}}
+"""
@@ -1,13 +1,16 @@
 import os
-import re
 import inquirer
 
+from extract_data import extraer_atributos
+from gen.nombres import extraer_base_paquete, getter
+from gen.specification import generar_cuerpo_specifications, operadores_seleccionados
+
 def extraer_atributos_search(codigo_java):
     """
     Extrae los atributos de la clase SearchModel Java.
-    Busca variables privadas con su tipo de dato y nombre.
+    Retorna sus atributos (tipo, nombre) con el mismo analizador que las entidades.
     """
-    return re.findall(r'private\s+([\w<>]+)\s+(\w+);', codigo_java)
+    return extraer_atributos(codigo_java)
 
 def seleccionar_atributos(atributos):
     """
@@ -28,64 +31,50 @@ def seleccionar_atributos(atributos):
         return [tuple(attr.split(" ")) for attr in respuestas["atributos"]]
     return []
 
-def generar_factories_specifications(nombre_entidad, paquete, atributos_seleccionados):
+def generar_factories_specifications(nombre_entidad, paquete, atributos_seleccionados, id_atributo=None, enums=None,
+                                     importaciones_proyecto=None):
     """
     Genera el código Java para las Specifications que serán usadas en la Specification Factory,
-    con los atributos seleccionados desde el SearchModel.
-    Se utiliza un package fijo: "com.inycom.cws.specifications".
+    con los filtros tipados de los atributos seleccionados desde el SearchModel.
+    El package es <base>.specifications, con la base del package de la entidad.
     """
     nombre_simple = nombre_entidad.replace("Entity", "")
     nombre_spec = f"{nombre_simple}Specifications"
 
-    # Usamos un package fijo para specifications
-    importaciones = """package com.inycom.cws.specifications;
-
-import com.inycom.cws.models.entities.""" + f"{nombre_entidad};\n" + \
-"""import lombok.experimental.UtilityClass;
-import org.springframework.data.jpa.domain.Specification;
-"""
-
-    metodo_empty = f"""
-@UtilityClass
-public class {nombre_spec} {{
+    tipos_importaciones, cuerpo = generar_cuerpo_specifications(nombre_entidad, atributos_seleccionados, id_atributo, enums, importaciones_proyecto)
+    java = sorted(i for i in tipos_importaciones if i.startswith("import java."))
+    importaciones_java = "\n" + "\n".join(java) + "\n" if java else ""
+    # Los tipos del proyecto (enums, embebidos) van junto a la entidad
+    importaciones_proyecto = "".join(f"{i}\n" for i in sorted(tipos_importaciones) if not i.startswith("import java."))
 
-    public static Specification<{nombre_entidad}> empty() {{
-        return (root, query, builder) -> builder.conjunction();
-    }}
-"""
+    importaciones = f"""package {extraer_base_paquete(paquete)}.specifications;
 
-    especificaciones = "\n".join([
-        f"""    public static Specification<{nombre_entidad}> {attr}(final {tipo} {attr}) {{
-        return (root, query, builder) -> builder.equal(root.get("{attr}"), {attr});
-    }}"""
-        for tipo, attr in atributos_seleccionados
-    ])
-
-    cierre_clase = "}\n"
+import {paquete}.{nombre_entidad};
+{importaciones_proyecto}import lombok.experimental.UtilityClass;
+import org.springframework.data.jpa.domain.Specification;
+{importaciones_java}"""
 
     specifications_code = f"""{importaciones}
-{metodo_empty}
-{especificaciones}
-{cierre_clase}
-"""
+{cuerpo}"""
     return nombre_spec, specifications_code
 
-def generar_factories_factory(nombre_entidad, paquete, atributos_seleccionados):
+def generar_factories_factory(nombre_entidad, paquete, atributos_seleccionados, id_atributo=None, enums=None):
     """
-    Genera el código Java para la Specification Factory con los atributos seleccionados desde el SearchModel.
-    Se utiliza un package fijo: "com.inycom.cws.factories".
+    Genera el código Java para la Specification Factory con los filtros de los atributos
+    seleccionados desde el SearchModel. Los filtros In solo se aplican con listas no vacías.
+    El package es <base>.factories, con la base del package de la entidad.
     """
     nombre_simple = nombre_entidad.replace("Entity", "")
     nombre_search = f"{nombre_simple}SearchModel"
     nombre_spec = f"{nombre_simple}Specifications"
     nombre_factory = f"{nombre_simple}SpecificationFactory"
+    base = extraer_base_paquete(paquete)
 
-    # Usamos un package fijo para factories
-    importaciones = f"""package com.inycom.cws.factories;
+    importaciones = f"""package {base}.factories;
 
-import com.inycom.cws.models.entities.{nombre_entidad};
-import com.inycom.cws.search.{nombre_search};
-import com.inycom.cws.specifications.{nombre_spec};
+import {paquete}.{nombre_entidad};
+import {base}.search.{nombre_search};
+import {base}.specifications.{nombre_spec};
 import lombok.experimental.UtilityClass;
 import org.springframework.data.jpa.domain.Specification;
 
@@ -94,12 +83,12 @@ import java.util.List;
 import java.util.Optional;
 """
 
-    especificaciones = "\n".join([
-        f"""        Optional.ofNullable(searchModel.get{attr.capitalize()}())
-                .map({nombre_spec}::{attr})
-                .ifPresent(specifications::add);"""
-        for _, attr in atributos_seleccionados
-    ])
+    especificaciones = []
+    for campo, tipo, operador, _ in operadores_seleccionados(atributos_seleccionados, id_atributo, enums):
+        filtro = "\n                .filter(values -> !values.isEmpty())" if operador == "in" else ""
+        especificaciones.append(f"""        Optional.ofNullable(searchModel.{getter(tipo, campo)}()){filtro}
+                .map({nombre_spec}::{campo})
+                .ifPresent(specifications::add);""")
 
     factory_code = f"""{importaciones}
 
@@ -110,7 +99,7 @@ public class {nombre_factory} {{
 
         final List<Specification<{nombre_entidad}>> specifications = new LinkedList<>();
 
-{especificaciones}
+{chr(10).join(especificaciones)}
 
         return specifications.stream()
                 .reduce(Specification::and)
@@ -120,59 +109,57 @@ public class {nombre_factory} {{
 """
     return nombre_factory, factory_code
 
-def generar_archivos_factories(entidad_file, atributos_seleccionados):
+def renderizar_factories(nombre_entidad, paquete, codigo_search, atributos_seleccionados, id_atributo=None, enums=None,
+                         importaciones_proyecto=None):
     """
-    Genera tanto las Specifications como la Specification Factory a partir del archivo de la entidad
-    y de la lista de atributos seleccionados (ya realizada).
-    Se asume que la lista de atributos ya fue seleccionada previamente.
+    Genera en memoria las Specifications y la Specification Factory a partir del código
+    del SearchModel ya generado para la entidad y de los atributos seleccionados.
+    Retorna (nombre_spec, spec_code, nombre_factory, factory_code) o None si no hay nada que generar.
     """
-    # Obtener el nombre de la entidad sin la extensión ".java"
-    nombre_entidad = os.path.basename(entidad_file).replace(".java", "")
-    nombre_simple = nombre_entidad.replace("Entity", "")
-
-    # Definir el archivo SearchModel generado previamente (ahora dentro de output/search)
-    search_file = os.path.join("output", "search", f"{nombre_simple}SearchModel.java")
-    if not os.path.exists(search_file):
-        print(f"❌ No se encontró el archivo SearchModel: {search_file}")
-        return ""
-
-    # Leer el código Java del SearchModel
-    with open(search_file, "r", encoding="utf-8") as f:
-        codigo_java = f.read()
-
-    # Extraer el package del SearchModel (aunque se usará un package fijo para factories)
-    paquete_extraido = extraer_paquete(codigo_java)
     # Validar que se extrajeron atributos del SearchModel
-    atributos_search = extraer_atributos_search(codigo_java)
-    if not nombre_entidad or not atributos_search:
+    atributos_search = extraer_atributos_search(codigo_search)
+    if not atributos_search:
         print("❌ Error: No se pudo extraer el nombre de la entidad o los atributos del SearchModel.")
-        return ""
+        return None
 
     if not atributos_seleccionados:
         print("⚠ No se seleccionaron atributos. No se generarán las Specifications ni la Specification Factory.")
-        return ""
+        return None
 
     # Generar Specifications y Specification Factory usando los mismos atributos
-    nombre_spec, spec_code = generar_factories_specifications(nombre_entidad, None, atributos_seleccionados)
-    nombre_factory, factory_code = generar_factories_factory(nombre_entidad, None, atributos_seleccionados)
+    nombre_spec, spec_code = generar_factories_specifications(
+        nombre_entidad, paquete, atributos_seleccionados, id_atributo, enums, importaciones_proyecto
+    )
+    nombre_factory, factory_code = generar_factories_factory(nombre_entidad, paquete, atributos_seleccionados, id_atributo, enums)
+    return nombre_spec, spec_code, nombre_factory, factory_code
+
+def generar_archivos_factories(entidad, salida, atributos_seleccionados, enums=None):
+    """
+    Genera tanto las Specifications como la Specification Factory a partir del modelo de la entidad
+    y de la lista de atributos seleccionados (ya realizada), y las añade a la salida.
+    Se asume que la lista de atributos ya fue seleccionada previamente.
+    """
+    nombre_simple = entidad.nombre_simple
 
-    # Crear carpetas dentro de output si no existen
-    os.makedirs(os.path.join("output", "specifications"), exist_ok=True)
-    os.makedirs(os.path.join("output", "factories"), exist_ok=True)
+    # SearchModel generado previamente en esta ejecución
+    search_file = os.path.join("search", f"{nombre_simple}SearchModel.java")
+    codigo_java = salida.contenido(search_file)
+    if codigo_java is None:
+        print(f"❌ No se encontró el archivo SearchModel: {search_file}")
+        return ""
 
-    # Guardar archivos dentro de output
-    spec_file = os.path.join("output", "specifications", f"{nombre_spec}.java")
-    factory_file = os.path.join("output", "factories", f"{nombre_factory}.java")
-    with open(spec_file, "w", encoding="utf-8") as f:
-        f.write(spec_code)
-    with open(factory_file, "w", encoding="utf-8") as f:
-        f.write(factory_code)
+    resultado = renderizar_factories(entidad.nombre, entidad.paquete, codigo_java, atributos_seleccionados, entidad.id_atributo, enums,
+                                     entidad.importaciones_proyecto)
+    if not resultado:
+        return ""
+    nombre_spec, spec_code, nombre_factory, factory_code = resultado
+
+    spec_file = os.path.join("specifications", f"{nombre_spec}.java")
+    factory_file = os.path.join("factories", f"{nombre_factory}.java")
+    salida.agregar(spec_file, spec_code)
+    salida.agregar(factory_file, factory_code)
 
     print(f"✅ Specifications generado en: {spec_file}")
     print(f"✅ SpecificationFactory generado en: {factory_file}")
 
     return spec_code, factory_code
-
-def extraer_paquete(codigo_java):
-    match = re.search(r'package\s+([\w\.]+);', codigo_java)
-    return match.group(1) if match else "com.example"
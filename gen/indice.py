@@ -0,0 +1,218 @@
+import json
+import os
+from dataclasses import dataclass, field
+
+from analizador_java import parsear_java
+from gen.nombres import tipos_simples
+from gen.specification import es_enum
+
+INDICE_FILE = ".generador-indice.json"
+
+# Se incrementa cuando cambia el formato de los símbolos para descartar los índices guardados
+VERSION_INDICE = 2
+
+# Directorios que no forman parte de las fuentes del proyecto
+DIRECTORIOS_IGNORADOS = {".git", ".idea", ".gradle", ".mvn", "target", "build", "node_modules", "__pycache__"}
+
+
+def tipo_simbolo(tipo_declaracion, anotaciones):
+    """
+    Clasifica una declaración: "entidad" (@Entity), "embeddable" (@Embeddable), "enum" o
+    el tipo de declaración ("class", "interface" o "record").
+    """
+    if "Entity" in anotaciones:
+        return "entidad"
+    if "Embeddable" in anotaciones:
+        return "embeddable"
+    return tipo_declaracion
+
+def simbolos_archivo(codigo_java):
+    """
+    Símbolos que declara un archivo: la clase principal, con sus atributos, y sus tipos anidados.
+    Retorna una lista de diccionarios {"nombre", "paquete", "tipo", "campos"}.
+    """
+    clase = parsear_java(codigo_java)
+    if not clase.nombre:
+        return []
+    simbolos = [{
+        "nombre": clase.nombre,
+        "paquete": clase.paquete,
+        "tipo": tipo_simbolo(clase.tipo, {anotacion.nombre for anotacion in clase.anotaciones}),
+        "campos": [[campo.tipo, campo.nombre] for campo in clase.campos if not campo.estatico],
+    }]
+    for tipo, nombre in clase.tipos_anidados:
+        simbolos.append({"nombre": nombre, "paquete": clase.paquete, "tipo": tipo, "campos": []})
+    return simbolos
+
+
+@dataclass
+class IndiceProyecto:
+    """
+    Índice de los tipos declarados en los .java de un directorio y sus subdirectorios.
+    archivos guarda, por ruta relativa a la raíz, el mtime y el tamaño con los que se analizó el
+    archivo y sus símbolos; actualizar solo vuelve a leer los archivos que han cambiado.
+    Las búsquedas por nombre simple usan un diccionario en memoria.
+    """
+    raiz: str
+    archivos: dict = field(default_factory=dict)
+    nombres: dict = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        self.indexar_nombres()
+
+    def indexar_nombres(self):
+        # Ante nombres repetidos en varios paquetes gana el primero por ruta
+        self.nombres = {}
+        for ruta in sorted(self.archivos):
+            for simbolo in self.archivos[ruta]["simbolos"]:
+                self.nombres.setdefault(simbolo["nombre"], dict(simbolo, archivo=ruta))
+
+    def actualizar(self):
+        """
+        Recorre la raíz una sola vez con os.scandir. Los archivos con el mismo mtime y tamaño
+        conservan sus símbolos; los nuevos o modificados se analizan y los borrados se eliminan.
+        Retorna (archivos analizados, archivos eliminados).
+        """
+        vistos = set()
+        analizados = 0
+        pendientes = [self.raiz]
+        while pendientes:
+            with os.scandir(pendientes.pop()) as entradas:
+                for entrada in entradas:
+                    if entrada.is_dir(follow_symlinks=False):
+                        if entrada.name not in DIRECTORIOS_IGNORADOS:
+                            pendientes.append(entrada.path)
+                        continue
+                    if not entrada.name.endswith(".java"):
+                        continue
+                    ruta = os.path.relpath(entrada.path, self.raiz).replace(os.sep, "/")
+                    vistos.add(ruta)
+                    estado = entrada.stat()
+                    registro = self.archivos.get(ruta)
+                    if registro and registro["mtime"] == estado.st_mtime_ns and registro["tamano"] == estado.st_size:
+                        continue
+                    try:
+                        with open(entrada.path, "r", encoding="utf-8") as f:
+                            simbolos = simbolos_archivo(f.read())
+                    except (OSError, UnicodeDecodeError):
+                        simbolos = []
+                    self.archivos[ruta] = {"mtime": estado.st_mtime_ns, "tamano": estado.st_size, "simbolos": simbolos}
+                    analizados += 1
+        eliminados = set(self.archivos) - vistos
+        for ruta in eliminados:
+            del self.archivos[ruta]
+        if analizados or eliminados:
+            self.indexar_nombres()
+        return analizados, len(eliminados)
+
+    def buscar(self, nombre):
+        """
+        Retorna el símbolo {"nombre", "paquete", "tipo", "campos", "archivo"} o None.
+        """
+        return self.nombres.get(nombre)
+
+    def es_enum(self, tipo):
+        """
+        Indica si el tipo es un enum. Los tipos declarados en el proyecto se resuelven con el índice;
+        los externos (sin archivo en la raíz) siguen la heurística de gen/specification.py:es_enum.
+        """
+        simbolo = self.buscar(tipo)
+        if simbolo:
+            return simbolo["tipo"] == "enum"
+        return es_enum(tipo)
+
+    def tipos_entidad(self, nombre):
+        """
+        Tipos de los atributos de la clase declarados en el proyecto, con su tipo de símbolo:
+        {"AddressEmbeddable": "embeddable", "DoctorEntity": "entidad", "Status": "enum"}.
+        Se guarda en Entidad.tipos_proyecto para resolver los embebidos sin @Embedded y las relaciones.
+        """
+        simbolo = self.buscar(nombre)
+        if not simbolo:
+            return {}
+        return {tipo: self.nombres[tipo]["tipo"] for tipo, _ in simbolo["campos"] if tipo in self.nombres}
+
+    def importacion_para(self, tipo):
+        """
+        Importación de un tipo declarado en el proyecto con el paquete que registra el índice:
+        "import com.inycom.cws.models.entities.Status;" (los tipos anidados se importan a través
+        de su clase: "import paquete.Clase.Anidado;"). Retorna None si el tipo no está en el
+        índice o está en el paquete por defecto.
+        """
+        simbolo = self.buscar(tipo)
+        if not simbolo or not simbolo["paquete"]:
+            return None
+        principal = self.archivos[simbolo["archivo"]]["simbolos"][0]["nombre"]
+        nombre = tipo if principal == tipo else f"{principal}.{tipo}"
+        return f"import {simbolo['paquete']}.{nombre};"
+
+    def importaciones_entidad(self, nombre):
+        """
+        {tipo: importación} de los tipos del proyecto que aparecen en los atributos de la clase,
+        también como argumentos genéricos. Se guarda en Entidad.importaciones_proyecto para que los
+        generadores importen los enums, entidades y embebidos (ver gen/nombres.py:importaciones_tipos).
+        """
+        simbolo = self.buscar(nombre)
+        if not simbolo:
+            return {}
+        importaciones = {}
+        for tipo, _ in simbolo["campos"]:
+            for parte in tipos_simples(tipo):
+                importacion = self.importacion_para(parte)
+                if importacion:
+                    importaciones[parte] = importacion
+        return importaciones
+
+    def enums_entidad(self, nombre):
+        """
+        Tipos de los atributos de la clase que son enums, ordenados. Es el conjunto que se pasa
+        como enums a los generadores de búsqueda.
+        """
+        simbolo = self.buscar(nombre)
+        if not simbolo:
+            return []
+        return sorted({tipo for tipo, _ in simbolo["campos"] if self.es_enum(tipo)})
+
+
+def cargar_indice(raiz, indice_file=None):
+    """
+    Construye el índice de la raíz partiendo del guardado en indice_file (si existe, es de la
+    misma raíz y de la versión actual) y lo actualiza de forma incremental.
+    """
+    raiz = os.path.abspath(raiz)
+    archivos = {}
+    if indice_file:
+        try:
+            with open(indice_file, "r", encoding="utf-8") as f:
+                guardado = json.load(f)
+            if guardado.get("version") == VERSION_INDICE and guardado.get("raiz") == raiz:
+                archivos = guardado.get("archivos", {})
+        except (OSError, ValueError):
+            pass
+    indice = IndiceProyecto(raiz, archivos)
+    indice.actualizar()
+    return indice
+
+def guardar_indice(indice, indice_file):
+    """
+    Guarda el índice para que la siguiente ejecución solo analice los archivos modificados.
+    """
+    directorio = os.path.dirname(indice_file)
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+    with open(indice_file, "w", encoding="utf-8") as f:
+        json.dump({"version": VERSION_INDICE, "raiz": indice.raiz, "archivos": indice.archivos}, f, indent=2, sort_keys=True)
+
+
+_indices = {}
+
+
+def indice_proyecto(raiz):
+    """
+    Índice de la raíz compartido dentro del proceso: se construye en la primera consulta y las
+    siguientes no vuelven a recorrer el directorio.
+    """
+    clave = os.path.abspath(raiz)
+    if clave not in _indices:
+        _indices[clave] = cargar_indice(clave)
+    return _indices[clave]
@@ -0,0 +1,125 @@
+import hashlib
+import re
+
+from gen.specification import TIPOS_RANGO
+
+# Anotaciones cuyos atributos no tienen una columna propia en la tabla
+ANOTACIONES_SIN_COLUMNA = {"Embedded", "EmbeddedId", "OneToMany", "ManyToMany", "Transient", "ElementCollection"}
+# Anotaciones de relación cuya columna es la clave ajena
+ANOTACIONES_CLAVE_AJENA = {"ManyToOne", "OneToOne"}
+
+# Longitud máxima de un identificador en PostgreSQL
+LONGITUD_MAXIMA_NOMBRE = 63
+
+
+def snake_case(nombre):
+    """
+    Convierte un nombre Java a columna como CamelCaseToUnderscoresNamingStrategy de Spring:
+    "birthDate" -> "birth_date", "PatientEntity" -> "patient_entity".
+    """
+    return re.sub(r'(?<=[a-z0-9])([A-Z])', r'_\1', nombre).lower()
+
+def nombre_tabla(entidad):
+    """
+    Tabla de la entidad: la de @Table(name = ...) o, si no hay, la que deriva Spring del nombre de la clase.
+    """
+    return entidad.tabla or snake_case(entidad.nombre)
+
+def nombre_columna(entidad, nombre):
+    """
+    Columna de un atributo: la explícita de @Column/@JoinColumn o la derivada por Spring.
+    Para las relaciones @ManyToOne/@OneToOne se usa la clave ajena "<atributo>_id".
+    Retorna None si el atributo no tiene una columna propia (embebidos, colecciones...).
+    """
+    anotaciones = set(entidad.anotaciones.get(nombre, []))
+    if anotaciones & ANOTACIONES_SIN_COLUMNA:
+        return None
+    if nombre in entidad.columnas:
+        return entidad.columnas[nombre]
+    if anotaciones & ANOTACIONES_CLAVE_AJENA:
+        return f"{snake_case(nombre)}_id"
+    return snake_case(nombre)
+
+def nombre_indice(tabla, columnas):
+    """
+    Nombre determinista del índice; si supera la longitud máxima se acorta con un hash.
+    """
+    nombre = f"idx_{tabla}_{'_'.join(columnas)}"
+    if len(nombre) <= LONGITUD_MAXIMA_NOMBRE:
+        return nombre
+    sufijo = hashlib.sha1(nombre.encode("utf-8")).hexdigest()[:8]
+    return f"{nombre[:LONGITUD_MAXIMA_NOMBRE - 9]}_{sufijo}"
+
+def columnas_compuesto(filtros, compuesto):
+    """
+    Columnas del índice compuesto para los atributos de compuesto, que se buscan siempre juntos:
+    primero las igualdades y al final una sola columna de rango, la primera indicada (las
+    columnas que siguen a un rango no pueden usarse para acotar el índice).
+    filtros es la lista de (tipo, nombre, columna) de los filtros con columna propia.
+    """
+    seleccionados = [filtro for nombre in compuesto for filtro in filtros if filtro[1] == nombre]
+    columnas = [columna for tipo, _, columna in seleccionados if tipo not in TIPOS_RANGO]
+    columnas += [columna for tipo, _, columna in seleccionados if tipo in TIPOS_RANGO][:1]
+    return columnas
+
+def analizar_indices(entidad, atributos_seleccionados, compuesto=None):
+    """
+    Determina los índices necesarios para los filtros seleccionados.
+    Un filtro está cubierto si su columna es la clave primaria o la primera columna de
+    algún índice declarado en @Table(indexes = ...).
+    Cada filtro es opcional, así que solo se crean índices de una columna; compuesto, una lista
+    de nombres de atributos que se filtran siempre juntos, añade además su índice compuesto
+    (ver columnas_compuesto).
+    Retorna (indices_nuevos, no_cubiertos) donde indices_nuevos es una lista de listas de
+    columnas y no_cubiertos una lista de tuplas (atributo, columna).
+    """
+    id_nombre = entidad.id_atributo[1] if entidad.id_atributo else None
+    primeras_columnas = {indice[0] for indice in entidad.indices if indice}
+    existentes = {tuple(indice) for indice in entidad.indices}
+
+    filtros = []
+    for tipo, nombre in atributos_seleccionados:
+        if nombre == id_nombre:
+            continue
+        columna = nombre_columna(entidad, nombre)
+        if columna:
+            filtros.append((tipo, nombre, columna))
+
+    no_cubiertos = [(nombre, columna) for _, nombre, columna in filtros if columna not in primeras_columnas]
+    indices_nuevos = [[columna] for _, columna in no_cubiertos]
+
+    if compuesto:
+        columnas = columnas_compuesto(filtros, compuesto)
+        if len(columnas) > 1 and tuple(columnas) not in existentes:
+            indices_nuevos.append(columnas)
+
+    return indices_nuevos, no_cubiertos
+
+def generar_migracion_indices(entidad, atributos_seleccionados, compuesto=None):
+    """
+    Genera una migración repetible de Flyway (R__indices_<tabla>.sql) con los índices de los
+    filtros de búsqueda, junto con la sugerencia equivalente de @Table(indexes = ...).
+    La sintaxis CREATE INDEX IF NOT EXISTS es la de PostgreSQL.
+    Retorna (nombre del archivo, código SQL, no_cubiertos) o None si no hace falta ningún índice.
+    """
+    indices_nuevos, no_cubiertos = analizar_indices(entidad, atributos_seleccionados, compuesto)
+    if not indices_nuevos:
+        return None
+
+    tabla = nombre_tabla(entidad)
+    sentencias = []
+    sugerencias = []
+    for columnas in indices_nuevos:
+        indice = nombre_indice(tabla, columnas)
+        sentencias.append(f"CREATE INDEX IF NOT EXISTS {indice} ON {tabla} ({', '.join(columnas)});")
+        sugerencias.append(f'--     @Index(name = "{indice}", columnList = "{", ".join(columnas)}")')
+
+    sql = f"""-- Índices para los filtros de búsqueda de {entidad.nombre} (generado).
+-- Equivalente en la entidad:
+-- @Table(name = "{tabla}", indexes = {{
+{("," + chr(10)).join(sugerencias)}
+-- }})
+
+{chr(10).join(sentencias)}
+"""
+    return f"R__indices_{tabla}.sql", sql, no_cubiertos
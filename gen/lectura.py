@@ -0,0 +1,174 @@
+# Filas que el driver JDBC trae por viaje en las consultas de búsqueda
+FETCH_SIZE = 100
+
+IMPORT_HIBERNATE_HINTS = "import org.hibernate.jpa.HibernateHints;"
+
+
+def configurar_hints(fetch_size=FETCH_SIZE, cacheable=False):
+    """
+    Retorna la lista de hints de Hibernate [(constante, valor)] para las consultas de lectura:
+    fetch size, entidades en solo lectura (sin snapshots de dirty-checking) y, si se pide,
+    caché de consultas (requiere hibernate.cache.use_query_cache).
+    """
+    hints = [
+        ("HibernateHints.HINT_FETCH_SIZE", str(int(fetch_size))),
+        ("HibernateHints.HINT_READ_ONLY", "true"),
+    ]
+    if cacheable:
+        hints.append(("HibernateHints.HINT_CACHEABLE", "true"))
+    return hints
+
+def anotacion_query_hints(hints, sangria="    "):
+    """
+    Anotación @QueryHints para redeclarar un método del repositorio.
+    Retorna (importaciones, código de la anotación).
+    """
+    importaciones = {
+        IMPORT_HIBERNATE_HINTS,
+        "import jakarta.persistence.QueryHint;",
+        "import org.springframework.data.jpa.repository.QueryHints;",
+    }
+    lineas = ",\n".join(f'{sangria}    @QueryHint(name = {nombre}, value = "{valor}")' for nombre, valor in hints)
+    return importaciones, f"{sangria}@QueryHints({{\n{lineas}\n{sangria}}})"
+
+def asignacion_query_hints(variable, hints, sangria="        "):
+    """
+    Llamadas setHint equivalentes para una consulta construida a mano (TypedQuery).
+    Retorna (importaciones, código).
+    """
+    lineas = [f'{sangria}{variable}.setHint({nombre}, {valor});' for nombre, valor in hints]
+    return {IMPORT_HIBERNATE_HINTS}, "\n".join(lineas)
+
+def anotacion_solo_lectura(base, replica=False):
+    """
+    Anotación de transacción de solo lectura para los servicios de consulta.
+    Con replica=True se usa la meta-anotación @ReadOnlyTransactional, que además
+    enruta la conexión a la réplica (ver generar_routing_config).
+    Retorna (importación, anotación).
+    """
+    if replica:
+        return f"import {base}.annotations.ReadOnlyTransactional;", "@ReadOnlyTransactional"
+    return "import org.springframework.transaction.annotation.Transactional;", "@Transactional(readOnly = true)"
+
+def generar_anotacion_replica(base):
+    """
+    Meta-anotación @ReadOnlyTransactional: @Transactional(readOnly = true) cuya conexión
+    sirve la réplica de lectura.
+    """
+    return f"""package {base}.annotations;
+
+import org.springframework.transaction.annotation.Transactional;
+
+import java.lang.annotation.Documented;
+import java.lang.annotation.ElementType;
+import java.lang.annotation.Retention;
+import java.lang.annotation.RetentionPolicy;
+import java.lang.annotation.Target;
+
+@Target({{ElementType.METHOD, ElementType.TYPE}})
+@Retention(RetentionPolicy.RUNTIME)
+@Documented
+@Transactional(readOnly = true)
+public @interface ReadOnlyTransactional {{
+}}
+"""
+
+def generar_routing_datasource(base):
+    """
+    DataSource que elige primaria o réplica según el flag readOnly de la transacción en curso.
+    """
+    return f"""package {base}.config;
+
+import org.springframework.jdbc.datasource.lookup.AbstractRoutingDataSource;
+import org.springframework.transaction.support.TransactionSynchronizationManager;
+
+public class ReadOnlyRoutingDataSource extends AbstractRoutingDataSource {{
+
+    public enum Target {{
+        PRIMARY,
+        REPLICA
+    }}
+
+    @Override
+    protected Object determineCurrentLookupKey() {{
+        return TransactionSynchronizationManager.isCurrentTransactionReadOnly() ? Target.REPLICA : Target.PRIMARY;
+    }}
+}}
+"""
+
+def generar_routing_config(base):
+    """
+    Configuración de los DataSource primario y réplica. El DataSource principal se envuelve en un
+    LazyConnectionDataSourceProxy: la conexión se pide al ejecutar la primera sentencia, cuando
+    el flag readOnly de la transacción ya está fijado; sin el proxy todo iría a la primaria.
+    """
+    return f"""package {base}.config;
+
+import {base}.config.ReadOnlyRoutingDataSource.Target;
+import com.zaxxer.hikari.HikariDataSource;
+import org.springframework.beans.factory.annotation.Qualifier;
+import org.springframework.boot.autoconfigure.jdbc.DataSourceProperties;
+import org.springframework.boot.context.properties.ConfigurationProperties;
+import org.springframework.context.annotation.Bean;
+import org.springframework.context.annotation.Configuration;
+import org.springframework.context.annotation.Primary;
+import org.springframework.jdbc.datasource.LazyConnectionDataSourceProxy;
+
+import javax.sql.DataSource;
+import java.util.Map;
+
+@Configuration
+public class DataSourceRoutingConfig {{
+
+    @Bean
+    @ConfigurationProperties("app.datasource.primary")
+    public DataSourceProperties primaryDataSourceProperties() {{
+        return new DataSourceProperties();
+    }}
+
+    @Bean
+    @ConfigurationProperties("app.datasource.replica")
+    public DataSourceProperties replicaDataSourceProperties() {{
+        return new DataSourceProperties();
+    }}
+
+    @Bean
+    @ConfigurationProperties("app.datasource.primary.hikari")
+    public HikariDataSource primaryDataSource(@Qualifier("primaryDataSourceProperties") final DataSourceProperties properties) {{
+        return properties.initializeDataSourceBuilder().type(HikariDataSource.class).build();
+    }}
+
+    @Bean
+    @ConfigurationProperties("app.datasource.replica.hikari")
+    public HikariDataSource replicaDataSource(@Qualifier("replicaDataSourceProperties") final DataSourceProperties properties) {{
+        final HikariDataSource dataSource = properties.initializeDataSourceBuilder().type(HikariDataSource.class).build();
+        dataSource.setReadOnly(true);
+        return dataSource;
+    }}
+
+    @Bean
+    @Primary
+    public DataSource dataSource(@Qualifier("primaryDataSource") final DataSource primary,
+                                 @Qualifier("replicaDataSource") final DataSource replica) {{
+        final ReadOnlyRoutingDataSource routing = new ReadOnlyRoutingDataSource();
+        routing.setTargetDataSources(Map.of(Target.PRIMARY, primary, Target.REPLICA, replica));
+        routing.setDefaultTargetDataSource(primary);
+        routing.afterPropertiesSet();
+        return new LazyConnectionDataSourceProxy(routing);
+    }}
+}}
+"""
+
+def generar_propiedades_replica():
+    """
+    Fragmento de application.properties para la configuración de primaria y réplica.
+    """
+    return """# DataSources para el enrutado de lecturas a réplica (DataSourceRoutingConfig).
+# Los servicios anotados con @ReadOnlyTransactional usan la réplica; el resto, la primaria.
+app.datasource.primary.url=jdbc:postgresql://primary:5432/app
+app.datasource.primary.username=app
+app.datasource.primary.password=
+app.datasource.replica.url=jdbc:postgresql://replica:5432/app
+app.datasource.replica.username=app_ro
+app.datasource.replica.password=
+"""
@@ -0,0 +1,109 @@
+import hashlib
+import json
+import os
+
+MANIFEST_FILE = ".generador-manifest.json"
+
+# Fuentes cuyo contenido define la versión del generador: si cambia cualquiera de ellas,
+# todas las entidades se regeneran aunque su código no haya cambiado.
+_RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_FUENTES_GENERADOR = ["analizador_java.py", "extract_data.py", "batch.py", "gen"]
+
+_version_generador = None
+
+
+def version_generador():
+    """
+    Calcula (una sola vez por proceso) un hash de las fuentes Python del generador.
+    """
+    global _version_generador
+    if _version_generador is None:
+        digest = hashlib.sha256()
+        for fuente in _FUENTES_GENERADOR:
+            ruta = os.path.join(_RAIZ, fuente)
+            if os.path.isdir(ruta):
+                archivos = [os.path.join(ruta, f) for f in sorted(os.listdir(ruta)) if f.endswith(".py")]
+            else:
+                archivos = [ruta]
+            for archivo in archivos:
+                digest.update(os.path.relpath(archivo, _RAIZ).encode("utf-8"))
+                with open(archivo, "rb") as f:
+                    digest.update(f.read())
+        _version_generador = digest.hexdigest()
+    return _version_generador
+
+
+def hash_entidad(entidad_file, config, enums=None, version_plantillas=None, tipos=None, importaciones=None):
+    """
+    Hash de una entidad: código fuente + configuración de selección + enums, tipos del proyecto
+    de sus atributos e importaciones de esos tipos (resueltos con el índice) + versión de las plantillas del proyecto + versión del generador.
+    """
+    digest = hashlib.sha256()
+    with open(entidad_file, "rb") as f:
+        digest.update(f.read())
+    digest.update(json.dumps(config, sort_keys=True).encode("utf-8"))
+    if enums is not None:
+        digest.update(json.dumps(enums).encode("utf-8"))
+    if version_plantillas:
+        digest.update(version_plantillas.encode("utf-8"))
+    if tipos:
+        digest.update(json.dumps(tipos, sort_keys=True).encode("utf-8"))
+    if importaciones:
+        digest.update(json.dumps(importaciones, sort_keys=True).encode("utf-8"))
+    digest.update(version_generador().encode("utf-8"))
+    return digest.hexdigest()
+
+
+def cargar_manifest(salida_dir):
+    """
+    Lee el manifest de la carpeta de salida. Si no existe o está corrupto, retorna uno vacío.
+    """
+    manifest_file = os.path.join(salida_dir, MANIFEST_FILE)
+    try:
+        with open(manifest_file, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"entidades": {}}
+    manifest.setdefault("entidades", {})
+    return manifest
+
+
+def guardar_manifest(salida_dir, manifest):
+    """
+    Guarda el manifest en la carpeta de salida.
+    """
+    os.makedirs(salida_dir, exist_ok=True)
+    manifest_file = os.path.join(salida_dir, MANIFEST_FILE)
+    with open(manifest_file, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def entidad_actualizada(manifest, salida_dir, nombre, hash_actual):
+    """
+    Indica si la entidad ya está generada con el mismo hash y todos sus archivos siguen en disco.
+    """
+    registro = manifest["entidades"].get(nombre)
+    if not registro or registro.get("hash") != hash_actual:
+        return False
+    return all(os.path.exists(os.path.join(salida_dir, ruta)) for ruta in registro.get("archivos", []))
+
+
+def registrar_entidad(manifest, nombre, hash_actual, artefactos):
+    """
+    Registra en el manifest el hash y los archivos generados para la entidad.
+    """
+    manifest["entidades"][nombre] = {
+        "hash": hash_actual,
+        "archivos": sorted(artefactos),
+    }
+
+
+def contenido_identico(destino, contenido):
+    """
+    Indica si el archivo ya existe con exactamente el mismo contenido.
+    """
+    try:
+        with open(destino, "r", encoding="utf-8") as f:
+            return f.read() == contenido
+    except (OSError, UnicodeDecodeError):
+        return False
@@ -1,21 +1,23 @@
 import os
-import re
 
-def extraer_base_paquete(paquete):
-    """
-    Extrae la base del package, por ejemplo, a partir de 
-    "com.inycom.cws.models.entities" retorna "com.inycom.cws".
-    """
-    parts = paquete.split('.')
-    if len(parts) >= 3:
-        return '.'.join(parts[:3])
-    return paquete
+from gen.nombres import extraer_base_paquete, getter, setter
+
+MODOS_MAPPER = ("jackson", "manual", "mapstruct")
 
-def generar_mapper(nombre_entidad, paquete):
+def generar_mapper(nombre_entidad, paquete, modo="jackson", atributos_pojo=None, atributos_dto=None):
     """
     Genera el código Java para un Mapper basado en la entidad, el DTO y el POJO.
     Se fija el package de los mappers en "com.inycom.cws.mappers".
+    Modos disponibles:
+      - "jackson": conversión con ObjectMapper.convertValue (comportamiento original).
+      - "manual": copia campo a campo con el builder del DTO y los setters de la entidad.
+      - "mapstruct": interfaz @Mapper de MapStruct con métodos estáticos toDto/toEntity.
+    Los modos "manual" y "mapstruct" reciben los atributos (tipo, nombre, ...) seleccionados
+    para el POJO y para el DTO; el DTO hereda los del POJO.
     """
+    if modo not in MODOS_MAPPER:
+        raise ValueError(f"Modo de mapper desconocido: {modo}. Opciones: {', '.join(MODOS_MAPPER)}")
+
     nombre_simple = nombre_entidad.replace("Entity", "")
     nombre_dto = f"{nombre_simple}Dto"
     nombre_pojo = nombre_simple  # El POJO suele tener el mismo nombre sin "Entity"
@@ -24,6 +26,11 @@ def generar_mapper(nombre_entidad, paquete):
     # Extraer la base del package (por ejemplo, "com.inycom.cws")
     base = extraer_base_paquete(paquete)
     paquete_mapper = f"{base}.mappers"
+
+    if modo == "manual":
+        return generar_mapper_manual(base, nombre_entidad, atributos_pojo or [], atributos_dto or [])
+    if modo == "mapstruct":
+        return generar_mapper_mapstruct(base, nombre_entidad)
     
     # Importaciones necesarias, usando la base para formar las rutas
     importaciones = f"""package {paquete_mapper};
@@ -53,36 +60,104 @@ public class {nombre_mapper} {{
 """
     return mapper_code
 
-def generar_mapper_archivo(entidad_file):
+def campos_dto(atributos_pojo, atributos_dto):
     """
-    Lee el archivo de la entidad y genera el Mapper correspondiente, 
-    guardándolo en output/mappers.
+    Campos del DTO: los heredados del POJO más los propios, sin repetir.
+    Retorna una lista de tuplas (tipo, nombre).
     """
-    with open(entidad_file, "r", encoding="utf-8") as f:
-        codigo_java = f.read()
+    campos = []
+    for attr in list(atributos_pojo) + list(atributos_dto):
+        if not any(campo[1] == attr[1] for campo in campos):
+            campos.append((attr[0], attr[1]))
+    return campos
+
+def generar_mapper_manual(base, nombre_entidad, atributos_pojo, atributos_dto):
+    """
+    Mapper sin reflexión: toDto copia con el builder del DTO (POJO + DTO) y
+    toEntity copia con los setters de la entidad (solo los atributos del POJO).
+    """
+    nombre_simple = nombre_entidad.replace("Entity", "")
+    nombre_dto = f"{nombre_simple}Dto"
+
+    builder_str = "".join(
+        f"\n                .{nombre}(entity.{getter(tipo, nombre)}())" for tipo, nombre in campos_dto(atributos_pojo, atributos_dto)
+    )
+    setters_str = "".join(
+        f"\n        entity.{setter(attr[1])}(pojo.{getter(attr[0], attr[1])}());" for attr in atributos_pojo
+    )
 
-    nombre_entidad = extraer_nombre_entidad(codigo_java)
-    paquete = extraer_paquete(codigo_java)
+    return f"""package {base}.mappers;
 
-    if not nombre_entidad:
-        print("❌ Error: No se pudo extraer el nombre de la entidad.")
-        return
+import {base}.models.dtos.{nombre_dto};
+import {base}.models.entities.{nombre_entidad};
+import {base}.models.pojos.{nombre_simple};
+import lombok.experimental.UtilityClass;
 
-    mapper_code = generar_mapper(nombre_entidad, paquete)
+@UtilityClass
+public class {nombre_simple}Mapper {{
 
-    # Crear carpeta "output/mappers" si no existe
-    mapper_dir = os.path.join("output", "mappers")
-    os.makedirs(mapper_dir, exist_ok=True)
-    mapper_file = os.path.join(mapper_dir, f"{nombre_entidad.replace('Entity', '')}Mapper.java")
-    with open(mapper_file, "w", encoding="utf-8") as f:
-        f.write(mapper_code)
+    public static {nombre_dto} toDto(final {nombre_entidad} entity) {{
+        if (entity == null) {{
+            return null;
+        }}
+        return {nombre_dto}.builder(){builder_str}
+                .build();
+    }}
 
-    print(f"✅ Mapper generado en: {mapper_file}")
+    public static {nombre_entidad} toEntity(final {nombre_simple} pojo) {{
+        if (pojo == null) {{
+            return null;
+        }}
+        final {nombre_entidad} entity = new {nombre_entidad}();{setters_str}
+        return entity;
+    }}
+}}
+"""
+
+def generar_mapper_mapstruct(base, nombre_entidad):
+    """
+    Mapper MapStruct: la implementación se genera en compilación. Se mantienen los métodos
+    estáticos toDto/toEntity para que los servicios sigan usando {X}Mapper::toDto.
+    """
+    nombre_simple = nombre_entidad.replace("Entity", "")
+    nombre_dto = f"{nombre_simple}Dto"
+    nombre_mapper = f"{nombre_simple}Mapper"
+
+    return f"""package {base}.mappers;
+
+import {base}.models.dtos.{nombre_dto};
+import {base}.models.entities.{nombre_entidad};
+import {base}.models.pojos.{nombre_simple};
+import org.mapstruct.Mapper;
+import org.mapstruct.ReportingPolicy;
+import org.mapstruct.factory.Mappers;
+
+@Mapper(unmappedTargetPolicy = ReportingPolicy.IGNORE)
+public interface {nombre_mapper} {{
+    {nombre_mapper} INSTANCE = Mappers.getMapper({nombre_mapper}.class);
+
+    {nombre_dto} entityToDto({nombre_entidad} entity);
 
-def extraer_nombre_entidad(codigo_java):
-    match = re.search(r'public\s+class\s+(\w+)', codigo_java)
-    return match.group(1) if match else None
+    {nombre_entidad} pojoToEntity({nombre_simple} pojo);
 
-def extraer_paquete(codigo_java):
-    match = re.search(r'package\s+([\w\.]+);', codigo_java)
-    return match.group(1) if match else "com.example"
+    static {nombre_dto} toDto(final {nombre_entidad} entity) {{
+        return INSTANCE.entityToDto(entity);
+    }}
+
+    static {nombre_entidad} toEntity(final {nombre_simple} pojo) {{
+        return INSTANCE.pojoToEntity(pojo);
+    }}
+}}
+"""
+
+def generar_mapper_archivo(entidad, salida):
+    """
+    Genera el Mapper correspondiente al modelo de la entidad,
+    añadiéndolo a la salida en mappers.
+    """
+    mapper_code = generar_mapper(entidad.nombre, entidad.paquete)
+
+    mapper_file = os.path.join("mappers", f"{entidad.nombre_simple}Mapper.java")
+    salida.agregar(mapper_file, mapper_code)
+
+    print(f"✅ Mapper generado en: {mapper_file}")
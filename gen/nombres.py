@@ -0,0 +1,90 @@
+def extraer_base_paquete(paquete):
+    """
+    Extrae la base del package, por ejemplo:
+    de "com.inycom.cws.models.entities" retorna "com.inycom.cws"
+    """
+    parts = paquete.split('.')
+    if len(parts) >= 3:
+        return '.'.join(parts[:3])
+    return paquete
+
+def capitalizar(nombre):
+    """
+    Pone en mayúscula solo la primera letra, como hace Lombok: "birthDate" -> "BirthDate".
+    (str.capitalize() pasaría el resto a minúsculas: "Birthdate").
+    """
+    return nombre[:1].upper() + nombre[1:]
+
+def getter(tipo, nombre):
+    """
+    Nombre del getter generado por Lombok para el atributo.
+    Los boolean primitivos usan el prefijo "is".
+    """
+    prefijo = "is" if tipo == "boolean" else "get"
+    return f"{prefijo}{capitalizar(nombre)}"
+
+def setter(nombre):
+    """
+    Nombre del setter generado por Lombok para el atributo.
+    """
+    return f"set{capitalizar(nombre)}"
+
+# Importaciones de los tipos que no están en java.lang
+IMPORTACIONES_TIPOS = {
+    "BigDecimal": "import java.math.BigDecimal;",
+    "BigInteger": "import java.math.BigInteger;",
+    "LocalDate": "import java.time.LocalDate;",
+    "LocalDateTime": "import java.time.LocalDateTime;",
+    "LocalTime": "import java.time.LocalTime;",
+    "OffsetDateTime": "import java.time.OffsetDateTime;",
+    "ZonedDateTime": "import java.time.ZonedDateTime;",
+    "Instant": "import java.time.Instant;",
+    "UUID": "import java.util.UUID;",
+    "List": "import java.util.List;",
+    "Set": "import java.util.Set;",
+    "Map": "import java.util.Map;",
+}
+
+# Tipos envoltorio de los primitivos
+TIPOS_ENVOLTORIO = {
+    "int": "Integer",
+    "long": "Long",
+    "short": "Short",
+    "byte": "Byte",
+    "double": "Double",
+    "float": "Float",
+    "boolean": "Boolean",
+    "char": "Character",
+}
+
+def envolver(tipo):
+    """
+    Retorna el tipo envoltorio de un primitivo ("int" -> "Integer") o el mismo tipo.
+    """
+    return TIPOS_ENVOLTORIO.get(tipo, tipo)
+
+def tipos_simples(tipo):
+    """
+    Nombres simples que aparecen en un tipo, incluidos los argumentos genéricos y sin corchetes
+    de array: "Map<String, List<Status>>" -> ["Map", "String", "List", "Status"]. De los tipos
+    anidados se toma la clase que los declara ("Order.Kind" -> "Order").
+    """
+    partes = tipo.replace("[]", "").replace(">", "<").replace(",", "<").replace("?", "<").split("<")
+    return [parte.strip().split()[-1].split(".")[0] for parte in partes if parte.strip()]
+
+def importaciones_tipos(tipos, proyecto=None):
+    """
+    Retorna el conjunto de importaciones necesarias para los tipos indicados,
+    incluyendo los argumentos genéricos ("List<LocalDate>").
+    proyecto es {tipo: importación} de los tipos declarados en el proyecto (enums, entidades y
+    embebidos; ver gen/indice.py:importaciones_entidad).
+    """
+    proyecto = proyecto or {}
+    importaciones = set()
+    for tipo in tipos:
+        for parte in tipos_simples(tipo):
+            if parte in IMPORTACIONES_TIPOS:
+                importaciones.add(IMPORTACIONES_TIPOS[parte])
+            elif parte in proyecto:
+                importaciones.add(proyecto[parte])
+    return importaciones
@@ -0,0 +1,129 @@
+import hashlib
+import os
+import posixpath
+from dataclasses import dataclass, field
+
+try:
+    import jinja2
+except ImportError:  # Solo es necesario si el proyecto define plantillas propias
+    jinja2 = None
+
+EXTENSION_PLANTILLA = ".j2"
+
+# Marcador del nombre simple de la entidad en los nombres de plantilla: controllers/Post{entidad}Controller.java.j2
+MARCADOR_ENTIDAD = "{entidad}"
+
+# Entornos de Jinja2 por directorio, creados una vez por proceso
+_entornos = {}
+
+
+def entorno_plantillas(directorio):
+    """
+    Entorno de Jinja2 del directorio de plantillas, compartido dentro del proceso. Cada plantilla
+    se compila la primera vez que se usa y se reutiliza mientras no cambie su mtime; el bytecode
+    compilado se guarda además en el directorio temporal para los demás procesos y ejecuciones.
+    """
+    if directorio not in _entornos:
+        if jinja2 is None:
+            raise ValueError(f"Las plantillas de {directorio} necesitan Jinja2 (pip install jinja2)")
+        _entornos[directorio] = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(directorio),
+            bytecode_cache=jinja2.FileSystemBytecodeCache(),
+            auto_reload=True,
+            cache_size=-1,
+            keep_trailing_newline=True,
+            trim_blocks=True,
+            lstrip_blocks=True,
+            undefined=jinja2.StrictUndefined,
+        )
+    return _entornos[directorio]
+
+def listar_plantillas(directorio):
+    """
+    Nombres de las plantillas del directorio y sus subdirectorios, relativos a él, con "/" y sin
+    la extensión .j2 (por ejemplo, "controllers/Post{entidad}Controller.java").
+    """
+    nombres = set()
+    pendientes = [directorio]
+    while pendientes:
+        with os.scandir(pendientes.pop()) as entradas:
+            for entrada in entradas:
+                if entrada.is_dir():
+                    pendientes.append(entrada.path)
+                elif entrada.name.endswith(EXTENSION_PLANTILLA):
+                    ruta = os.path.relpath(entrada.path, directorio).replace(os.sep, "/")
+                    nombres.add(ruta[:-len(EXTENSION_PLANTILLA)])
+    return nombres
+
+
+@dataclass
+class Plantillas:
+    """
+    Plantillas propias de un proyecto que sustituyen a los artefactos generados. Una plantilla
+    se aplica al artefacto con su misma ruta relativa a la salida (resources/application-bulk.properties.j2)
+    o, en los artefactos de una entidad, con el nombre simple sustituido por {entidad}
+    (services/Find{entidad}Service.java.j2); la ruta exacta tiene prioridad.
+    Las plantillas reciben el contexto del artefacto y, en "codigo", el contenido que genera el
+    generador, para poder reescribirlo por completo o solo retocarlo.
+    """
+    directorio: str
+    nombres: set = field(default_factory=set)
+    version: str = None
+
+    def plantilla_artefacto(self, ruta, nombre_simple=None):
+        """
+        Nombre de la plantilla que sustituye al artefacto, o None si no hay ninguna.
+        """
+        ruta = ruta.replace(os.sep, "/")
+        if ruta in self.nombres:
+            return ruta + EXTENSION_PLANTILLA
+        if not nombre_simple:
+            return None
+        directorio, archivo = posixpath.split(ruta)
+        inicio = archivo.find(nombre_simple)
+        while inicio != -1:
+            candidata = posixpath.join(directorio, archivo[:inicio] + MARCADOR_ENTIDAD + archivo[inicio + len(nombre_simple):])
+            if candidata in self.nombres:
+                return candidata + EXTENSION_PLANTILLA
+            inicio = archivo.find(nombre_simple, inicio + 1)
+        return None
+
+    def aplicar(self, artefactos, contexto, nombre_simple=None):
+        """
+        Sustituye los artefactos que tienen plantilla por su renderizado.
+        Retorna un diccionario nuevo {ruta relativa a la salida: contenido}.
+        """
+        resultado = {}
+        for ruta, codigo in artefactos.items():
+            nombre = self.plantilla_artefacto(ruta, nombre_simple)
+            if nombre:
+                entorno = entorno_plantillas(self.directorio)
+                try:
+                    plantilla = entorno.get_template(nombre)
+                    codigo = plantilla.render(contexto, ruta=ruta.replace(os.sep, "/"), codigo=codigo)
+                except jinja2.TemplateError as e:
+                    raise ValueError(f"Error en la plantilla {nombre}: {e}") from e
+            resultado[ruta] = codigo
+        return resultado
+
+
+def cargar_plantillas(directorio):
+    """
+    Lista las plantillas del directorio y calcula su versión (hash de nombres y contenidos), que
+    se añade al hash de cada entidad para regenerarla cuando cambia alguna plantilla.
+    Retorna None si el directorio no tiene plantillas.
+    """
+    directorio = os.path.abspath(directorio)
+    if not os.path.isdir(directorio):
+        raise ValueError(f"El directorio de plantillas '{directorio}' no existe")
+    nombres = listar_plantillas(directorio)
+    if not nombres:
+        return None
+    if jinja2 is None:
+        raise ValueError(f"Las plantillas de {directorio} necesitan Jinja2 (pip install jinja2)")
+    digest = hashlib.sha256()
+    for nombre in sorted(nombres):
+        digest.update(nombre.encode("utf-8"))
+        with open(os.path.join(directorio, nombre + EXTENSION_PLANTILLA), "rb") as f:
+            digest.update(f.read())
+    return Plantillas(directorio, nombres, digest.hexdigest())
@@ -1,41 +1,12 @@
 import os
-import re
 import inquirer
 
-def extraer_constantes_estaticas(codigo_java):
-    """
-    Extrae las constantes estáticas de la clase Java y las devuelve en un diccionario.
-    """
-    constantes = {}
-    matches = re.findall(r'private\s+static\s+final\s+int\s+(\w+)\s*=\s*(\d+);', codigo_java)
-    for nombre, valor in matches:
-        constantes[nombre] = int(valor)
-    return constantes
-
-def extraer_atributos_para_pojo(codigo_java, constantes):
-    """
-    Extrae todos los atributos de la clase Java, incluyendo los que tienen validación de longitud.
-    """
-    atributos = []
+from gen.nombres import importaciones_tipos
 
-    # Extraer atributos con @Column(length = ...)
-    matches = re.findall(r'@Column\(.*?length\s*=\s*(\w+)\)\s*private\s+([\w<>]+)\s+(\w+);', codigo_java)
-    for constante, tipo, nombre in matches:
-        if constante in constantes:  
-            atributos.append((tipo, nombre, constante))
-
-    # Extraer atributos sin @Column
-    matches_sin_column = re.findall(r'private\s+([\w<>]+)\s+(\w+);', codigo_java)
-    for tipo, nombre in matches_sin_column:
-        # Evitar agregar atributos duplicados
-        if not any(attr[1] == nombre for attr in atributos):
-            atributos.append((tipo, nombre, None))  # None indica que no tiene longitud definida
-
-    return atributos
-
-def generar_pojo(nombre_entidad, paquete, atributos_seleccionados, constantes_usadas):
+def generar_pojo(nombre_entidad, paquete, atributos_seleccionados, constantes_usadas, importaciones_proyecto=None):
     """
     Genera el código del POJO basado en los atributos seleccionados y las constantes utilizadas.
+    importaciones_proyecto son las de los tipos del proyecto (ver gen/indice.py:importaciones_entidad).
     """
     nombre_pojo = nombre_entidad.replace("Entity", "")
     paquete_pojo = paquete.replace("models.entities", "models.pojos")
@@ -47,9 +18,8 @@ def generar_pojo(nombre_entidad, paquete, atributos_seleccionados, constantes_us
         "import lombok.experimental.SuperBuilder;"
     }
 
-    # Verificar si hay atributos de tipo LocalDate para agregar la importación
-    if any(tipo == "LocalDate" for tipo, _, _ in atributos_seleccionados):
-        importaciones.add("import java.time.LocalDate;")
+    # Tipos de java.* y del proyecto (enums, entidades y embebidos) de los atributos
+    importaciones |= importaciones_tipos((tipo for tipo, _, _ in atributos_seleccionados), importaciones_proyecto)
 
     # Generar solo las constantes utilizadas
     constantes_str = [f"    private static final int {nombre} = {valor};" for nombre, valor in constantes_usadas.items()]
@@ -64,7 +34,7 @@ def generar_pojo(nombre_entidad, paquete, atributos_seleccionados, constantes_us
 
     pojo_code = f"""package {paquete_pojo};
 
-{chr(10).join(importaciones)}
+{chr(10).join(sorted(importaciones))}
 
 @SuperBuilder
 @Data
@@ -78,26 +48,14 @@ public class {nombre_pojo} {{
 }}"""
     return pojo_code
 
-def generar_pojo_archivo(entidad_file, pojos_path):
+def generar_pojo_archivo(entidad, salida):
     """
-    Genera el POJO en base a una entidad Java, extrayendo sus constantes y atributos.
+    Genera el POJO en base al modelo de la entidad, usando sus constantes y atributos,
+    y lo añade a la salida (gen/salida.py:SalidaArtefactos) en models/pojos.
     """
-    with open(entidad_file, "r", encoding="utf-8") as f:
-        codigo_java = f.read()
-    
-    nombre_entidad = re.search(r'public\s+class\s+(\w+)', codigo_java)
-    if not nombre_entidad:
-        print("❌ Error: No se pudo extraer el nombre de la entidad.")
-        return
-    
-    nombre_entidad = nombre_entidad.group(1)
-    
-    paquete = re.search(r'package\s+([\w\.]+);', codigo_java)
-    paquete = paquete.group(1) if paquete else "com.example.models.entities"
-    
-    constantes = extraer_constantes_estaticas(codigo_java)
-    atributos = extraer_atributos_para_pojo(codigo_java, constantes)
-    
+    atributos = entidad.atributos_pojo
+    constantes = entidad.constantes
+
     if not atributos:
         print("❌ Error: No se encontraron atributos en la entidad.")
         return
@@ -117,12 +75,10 @@ def generar_pojo_archivo(entidad_file, pojos_path):
     constantes_usadas = {nombre: valor for nombre, valor in constantes.items() if nombre in [attr[2] for attr in atributos_seleccionados]}
 
     # Generar código POJO
-    pojo_code = generar_pojo(nombre_entidad, paquete, atributos_seleccionados, constantes_usadas)
+    pojo_code = generar_pojo(entidad.nombre, entidad.paquete, atributos_seleccionados, constantes_usadas, entidad.importaciones_proyecto)
 
-    # Guardar archivo
-    os.makedirs(pojos_path, exist_ok=True)
-    pojo_file = os.path.join(pojos_path, f"{nombre_entidad.replace('Entity', '')}.java")
-    with open(pojo_file, "w", encoding="utf-8") as f:
-        f.write(pojo_code)
+    # Añadir a la salida
+    pojo_file = os.path.join("models", "pojos", f"{entidad.nombre_simple}.java")
+    salida.agregar(pojo_file, pojo_code)
 
     print(f"\n✅ POJO generado: {pojo_file}")
@@ -0,0 +1,55 @@
+from gen.indices import ANOTACIONES_CLAVE_AJENA
+from gen.mapper import campos_dto
+from gen.nombres import extraer_base_paquete, importaciones_tipos
+
+# Atributos que no se pueden proyectar en una fila: colecciones y campos sin columna
+ANOTACIONES_NO_PROYECTABLES = {"OneToMany", "ManyToMany", "ElementCollection", "Transient"}
+
+
+def campos_proyeccion(entidad, atributos_pojo, atributos_dto):
+    """
+    Campos de la proyección: los mismos del DTO y en el mismo orden que el mapper.
+    Las relaciones @ManyToOne/@OneToOne se seleccionan con un LEFT JOIN para no perder las filas
+    sin relación. Las colecciones no caben en una fila y se omiten.
+    Retorna (campos, omitidos) con campos como tuplas (tipo, nombre, es_relación).
+    """
+    campos = []
+    omitidos = []
+    for tipo, nombre in campos_dto(atributos_pojo, atributos_dto):
+        anotaciones = set(entidad.anotaciones.get(nombre, []))
+        if anotaciones & ANOTACIONES_NO_PROYECTABLES:
+            omitidos.append(nombre)
+        else:
+            campos.append((tipo, nombre, bool(anotaciones & ANOTACIONES_CLAVE_AJENA)))
+    return campos, omitidos
+
+def generar_proyeccion(nombre_entidad, paquete, campos, importaciones_proyecto=None):
+    """
+    Record {X}Projection con las columnas que necesita el DTO. Lo construye el método
+    findProjected del fragmento del repositorio (ver generar_repository_impl) y se convierte
+    al DTO con toDto, sin hidratar la entidad completa.
+    importaciones_proyecto ({tipo: importación}) resuelve los enums, embebidos y entidades
+    de las columnas, que viven en otro paquete que el record.
+    """
+    base = extraer_base_paquete(paquete)
+    nombre_simple = nombre_entidad.replace("Entity", "")
+    componentes = ",\n".join(f"        {tipo} {nombre}" for tipo, nombre, _ in campos)
+    builder_str = "".join(f"\n                .{nombre}({nombre})" for _, nombre, _ in campos)
+    importaciones = importaciones_tipos((tipo for tipo, _, _ in campos), importaciones_proyecto)
+    propias = "".join(f"\n{i}" for i in sorted(i for i in importaciones if not i.startswith("import java.")))
+    java = "".join(f"\n{i}" for i in sorted(i for i in importaciones if i.startswith("import java.")))
+    java = f"{java}\n" if java else ""
+    return f"""package {base}.models.projections;
+
+import {base}.models.dtos.{nombre_simple}Dto;{propias}
+{java}
+public record {nombre_simple}Projection(
+{componentes}
+) {{
+
+    public {nombre_simple}Dto toDto() {{
+        return {nombre_simple}Dto.builder(){builder_str}
+                .build();
+    }}
+}}
+"""
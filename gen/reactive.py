@@ -0,0 +1,504 @@
+
+from gen.indices import ANOTACIONES_CLAVE_AJENA, nombre_columna, nombre_tabla
+from gen.nombres import extraer_base_paquete, getter, importaciones_tipos
+from gen.specification import operadores_atributo
+
+# Destinos de generación: Spring MVC + JPA (por defecto) o WebFlux + R2DBC
+TARGETS = ("servlet", "reactive")
+
+# Importaciones de la entidad JPA que no se copian a la entidad R2DBC
+PREFIJOS_IMPORTACION_JPA = ("jakarta.persistence.", "org.hibernate.", "lombok.")
+
+# Método de Criteria de Spring Data Relational para cada operador de filtro (ver operadores_atributo)
+CRITERIA_OPERADORES = {
+    "equal": "is({valor})",
+    "from": "greaterThanOrEquals({valor})",
+    "to": "lessThanOrEquals({valor})",
+    "startsWith": 'like(escapeLike({valor}) + "%")',
+    "in": "in({valor})",
+}
+
+
+def columnas_reactivas(entidad):
+    """
+    Atributos de la entidad que R2DBC puede mapear a una columna: R2DBC no gestiona relaciones
+    ni embebidos, así que se omiten.
+    Retorna (columnas, omitidos) con columnas como tuplas (tipo, nombre, columna).
+    """
+    columnas = []
+    omitidos = []
+    for tipo, nombre in entidad.atributos:
+        columna = nombre_columna(entidad, nombre)
+        if columna is None or set(entidad.anotaciones.get(nombre, [])) & ANOTACIONES_CLAVE_AJENA:
+            omitidos.append(nombre)
+        else:
+            columnas.append((tipo, nombre, columna))
+    return columnas, omitidos
+
+def generar_entidad_reactiva(entidad, columnas):
+    """
+    Entidad de Spring Data Relational con el mismo nombre, paquete y atributos mapeables que la
+    entidad JPA, para que el POJO, el DTO y el Mapper se generen igual en los dos destinos.
+    Conserva las importaciones de la entidad original que no son de JPA, Hibernate ni Lombok
+    (por ejemplo, enums de otros paquetes).
+    """
+    id_nombre = entidad.id_atributo[1] if entidad.id_atributo else None
+    importaciones = {
+        "import lombok.Data;",
+        "import org.springframework.data.relational.core.mapping.Column;",
+        "import org.springframework.data.relational.core.mapping.Table;",
+    }
+    if id_nombre:
+        importaciones.add("import org.springframework.data.annotation.Id;")
+    for importacion in entidad.importaciones:
+        if not importacion.startswith(PREFIJOS_IMPORTACION_JPA + ("java.", "static ")):
+            importaciones.add(f"import {importacion};")
+    importaciones_java = importaciones_tipos(tipo for tipo, _, _ in columnas)
+
+    campos = []
+    for tipo, nombre, columna in columnas:
+        anotacion_id = "    @Id\n" if nombre == id_nombre else ""
+        campos.append(f'{anotacion_id}    @Column("{columna}")\n    private {tipo} {nombre};')
+    importaciones_str = "\n".join(sorted(importaciones))
+    if importaciones_java:
+        importaciones_str += "\n\n" + "\n".join(sorted(importaciones_java))
+    return f"""package {entidad.paquete};
+
+{importaciones_str}
+
+@Data
+@Table("{nombre_tabla(entidad)}")
+public class {entidad.nombre} {{
+
+{(chr(10) * 2).join(campos)}
+}}
+"""
+
+def generar_criteria_factory(nombre_entidad, paquete, atributos_seleccionados, id_atributo=None, enums=None):
+    """
+    Equivalente reactivo de la Specification Factory: traduce el SearchModel a un Criteria de
+    Spring Data Relational con los mismos filtros (igualdad, rangos, prefijo e In) que
+    generar_factories_factory. Los filtros In solo se aplican con listas no vacías.
+    Retorna (nombre de la factory, código).
+    """
+    base = extraer_base_paquete(paquete)
+    nombre_simple = nombre_entidad.replace("Entity", "")
+    nombre_search = f"{nombre_simple}SearchModel"
+    nombre_factory = f"{nombre_simple}CriteriaFactory"
+    id_nombre = id_atributo[1] if id_atributo else None
+
+    criterios = []
+    con_like = False
+    for tipo, nombre in atributos_seleccionados:
+        for campo, tipo_campo, operador, _ in operadores_atributo(tipo, nombre, nombre == id_nombre, enums):
+            filtro = "\n                .filter(values -> !values.isEmpty())" if operador == "in" else ""
+            condicion = CRITERIA_OPERADORES[operador].format(valor="value")
+            con_like = con_like or operador == "startsWith"
+            criterios.append(f"""        Optional.ofNullable(searchModel.{getter(tipo_campo, campo)}()){filtro}
+                .map(value -> Criteria.where("{nombre}").{condicion})
+                .ifPresent(criteria::add);""")
+
+    escape = ""
+    if con_like:
+        escape = """
+
+    private static String escapeLike(final String value) {
+        return value.replace("\\\\", "\\\\\\\\").replace("%", "\\\\%").replace("_", "\\\\_");
+    }"""
+
+    factory_code = f"""package {base}.factories;
+
+import {base}.search.{nombre_search};
+import lombok.experimental.UtilityClass;
+import org.springframework.data.relational.core.query.Criteria;
+
+import java.util.LinkedList;
+import java.util.List;
+import java.util.Optional;
+
+@UtilityClass
+public class {nombre_factory} {{
+
+    public Criteria mapToCriteria(final {nombre_search} searchModel) {{
+
+        final List<Criteria> criteria = new LinkedList<>();
+
+{chr(10).join(criterios)}
+
+        return Criteria.from(criteria);
+    }}{escape}
+}}
+"""
+    return nombre_factory, factory_code
+
+def generar_repository_reactivo(nombre_entidad, paquete, id_tipo="Long"):
+    """
+    Repositorio R2DBC. Las búsquedas con filtros usan R2dbcEntityTemplate con el Criteria de
+    {X}CriteriaFactory (ver generar_search_service_reactivo).
+    """
+    base = extraer_base_paquete(paquete)
+    nombre_simple = nombre_entidad.replace("Entity", "")
+    return f"""package {base}.repositories;
+
+import {base}.models.entities.{nombre_entidad};
+import org.springframework.data.r2dbc.repository.R2dbcRepository;
+
+public interface {nombre_simple}Repository extends R2dbcRepository<{nombre_entidad}, {id_tipo}> {{
+}}
+"""
+
+def generar_get_controller_reactivo(nombre_entidad, paquete, con_busqueda=True):
+    """
+    Controller que maneja GET /1.0/<ruta> y devuelve un Flux con la página pedida.
+    El Pageable lo resuelve el ReactivePageableHandlerMethodArgumentResolver de ReactiveWebConfig.
+    """
+    base = extraer_base_paquete(paquete)
+    nombre_simple = nombre_entidad.replace("Entity", "")
+    ruta = nombre_simple.lower() + "s"
+    import_search = f"import {base}.search.{nombre_simple}SearchModel;\n" if con_busqueda else ""
+    parametros = f"final {nombre_simple}SearchModel searchModel, final Pageable pageable" if con_busqueda else "final Pageable pageable"
+    argumentos = "searchModel, pageable" if con_busqueda else "pageable"
+    return f"""package {base}.controllers;
+
+import {base}.models.dtos.{nombre_simple}Dto;
+{import_search}import {base}.services.Search{nombre_simple}Service;
+import lombok.RequiredArgsConstructor;
+import org.springframework.data.domain.Pageable;
+import org.springframework.web.bind.annotation.GetMapping;
+import org.springframework.web.bind.annotation.RequestMapping;
+import org.springframework.web.bind.annotation.RestController;
+import reactor.core.publisher.Flux;
+
+@RequiredArgsConstructor
+@RestController
+@RequestMapping("/1.0/{ruta}")
+public class Get{nombre_simple}Controller {{
+
+    private final Search{nombre_simple}Service service;
+
+    @GetMapping
+    public Flux<{nombre_simple}Dto> get({parametros}) {{
+        return service.search({argumentos});
+    }}
+}}
+"""
+
+def generar_post_controller_reactivo(nombre_entidad, paquete, con_value):
+    """
+    Controller que maneja POST /1.0/<ruta> y responde 201 con el DTO creado.
+    """
+    base = extraer_base_paquete(paquete)
+    nombre_simple = nombre_entidad.replace("Entity", "")
+    ruta = nombre_simple.lower() + "s"
+    nombre_simple_upper = nombre_simple.upper()
+    return f"""package {base}.controllers;
+
+import {base}.annotations.Audit;
+import {base}.enums.AuditAction;
+import {base}.models.dtos.{nombre_simple}Dto;
+import {base}.models.pojos.{nombre_simple};
+import {base}.services.Create{nombre_simple}Service;
+import jakarta.validation.Valid;
+import lombok.RequiredArgsConstructor;
+import org.springframework.http.HttpStatus;
+import org.springframework.http.ResponseEntity;
+import org.springframework.web.bind.annotation.*;
+import reactor.core.publisher.Mono;
+
+@RequiredArgsConstructor
+@RestController
+@RequestMapping("/1.0/{ruta}")
+public class Post{nombre_simple}Controller {{
+    private static final long CON_{nombre_simple_upper} = {con_value};
+
+    private final Create{nombre_simple}Service service;
+
+    @Audit(controllerId = CON_{nombre_simple_upper}, action = AuditAction.POST)
+    @PostMapping
+    public Mono<ResponseEntity<{nombre_simple}Dto>> create(@Valid @RequestBody {nombre_simple} newObject) {{
+        return service.create(newObject).map(dto -> new ResponseEntity<>(dto, HttpStatus.CREATED));
+    }}
+}}
+"""
+
+def generar_patch_controller_reactivo(nombre_entidad, paquete, con_value, id_tipo="Long"):
+    """
+    Controller que maneja PATCH /1.0/<ruta> y responde sin contenido al completarse el servicio.
+    """
+    base = extraer_base_paquete(paquete)
+    nombre_simple = nombre_entidad.replace("Entity", "")
+    ruta = nombre_simple.lower() + "s"
+    nombre_simple_upper = nombre_simple.upper()
+    nombre_var = nombre_simple[0].lower() + nombre_simple[1:]
+    return f"""package {base}.controllers;
+
+import {base}.annotations.Audit;
+import {base}.enums.AuditAction;
+import {base}.models.pojos.{nombre_simple};
+import {base}.services.Patch{nombre_simple}Service;
+import lombok.RequiredArgsConstructor;
+import org.springframework.http.ResponseEntity;
+import org.springframework.web.bind.annotation.PatchMapping;
+import org.springframework.web.bind.annotation.PathVariable;
+import org.springframework.web.bind.annotation.RequestBody;
+import org.springframework.web.bind.annotation.RequestMapping;
+import org.springframework.web.bind.annotation.RestController;
+import reactor.core.publisher.Mono;
+
+@RequiredArgsConstructor
+@RestController
+@RequestMapping("/1.0/{ruta}")
+public class Patch{nombre_simple}Controller {{
+    private static final long CON_{nombre_simple_upper} = {con_value};
+    private final Patch{nombre_simple}Service service;
+
+    @Audit(controllerId = CON_{nombre_simple_upper}, action = AuditAction.PATCH)
+    @PatchMapping("/{{{nombre_var}Id}}")
+    public Mono<ResponseEntity<Void>> patch(@PathVariable final {id_tipo} {nombre_var}Id, @RequestBody final {nombre_simple} {nombre_var}) {{
+        return service.patch({nombre_var}Id, {nombre_var})
+                .then(Mono.fromSupplier(() -> ResponseEntity.noContent().<Void>build()));
+    }}
+}}
+"""
+
+def generar_delete_controller_reactivo(nombre_entidad, paquete, con_value, id_tipo="Long"):
+    """
+    Controller que maneja DELETE /1.0/<ruta> y responde sin contenido al completarse el servicio.
+    """
+    base = extraer_base_paquete(paquete)
+    nombre_simple = nombre_entidad.replace("Entity", "")
+    ruta = nombre_simple.lower() + "s"
+    nombre_simple_upper = nombre_simple.upper()
+    nombre_var = nombre_simple[0].lower() + nombre_simple[1:]
+    return f"""package {base}.controllers;
+
+import {base}.annotations.Audit;
+import {base}.enums.AuditAction;
+import {base}.services.Delete{nombre_simple}Service;
+import lombok.RequiredArgsConstructor;
+import org.springframework.http.ResponseEntity;
+import org.springframework.web.bind.annotation.DeleteMapping;
+import org.springframework.web.bind.annotation.PathVariable;
+import org.springframework.web.bind.annotation.RequestMapping;
+import org.springframework.web.bind.annotation.RestController;
+import reactor.core.publisher.Mono;
+
+@RequiredArgsConstructor
+@RestController
+@RequestMapping("/1.0/{ruta}")
+public class Delete{nombre_simple}Controller {{
+    private static final long CON_{nombre_simple_upper} = {con_value};
+    private final Delete{nombre_simple}Service service;
+
+    @Audit(controllerId = CON_{nombre_simple_upper}, action = AuditAction.DELETE)
+    @DeleteMapping("/{{{nombre_var}Id}}")
+    public Mono<ResponseEntity<Void>> delete(@PathVariable final {id_tipo} {nombre_var}Id) {{
+        return service.delete({nombre_var}Id)
+                .then(Mono.fromSupplier(() -> ResponseEntity.noContent().<Void>build()));
+    }}
+}}
+"""
+
+def generar_create_service_reactivo(nombre_entidad, paquete):
+    """
+    Servicio reactivo para crear la entidad.
+    """
+    base = extraer_base_paquete(paquete)
+    nombre_simple = nombre_entidad.replace("Entity", "")
+    nombre_var = nombre_simple[0].lower() + nombre_simple[1:]
+    return f"""package {base}.services;
+
+import {base}.mappers.{nombre_simple}Mapper;
+import {base}.models.dtos.{nombre_simple}Dto;
+import {base}.models.pojos.{nombre_simple};
+import {base}.repositories.{nombre_simple}Repository;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+import reactor.core.publisher.Mono;
+
+@RequiredArgsConstructor
+@Service
+public class Create{nombre_simple}Service {{
+    private final {nombre_simple}Repository repository;
+
+    @Transactional
+    public Mono<{nombre_simple}Dto> create(final {nombre_simple} {nombre_var}) {{
+        return repository.save({nombre_simple}Mapper.toEntity({nombre_var})).map({nombre_simple}Mapper::toDto);
+    }}
+}}
+"""
+
+def generar_find_service_reactivo(nombre_entidad, paquete, id_tipo="Long"):
+    """
+    Servicio reactivo para buscar la entidad por id; emite CwsException si no existe.
+    """
+    base = extraer_base_paquete(paquete)
+    nombre_simple = nombre_entidad.replace("Entity", "")
+    nombre_var = nombre_simple[0].lower() + nombre_simple[1:]
+    return f"""package {base}.services;
+
+import {base}.exceptions.CwsException;
+import {base}.models.entities.{nombre_entidad};
+import {base}.repositories.{nombre_simple}Repository;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+import reactor.core.publisher.Mono;
+
+@RequiredArgsConstructor
+@Service
+public class Find{nombre_simple}Service {{
+    private final {nombre_simple}Repository repository;
+
+    @Transactional(readOnly = true)
+    public Mono<{nombre_entidad}> find(final {id_tipo} {nombre_var}Id) {{
+        return repository.findById({nombre_var}Id)
+                         .switchIfEmpty(Mono.error(() -> new CwsException("Not found " + {nombre_var}Id)));
+    }}
+}}
+"""
+
+def generar_patch_service_reactivo(nombre_entidad, paquete, id_tipo="Long"):
+    """
+    Servicio reactivo para aplicar un PATCH: lee la entidad, combina los campos no nulos con
+    PatchUtils y la guarda en la misma transacción.
+    """
+    base = extraer_base_paquete(paquete)
+    nombre_simple = nombre_entidad.replace("Entity", "")
+    nombre_var = nombre_simple[0].lower() + nombre_simple[1:]
+    return f"""package {base}.services;
+
+import {base}.mappers.{nombre_simple}Mapper;
+import {base}.models.entities.{nombre_entidad};
+import {base}.models.pojos.{nombre_simple};
+import {base}.repositories.{nombre_simple}Repository;
+import {base}.utils.PatchUtils;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+import reactor.core.publisher.Mono;
+
+@RequiredArgsConstructor
+@Service
+public class Patch{nombre_simple}Service {{
+    private final Find{nombre_simple}Service service;
+    private final {nombre_simple}Repository repository;
+
+    @Transactional
+    public Mono<Void> patch(final {id_tipo} {nombre_var}Id, final {nombre_simple} {nombre_var}Patch) {{
+        final {nombre_entidad} patchedEntity = {nombre_simple}Mapper.toEntity({nombre_var}Patch);
+        return service.find({nombre_var}Id)
+                .map(existingEntity -> PatchUtils.merge(existingEntity, patchedEntity))
+                .flatMap(repository::save)
+                .then();
+    }}
+}}
+"""
+
+def generar_delete_service_reactivo(nombre_entidad, paquete, id_tipo="Long"):
+    """
+    Servicio reactivo para borrar la entidad; emite CwsException si no existe.
+    """
+    base = extraer_base_paquete(paquete)
+    nombre_simple = nombre_entidad.replace("Entity", "")
+    return f"""package {base}.services;
+
+import {base}.repositories.{nombre_simple}Repository;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+import reactor.core.publisher.Mono;
+
+@RequiredArgsConstructor
+@Service
+public class Delete{nombre_simple}Service {{
+    private final Find{nombre_simple}Service service;
+    private final {nombre_simple}Repository repository;
+
+    @Transactional
+    public Mono<Void> delete(final {id_tipo} id) {{
+        return service.find(id).flatMap(repository::delete);
+    }}
+}}
+"""
+
+def generar_search_service_reactivo(nombre_entidad, paquete, con_busqueda=True):
+    """
+    Servicio reactivo de búsqueda: R2dbcEntityTemplate con el Criteria de {X}CriteriaFactory y
+    el Pageable (LIMIT/OFFSET y orden). Sin atributos de búsqueda se pagina toda la tabla.
+    """
+    base = extraer_base_paquete(paquete)
+    nombre_simple = nombre_entidad.replace("Entity", "")
+    import_factory = import_search = ""
+    if con_busqueda:
+        import_factory = f"import {base}.factories.{nombre_simple}CriteriaFactory;\n"
+        import_search = f"import {base}.search.{nombre_simple}SearchModel;\n"
+        parametros = f"final {nombre_simple}SearchModel searchModel, final Pageable pageable"
+        consulta = f"Query.query({nombre_simple}CriteriaFactory.mapToCriteria(searchModel)).with(pageable)"
+    else:
+        parametros = "final Pageable pageable"
+        consulta = "Query.empty().with(pageable)"
+    return f"""package {base}.services;
+
+{import_factory}import {base}.mappers.{nombre_simple}Mapper;
+import {base}.models.dtos.{nombre_simple}Dto;
+import {base}.models.entities.{nombre_entidad};
+{import_search}import lombok.RequiredArgsConstructor;
+import org.springframework.data.domain.Pageable;
+import org.springframework.data.r2dbc.core.R2dbcEntityTemplate;
+import org.springframework.data.relational.core.query.Query;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+import reactor.core.publisher.Flux;
+
+@RequiredArgsConstructor
+@Service
+public class Search{nombre_simple}Service {{
+    private final R2dbcEntityTemplate template;
+
+    @Transactional(readOnly = true)
+    public Flux<{nombre_simple}Dto> search({parametros}) {{
+        return template.select({nombre_entidad}.class)
+                .matching({consulta})
+                .all()
+                .map({nombre_simple}Mapper::toDto);
+    }}
+}}
+"""
+
+def generar_reactive_web_config(base):
+    """
+    Configuración de WebFlux: Spring Boot solo registra la resolución de Pageable en Spring MVC,
+    así que se añade el ReactivePageableHandlerMethodArgumentResolver de Spring Data.
+    """
+    return f"""package {base}.config;
+
+import org.springframework.context.annotation.Configuration;
+import org.springframework.data.web.ReactivePageableHandlerMethodArgumentResolver;
+import org.springframework.web.reactive.config.WebFluxConfigurer;
+import org.springframework.web.reactive.result.method.annotation.ArgumentResolverConfigurer;
+
+@Configuration
+public class ReactiveWebConfig implements WebFluxConfigurer {{
+
+    @Override
+    public void configureArgumentResolvers(final ArgumentResolverConfigurer configurer) {{
+        configurer.addCustomResolver(new ReactivePageableHandlerMethodArgumentResolver());
+    }}
+}}
+"""
+
+def generar_propiedades_r2dbc():
+    """
+    Fragmento de application.properties para el destino reactivo (R2DBC con pool).
+    """
+    return """# Destino reactivo: WebFlux + R2DBC.
+# Requiere spring-boot-starter-webflux, spring-boot-starter-data-r2dbc y el driver R2DBC de la base de datos.
+spring.r2dbc.url=r2dbc:postgresql://localhost:5432/cws
+spring.r2dbc.username=${DB_USER}
+spring.r2dbc.password=${DB_PASSWORD}
+spring.r2dbc.pool.initial-size=10
+spring.r2dbc.pool.max-size=50
+spring.r2dbc.pool.max-idle-time=30m
+"""
@@ -0,0 +1,52 @@
+RELACIONES_COLECCION = {"OneToMany", "ManyToMany"}
+
+
+def analizar_relaciones(entidad, atributos_dto, modo_mapper="jackson"):
+    """
+    Decide qué relaciones del DTO se cargan con un EntityGraph y qué relaciones provocarán
+    consultas N+1 al mapear cada fila.
+      - Las relaciones @ManyToOne/@OneToOne incluidas en el DTO entran en el grafo (un JOIN).
+      - Las colecciones del DTO se quedan fuera: con paginación Hibernate las paginaría en memoria.
+      - El mapper "jackson" recorre con convertValue todos los getters de la entidad, por lo que
+        también carga las relaciones LAZY que no están en el DTO.
+    Retorna (grafo, avisos) con grafo como lista de nombres de atributo y avisos como textos.
+    """
+    nombres_dto = {attr[1] for attr in atributos_dto}
+    grafo = []
+    avisos = []
+    for nombre, (relacion, fetch) in entidad.relaciones.items():
+        if nombre in nombres_dto:
+            if relacion in RELACIONES_COLECCION:
+                avisos.append(f"la colección '{nombre}' del DTO se carga con una consulta por fila; "
+                              f"considerar @BatchSize o quitarla del DTO.")
+            else:
+                grafo.append(nombre)
+        elif fetch == "LAZY" and modo_mapper == "jackson":
+            avisos.append(f"el mapper jackson recorre la relación LAZY '{nombre}' aunque no esté en el DTO "
+                          f"(una consulta por fila); usar \"mapper\": \"manual\" o \"mapstruct\".")
+        elif fetch == "EAGER" and relacion not in RELACIONES_COLECCION:
+            avisos.append(f"la relación EAGER '{nombre}' no está en el DTO pero se carga igualmente "
+                          f"(una consulta por fila en las búsquedas); declararla con fetch = FetchType.LAZY.")
+    return grafo, avisos
+
+def anotacion_entity_graph(grafo, sangria="    "):
+    """
+    Anotación @EntityGraph con los atributos del grafo para redeclarar un método del repositorio.
+    Retorna (importaciones, código de la anotación).
+    """
+    atributos = ", ".join(f'"{nombre}"' for nombre in grafo)
+    return (
+        {"import org.springframework.data.jpa.repository.EntityGraph;"},
+        f"{sangria}@EntityGraph(attributePaths = {{{atributos}}})",
+    )
+
+def asignacion_entity_graph(variable, nombre_entidad, grafo, sangria="        "):
+    """
+    Construcción del grafo y hint de fetch graph para una consulta construida a mano (TypedQuery).
+    Retorna (importaciones, código).
+    """
+    atributos = ", ".join(f'"{nombre}"' for nombre in grafo)
+    codigo = f"""{sangria}final EntityGraph<{nombre_entidad}> graph = entityManager.createEntityGraph({nombre_entidad}.class);
+{sangria}graph.addAttributeNodes({atributos});
+{sangria}{variable}.setHint(SpecHints.HINT_SPEC_FETCH_GRAPH, graph);"""
+    return {"import jakarta.persistence.EntityGraph;", "import org.hibernate.jpa.SpecHints;"}, codigo
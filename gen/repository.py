@@ -1,24 +1,351 @@
-def extraer_base_paquete(paquete):
+from gen.indices import ANOTACIONES_CLAVE_AJENA, ANOTACIONES_SIN_COLUMNA
+from gen.lectura import anotacion_query_hints, asignacion_query_hints
+from gen.nombres import TIPOS_ENVOLTORIO, extraer_base_paquete, getter, importaciones_tipos
+from gen.relaciones import anotacion_entity_graph, asignacion_entity_graph
+
+
+def generar_repository(nombre_entidad, paquete, id_tipo="Long", con_custom=False, delete_directo=None,
+                       paginacion="page", hints=None, grafo=None, proyeccion=False):
     """
-    Extrae la base del package, por ejemplo:
-    de "com.inycom.cws.models.entities" retorna "com.inycom.cws"
+    con_custom=True añade el fragmento {X}RepositoryCustom (ver generar_repository_custom).
+    delete_directo, con la tupla (tipo, nombre) del @Id, añade deleteDirectById: un DELETE JPQL
+    que devuelve las filas afectadas sin cargar antes la entidad.
+    hints (ver gen/lectura.py) redeclara con @QueryHints el método de búsqueda que usa el modo de
+    paginación: findAll(specification, pageable) en "page" y findBy(specification, query) en "keyset".
+    En "slice" y con proyeccion=True la búsqueda va por el fragmento (findSlice o findProjected),
+    que fija allí los hints, y no se redeclara ningún método con @QueryHints.
+    grafo, lista de relaciones (ver gen/relaciones.py), añade @EntityGraph a ese mismo método y
+    redeclara findById con él, para cargar las relaciones del DTO en la misma consulta.
     """
-    parts = paquete.split('.')
-    if len(parts) >= 3:
-        return '.'.join(parts[:3])
-    return paquete
-
-def generar_repository(nombre_entidad, paquete, id_tipo="Long"):
     base = extraer_base_paquete(paquete)
     nombre_simple = nombre_entidad.replace("Entity", "")
+    custom_str = f", {nombre_simple}RepositoryCustom" if con_custom else ""
+    importaciones = {
+        f"import {base}.models.entities.{nombre_entidad};",
+        "import org.springframework.data.jpa.repository.JpaSpecificationExecutor;",
+        "import org.springframework.data.repository.CrudRepository;",
+        "import org.springframework.stereotype.Repository;",
+    }
+    metodos = []
+    if delete_directo:
+        importaciones.update({
+            "import org.springframework.data.jpa.repository.Modifying;",
+            "import org.springframework.data.jpa.repository.Query;",
+            "import org.springframework.data.repository.query.Param;",
+        })
+        metodos.append(f"""    @Modifying(flushAutomatically = true, clearAutomatically = true)
+    @Query("DELETE FROM {nombre_entidad} e WHERE e.{delete_directo[1]} = :id")
+    int deleteDirectById(@Param("id") {id_tipo} id);""")
+    busqueda_redeclarada = paginacion in ("page", "keyset") and not proyeccion
+    anotaciones = []
+    if grafo:
+        importaciones_grafo, anotacion_grafo = anotacion_entity_graph(grafo)
+        importaciones.update(importaciones_grafo)
+        importaciones.add("import java.util.Optional;")
+        anotaciones.append(anotacion_grafo)
+        metodos.append(f"{anotacion_grafo}\n    Optional<{nombre_entidad}> findById({id_tipo} id);")
+    if hints and busqueda_redeclarada:
+        importaciones_hints, anotacion_hints = anotacion_query_hints(hints)
+        importaciones.update(importaciones_hints)
+        anotaciones.append(anotacion_hints)
+    if anotaciones and busqueda_redeclarada:
+        importaciones.add("import org.springframework.data.jpa.domain.Specification;")
+        if paginacion == "page":
+            importaciones.add("import org.springframework.data.domain.Page;")
+            importaciones.add("import org.springframework.data.domain.Pageable;")
+            firma = f"Page<{nombre_entidad}> findAll(Specification<{nombre_entidad}> specification, Pageable pageable);"
+        else:
+            importaciones.add("import org.springframework.data.repository.query.FluentQuery;")
+            importaciones.add("import java.util.function.Function;")
+            firma = (f"<S extends {nombre_entidad}, R> R findBy(Specification<{nombre_entidad}> specification, "
+                     f"Function<FluentQuery.FetchableFluentQuery<S>, R> queryFunction);")
+        metodos.append("\n".join(anotaciones) + f"\n    {firma}")
+    cuerpo = f"\n{(chr(10) * 2).join(metodos)}\n" if metodos else "\n"
     return f"""package {base}.repositories;
 
-import {base}.models.entities.{nombre_entidad};
-import org.springframework.data.jpa.repository.JpaSpecificationExecutor;
-import org.springframework.data.repository.CrudRepository;
-import org.springframework.stereotype.Repository;
+{chr(10).join(ordenar_importaciones(importaciones))}
 
 @Repository
-public interface {nombre_simple}Repository extends CrudRepository<{nombre_entidad}, {id_tipo}>, JpaSpecificationExecutor<{nombre_entidad}> {{
+public interface {nombre_simple}Repository extends CrudRepository<{nombre_entidad}, {id_tipo}>, JpaSpecificationExecutor<{nombre_entidad}>{custom_str} {{{cuerpo}}}
+"""
+
+def atributos_patch_directo(entidad, atributos_pojo):
+    """
+    Separa los atributos del POJO que puede actualizar patchById (ver generar_repository_impl).
+    Se omiten el @Id, los primitivos (no pueden ser null, así que no se distingue si vienen en
+    el parche), los embebidos y las relaciones.
+    Retorna (aplicables, omitidos) como listas de tuplas (tipo, nombre).
+    """
+    id_nombre = entidad.id_atributo[1] if entidad.id_atributo else None
+    aplicables = []
+    omitidos = []
+    for tipo, nombre, _ in atributos_pojo:
+        if nombre == id_nombre:
+            continue
+        anotaciones = set(entidad.anotaciones.get(nombre, []))
+        if tipo in TIPOS_ENVOLTORIO or anotaciones & (ANOTACIONES_SIN_COLUMNA | ANOTACIONES_CLAVE_AJENA):
+            omitidos.append((tipo, nombre))
+        else:
+            aplicables.append((tipo, nombre))
+    return aplicables, omitidos
+
+def generar_repository_custom(nombre_entidad, paquete, slice=False, patch=None, id_atributo=None, hints=None,
+                              proyeccion=None, grafo=None, stream=None, importaciones_proyecto=None):
+    """
+    Genera la interfaz del fragmento {X}RepositoryCustom con los métodos que Spring Data
+    no ofrece de serie. Retorna None si no se ha pedido ninguno.
+      - slice: findSlice(specification, pageable) sin SELECT COUNT(*).
+      - patch: lista de atributos (tipo, nombre) para patchById(id, pojo), un UPDATE de las
+        columnas no nulas. id_atributo es la tupla (tipo, nombre) del @Id.
+      - proyeccion: campos (tipo, nombre, es_relación) para findProjected(specification, pageable),
+        que devuelve un Slice de {X}Projection (ver gen/proyeccion.py).
+      - stream: hints de la consulta de streamAll(specification), un Stream con cursor en
+        servidor para las exportaciones (ver gen/export.py).
+    hints y grafo solo afectan a la implementación (ver generar_repository_impl).
+    """
+    if not slice and patch is None and not proyeccion and not stream:
+        return None
+    base = extraer_base_paquete(paquete)
+    nombre_simple = nombre_entidad.replace("Entity", "")
+    importaciones = {f"import {base}.models.entities.{nombre_entidad};"}
+    metodos = []
+    if slice:
+        importaciones.add("import org.springframework.data.jpa.domain.Specification;")
+        importaciones.add("import org.springframework.data.domain.Pageable;")
+        importaciones.add("import org.springframework.data.domain.Slice;")
+        metodos.append(f"    Slice<{nombre_entidad}> findSlice(Specification<{nombre_entidad}> specification, Pageable pageable);")
+    if proyeccion:
+        importaciones.update({
+            f"import {base}.models.projections.{nombre_simple}Projection;",
+            "import org.springframework.data.domain.Pageable;",
+            "import org.springframework.data.domain.Slice;",
+            "import org.springframework.data.jpa.domain.Specification;",
+        })
+        metodos.append(f"    Slice<{nombre_simple}Projection> findProjected(Specification<{nombre_entidad}> specification, Pageable pageable);")
+    if stream:
+        importaciones.add("import org.springframework.data.jpa.domain.Specification;")
+        importaciones.add("import java.util.stream.Stream;")
+        metodos.append(f"    Stream<{nombre_entidad}> streamAll(Specification<{nombre_entidad}> specification);")
+    if patch is not None:
+        id_tipo = id_atributo[0] if id_atributo else "Long"
+        importaciones.add(f"import {base}.models.pojos.{nombre_simple};")
+        metodos.append(f"    int patchById({id_tipo} id, {nombre_simple} patch);")
+    return f"""package {base}.repositories;
+
+{chr(10).join(sorted(importaciones))}
+
+public interface {nombre_simple}RepositoryCustom {{
+
+{(chr(10) * 2).join(metodos)}
+}}
+"""
+
+def generar_repository_impl(nombre_entidad, paquete, slice=False, patch=None, id_atributo=None, hints=None,
+                            proyeccion=None, grafo=None, stream=None, importaciones_proyecto=None):
+    """
+    Genera la implementación {X}RepositoryCustomImpl del fragmento con Criteria API.
+    findSlice pide una fila más que el tamaño de página para saber si hay página siguiente,
+    evitando la consulta de conteo que lanza findAll(specification, pageable).
+    patchById lanza un CriteriaUpdate con solo las columnas no nulas del POJO, sin cargar la
+    entidad; como toda actualización masiva, no pasa por @Version, @PreUpdate ni el contexto
+    de persistencia. La alternativa con @DynamicUpdate sigue necesitando el SELECT previo.
+    findProjected selecciona con builder.construct solo las columnas del DTO y pagina como findSlice.
+    hints (ver gen/lectura.py) se aplican a las consultas de findSlice y findProjected; el grafo de
+    relaciones (ver gen/relaciones.py), solo a findSlice: findProjected ya hace los JOIN.
+    streamAll devuelve getResultStream con sus propios hints (fetch size y solo lectura) y el mismo
+    grafo; el Stream debe consumirse y cerrarse dentro de la transacción.
+    importaciones_proyecto ({tipo: importación}) resuelve los tipos de las relaciones unidas y
+    los enums de las columnas de patchById.
+    Retorna None si no se ha pedido ningún método.
+    """
+    if not slice and patch is None and not proyeccion and not stream:
+        return None
+    base = extraer_base_paquete(paquete)
+    nombre_simple = nombre_entidad.replace("Entity", "")
+    importaciones = {
+        f"import {base}.models.entities.{nombre_entidad};",
+        "import jakarta.persistence.EntityManager;",
+        "import jakarta.persistence.PersistenceContext;",
+    }
+    metodos = []
+    asignacion_hints = ""
+    if hints:
+        importaciones_hints, asignacion_hints = asignacion_query_hints("typedQuery", hints)
+        importaciones.update(importaciones_hints)
+        asignacion_hints = "\n" + asignacion_hints
+    if slice:
+        asignacion_grafo = ""
+        if grafo:
+            importaciones_grafo, asignacion_grafo = asignacion_entity_graph("typedQuery", nombre_entidad, grafo)
+            importaciones.update(importaciones_grafo)
+            asignacion_grafo = "\n" + asignacion_grafo
+        importaciones.update({
+            "import org.springframework.data.jpa.domain.Specification;",
+            "import jakarta.persistence.TypedQuery;",
+            "import jakarta.persistence.criteria.CriteriaBuilder;",
+            "import jakarta.persistence.criteria.CriteriaQuery;",
+            "import jakarta.persistence.criteria.Predicate;",
+            "import jakarta.persistence.criteria.Root;",
+            "import org.springframework.data.domain.Pageable;",
+            "import org.springframework.data.domain.Slice;",
+            "import org.springframework.data.domain.SliceImpl;",
+            "import org.springframework.data.jpa.repository.query.QueryUtils;",
+            "import java.util.List;",
+        })
+        metodos.append(f"""    @Override
+    public Slice<{nombre_entidad}> findSlice(final Specification<{nombre_entidad}> specification, final Pageable pageable) {{
+        final CriteriaBuilder builder = entityManager.getCriteriaBuilder();
+        final CriteriaQuery<{nombre_entidad}> query = builder.createQuery({nombre_entidad}.class);
+        final Root<{nombre_entidad}> root = query.from({nombre_entidad}.class);
+        final Predicate predicate = specification.toPredicate(root, query, builder);
+        if (predicate != null) {{
+            query.where(predicate);
+        }}
+        query.select(root);
+        if (pageable.getSort().isSorted()) {{
+            query.orderBy(QueryUtils.toOrders(pageable.getSort(), root, builder));
+        }}
+
+        final TypedQuery<{nombre_entidad}> typedQuery = entityManager.createQuery(query);{asignacion_hints}{asignacion_grafo}
+        if (pageable.isUnpaged()) {{
+            return new SliceImpl<>(typedQuery.getResultList(), pageable, false);
+        }}
+        typedQuery.setFirstResult((int) pageable.getOffset());
+        typedQuery.setMaxResults(pageable.getPageSize() + 1);
+
+        final List<{nombre_entidad}> content = typedQuery.getResultList();
+        final boolean hasNext = content.size() > pageable.getPageSize();
+        return new SliceImpl<>(hasNext ? content.subList(0, pageable.getPageSize()) : content, pageable, hasNext);
+    }}""")
+    if proyeccion:
+        importaciones.update({
+            f"import {base}.models.projections.{nombre_simple}Projection;",
+            "import jakarta.persistence.TypedQuery;",
+            "import jakarta.persistence.criteria.CriteriaBuilder;",
+            "import jakarta.persistence.criteria.CriteriaQuery;",
+            "import jakarta.persistence.criteria.Predicate;",
+            "import jakarta.persistence.criteria.Root;",
+            "import org.springframework.data.domain.Pageable;",
+            "import org.springframework.data.domain.Slice;",
+            "import org.springframework.data.domain.SliceImpl;",
+            "import org.springframework.data.jpa.domain.Specification;",
+            "import org.springframework.data.jpa.repository.query.QueryUtils;",
+            "import java.util.List;",
+        })
+        joins = ""
+        if any(relacion for _, _, relacion in proyeccion):
+            importaciones.add("import jakarta.persistence.criteria.JoinType;")
+            joins = "".join(
+                f'\n        final Join<{nombre_entidad}, {tipo}> {nombre}Join = root.join("{nombre}", JoinType.LEFT);'
+                for tipo, nombre, relacion in proyeccion if relacion
+            )
+            importaciones.add("import jakarta.persistence.criteria.Join;")
+            importaciones.update(importaciones_tipos(
+                (tipo for tipo, _, relacion in proyeccion if relacion), importaciones_proyecto
+            ))
+        selecciones = ",".join(
+            f"\n                {nombre}Join" if relacion else f'\n                root.get("{nombre}")'
+            for _, nombre, relacion in proyeccion
+        )
+        metodos.append(f"""    @Override
+    public Slice<{nombre_simple}Projection> findProjected(final Specification<{nombre_entidad}> specification, final Pageable pageable) {{
+        final CriteriaBuilder builder = entityManager.getCriteriaBuilder();
+        final CriteriaQuery<{nombre_simple}Projection> query = builder.createQuery({nombre_simple}Projection.class);
+        final Root<{nombre_entidad}> root = query.from({nombre_entidad}.class);{joins}
+        final Predicate predicate = specification.toPredicate(root, query, builder);
+        if (predicate != null) {{
+            query.where(predicate);
+        }}
+        query.select(builder.construct({nombre_simple}Projection.class,{selecciones}));
+        if (pageable.getSort().isSorted()) {{
+            query.orderBy(QueryUtils.toOrders(pageable.getSort(), root, builder));
+        }}
+
+        final TypedQuery<{nombre_simple}Projection> typedQuery = entityManager.createQuery(query);{asignacion_hints}
+        if (pageable.isUnpaged()) {{
+            return new SliceImpl<>(typedQuery.getResultList(), pageable, false);
+        }}
+        typedQuery.setFirstResult((int) pageable.getOffset());
+        typedQuery.setMaxResults(pageable.getPageSize() + 1);
+
+        final List<{nombre_simple}Projection> content = typedQuery.getResultList();
+        final boolean hasNext = content.size() > pageable.getPageSize();
+        return new SliceImpl<>(hasNext ? content.subList(0, pageable.getPageSize()) : content, pageable, hasNext);
+    }}""")
+    if stream:
+        importaciones_stream, asignacion_stream = asignacion_query_hints("typedQuery", stream)
+        importaciones.update(importaciones_stream)
+        if grafo:
+            importaciones_grafo, asignacion_grafo = asignacion_entity_graph("typedQuery", nombre_entidad, grafo)
+            importaciones.update(importaciones_grafo)
+            asignacion_stream += "\n" + asignacion_grafo
+        importaciones.update({
+            "import jakarta.persistence.TypedQuery;",
+            "import jakarta.persistence.criteria.CriteriaBuilder;",
+            "import jakarta.persistence.criteria.CriteriaQuery;",
+            "import jakarta.persistence.criteria.Predicate;",
+            "import jakarta.persistence.criteria.Root;",
+            "import org.springframework.data.jpa.domain.Specification;",
+            "import java.util.stream.Stream;",
+        })
+        metodos.append(f"""    @Override
+    public Stream<{nombre_entidad}> streamAll(final Specification<{nombre_entidad}> specification) {{
+        final CriteriaBuilder builder = entityManager.getCriteriaBuilder();
+        final CriteriaQuery<{nombre_entidad}> query = builder.createQuery({nombre_entidad}.class);
+        final Root<{nombre_entidad}> root = query.from({nombre_entidad}.class);
+        final Predicate predicate = specification.toPredicate(root, query, builder);
+        if (predicate != null) {{
+            query.where(predicate);
+        }}
+        query.select(root);
+
+        final TypedQuery<{nombre_entidad}> typedQuery = entityManager.createQuery(query);
+{asignacion_stream}
+        return typedQuery.getResultStream();
+    }}""")
+    if patch is not None:
+        id_tipo, id_nombre = id_atributo if id_atributo else ("Long", "id")
+        importaciones.update({
+            f"import {base}.models.pojos.{nombre_simple};",
+            "import jakarta.persistence.criteria.CriteriaBuilder;",
+            "import jakarta.persistence.criteria.CriteriaUpdate;",
+            "import jakarta.persistence.criteria.Root;",
+        })
+        importaciones.update(importaciones_tipos((tipo for tipo, _ in patch), importaciones_proyecto))
+        asignaciones = "".join(f"""
+        if (patch.{getter(tipo, nombre)}() != null) {{
+            update.set(root.<{tipo}>get("{nombre}"), patch.{getter(tipo, nombre)}());
+            changed = true;
+        }}""" for tipo, nombre in patch)
+        metodos.append(f"""    @Override
+    public int patchById(final {id_tipo} id, final {nombre_simple} patch) {{
+        final CriteriaBuilder builder = entityManager.getCriteriaBuilder();
+        final CriteriaUpdate<{nombre_entidad}> update = builder.createCriteriaUpdate({nombre_entidad}.class);
+        final Root<{nombre_entidad}> root = update.from({nombre_entidad}.class);
+        boolean changed = false;{asignaciones}
+        if (!changed) {{
+            return entityManager.find({nombre_entidad}.class, id) != null ? 1 : 0;
+        }}
+        update.where(builder.equal(root.get("{id_nombre}"), id));
+        return entityManager.createQuery(update).executeUpdate();
+    }}""")
+    return f"""package {base}.repositories;
+
+{chr(10).join(ordenar_importaciones(importaciones))}
+
+public class {nombre_simple}RepositoryCustomImpl implements {nombre_simple}RepositoryCustom {{
+
+    @PersistenceContext
+    private EntityManager entityManager;
+
+{(chr(10) * 2).join(metodos)}
 }}
 """
+
+def ordenar_importaciones(importaciones):
+    """
+    Ordena las importaciones dejando las de java.* en un bloque final, como en el resto de generadores.
+    """
+    propias = sorted(i for i in importaciones if not i.startswith("import java."))
+    java = sorted(i for i in importaciones if i.startswith("import java."))
+    return propias + ([""] + java if java else [])
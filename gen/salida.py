@@ -0,0 +1,224 @@
+import difflib
+import io
+import os
+import posixpath
+import re
+import tarfile
+import time
+import zipfile
+
+from gen.manifest import contenido_identico
+
+# Formatos de salida: un directorio (por defecto), un único .zip o .tar(.gz), o el árbol de
+# fuentes de un proyecto Maven/Gradle (src/main/java/<paquete>/..., src/main/resources/...).
+FORMATOS_SALIDA = ("directorio", "zip", "tar", "arbol")
+
+# Prefijos de los artefactos que van a los recursos y a las fuentes de test en el formato "arbol"
+PREFIJOS_RECURSOS = {"resources": "", "db": "db"}
+PREFIJOS_TEST = ("benchmarks/",)
+
+PATRON_PAQUETE = re.compile(r'^package\s+([\w.]+)\s*;', re.MULTILINE)
+
+
+def formato_salida(destino):
+    """
+    Formato que corresponde a la extensión del destino: .zip, .tar, .tar.gz/.tgz o, si no, directorio.
+    """
+    if destino.endswith(".zip"):
+        return "zip"
+    if destino.endswith((".tar", ".tar.gz", ".tgz")):
+        return "tar"
+    return "directorio"
+
+
+def diff_unificado(destino, anterior, contenido):
+    """
+    Líneas del diff unificado de un artefacto, con el formato de git (a/ruta, b/ruta y
+    /dev/null para los archivos nuevos).
+    """
+    return difflib.unified_diff(
+        (anterior or "").splitlines(keepends=True),
+        contenido.splitlines(keepends=True),
+        fromfile=f"a/{destino}" if anterior is not None else "/dev/null",
+        tofile=f"b/{destino}",
+    )
+
+
+class SalidaArtefactos:
+    """
+    Destino único de los artefactos generados. Los artefactos se acumulan en memoria y se escriben
+    todos a la vez con volcar():
+      - directorio y arbol: cada directorio se crea una sola vez, cada archivo se escribe en un
+        temporal junto a su destino y, solo cuando están todos escritos, se renombran con
+        os.replace. Si falla la escritura de un temporal no se modifica ningún archivo; cada
+        os.replace es atómico, pero si falla uno a mitad los ya renombrados conservan la versión
+        nueva. Los artefactos idénticos a los del disco no se reescriben.
+      - zip y tar: un único archivo comprimido, escrito también en un temporal y renombrado.
+    """
+
+    def __init__(self, destino, formato=None, paquete_base="com.inycom.cws"):
+        self.destino = destino
+        self.formato = formato or formato_salida(destino)
+        if self.formato not in FORMATOS_SALIDA:
+            raise ValueError(f"Formato de salida desconocido: {self.formato}. Opciones: {', '.join(FORMATOS_SALIDA)}")
+        self.paquete_base = paquete_base
+        self.pendientes = {}
+        self.destinos = {}
+        self.identicos = {}
+
+    @property
+    def archivo(self):
+        """
+        Indica si la salida es un único archivo comprimido.
+        """
+        return self.formato in ("zip", "tar")
+
+    def ruta_destino(self, ruta, contenido=None):
+        """
+        Ruta relativa al destino en la que se escribe el artefacto. Solo cambia en el formato
+        "arbol": las clases van a src/main/java (src/test/java los benchmarks) según su package,
+        resources/ y db/ a src/main/resources, y el resto (loadtests/) se mantiene.
+        """
+        ruta = ruta.replace(os.sep, "/")
+        if self.formato != "arbol":
+            return ruta
+        primera, _, resto = ruta.partition("/")
+        if primera in PREFIJOS_RECURSOS:
+            return posixpath.join("src/main/resources", PREFIJOS_RECURSOS[primera], resto)
+        if not ruta.endswith(".java"):
+            return ruta
+        match = PATRON_PAQUETE.search(contenido or "")
+        if match:
+            paquete = match.group(1).replace(".", "/")
+            ruta = posixpath.join(paquete, posixpath.basename(ruta))
+        else:
+            ruta = posixpath.join(self.paquete_base.replace(".", "/"), ruta)
+        fuentes = "src/test/java" if primera + "/" in PREFIJOS_TEST else "src/main/java"
+        return posixpath.join(fuentes, ruta)
+
+    def agregar(self, ruta, contenido):
+        """
+        Añade un artefacto a la salida. Retorna True si se escribirá (es nuevo o ha cambiado).
+        """
+        destino = self.ruta_destino(ruta, contenido)
+        self.destinos[ruta] = destino
+        if not self.archivo and contenido_identico(os.path.join(self.destino, destino), contenido):
+            self.pendientes.pop(destino, None)
+            self.identicos[destino] = len(contenido.encode("utf-8"))
+            return False
+        self.identicos.pop(destino, None)
+        self.pendientes[destino] = contenido
+        return True
+
+    def agregar_todos(self, artefactos):
+        """
+        Añade un diccionario {ruta: contenido}. Retorna el número de artefactos que se escribirán.
+        """
+        return sum(self.agregar(ruta, contenido) for ruta, contenido in artefactos.items())
+
+    def generado(self, ruta):
+        """
+        Indica si el artefacto se ha añadido a la salida en esta ejecución.
+        """
+        return ruta in self.destinos
+
+    def contenido(self, ruta):
+        """
+        Contenido de un artefacto añadido en esta ejecución: el pendiente de escribir o, si era
+        idéntico al del disco, el del disco. Retorna None si no se ha generado.
+        """
+        destino = self.destinos.get(ruta)
+        if destino is None:
+            return None
+        if destino in self.pendientes:
+            return self.pendientes[destino]
+        try:
+            with open(os.path.join(self.destino, destino), "r", encoding="utf-8") as f:
+                return f.read()
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def cambios(self):
+        """
+        Artefactos pendientes comparados con el destino, sin escribir nada.
+        Retorna una lista ordenada de (ruta de destino, contenido actual o None si es nuevo, contenido nuevo).
+        """
+        resultado = []
+        for destino in sorted(self.pendientes):
+            try:
+                with open(os.path.join(self.destino, destino), "r", encoding="utf-8") as f:
+                    anterior = f.read()
+            except (OSError, UnicodeDecodeError):
+                anterior = None
+            resultado.append((destino, anterior, self.pendientes[destino]))
+        return resultado
+
+    def volcar(self):
+        """
+        Escribe los artefactos pendientes. Retorna el número de archivos escritos.
+        """
+        escritos = len(self.pendientes)
+        if self.formato == "zip":
+            self.escribir_zip()
+        elif self.formato == "tar":
+            self.escribir_tar()
+        elif self.pendientes:
+            self.escribir_directorio()
+        self.pendientes = {}
+        return escritos
+
+    def escribir_directorio(self):
+        for directorio in {os.path.dirname(os.path.join(self.destino, destino)) for destino in self.pendientes}:
+            os.makedirs(directorio, exist_ok=True)
+        sufijo = f".{os.getpid()}.tmp"
+        temporales = []
+        try:
+            for destino, contenido in self.pendientes.items():
+                ruta = os.path.join(self.destino, destino)
+                temporales.append(ruta)
+                with open(ruta + sufijo, "w", encoding="utf-8") as f:
+                    f.write(contenido)
+            for ruta in temporales:
+                os.replace(ruta + sufijo, ruta)
+        except OSError:
+            for ruta in temporales:
+                if os.path.exists(ruta + sufijo):
+                    os.remove(ruta + sufijo)
+            raise
+
+    def reemplazar_archivo(self, escribir):
+        """
+        Escribe el archivo comprimido con la función escribir(temporal) y lo renombra al destino.
+        """
+        directorio = os.path.dirname(os.path.abspath(self.destino))
+        os.makedirs(directorio, exist_ok=True)
+        temporal = f"{self.destino}.{os.getpid()}.tmp"
+        try:
+            escribir(temporal)
+        except OSError:
+            if os.path.exists(temporal):
+                os.remove(temporal)
+            raise
+        os.replace(temporal, self.destino)
+
+    def escribir_zip(self):
+        def escribir(temporal):
+            with zipfile.ZipFile(temporal, "w", zipfile.ZIP_DEFLATED) as archivo:
+                for destino in sorted(self.pendientes):
+                    archivo.writestr(destino, self.pendientes[destino])
+        self.reemplazar_archivo(escribir)
+
+    def escribir_tar(self):
+        modo = "w:gz" if self.destino.endswith((".gz", ".tgz")) else "w"
+        instante = time.time()
+
+        def escribir(temporal):
+            with tarfile.open(temporal, modo) as archivo:
+                for destino in sorted(self.pendientes):
+                    datos = self.pendientes[destino].encode("utf-8")
+                    info = tarfile.TarInfo(destino)
+                    info.size = len(datos)
+                    info.mtime = instante
+                    info.mode = 0o644
+                    archivo.addfile(info, io.BytesIO(datos))
+        self.reemplazar_archivo(escribir)
@@ -1,14 +1,8 @@
 import os
-import re
 import inquirer
 
-def extraer_atributos(codigo_java):
-    """
-    Extrae los atributos de la clase Java.
-    Busca variables privadas con su tipo de dato y nombre.
-    """
-    patron = re.findall(r'private\s+([\w<>]+)\s+(\w+);', codigo_java)
-    return patron
+from gen.nombres import extraer_base_paquete, importaciones_tipos
+from gen.specification import operadores_seleccionados
 
 def seleccionar_atributos(atributos):
     """
@@ -28,22 +22,30 @@ def seleccionar_atributos(atributos):
     
     return []
 
-def generar_search_model(nombre_entidad, paquete, atributos_seleccionados):
+def generar_search_model(nombre_entidad, paquete, atributos_seleccionados, id_atributo=None, enums=None, importaciones_proyecto=None):
     """
-    Genera el código Java para el SearchModel con los atributos seleccionados.
+    Genera el código Java para el SearchModel con un campo por cada filtro de los atributos
+    seleccionados (igualdad, rangos From/To, prefijo StartsWith y listas In; ver
+    gen/specification.py:operadores_atributo). Los enums y demás tipos del proyecto se importan
+    con importaciones_proyecto (ver gen/indice.py:importaciones_entidad).
     """
     nombre_simple = nombre_entidad.replace("Entity", "")
     nombre_search = f"{nombre_simple}SearchModel"
+    operadores = operadores_seleccionados(atributos_seleccionados, id_atributo, enums)
 
     # Importaciones necesarias
-    importaciones = """import lombok.Data;
-"""
+    tipos_importaciones = importaciones_tipos((tipo for _, tipo, _, _ in operadores), importaciones_proyecto)
+    # Las del proyecto van junto a lombok y las de java.* en su propio bloque
+    importaciones = "\n".join(sorted({"import lombok.Data;"} | {i for i in tipos_importaciones if not i.startswith("import java.")})) + "\n"
+    importaciones_java = sorted(i for i in tipos_importaciones if i.startswith("import java."))
+    if importaciones_java:
+        importaciones += "\n" + "\n".join(importaciones_java) + "\n"
 
-    # Fijamos el package de forma fija (igual que en Specifications)
-    paquete_search = "com.inycom.cws.search"
+    # El package cuelga de la base del de la entidad (igual que en Specifications)
+    paquete_search = f"{extraer_base_paquete(paquete)}.search"
 
     # Definir los atributos del SearchModel
-    atributos_str = "\n    ".join([f"private {tipo} {nombre};" for tipo, nombre in atributos_seleccionados])
+    atributos_str = "\n    ".join([f"private {tipo} {campo};" for campo, tipo, _, _ in operadores])
 
     # Generar código del SearchModel
     search_code = f"""package {paquete_search};
@@ -58,51 +60,28 @@ public class {nombre_search} {{
 """
     return search_code
 
-def generar_search_model_archivo(entidad_file, atributos_seleccionados=None):
+def generar_search_model_archivo(entidad, salida, atributos_seleccionados=None, enums=None):
     """
-    Genera el SearchModel correspondiente a partir del archivo de la entidad.
-    Si se pasa una lista de atributos ya seleccionados, se usa esa; de lo contrario, se extrae y solicita.
+    Genera el SearchModel correspondiente a partir del modelo de la entidad y lo añade a la salida en search.
+    Si se pasa una lista de atributos ya seleccionados, se usa esa; de lo contrario, se solicita.
     """
-    # Leer código Java
-    with open(entidad_file, "r", encoding="utf-8") as f:
-        codigo_java = f.read()
-
-    # Extraer metadatos
-    nombre_entidad = extraer_nombre_entidad(codigo_java)
-    paquete = extraer_paquete(codigo_java)
-    atributos = extraer_atributos(codigo_java)
-
-    if not nombre_entidad or not atributos:
+    if not entidad.atributos:
         print("❌ Error: No se pudo extraer el nombre de la entidad o los atributos.")
         return
 
     # Si no se han pasado atributos seleccionados, se solicita por consola
     if atributos_seleccionados is None:
-        atributos_seleccionados = seleccionar_atributos(atributos)
+        atributos_seleccionados = seleccionar_atributos(entidad.atributos)
 
     if not atributos_seleccionados:
         print("⚠ No se seleccionaron atributos. No se generará el SearchModel.")
         return
 
     # Generar SearchModel
-    search_code = generar_search_model(nombre_entidad, paquete, atributos_seleccionados)
-
-    # Crear carpeta 'output/search' si no existe
-    search_dir = os.path.join("output", "search")
-    os.makedirs(search_dir, exist_ok=True)
+    search_code = generar_search_model(entidad.nombre, entidad.paquete, atributos_seleccionados, entidad.id_atributo, enums,
+                                       entidad.importaciones_proyecto)
 
-    # Guardar archivo en 'output/search' con el nombre adecuado
-    search_file = os.path.join(search_dir, f"{nombre_entidad.replace('Entity', '')}SearchModel.java")
-    with open(search_file, "w", encoding="utf-8") as f:
-        f.write(search_code)
+    search_file = os.path.join("search", f"{entidad.nombre_simple}SearchModel.java")
+    salida.agregar(search_file, search_code)
 
     print(f"✅ SearchModel generado en: {search_file}")
-
-# Funciones auxiliares para extraer nombre de entidad y paquete
-def extraer_nombre_entidad(codigo_java):
-    match = re.search(r'public\s+class\s+(\w+)', codigo_java)
-    return match.group(1) if match else None
-
-def extraer_paquete(codigo_java):
-    match = re.search(r'package\s+([\w\.]+);', codigo_java)
-    return match.group(1) if match else "com.example"
@@ -1,12 +1,10 @@
-def extraer_base_paquete(paquete):
-    """
-    Extrae la base del package, por ejemplo:
-    de "com.inycom.cws.models.entities" retorna "com.inycom.cws"
-    """
-    parts = paquete.split('.')
-    if len(parts) >= 3:
-        return '.'.join(parts[:3])
-    return paquete
+from gen.cache import anotacion_cacheable, anotacion_evict
+from gen.lectura import anotacion_solo_lectura
+from gen.nombres import extraer_base_paquete
+
+MODOS_PAGINACION = ("page", "slice", "keyset")
+MODOS_PATCH = ("merge", "criteria")
+MODOS_DELETE = ("find", "jpql")
 
 
 def generar_create_service(nombre_entidad, paquete, id_tipo="Long"):
@@ -34,54 +32,128 @@ public class Create{nombre_simple}Service {{
 """
 
 
-def generar_find_service(nombre_entidad, paquete, id_tipo="Long"):
+def transaccion_lectura(base, solo_lectura, replica):
+    """
+    Importaciones (de la base y de Spring) y anotación de transacción para los servicios de consulta.
+    Retorna ("", "", "") si no se pide transacción de solo lectura.
+    """
+    if not (solo_lectura or replica):
+        return "", "", ""
+    importacion, anotacion = anotacion_solo_lectura(base, replica)
+    if replica:
+        return importacion + "\n", "", f"    {anotacion}\n"
+    return "", importacion + "\n", f"    {anotacion}\n"
+
+
+def generar_find_service(nombre_entidad, paquete, id_tipo="Long", solo_lectura=False, replica=False, cache=None):
+    """
+    solo_lectura=True anota find con @Transactional(readOnly = true): Hibernate no guarda
+    snapshots para el dirty-checking ni hace flush. replica=True usa en su lugar
+    @ReadOnlyTransactional, que además lee de la réplica (ver gen/lectura.py).
+    cache, el nombre de una caché (ver gen/cache.py), añade findDto, que cachea por id el DTO y no
+    la entidad: una entidad gestionada en la caché se compartiría entre peticiones ya desacoplada y
+    sus asociaciones LAZY lanzarían LazyInitializationException. El DTO se construye dentro de
+    una transacción de solo lectura; find, que devuelve la entidad, no se cachea.
+    """
     base = extraer_base_paquete(paquete)
     nombre_simple = nombre_entidad.replace("Entity", "")
     nombre_var = nombre_simple[0].lower() + nombre_simple[1:]
+    import_base, import_spring, anotacion = transaccion_lectura(base, solo_lectura, replica)
+    import_cache = find_dto = import_dto = ""
+    if cache:
+        import_cache, anotacion_cache = anotacion_cacheable(cache)
+        import_dto_base, import_dto_spring, anotacion_dto = transaccion_lectura(base, True, replica)
+        import_base = import_base or import_dto_base
+        import_spring = import_spring or import_dto_spring
+        import_dto = f"import {base}.mappers.{nombre_simple}Mapper;\nimport {base}.models.dtos.{nombre_simple}Dto;\n"
+        find_dto = f"""
+{anotacion_cache}{anotacion_dto}    public {nombre_simple}Dto findDto(final {id_tipo} {nombre_var}Id) {{
+        return {nombre_simple}Mapper.toDto(find({nombre_var}Id));
+    }}
+"""
     return f"""package {base}.services;
 
-import {base}.exceptions.CwsException;
-import {base}.models.entities.{nombre_entidad};
+{import_base}import {base}.exceptions.CwsException;
+{import_dto}import {base}.models.entities.{nombre_entidad};
 import {base}.repositories.{nombre_simple}Repository;
 import lombok.RequiredArgsConstructor;
-import org.springframework.stereotype.Service;
-
+{import_cache}import org.springframework.stereotype.Service;
+{import_spring}
 @RequiredArgsConstructor
 @Service
 public class Find{nombre_simple}Service {{
     private final {nombre_simple}Repository repository;
 
-    public {nombre_entidad} find(final {id_tipo} {nombre_var}Id) {{
+{anotacion}    public {nombre_entidad} find(final {id_tipo} {nombre_var}Id) {{
         return repository.findById({nombre_var}Id)
                          .orElseThrow(() -> new CwsException("Not found " + {nombre_var}Id));
     }}
-}}
+{find_dto}}}
 """
 
 
-def generar_patch_service(nombre_entidad, paquete, id_tipo="Long"):
+def generar_patch_service(nombre_entidad, paquete, id_tipo="Long", modo="merge", cache=None):
+    """
+    modo="merge" carga la entidad, la combina con el parche mediante PatchUtils.merge y la guarda
+    (SELECT más un UPDATE de todas las columnas).
+    modo="criteria" delega en el método patchById del fragmento del repositorio, que lanza un único
+    UPDATE con las columnas no nulas del POJO; si no se actualiza ninguna fila, el id no existe.
+    cache, el nombre de la caché de Find{X}Service, invalida la clave del id.
+    En modo "merge" la entidad se lee con repository.findById dentro de la propia transacción y no
+    con Find{X}Service.find: este puede ser de solo lectura (con open-session-in-view la entidad
+    seguiría marcada como read-only y el flush descartaría los cambios) o estar cacheado
+    (PatchUtils.merge modificaría la instancia compartida).
+    """
+    if modo not in MODOS_PATCH:
+        raise ValueError(f"Modo de patch desconocido: {modo}. Opciones: {', '.join(MODOS_PATCH)}")
     base = extraer_base_paquete(paquete)
     nombre_simple = nombre_entidad.replace("Entity", "")
     nombre_var = nombre_simple[0].lower() + nombre_simple[1:]
+    import_cache, anotacion_cache = anotacion_evict(cache) if cache else ("", "")
+    if modo == "criteria":
+        return f"""package {base}.services;
+
+import {base}.exceptions.CwsException;
+import {base}.models.pojos.{nombre_simple};
+import {base}.repositories.{nombre_simple}Repository;
+import lombok.RequiredArgsConstructor;
+{import_cache}import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+@RequiredArgsConstructor
+@Service
+public class Patch{nombre_simple}Service {{
+    private final {nombre_simple}Repository repository;
+
+{anotacion_cache}    @Transactional
+    public void patch(final {id_tipo} {nombre_var}Id, final {nombre_simple} {nombre_var}Patch) {{
+        if (repository.patchById({nombre_var}Id, {nombre_var}Patch) == 0) {{
+            throw new CwsException("Not found " + {nombre_var}Id);
+        }}
+    }}
+}}
+"""
     return f"""package {base}.services;
 
+import {base}.exceptions.CwsException;
 import {base}.mappers.{nombre_simple}Mapper;
 import {base}.models.entities.{nombre_entidad};
 import {base}.models.pojos.{nombre_simple};
 import {base}.repositories.{nombre_simple}Repository;
-import {base}.services.Find{nombre_simple}Service;
 import {base}.utils.PatchUtils;
 import lombok.RequiredArgsConstructor;
-import org.springframework.stereotype.Service;
+{import_cache}import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
 
 @RequiredArgsConstructor
 @Service
 public class Patch{nombre_simple}Service {{
-    private final Find{nombre_simple}Service service;
     private final {nombre_simple}Repository repository;
 
+{anotacion_cache}    @Transactional
     public void patch(final {id_tipo} {nombre_var}Id, final {nombre_simple} {nombre_var}Patch) {{
-        final {nombre_entidad} existingEntity = service.find({nombre_var}Id);
+        final {nombre_entidad} existingEntity = repository.findById({nombre_var}Id)
+                .orElseThrow(() -> new CwsException("Not found " + {nombre_var}Id));
         final {nombre_entidad} patchedEntity = {nombre_simple}Mapper.toEntity({nombre_var}Patch);
         repository.save(PatchUtils.merge(existingEntity, patchedEntity));
     }}
@@ -89,15 +161,47 @@ public class Patch{nombre_simple}Service {{
 """
 
 
-def generar_delete_service(nombre_entidad, paquete, id_tipo="Long"):
+def generar_delete_service(nombre_entidad, paquete, id_tipo="Long", modo="find", cache=None):
+    """
+    modo="find" busca la entidad y la elimina (SELECT más DELETE). Es el único que respeta
+    las cascadas, orphanRemoval y los callbacks @PreRemove de la entidad.
+    modo="jpql" usa el DELETE JPQL deleteDirectById del repositorio (ver generar_repository) y
+    comprueba las filas afectadas. CrudRepository.deleteById no sirve: hace también un findById.
+    cache, el nombre de la caché de Find{X}Service, invalida la clave del id.
+    """
+    if modo not in MODOS_DELETE:
+        raise ValueError(f"Modo de delete desconocido: {modo}. Opciones: {', '.join(MODOS_DELETE)}")
     base = extraer_base_paquete(paquete)
     nombre_simple = nombre_entidad.replace("Entity", "")
+    import_cache, anotacion_cache = anotacion_evict(cache) if cache else ("", "")
+    if modo == "jpql":
+        return f"""package {base}.services;
+
+import {base}.exceptions.CwsException;
+import {base}.repositories.{nombre_simple}Repository;
+import lombok.RequiredArgsConstructor;
+{import_cache}import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+@RequiredArgsConstructor
+@Service
+public class Delete{nombre_simple}Service {{
+    private final {nombre_simple}Repository repository;
+
+{anotacion_cache}    @Transactional
+    public void delete(final {id_tipo} id) {{
+        if (repository.deleteDirectById(id) == 0) {{
+            throw new CwsException("Not found " + id);
+        }}
+    }}
+}}
+"""
     return f"""package {base}.services;
 
 import {base}.models.entities.{nombre_entidad};
 import {base}.repositories.{nombre_simple}Repository;
 import lombok.RequiredArgsConstructor;
-import org.springframework.stereotype.Service;
+{import_cache}import org.springframework.stereotype.Service;
 
 @RequiredArgsConstructor
 @Service
@@ -105,7 +209,7 @@ public class Delete{nombre_simple}Service {{
     private final Find{nombre_simple}Service service;
     private final {nombre_simple}Repository repository;
 
-    public void delete(final {id_tipo} id) {{
+{anotacion_cache}    public void delete(final {id_tipo} id) {{
         final {nombre_entidad} entity = service.find(id);
         repository.delete(entity);
     }}
@@ -113,35 +217,77 @@ public class Delete{nombre_simple}Service {{
 """
 
 
-def generar_search_service(nombre_entidad, paquete):
+def generar_search_service(nombre_entidad, paquete, paginacion="page", solo_lectura=False, replica=False,
+                           proyeccion=False):
+    """
+    paginacion="page" usa findAll(specification, pageable), que lanza además un SELECT COUNT(*).
+    paginacion="slice" usa el fragmento findSlice del repositorio, sin consulta de conteo,
+    y devuelve un Slice para que el controller pueda informar de si hay más resultados.
+    paginacion="keyset" recorre los resultados con un ScrollPosition (ver gen/cursor.py) y
+    devuelve un Window: el coste de cada página no depende de su profundidad.
+    solo_lectura y replica, como en generar_find_service.
+    proyeccion=True usa findProjected del fragmento (ver gen/proyeccion.py), que solo lee las
+    columnas del DTO y no lanza el conteo; no está disponible con paginacion="keyset".
+    """
+    if paginacion not in MODOS_PAGINACION:
+        raise ValueError(f"Modo de paginación desconocido: {paginacion}. Opciones: {', '.join(MODOS_PAGINACION)}")
+    if proyeccion and paginacion == "keyset":
+        raise ValueError("La proyección no admite paginacion=\"keyset\"")
     base = extraer_base_paquete(paquete)
     nombre_simple = nombre_entidad.replace("Entity", "")
+    parametros = f"final {nombre_simple}SearchModel searchModel, final Pageable pageable"
+    import_cursor = ""
+    if paginacion == "slice":
+        import_resultado = "import org.springframework.data.domain.Slice;\n"
+        import_collection = ""
+        tipo_resultado = f"Slice<{nombre_simple}Dto>"
+        consulta = f"repository.findSlice(specification, pageable).map({nombre_simple}Mapper::toDto)"
+    elif paginacion == "keyset":
+        import_cursor = f"import {base}.search.{nombre_simple}Cursor;\n"
+        import_resultado = "import org.springframework.data.domain.ScrollPosition;\nimport org.springframework.data.domain.Window;\n"
+        import_collection = ""
+        tipo_resultado = f"Window<{nombre_simple}Dto>"
+        parametros = f"final {nombre_simple}SearchModel searchModel, final ScrollPosition position, final int size"
+        consulta = f"""repository.findBy(specification, query -> query.sortBy({nombre_simple}Cursor.SORT)
+                        .limit(size)
+                        .scroll(position))
+                .map({nombre_simple}Mapper::toDto)"""
+    else:
+        import_resultado = ""
+        import_collection = "\nimport java.util.Collection;\n"
+        tipo_resultado = f"Collection<{nombre_simple}Dto>"
+        consulta = f"repository.findAll(specification, pageable).map({nombre_simple}Mapper::toDto).getContent()"
+    import_mapper = f"import {base}.mappers.{nombre_simple}Mapper;\n"
+    import_proyeccion = ""
+    if proyeccion:
+        import_mapper = ""
+        import_proyeccion = f"import {base}.models.projections.{nombre_simple}Projection;\n"
+        consulta = f"repository.findProjected(specification, pageable).map({nombre_simple}Projection::toDto)"
+        if paginacion == "page":
+            consulta += ".getContent()"
+    import_pageable = "" if paginacion == "keyset" else "import org.springframework.data.domain.Pageable;\n"
+    import_base, import_spring, anotacion = transaccion_lectura(base, solo_lectura, replica)
     return f"""package {base}.services;
 
-import {base}.factories.{nombre_simple}SpecificationFactory;
-import {base}.mappers.{nombre_simple}Mapper;
-import {base}.models.dtos.{nombre_simple}Dto;
+{import_base}import {base}.factories.{nombre_simple}SpecificationFactory;
+{import_mapper}import {base}.models.dtos.{nombre_simple}Dto;
 import {base}.models.entities.{nombre_entidad};
-import {base}.repositories.{nombre_simple}Repository;
-import {base}.search.{nombre_simple}SearchModel;
+{import_proyeccion}import {base}.repositories.{nombre_simple}Repository;
+{import_cursor}import {base}.search.{nombre_simple}SearchModel;
 import lombok.RequiredArgsConstructor;
-import org.springframework.data.domain.Pageable;
-import org.springframework.data.jpa.domain.Specification;
+{import_pageable}{import_resultado}import org.springframework.data.jpa.domain.Specification;
 import org.springframework.stereotype.Service;
-
-import java.util.Collection;
-
+{import_spring}{import_collection}
 @RequiredArgsConstructor
 @Service
 public class Search{nombre_simple}Service {{
     private final {nombre_simple}Repository repository;
 
-    public Collection<{nombre_simple}Dto> search(final {nombre_simple}SearchModel searchModel, final Pageable pageable) {{
+{anotacion}    public {tipo_resultado} search({parametros}) {{
         final Specification<{nombre_entidad}> specification =
                 {nombre_simple}SpecificationFactory.mapToSpecification(searchModel);
 
-        return repository.findAll(specification, pageable).map({nombre_simple}Mapper::toDto).getContent();
+        return {consulta};
     }}
 }}
 """
-
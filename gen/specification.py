@@ -1,14 +1,20 @@
 import os
-import re
 import inquirer
 
-def extraer_atributos_entidad(codigo_java):
-    """
-    Extrae los atributos de la clase Entity en Java.
-    Busca variables privadas con su tipo de dato y nombre.
-    """
-    patron = re.findall(r'private\s+([\w<>]+)\s+(\w+);', codigo_java)
-    return patron
+from gen.nombres import envolver, extraer_base_paquete, importaciones_tipos
+
+# Tipos sobre los que se generan filtros de rango (From/To)
+TIPOS_RANGO = {
+    "Integer", "int", "Long", "long", "Short", "short", "Double", "double", "Float", "float",
+    "BigDecimal", "BigInteger",
+    "LocalDate", "LocalDateTime", "LocalTime", "OffsetDateTime", "ZonedDateTime", "Instant",
+}
+
+# Tipos escalares conocidos: cualquier otro tipo simple se trata como enum (filtro In)
+TIPOS_ESCALARES = TIPOS_RANGO | {"String", "Boolean", "boolean", "UUID", "Character", "char", "Byte", "byte"}
+
+# Sufijos de tipo que indican relaciones o embebidos, sobre los que no se generan filtros In
+SUFIJOS_NO_ENUM = ("Entity", "Embeddable")
 
 def seleccionar_atributos(atributos):
     """
@@ -31,23 +37,66 @@ def seleccionar_atributos(atributos):
     
     return []
 
-def generar_specifications(nombre_entidad, paquete_entidad, atributos_seleccionados):
+def es_enum(tipo, enums=None):
+    """
+    Indica si el tipo es un enum. Si se conoce el conjunto de enums del proyecto se usa;
+    si no, se considera enum cualquier tipo simple que no sea escalar, relación ni embebido.
+    """
+    if enums is not None:
+        return tipo in enums
+    return (
+        "<" not in tipo
+        and "[" not in tipo
+        and tipo not in TIPOS_ESCALARES
+        and not tipo.endswith(SUFIJOS_NO_ENUM)
+    )
+
+def operadores_atributo(tipo, nombre, es_id=False, enums=None):
+    """
+    Retorna los filtros que se generan para un atributo según su tipo, como tuplas
+    (campo del SearchModel, tipo del campo, operador, expresión Criteria):
+      - siempre igualdad: campo = nombre;
+    Los campos de tipo primitivo se declaran con su envoltorio ("boolean" -> "Boolean"): un
+    primitivo nunca es null, y el filtro se aplicaría siempre con su valor por defecto.
+      - números y fechas: nombreFrom / nombreTo (>= y <=);
+      - String: nombreStartsWith (LIKE 'prefijo%', que puede usar un índice);
+      - @Id y enums: nombreIn (IN sobre una lista de valores).
+    """
+    tipo_envuelto = envolver(tipo)
+    operadores = [(nombre, tipo_envuelto, "equal", f'builder.equal(root.get("{nombre}"), {nombre})')]
+    if tipo in TIPOS_RANGO:
+        operadores.append((f"{nombre}From", tipo_envuelto, "from",
+                           f'builder.greaterThanOrEqualTo(root.<{tipo_envuelto}>get("{nombre}"), {nombre}From)'))
+        operadores.append((f"{nombre}To", tipo_envuelto, "to",
+                           f'builder.lessThanOrEqualTo(root.<{tipo_envuelto}>get("{nombre}"), {nombre}To)'))
+    if tipo == "String":
+        operadores.append((f"{nombre}StartsWith", "String", "startsWith",
+                           f"builder.like(root.<String>get(\"{nombre}\"), escapeLike({nombre}StartsWith) + \"%\", '\\\\')"))
+    if es_id or es_enum(tipo, enums):
+        operadores.append((f"{nombre}In", f"List<{tipo_envuelto}>", "in",
+                           f'root.get("{nombre}").in({nombre}In)'))
+    return operadores
+
+def operadores_seleccionados(atributos_seleccionados, id_atributo=None, enums=None):
+    """
+    Aplica operadores_atributo a todos los atributos seleccionados, en orden.
+    """
+    id_nombre = id_atributo[1] if id_atributo else None
+    operadores = []
+    for tipo, nombre in atributos_seleccionados:
+        operadores.extend(operadores_atributo(tipo, nombre, nombre == id_nombre, enums))
+    return operadores
+
+def generar_cuerpo_specifications(nombre_entidad, atributos_seleccionados, id_atributo=None, enums=None, importaciones_proyecto=None):
     """
-    Genera el código Java para Specifications con los atributos seleccionados.
+    Genera los métodos de la clase Specifications (empty, un método por filtro y, si hay
+    filtros de prefijo, el escape de comodines LIKE) junto con las importaciones de tipos, también
+    las de los tipos del proyecto (importaciones_proyecto).
+    Retorna (importaciones, código de la clase sin la cabecera).
     """
     nombre_simple = nombre_entidad.replace("Entity", "")
     nombre_spec = f"{nombre_simple}Specifications"
-
-    # El package se fija siempre
-    paquete_specifications = "com.inycom.cws.specifications"
-
-    # Importaciones (incluye el Entity original)
-    importaciones = f"""package {paquete_specifications};
-
-import {paquete_entidad}.{nombre_entidad};
-import lombok.experimental.UtilityClass;
-import org.springframework.data.jpa.domain.Specification;
-"""
+    operadores = operadores_seleccionados(atributos_seleccionados, id_atributo, enums)
 
     # Método empty()
     metodo_empty = f"""
@@ -59,60 +108,78 @@ public class {nombre_spec} {{
     }}
 """
 
-    # Métodos para cada atributo seleccionado
+    # Métodos para cada filtro de los atributos seleccionados
     especificaciones = "\n".join([
-        f"""    public static Specification<{nombre_entidad}> {attr}(final {tipo} {attr}) {{
-        return (root, query, builder) -> builder.equal(root.get("{attr}"), {attr});
+        f"""    public static Specification<{nombre_entidad}> {campo}(final {tipo} {campo}) {{
+        return (root, query, builder) -> {expresion};
     }}"""
-        for tipo, attr in atributos_seleccionados
+        for campo, tipo, _, expresion in operadores
     ])
 
+    if any(operador == "startsWith" for _, _, operador, _ in operadores):
+        especificaciones += """
+
+    private static String escapeLike(final String value) {
+        return value.replace("\\\\", "\\\\\\\\").replace("%", "\\\\%").replace("_", "\\\\_");
+    }"""
+
     cierre_clase = "}\n"
 
-    specifications_code = f"""{importaciones}
-{metodo_empty}
+    importaciones = importaciones_tipos((tipo for _, tipo, _, _ in operadores), importaciones_proyecto)
+    return importaciones, f"""{metodo_empty}
 {especificaciones}
 {cierre_clase}
 """
-    return nombre_spec, specifications_code
 
-def generar_specifications_archivo(entidad_file, atributos_seleccionados=None):
+def generar_specifications(nombre_entidad, paquete_entidad, atributos_seleccionados, id_atributo=None, enums=None, importaciones_proyecto=None):
     """
-    Genera Specifications a partir del archivo de la entidad.
-    Si se pasa una lista de atributos ya seleccionados, se usa esa; de lo contrario, se extrae y solicita.
+    Genera el código Java para Specifications con los filtros de los atributos seleccionados.
     """
-    nombre_entidad = os.path.basename(entidad_file).replace(".java", "")
+    nombre_simple = nombre_entidad.replace("Entity", "")
+    nombre_spec = f"{nombre_simple}Specifications"
 
-    with open(entidad_file, "r", encoding="utf-8") as f:
-        codigo_java = f.read()
+    # El package cuelga de la base del de la entidad
+    paquete_specifications = f"{extraer_base_paquete(paquete_entidad)}.specifications"
 
-    paquete = extraer_paquete(codigo_java)
-    atributos = extraer_atributos_entidad(codigo_java)
+    tipos_importaciones, cuerpo = generar_cuerpo_specifications(nombre_entidad, atributos_seleccionados, id_atributo, enums, importaciones_proyecto)
+    java = sorted(i for i in tipos_importaciones if i.startswith("import java."))
+    importaciones_java = "\n" + "\n".join(java) + "\n" if java else ""
+    # Los tipos del proyecto (enums, embebidos) van junto a la entidad
+    importaciones_proyecto = "".join(f"{i}\n" for i in sorted(tipos_importaciones) if not i.startswith("import java."))
 
-    if not nombre_entidad or not atributos:
+    # Importaciones (incluye el Entity original)
+    importaciones = f"""package {paquete_specifications};
+
+import {paquete_entidad}.{nombre_entidad};
+{importaciones_proyecto}import lombok.experimental.UtilityClass;
+import org.springframework.data.jpa.domain.Specification;
+{importaciones_java}"""
+
+    specifications_code = f"""{importaciones}
+{cuerpo}"""
+    return nombre_spec, specifications_code
+
+def generar_specifications_archivo(entidad, salida, atributos_seleccionados=None, enums=None):
+    """
+    Genera Specifications a partir del modelo de la entidad y las añade a la salida en specifications.
+    Si se pasa una lista de atributos ya seleccionados, se usa esa; de lo contrario, se solicita.
+    """
+    if not entidad.atributos:
         print("❌ Error: No se pudo extraer el nombre de la entidad o los atributos.")
         return ""
 
     if atributos_seleccionados is None:
-        atributos_seleccionados = seleccionar_atributos(atributos)
+        atributos_seleccionados = seleccionar_atributos(entidad.atributos)
 
     if not atributos_seleccionados:
         print("⚠ No se seleccionaron atributos. No se generará Specifications.")
         return ""
 
-    nombre_spec, spec_code = generar_specifications(nombre_entidad, paquete, atributos_seleccionados)
+    nombre_spec, spec_code = generar_specifications(entidad.nombre, entidad.paquete, atributos_seleccionados, entidad.id_atributo, enums,
+                                                    entidad.importaciones_proyecto)
 
-    # Crear carpeta "output/specifications" si no existe
-    spec_dir = os.path.join("output", "specifications")
-    os.makedirs(spec_dir, exist_ok=True)
-
-    spec_file = os.path.join(spec_dir, f"{nombre_spec}.java")
-    with open(spec_file, "w", encoding="utf-8") as f:
-        f.write(spec_code)
+    spec_file = os.path.join("specifications", f"{nombre_spec}.java")
+    salida.agregar(spec_file, spec_code)
 
     print(f"✅ Specifications generado en: {spec_file}")
     return spec_code
-
-def extraer_paquete(codigo_java):
-    match = re.search(r'package\s+([\w\.]+);', codigo_java)
-    return match.group(1) if match else "com.example"
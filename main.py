@@ -1,5 +1,4 @@
 import os
-import shutil
 
 from gen.controller import (
     generar_get_controller,
@@ -16,13 +15,16 @@ from gen.service import (
     generar_search_service
 )
 from gen.repository import generar_repository
-from extract_data import extraer_nombre_entidad, extraer_paquete
+from gen.lectura import configurar_hints
+from extract_data import cargar_entidad
 from gen.dto import generar_dto_archivo
 from gen.pojo import generar_pojo_archivo  # Generador de POJOs
 from gen.mapper import generar_mapper_archivo
-from gen.search import generar_search_model_archivo, extraer_atributos, seleccionar_atributos
+from gen.search import generar_search_model_archivo, seleccionar_atributos
 from gen.specification import generar_specifications_archivo
 from gen.factories import generar_archivos_factories
+from gen.indice import indice_proyecto
+from gen.salida import SalidaArtefactos
 
 
 def seleccionar_archivo(entidad_dir):
@@ -48,6 +50,19 @@ def seleccionar_archivo(entidad_dir):
         print("❌ Selección inválida. Intente de nuevo.")
 
 
+def volcar_salida(salida):
+    """
+    Escribe en disco los artefactos reunidos. Retorna False si no se pudieron escribir.
+    """
+    try:
+        escritos = salida.volcar()
+    except OSError as e:
+        print(f"❌ No se pudo escribir la salida en {salida.destino}: {e}")
+        return False
+    print(f"✅ {escritos} archivos escritos en: {salida.destino}")
+    return True
+
+
 def main():
     # Solicitar por consola el directorio que contiene las entidades
     entidad_dir = input("Ingrese el directorio que contiene las entidades: ").strip()
@@ -65,24 +80,26 @@ def main():
         print(f"❌ Error: El archivo no existe en la ruta: {entidad_file}")
         return
 
-    # Leer el código de la entidad
-    with open(entidad_file, "r", encoding="utf-8") as f:
-        codigo_java = f.read()
-
-    # Extraer metadatos
-    nombre_entidad = extraer_nombre_entidad(codigo_java)
-    paquete = extraer_paquete(codigo_java)
-    nombre_simple = nombre_entidad.replace("Entity", "")
-
-    if not nombre_entidad or not paquete:
+    # Leer y analizar la entidad una sola vez; el modelo se comparte con todos los generadores
+    entidad = cargar_entidad(entidad_file)
+    if not entidad:
         print("❌ No se pudo extraer el nombre de la entidad o el paquete.")
         return
+    # Tipos de otros archivos (embeddables sin @Embedded, relaciones) y sus importaciones, resueltos con el índice del directorio
+    indice = indice_proyecto(entidad_dir)
+    entidad.tipos_proyecto = indice.tipos_entidad(entidad.nombre)
+    entidad.importaciones_proyecto = indice.importaciones_entidad(entidad.nombre)
 
-    # Mover (copiar) la entidad seleccionada a output/models/entities/
-    entities_out_dir = os.path.join("output", "models", "entities")
-    os.makedirs(entities_out_dir, exist_ok=True)
-    shutil.copy(entidad_file, os.path.join(entities_out_dir, os.path.basename(entidad_file)))
-    print(f"✅ Entidad copiada a: {os.path.join(entities_out_dir, os.path.basename(entidad_file))}")
+    nombre_entidad = entidad.nombre
+    paquete = entidad.paquete
+    nombre_simple = entidad.nombre_simple
+    id_tipo = entidad.id_tipo
+
+    # Todos los artefactos se reúnen en memoria y se escriben juntos en 'output' al terminar
+    salida = SalidaArtefactos("output")
+
+    # Copiar la entidad seleccionada a output/models/entities/
+    salida.agregar(os.path.join("models", "entities", os.path.basename(entidad_file)), entidad.codigo)
 
     # Solicitar el valor para la constante compartida (para POST, PATCH y DELETE)
     con_value_input = input("Ingrese el valor para la constante compartida para el controlador (por ejemplo, 40): ").strip()
@@ -91,75 +108,59 @@ def main():
         return
     con_value = con_value_input
 
-    # Crear carpetas dentro de la carpeta 'output' si no existen
-    output_dirs = {
-        "controllers": os.path.join("output", "controllers"),
-        "services": os.path.join("output", "services"),
-        "repositories": os.path.join("output", "repositories"),
-        "models_dtos": os.path.join("output", "models", "dtos"),
-        "models_pojos": os.path.join("output", "models", "pojos"),
-        "mappers": os.path.join("output", "mappers"),
-        "search": os.path.join("output", "search"),
-        "specifications": os.path.join("output", "specifications"),
-        "factories": os.path.join("output", "factories")
-    }
-
-    for dir_path in output_dirs.values():
-        os.makedirs(dir_path, exist_ok=True)
-
     # 1. Generar Controllers (GET no utiliza la constante)
     controllers_map = {
         f"Post{nombre_simple}Controller.java": generar_post_controller(nombre_entidad, paquete, con_value),
         f"Get{nombre_simple}Controller.java": generar_get_controller(nombre_entidad, paquete),
-        f"Patch{nombre_simple}Controller.java": generar_patch_controller(nombre_entidad, paquete, con_value),
-        f"Delete{nombre_simple}Controller.java": generar_delete_controller(nombre_entidad, paquete, con_value),
+        f"Patch{nombre_simple}Controller.java": generar_patch_controller(nombre_entidad, paquete, con_value, id_tipo),
+        f"Delete{nombre_simple}Controller.java": generar_delete_controller(nombre_entidad, paquete, con_value, id_tipo),
     }
     for filename, code in controllers_map.items():
-        filepath = os.path.join(output_dirs["controllers"], filename)
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(code)
+        salida.agregar(os.path.join("controllers", filename), code)
 
     # 2. Generar Services
     services_map = {
-        f"Create{nombre_simple}Service.java": generar_create_service(nombre_entidad, paquete),
-        f"Find{nombre_simple}Service.java": generar_find_service(nombre_entidad, paquete),
-        f"Patch{nombre_simple}Service.java": generar_patch_service(nombre_entidad, paquete),
-        f"Delete{nombre_simple}Service.java": generar_delete_service(nombre_entidad, paquete),
-        f"Search{nombre_simple}Service.java": generar_search_service(nombre_entidad, paquete),
+        f"Create{nombre_simple}Service.java": generar_create_service(nombre_entidad, paquete, id_tipo),
+        f"Find{nombre_simple}Service.java": generar_find_service(nombre_entidad, paquete, id_tipo, solo_lectura=True),
+        f"Patch{nombre_simple}Service.java": generar_patch_service(nombre_entidad, paquete, id_tipo),
+        f"Delete{nombre_simple}Service.java": generar_delete_service(nombre_entidad, paquete, id_tipo),
+        f"Search{nombre_simple}Service.java": generar_search_service(nombre_entidad, paquete, solo_lectura=True),
     }
     for filename, code in services_map.items():
-        filepath = os.path.join(output_dirs["services"], filename)
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(code)
+        salida.agregar(os.path.join("services", filename), code)
 
     # 3. Generar Repository
-    repo_code = generar_repository(nombre_entidad, paquete)
-    repo_file = os.path.join(output_dirs["repositories"], f"{nombre_simple}Repository.java")
-    with open(repo_file, "w", encoding="utf-8") as f:
-        f.write(repo_code)
+    repo_code = generar_repository(nombre_entidad, paquete, id_tipo, hints=configurar_hints())
+    salida.agregar(os.path.join("repositories", f"{nombre_simple}Repository.java"), repo_code)
 
     # 4. Generar archivos DTO y POJO
-    generar_pojo_archivo(entidad_file, output_dirs["models_pojos"])
-    generar_dto_archivo(entidad_file, output_dirs["models_dtos"], output_dirs["models_dtos"], output_dirs["models_pojos"])
+    generar_pojo_archivo(entidad, salida)
+    generar_dto_archivo(entidad, salida)
 
     # 5. Generar Mapper
-    generar_mapper_archivo(entidad_file)
+    generar_mapper_archivo(entidad, salida)
 
     # 6. Extraer atributos y solicitar selección (se hace una sola vez)
-    atributos = extraer_atributos(codigo_java)
+    atributos = entidad.atributos
     if not atributos:
         print("❌ No se pudieron extraer los atributos de la entidad.")
+        volcar_salida(salida)
         return
     atributos_seleccionados = seleccionar_atributos(atributos)
     if not atributos_seleccionados:
         print("⚠ No se seleccionaron atributos. Abortando generación de SearchModel, Specifications y Factories.")
+        volcar_salida(salida)
         return
 
-    # 7. Generar SearchModel, Specifications y Factories utilizando los mismos atributos seleccionados
-    generar_search_model_archivo(entidad_file, atributos_seleccionados)
-    generar_specifications_archivo(entidad_file, atributos_seleccionados)
-    generar_archivos_factories(entidad_file, atributos_seleccionados)
+    # 7. Generar SearchModel, Specifications y Factories utilizando los mismos atributos seleccionados.
+    # Los enums se resuelven con el índice del directorio de entidades (incluidos los de otros archivos)
+    enums = indice.enums_entidad(nombre_entidad)
+    generar_search_model_archivo(entidad, salida, atributos_seleccionados, enums)
+    generar_specifications_archivo(entidad, salida, atributos_seleccionados, enums)
+    generar_archivos_factories(entidad, salida, atributos_seleccionados, enums)
 
+    if not volcar_salida(salida):
+        return
     print("✅ Generación de código completada.")
     print("📁 Revisa la carpeta 'output' y sus subcarpetas: controllers, services, repositories, models/dtos, models/entities, models/pojos, mappers, search, specifications y factories.")
 
@@ -0,0 +1,39 @@
+package com.inycom.cws.factories;
+
+import com.inycom.cws.models.entities.PatientEntity;
+import com.inycom.cws.search.PatientSearchModel;
+import com.inycom.cws.specifications.PatientSpecifications;
+import lombok.experimental.UtilityClass;
+import org.springframework.data.jpa.domain.Specification;
+
+import java.util.LinkedList;
+import java.util.List;
+import java.util.Optional;
+
+
+@UtilityClass
+public class PatientSpecificationFactory {
+
+    public Specification<PatientEntity> mapToSpecification(final PatientSearchModel searchModel) {
+
+        final List<Specification<PatientEntity>> specifications = new LinkedList<>();
+
+        Optional.ofNullable(searchModel.getName())
+                .map(PatientSpecifications::name)
+                .ifPresent(specifications::add);
+        Optional.ofNullable(searchModel.getNameStartsWith())
+                .map(PatientSpecifications::nameStartsWith)
+                .ifPresent(specifications::add);
+        Optional.ofNullable(searchModel.getStatus())
+                .map(PatientSpecifications::status)
+                .ifPresent(specifications::add);
+        Optional.ofNullable(searchModel.getStatusIn())
+                .filter(values -> !values.isEmpty())
+                .map(PatientSpecifications::statusIn)
+                .ifPresent(specifications::add);
+
+        return specifications.stream()
+                .reduce(Specification::and)
+                .orElse(PatientSpecifications.empty());
+    }
+}
@@ -0,0 +1,18 @@
+package com.inycom.cws.models.pojos;
+
+import lombok.AllArgsConstructor;
+import lombok.Data;
+import lombok.NoArgsConstructor;
+import lombok.experimental.SuperBuilder;
+
+@SuperBuilder
+@Data
+@AllArgsConstructor
+@NoArgsConstructor
+public class Doctor {
+
+
+
+    private Long id;
+    private String fullName;
+}
\ No newline at end of file
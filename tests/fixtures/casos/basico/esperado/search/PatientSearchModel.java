@@ -0,0 +1,16 @@
+package com.inycom.cws.search;
+
+import com.inycom.cws.models.entities.PatientStatus;
+import lombok.Data;
+
+import java.util.List;
+
+
+@Data
+public class PatientSearchModel {
+
+    private String name;
+    private String nameStartsWith;
+    private PatientStatus status;
+    private List<PatientStatus> statusIn;
+}
@@ -0,0 +1,16 @@
+package com.inycom.cws.annotations;
+
+import com.inycom.cws.enums.AuditAction;
+
+import java.lang.annotation.ElementType;
+import java.lang.annotation.Retention;
+import java.lang.annotation.RetentionPolicy;
+import java.lang.annotation.Target;
+
+@Target(ElementType.METHOD)
+@Retention(RetentionPolicy.RUNTIME)
+public @interface AsyncAudit {
+    long controllerId();
+
+    AuditAction action();
+}
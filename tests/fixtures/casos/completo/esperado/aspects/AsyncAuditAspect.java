@@ -0,0 +1,30 @@
+package com.inycom.cws.aspects;
+
+import com.inycom.cws.annotations.AsyncAudit;
+import com.inycom.cws.events.AuditEvent;
+import lombok.RequiredArgsConstructor;
+import org.aspectj.lang.JoinPoint;
+import org.aspectj.lang.annotation.AfterReturning;
+import org.aspectj.lang.annotation.Aspect;
+import org.springframework.context.ApplicationEventPublisher;
+import org.springframework.stereotype.Component;
+
+import java.time.Instant;
+import java.util.Arrays;
+
+@Aspect
+@Component
+@RequiredArgsConstructor
+public class AsyncAuditAspect {
+
+    private final ApplicationEventPublisher publisher;
+
+    @AfterReturning("@annotation(asyncAudit)")
+    public void publish(final JoinPoint joinPoint, final AsyncAudit asyncAudit) {
+        publisher.publishEvent(new AuditEvent(
+                asyncAudit.controllerId(),
+                asyncAudit.action(),
+                Arrays.asList(joinPoint.getArgs()),
+                Instant.now()));
+    }
+}
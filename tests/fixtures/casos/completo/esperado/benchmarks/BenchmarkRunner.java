@@ -0,0 +1,22 @@
+package com.inycom.cws.benchmarks;
+
+import org.openjdk.jmh.results.format.ResultFormatType;
+import org.openjdk.jmh.runner.Runner;
+import org.openjdk.jmh.runner.RunnerException;
+import org.openjdk.jmh.runner.options.Options;
+import org.openjdk.jmh.runner.options.OptionsBuilder;
+
+public final class BenchmarkRunner {
+
+    private BenchmarkRunner() {
+    }
+
+    public static void main(final String[] args) throws RunnerException {
+        final Options options = new OptionsBuilder()
+                .include(BenchmarkRunner.class.getPackageName() + ".*Benchmark")
+                .resultFormat(ResultFormatType.JSON)
+                .result(args.length > 0 ? args[0] : "jmh-result.json")
+                .build();
+        new Runner(options).run();
+    }
+}
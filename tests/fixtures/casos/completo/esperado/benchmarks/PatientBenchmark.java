@@ -0,0 +1,79 @@
+package com.inycom.cws.benchmarks;
+
+import com.inycom.cws.factories.PatientSpecificationFactory;
+import com.inycom.cws.mappers.PatientMapper;
+import com.inycom.cws.models.dtos.PatientDto;
+import com.inycom.cws.models.entities.AddressEmbeddable;
+import com.inycom.cws.models.entities.DoctorEntity;
+import com.inycom.cws.models.entities.PatientEntity;
+import com.inycom.cws.models.entities.PatientStatus;
+import com.inycom.cws.models.pojos.Patient;
+import com.inycom.cws.search.PatientSearchModel;
+import org.openjdk.jmh.annotations.*;
+import org.springframework.data.jpa.domain.Specification;
+
+import java.time.LocalDate;
+import java.util.List;
+import java.util.concurrent.TimeUnit;
+
+@State(Scope.Benchmark)
+@BenchmarkMode(Mode.AverageTime)
+@OutputTimeUnit(TimeUnit.NANOSECONDS)
+@Warmup(iterations = 3, time = 1)
+@Measurement(iterations = 5, time = 1)
+@Fork(1)
+public class PatientBenchmark {
+
+    private PatientEntity entity;
+    private Patient pojo;
+    private PatientSearchModel searchModel;
+
+    @Setup
+    public void setup() {
+        entity = new PatientEntity();
+        entity.setId(1001L);
+        entity.setName("name-0001");
+        entity.setCode("code-0001");
+        entity.setBirthDate(LocalDate.of(2024, 1, 15));
+        entity.setAge(42);
+        entity.setStatus(PatientStatus.values()[0]);
+        entity.setAddress(new AddressEmbeddable());
+        entity.setDoctor(new DoctorEntity());
+        pojo = new Patient();
+        pojo.setName("name-0001");
+        pojo.setCode("code-0001");
+        pojo.setBirthDate(LocalDate.of(2024, 1, 15));
+        pojo.setAge(42);
+        pojo.setStatus(PatientStatus.values()[0]);
+        searchModel = new PatientSearchModel();
+        searchModel.setId(1001L);
+        searchModel.setIdFrom(1001L);
+        searchModel.setIdTo(1001L);
+        searchModel.setIdIn(List.of(1001L));
+        searchModel.setName("name-0001");
+        searchModel.setNameStartsWith("nameStartsWith-0001");
+        searchModel.setBirthDate(LocalDate.of(2024, 1, 15));
+        searchModel.setBirthDateFrom(LocalDate.of(2024, 1, 15));
+        searchModel.setBirthDateTo(LocalDate.of(2024, 1, 15));
+        searchModel.setAge(42);
+        searchModel.setAgeFrom(42);
+        searchModel.setAgeTo(42);
+        searchModel.setStatus(PatientStatus.values()[0]);
+        searchModel.setStatusIn(List.of(PatientStatus.values()[0]));
+    }
+
+    @Benchmark
+    public PatientDto toDto() {
+        return PatientMapper.toDto(entity);
+    }
+
+    @Benchmark
+    public PatientEntity toEntity() {
+        return PatientMapper.toEntity(pojo);
+    }
+
+    @Benchmark
+    public Specification<PatientEntity> mapToSpecification() {
+        return PatientSpecificationFactory.mapToSpecification(searchModel);
+    }
+}
@@ -0,0 +1,39 @@
+package com.inycom.cws.controllers;
+
+import com.inycom.cws.models.dtos.PatientDto;
+import com.inycom.cws.models.pojos.Patient;
+import com.inycom.cws.services.BulkPatientService;
+import jakarta.validation.Valid;
+import lombok.RequiredArgsConstructor;
+import org.springframework.http.HttpStatus;
+import org.springframework.http.ResponseEntity;
+import org.springframework.validation.annotation.Validated;
+import org.springframework.web.bind.annotation.*;
+
+import java.util.List;
+import java.util.Map;
+
+@Validated
+@RequiredArgsConstructor
+@RestController
+@RequestMapping("/1.0/patients/batch")
+public class BulkPatientController {
+    private final BulkPatientService service;
+
+    @PostMapping
+    public ResponseEntity<List<PatientDto>> createAll(@RequestBody final List<@Valid Patient> newObjects) {
+        return new ResponseEntity<>(service.createAll(newObjects), HttpStatus.CREATED);
+    }
+
+    @PatchMapping
+    public ResponseEntity<Void> patchAll(@RequestBody final Map<Long, Patient> patches) {
+        service.patchAll(patches);
+        return ResponseEntity.noContent().build();
+    }
+
+    @DeleteMapping
+    public ResponseEntity<Void> deleteAll(@RequestBody final List<Long> ids) {
+        service.deleteAll(ids);
+        return ResponseEntity.noContent().build();
+    }
+}
@@ -0,0 +1,26 @@
+package com.inycom.cws.controllers;
+
+import com.inycom.cws.annotations.AsyncAudit;
+import com.inycom.cws.enums.AuditAction;
+import com.inycom.cws.services.DeletePatientService;
+import lombok.RequiredArgsConstructor;
+import org.springframework.http.ResponseEntity;
+import org.springframework.web.bind.annotation.DeleteMapping;
+import org.springframework.web.bind.annotation.PathVariable;
+import org.springframework.web.bind.annotation.RequestMapping;
+import org.springframework.web.bind.annotation.RestController;
+
+@RequiredArgsConstructor
+@RestController
+@RequestMapping("/1.0/patients")
+public class DeletePatientController {
+    private static final long CON_PATIENT = 41;
+    private final DeletePatientService service;
+
+    @AsyncAudit(controllerId = CON_PATIENT, action = AuditAction.DELETE)
+    @DeleteMapping("/{patientId}")
+    public ResponseEntity<Void> delete(@PathVariable final Long patientId) {
+        service.delete(patientId);
+        return ResponseEntity.noContent().build();
+    }
+}
@@ -0,0 +1,36 @@
+package com.inycom.cws.controllers;
+
+import com.inycom.cws.search.PatientSearchModel;
+import com.inycom.cws.services.ExportPatientService;
+import lombok.RequiredArgsConstructor;
+import org.springframework.http.HttpHeaders;
+import org.springframework.http.MediaType;
+import org.springframework.http.ResponseEntity;
+import org.springframework.web.bind.annotation.GetMapping;
+import org.springframework.web.bind.annotation.RequestMapping;
+import org.springframework.web.bind.annotation.RequestParam;
+import org.springframework.web.bind.annotation.RestController;
+import org.springframework.web.servlet.mvc.method.annotation.StreamingResponseBody;
+
+@RequiredArgsConstructor
+@RestController
+@RequestMapping("/1.0/patients")
+public class ExportPatientController {
+    private static final MediaType TEXT_CSV = MediaType.parseMediaType("text/csv");
+
+    private final ExportPatientService service;
+
+    @GetMapping("/export")
+    public ResponseEntity<StreamingResponseBody> export(final PatientSearchModel searchModel,
+                                                        @RequestParam(defaultValue = "ndjson") final String format) {
+        final boolean csv = "csv".equalsIgnoreCase(format);
+        if (!csv && !"ndjson".equalsIgnoreCase(format)) {
+            return ResponseEntity.badRequest().build();
+        }
+        final StreamingResponseBody body = outputStream -> service.export(searchModel, csv, outputStream);
+        return ResponseEntity.ok()
+                .contentType(csv ? TEXT_CSV : MediaType.APPLICATION_NDJSON)
+                .header(HttpHeaders.CONTENT_DISPOSITION, "attachment; filename=\"patients." + (csv ? "csv" : "ndjson") + "\"")
+                .body(body);
+    }
+}
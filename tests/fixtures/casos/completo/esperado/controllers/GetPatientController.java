@@ -0,0 +1,35 @@
+package com.inycom.cws.controllers;
+
+import com.inycom.cws.models.dtos.PatientDto;
+import com.inycom.cws.search.PatientCursor;
+import com.inycom.cws.search.PatientSearchModel;
+import com.inycom.cws.services.SearchPatientService;
+import lombok.RequiredArgsConstructor;
+import org.springframework.data.domain.Window;
+import org.springframework.http.ResponseEntity;
+import org.springframework.web.bind.annotation.GetMapping;
+import org.springframework.web.bind.annotation.RequestMapping;
+import org.springframework.web.bind.annotation.RequestParam;
+import org.springframework.web.bind.annotation.RestController;
+
+import java.util.Collection;
+
+@RequiredArgsConstructor
+@RestController
+@RequestMapping("/1.0/patients")
+public class GetPatientController {
+
+    private final SearchPatientService service;
+
+    @GetMapping
+    public ResponseEntity<Collection<PatientDto>> get(final PatientSearchModel searchModel,
+                                                              @RequestParam(required = false) final String cursor,
+                                                              @RequestParam(defaultValue = "20") final int size) {
+        final Window<PatientDto> window = service.search(searchModel, PatientCursor.decode(cursor), size);
+        final ResponseEntity.BodyBuilder response = ResponseEntity.ok();
+        if (window.hasNext() && !window.isEmpty()) {
+            response.header("X-Next-Cursor", PatientCursor.encode(window.positionAt(window.size() - 1)));
+        }
+        return response.body(window.getContent());
+    }
+}
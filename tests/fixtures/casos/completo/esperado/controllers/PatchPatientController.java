@@ -0,0 +1,28 @@
+package com.inycom.cws.controllers;
+
+import com.inycom.cws.annotations.AsyncAudit;
+import com.inycom.cws.enums.AuditAction;
+import com.inycom.cws.models.pojos.Patient;
+import com.inycom.cws.services.PatchPatientService;
+import lombok.RequiredArgsConstructor;
+import org.springframework.http.ResponseEntity;
+import org.springframework.web.bind.annotation.PatchMapping;
+import org.springframework.web.bind.annotation.PathVariable;
+import org.springframework.web.bind.annotation.RequestBody;
+import org.springframework.web.bind.annotation.RequestMapping;
+import org.springframework.web.bind.annotation.RestController;
+
+@RequiredArgsConstructor
+@RestController
+@RequestMapping("/1.0/patients")
+public class PatchPatientController {
+    private static final long CON_PATIENT = 41;
+    private final PatchPatientService service;
+
+    @AsyncAudit(controllerId = CON_PATIENT, action = AuditAction.PATCH)
+    @PatchMapping("/{patientId}")
+    public ResponseEntity<Void> patch(@PathVariable final Long patientId, @RequestBody final Patient patient) {
+        service.patch(patientId, patient);
+        return ResponseEntity.noContent().build();
+    }
+}
@@ -0,0 +1,14 @@
+package com.inycom.cws.events;
+
+import com.inycom.cws.enums.AuditAction;
+
+import java.time.Instant;
+import java.util.List;
+
+public record AuditEvent(
+        long controllerId,
+        AuditAction action,
+        List<Object> arguments,
+        Instant timestamp
+) {
+}
@@ -0,0 +1,5 @@
+package com.inycom.cws.events;
+
+public interface AuditEventHandler {
+    void handle(AuditEvent event);
+}
@@ -0,0 +1,25 @@
+package com.inycom.cws.events;
+
+import lombok.RequiredArgsConstructor;
+import lombok.extern.slf4j.Slf4j;
+import org.springframework.beans.factory.ObjectProvider;
+import org.springframework.scheduling.annotation.Async;
+import org.springframework.stereotype.Component;
+import org.springframework.transaction.event.TransactionPhase;
+import org.springframework.transaction.event.TransactionalEventListener;
+
+@Slf4j
+@Component
+@RequiredArgsConstructor
+public class AuditEventListener {
+
+    private final ObjectProvider<AuditEventHandler> handler;
+
+    @Async("auditExecutor")
+    @TransactionalEventListener(phase = TransactionPhase.AFTER_COMMIT, fallbackExecution = true)
+    public void on(final AuditEvent event) {
+        handler.ifAvailable(
+                h -> h.handle(event),
+                () -> log.info("Audit {} {} {}", event.controllerId(), event.action(), event.timestamp()));
+    }
+}
@@ -0,0 +1,84 @@
+// Prueba de carga de /1.0/patients (generada). Perfil "pico" con 50 VUs.
+// Ejecutar con: k6 run -e BASE_URL=http://localhost:8080 Patient.js
+import http from 'k6/http';
+import { check } from 'k6';
+
+const BASE_URL = __ENV.BASE_URL || 'http://localhost:8080';
+const URL = `${BASE_URL}/1.0/patients`;
+const HEADERS = { 'Content-Type': 'application/json' };
+
+export const options = {
+  scenarios: {
+    patients: {
+      executor: 'ramping-vus',
+      startVUs: 0,
+      stages: [
+        { duration: '24s', target: 10 },
+        { duration: '12s', target: 50 },
+        { duration: '24s', target: 50 },
+        { duration: '12s', target: 10 },
+        { duration: '36s', target: 10 },
+        { duration: '12s', target: 0 },
+      ],
+    },
+  },
+  thresholds: {
+    http_req_failed: ['rate<0.01'],
+    'http_req_duration{name:POST /1.0/patients}': ['p(95)<500'],
+    'http_req_duration{name:GET /1.0/patients}': ['p(95)<300'],
+    'http_req_duration{name:PATCH /1.0/patients/{id}}': ['p(95)<500'],
+    'http_req_duration{name:DELETE /1.0/patients/{id}}': ['p(95)<500'],
+  },
+};
+
+function entero(min, max) {
+  return Math.floor(Math.random() * (max - min + 1)) + min;
+}
+
+function texto(longitud) {
+  const caracteres = 'abcdefghijklmnopqrstuvwxyz';
+  const total = entero(1, longitud);
+  let resultado = '';
+  for (let i = 0; i < total; i++) {
+    resultado += caracteres.charAt(entero(0, caracteres.length - 1));
+  }
+  return resultado;
+}
+
+function fecha() {
+  return new Date(Date.UTC(entero(1950, 2024), entero(0, 11), entero(1, 28))).toISOString().substring(0, 10);
+}
+
+function cuerpo() {
+  return JSON.stringify({
+        name: texto(100),
+        code: texto(20),
+        birthDate: fecha(),
+        age: entero(1, 1000)
+  });
+}
+
+const CONSULTAS = [
+    () => `idFrom=${encodeURIComponent(entero(1, 100000))}`,
+    () => `nameStartsWith=${encodeURIComponent(texto(3))}`,
+    () => `birthDateFrom=${encodeURIComponent(fecha())}`,
+    () => `ageFrom=${encodeURIComponent(entero(1, 1000))}`
+];
+
+export default function () {
+  const creado = http.post(URL, cuerpo(), { headers: HEADERS, tags: { name: 'POST /1.0/patients' } });
+  check(creado, { 'POST 201': (r) => r.status === 201 });
+
+  const consulta = CONSULTAS[entero(0, CONSULTAS.length - 1)]();
+  const busqueda = http.get(`${URL}?size=20&${consulta}`, { tags: { name: 'GET /1.0/patients' } });
+  check(busqueda, { 'GET 200': (r) => r.status === 200 });
+
+  if (creado.status !== 201) {
+    return;
+  }
+  const id = creado.json('id');
+  const parcheado = http.patch(`${URL}/${id}`, cuerpo(), { headers: HEADERS, tags: { name: 'PATCH /1.0/patients/{id}' } });
+  check(parcheado, { 'PATCH 204': (r) => r.status === 204 });
+  const borrado = http.del(`${URL}/${id}`, null, { tags: { name: 'DELETE /1.0/patients/{id}' } });
+  check(borrado, { 'DELETE 204': (r) => r.status === 204 });
+}
@@ -0,0 +1,39 @@
+package com.inycom.cws.mappers;
+
+import com.inycom.cws.models.dtos.PatientDto;
+import com.inycom.cws.models.entities.PatientEntity;
+import com.inycom.cws.models.pojos.Patient;
+import lombok.experimental.UtilityClass;
+
+@UtilityClass
+public class PatientMapper {
+
+    public static PatientDto toDto(final PatientEntity entity) {
+        if (entity == null) {
+            return null;
+        }
+        return PatientDto.builder()
+                .name(entity.getName())
+                .code(entity.getCode())
+                .birthDate(entity.getBirthDate())
+                .age(entity.getAge())
+                .status(entity.getStatus())
+                .id(entity.getId())
+                .address(entity.getAddress())
+                .doctor(entity.getDoctor())
+                .build();
+    }
+
+    public static PatientEntity toEntity(final Patient pojo) {
+        if (pojo == null) {
+            return null;
+        }
+        final PatientEntity entity = new PatientEntity();
+        entity.setName(pojo.getName());
+        entity.setCode(pojo.getCode());
+        entity.setBirthDate(pojo.getBirthDate());
+        entity.setAge(pojo.getAge());
+        entity.setStatus(pojo.getStatus());
+        return entity;
+    }
+}
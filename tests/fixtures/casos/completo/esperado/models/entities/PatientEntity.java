@@ -0,0 +1,42 @@
+package com.inycom.cws.models.entities;
+
+import jakarta.persistence.Cacheable;
+import org.hibernate.annotations.Cache;
+import org.hibernate.annotations.CacheConcurrencyStrategy;
+import jakarta.persistence.*;
+import lombok.Data;
+import java.time.LocalDate;
+
+@Data
+@Entity
+@Table(name = "patients", indexes = {@Index(name = "idx_patient_name", columnList = "name")})
+@Cacheable
+@Cache(usage = CacheConcurrencyStrategy.READ_WRITE)
+public class PatientEntity {
+
+    private static final int MAX_NAME = 100;
+    private static final int MAX_CODE = 20;
+
+    @Id
+    @GeneratedValue(strategy = GenerationType.IDENTITY)
+    private Long id;
+
+    @Column(length = MAX_NAME)
+    private String name;
+
+    @Column(name = "patient_code", length = MAX_CODE)
+    private String code;
+
+    @Column(nullable = false)
+    private LocalDate birthDate;
+
+    private Integer age;
+
+    private PatientStatus status;
+
+    @Embedded
+    private AddressEmbeddable address;
+
+    @ManyToOne(fetch = FetchType.LAZY)
+    private DoctorEntity doctor;
+}
@@ -0,0 +1,21 @@
+package com.inycom.cws.repositories;
+
+import com.inycom.cws.models.entities.DoctorEntity;
+import jakarta.persistence.QueryHint;
+import org.hibernate.jpa.HibernateHints;
+import org.springframework.data.domain.Page;
+import org.springframework.data.domain.Pageable;
+import org.springframework.data.jpa.domain.Specification;
+import org.springframework.data.jpa.repository.JpaSpecificationExecutor;
+import org.springframework.data.jpa.repository.QueryHints;
+import org.springframework.data.repository.CrudRepository;
+import org.springframework.stereotype.Repository;
+
+@Repository
+public interface DoctorRepository extends CrudRepository<DoctorEntity, Long>, JpaSpecificationExecutor<DoctorEntity> {
+    @QueryHints({
+        @QueryHint(name = HibernateHints.HINT_FETCH_SIZE, value = "100"),
+        @QueryHint(name = HibernateHints.HINT_READ_ONLY, value = "true")
+    })
+    Page<DoctorEntity> findAll(Specification<DoctorEntity> specification, Pageable pageable);
+}
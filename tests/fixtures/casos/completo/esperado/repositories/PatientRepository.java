@@ -0,0 +1,35 @@
+package com.inycom.cws.repositories;
+
+import com.inycom.cws.models.entities.PatientEntity;
+import jakarta.persistence.QueryHint;
+import org.hibernate.jpa.HibernateHints;
+import org.springframework.data.jpa.domain.Specification;
+import org.springframework.data.jpa.repository.EntityGraph;
+import org.springframework.data.jpa.repository.JpaSpecificationExecutor;
+import org.springframework.data.jpa.repository.Modifying;
+import org.springframework.data.jpa.repository.Query;
+import org.springframework.data.jpa.repository.QueryHints;
+import org.springframework.data.repository.CrudRepository;
+import org.springframework.data.repository.query.FluentQuery;
+import org.springframework.data.repository.query.Param;
+import org.springframework.stereotype.Repository;
+
+import java.util.Optional;
+import java.util.function.Function;
+
+@Repository
+public interface PatientRepository extends CrudRepository<PatientEntity, Long>, JpaSpecificationExecutor<PatientEntity>, PatientRepositoryCustom {
+    @Modifying(flushAutomatically = true, clearAutomatically = true)
+    @Query("DELETE FROM PatientEntity e WHERE e.id = :id")
+    int deleteDirectById(@Param("id") Long id);
+
+    @EntityGraph(attributePaths = {"doctor"})
+    Optional<PatientEntity> findById(Long id);
+
+    @EntityGraph(attributePaths = {"doctor"})
+    @QueryHints({
+        @QueryHint(name = HibernateHints.HINT_FETCH_SIZE, value = "100"),
+        @QueryHint(name = HibernateHints.HINT_READ_ONLY, value = "true")
+    })
+    <S extends PatientEntity, R> R findBy(Specification<PatientEntity> specification, Function<FluentQuery.FetchableFluentQuery<S>, R> queryFunction);
+}
@@ -0,0 +1,13 @@
+package com.inycom.cws.repositories;
+
+import com.inycom.cws.models.entities.PatientEntity;
+import com.inycom.cws.models.pojos.Patient;
+import java.util.stream.Stream;
+import org.springframework.data.jpa.domain.Specification;
+
+public interface PatientRepositoryCustom {
+
+    Stream<PatientEntity> streamAll(Specification<PatientEntity> specification);
+
+    int patchById(Long id, Patient patch);
+}
@@ -0,0 +1,79 @@
+package com.inycom.cws.repositories;
+
+import com.inycom.cws.models.entities.PatientEntity;
+import com.inycom.cws.models.entities.PatientStatus;
+import com.inycom.cws.models.pojos.Patient;
+import jakarta.persistence.EntityGraph;
+import jakarta.persistence.EntityManager;
+import jakarta.persistence.PersistenceContext;
+import jakarta.persistence.TypedQuery;
+import jakarta.persistence.criteria.CriteriaBuilder;
+import jakarta.persistence.criteria.CriteriaQuery;
+import jakarta.persistence.criteria.CriteriaUpdate;
+import jakarta.persistence.criteria.Predicate;
+import jakarta.persistence.criteria.Root;
+import org.hibernate.jpa.HibernateHints;
+import org.hibernate.jpa.SpecHints;
+import org.springframework.data.jpa.domain.Specification;
+
+import java.time.LocalDate;
+import java.util.stream.Stream;
+
+public class PatientRepositoryCustomImpl implements PatientRepositoryCustom {
+
+    @PersistenceContext
+    private EntityManager entityManager;
+
+    @Override
+    public Stream<PatientEntity> streamAll(final Specification<PatientEntity> specification) {
+        final CriteriaBuilder builder = entityManager.getCriteriaBuilder();
+        final CriteriaQuery<PatientEntity> query = builder.createQuery(PatientEntity.class);
+        final Root<PatientEntity> root = query.from(PatientEntity.class);
+        final Predicate predicate = specification.toPredicate(root, query, builder);
+        if (predicate != null) {
+            query.where(predicate);
+        }
+        query.select(root);
+
+        final TypedQuery<PatientEntity> typedQuery = entityManager.createQuery(query);
+        typedQuery.setHint(HibernateHints.HINT_FETCH_SIZE, 100);
+        typedQuery.setHint(HibernateHints.HINT_READ_ONLY, true);
+        final EntityGraph<PatientEntity> graph = entityManager.createEntityGraph(PatientEntity.class);
+        graph.addAttributeNodes("doctor");
+        typedQuery.setHint(SpecHints.HINT_SPEC_FETCH_GRAPH, graph);
+        return typedQuery.getResultStream();
+    }
+
+    @Override
+    public int patchById(final Long id, final Patient patch) {
+        final CriteriaBuilder builder = entityManager.getCriteriaBuilder();
+        final CriteriaUpdate<PatientEntity> update = builder.createCriteriaUpdate(PatientEntity.class);
+        final Root<PatientEntity> root = update.from(PatientEntity.class);
+        boolean changed = false;
+        if (patch.getName() != null) {
+            update.set(root.<String>get("name"), patch.getName());
+            changed = true;
+        }
+        if (patch.getCode() != null) {
+            update.set(root.<String>get("code"), patch.getCode());
+            changed = true;
+        }
+        if (patch.getBirthDate() != null) {
+            update.set(root.<LocalDate>get("birthDate"), patch.getBirthDate());
+            changed = true;
+        }
+        if (patch.getAge() != null) {
+            update.set(root.<Integer>get("age"), patch.getAge());
+            changed = true;
+        }
+        if (patch.getStatus() != null) {
+            update.set(root.<PatientStatus>get("status"), patch.getStatus());
+            changed = true;
+        }
+        if (!changed) {
+            return entityManager.find(PatientEntity.class, id) != null ? 1 : 0;
+        }
+        update.where(builder.equal(root.get("id"), id));
+        return entityManager.createQuery(update).executeUpdate();
+    }
+}
@@ -0,0 +1,35 @@
+package com.inycom.cws.search;
+
+import lombok.experimental.UtilityClass;
+import org.springframework.data.domain.KeysetScrollPosition;
+import org.springframework.data.domain.ScrollPosition;
+import org.springframework.data.domain.Sort;
+
+import java.nio.charset.StandardCharsets;
+import java.time.LocalDate;
+import java.util.Base64;
+import java.util.LinkedHashMap;
+import java.util.Map;
+
+@UtilityClass
+public class PatientCursor {
+
+    public static final Sort SORT = Sort.by("birthDate", "id");
+
+    public static ScrollPosition decode(final String cursor) {
+        if (cursor == null || cursor.isBlank()) {
+            return ScrollPosition.keyset();
+        }
+        final String[] values = new String(Base64.getUrlDecoder().decode(cursor), StandardCharsets.UTF_8).split("\\|", 2);
+        final Map<String, Object> keys = new LinkedHashMap<>();
+        keys.put("birthDate", LocalDate.parse(values[1]));
+        keys.put("id", Long.valueOf(values[0]));
+        return ScrollPosition.forward(keys);
+    }
+
+    public static String encode(final ScrollPosition position) {
+        final Map<String, Object> keys = ((KeysetScrollPosition) position).getKeys();
+        final String value = keys.get("id") + "|" + keys.get("birthDate");
+        return Base64.getUrlEncoder().withoutPadding().encodeToString(value.getBytes(StandardCharsets.UTF_8));
+    }
+}
@@ -0,0 +1,27 @@
+package com.inycom.cws.search;
+
+import com.inycom.cws.models.entities.PatientStatus;
+import lombok.Data;
+
+import java.time.LocalDate;
+import java.util.List;
+
+
+@Data
+public class PatientSearchModel {
+
+    private Long id;
+    private Long idFrom;
+    private Long idTo;
+    private List<Long> idIn;
+    private String name;
+    private String nameStartsWith;
+    private LocalDate birthDate;
+    private LocalDate birthDateFrom;
+    private LocalDate birthDateTo;
+    private Integer age;
+    private Integer ageFrom;
+    private Integer ageTo;
+    private PatientStatus status;
+    private List<PatientStatus> statusIn;
+}
@@ -0,0 +1,107 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.enums.AuditAction;
+import com.inycom.cws.events.AuditEvent;
+import com.inycom.cws.exceptions.CwsException;
+import com.inycom.cws.mappers.PatientMapper;
+import com.inycom.cws.models.dtos.PatientDto;
+import com.inycom.cws.models.entities.PatientEntity;
+import com.inycom.cws.models.pojos.Patient;
+import com.inycom.cws.repositories.PatientRepository;
+import com.inycom.cws.utils.PatchUtils;
+import jakarta.persistence.EntityManager;
+import lombok.RequiredArgsConstructor;
+import org.springframework.cache.Cache;
+import org.springframework.cache.CacheManager;
+import org.springframework.context.ApplicationEventPublisher;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+import java.time.Instant;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Collection;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+
+@RequiredArgsConstructor
+@Service
+public class BulkPatientService {
+    private static final int CHUNK_SIZE = 50;
+    private static final long CON_PATIENT = 41;
+    private static final String CACHE = "patients";
+
+    private final PatientRepository repository;
+    private final EntityManager entityManager;
+    private final ApplicationEventPublisher publisher;
+    private final CacheManager cacheManager;
+
+    @Transactional
+    public List<PatientDto> createAll(final List<Patient> newObjects) {
+        final List<PatientDto> created = new ArrayList<>(newObjects.size());
+        for (int from = 0; from < newObjects.size(); from += CHUNK_SIZE) {
+            final List<PatientEntity> chunk = newObjects.subList(from, Math.min(from + CHUNK_SIZE, newObjects.size()))
+                    .stream()
+                    .map(PatientMapper::toEntity)
+                    .toList();
+            repository.saveAll(chunk).forEach(entity -> created.add(PatientMapper.toDto(entity)));
+            flushAndClear();
+        }
+        newObjects.forEach(newObject -> audit(AuditAction.POST, newObject));
+        return created;
+    }
+
+    @Transactional
+    public void patchAll(final Map<Long, Patient> patches) {
+        final List<Long> ids = new ArrayList<>(patches.keySet());
+        for (int from = 0; from < ids.size(); from += CHUNK_SIZE) {
+            final List<PatientEntity> patched = new ArrayList<>();
+            for (final Map.Entry<Long, PatientEntity> existing : findAll(ids.subList(from, Math.min(from + CHUNK_SIZE, ids.size()))).entrySet()) {
+                final PatientEntity patchedEntity = PatientMapper.toEntity(patches.get(existing.getKey()));
+                patched.add(PatchUtils.merge(existing.getValue(), patchedEntity));
+            }
+            repository.saveAll(patched);
+            flushAndClear();
+        }
+        patches.forEach((id, patch) -> audit(AuditAction.PATCH, id, patch));
+        evict(ids);
+    }
+
+    @Transactional
+    public void deleteAll(final List<Long> ids) {
+        for (int from = 0; from < ids.size(); from += CHUNK_SIZE) {
+            repository.deleteAll(findAll(ids.subList(from, Math.min(from + CHUNK_SIZE, ids.size()))).values());
+            flushAndClear();
+        }
+        ids.forEach(id -> audit(AuditAction.DELETE, id));
+        evict(ids);
+    }
+
+    private Map<Long, PatientEntity> findAll(final List<Long> ids) {
+        final Map<Long, PatientEntity> found = new HashMap<>();
+        repository.findAllById(ids).forEach(entity -> found.put(entity.getId(), entity));
+        for (final Long id : ids) {
+            if (!found.containsKey(id)) {
+                throw new CwsException("Not found " + id);
+            }
+        }
+        return found;
+    }
+
+    private void flushAndClear() {
+        entityManager.flush();
+        entityManager.clear();
+    }
+
+    private void audit(final AuditAction action, final Object... arguments) {
+        publisher.publishEvent(new AuditEvent(CON_PATIENT, action, Arrays.asList(arguments), Instant.now()));
+    }
+
+    private void evict(final Collection<Long> ids) {
+        final Cache cache = cacheManager.getCache(CACHE);
+        if (cache != null) {
+            ids.forEach(cache::evict);
+        }
+    }
+}
@@ -0,0 +1,18 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.mappers.DoctorMapper;
+import com.inycom.cws.models.dtos.DoctorDto;
+import com.inycom.cws.models.pojos.Doctor;
+import com.inycom.cws.repositories.DoctorRepository;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+
+@RequiredArgsConstructor
+@Service
+public class CreateDoctorService {
+    private final DoctorRepository repository;
+
+    public DoctorDto create(final Doctor doctor) {
+        return DoctorMapper.toDto(repository.save(DoctorMapper.toEntity(doctor)));
+    }
+}
@@ -0,0 +1,18 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.mappers.PatientMapper;
+import com.inycom.cws.models.dtos.PatientDto;
+import com.inycom.cws.models.pojos.Patient;
+import com.inycom.cws.repositories.PatientRepository;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+
+@RequiredArgsConstructor
+@Service
+public class CreatePatientService {
+    private final PatientRepository repository;
+
+    public PatientDto create(final Patient patient) {
+        return PatientMapper.toDto(repository.save(PatientMapper.toEntity(patient)));
+    }
+}
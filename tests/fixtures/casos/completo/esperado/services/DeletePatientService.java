@@ -0,0 +1,26 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.exceptions.CwsException;
+import com.inycom.cws.repositories.PatientRepository;
+import lombok.RequiredArgsConstructor;
+import org.springframework.cache.annotation.CacheEvict;
+import org.springframework.cache.annotation.Caching;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+@RequiredArgsConstructor
+@Service
+public class DeletePatientService {
+    private final PatientRepository repository;
+
+    @Caching(evict = {
+            @CacheEvict(cacheNames = "patients", key = "#p0", beforeInvocation = true),
+            @CacheEvict(cacheNames = "patients", key = "#p0")
+    })
+    @Transactional
+    public void delete(final Long id) {
+        if (repository.deleteDirectById(id) == 0) {
+            throw new CwsException("Not found " + id);
+        }
+    }
+}
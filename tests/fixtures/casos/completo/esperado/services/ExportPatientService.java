@@ -0,0 +1,74 @@
+package com.inycom.cws.services;
+
+import com.fasterxml.jackson.databind.ObjectMapper;
+import com.inycom.cws.factories.ObjectMapperFactory;
+import com.inycom.cws.factories.PatientSpecificationFactory;
+import com.inycom.cws.mappers.PatientMapper;
+import com.inycom.cws.models.dtos.PatientDto;
+import com.inycom.cws.models.entities.PatientEntity;
+import com.inycom.cws.repositories.PatientRepository;
+import com.inycom.cws.search.PatientSearchModel;
+import jakarta.persistence.EntityManager;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+import java.io.BufferedWriter;
+import java.io.IOException;
+import java.io.OutputStream;
+import java.io.OutputStreamWriter;
+import java.io.Writer;
+import java.nio.charset.StandardCharsets;
+import java.util.Iterator;
+import java.util.stream.Stream;
+
+@RequiredArgsConstructor
+@Service
+public class ExportPatientService {
+    private static final ObjectMapper OBJECT_MAPPER = ObjectMapperFactory.create();
+    private static final String CSV_HEADER = "name,code,birthDate,age,status,id";
+
+    private final PatientRepository repository;
+    private final EntityManager entityManager;
+
+    @Transactional(readOnly = true)
+    public void export(final PatientSearchModel searchModel, final boolean csv, final OutputStream outputStream) throws IOException {
+        final Writer writer = new BufferedWriter(new OutputStreamWriter(outputStream, StandardCharsets.UTF_8));
+        if (csv) {
+            writer.write(CSV_HEADER);
+            writer.write('\n');
+        }
+        try (Stream<PatientEntity> entities = repository.streamAll(PatientSpecificationFactory.mapToSpecification(searchModel))) {
+            final Iterator<PatientEntity> iterator = entities.iterator();
+            while (iterator.hasNext()) {
+                final PatientEntity entity = iterator.next();
+                final PatientDto dto = PatientMapper.toDto(entity);
+                writer.write(csv ? toCsv(dto) : OBJECT_MAPPER.writeValueAsString(dto));
+                writer.write('\n');
+                entityManager.detach(entity);
+            }
+        }
+        writer.flush();
+    }
+
+    private static String toCsv(final PatientDto dto) {
+        return String.join(",",
+                escape(dto.getName()),
+                escape(dto.getCode()),
+                escape(dto.getBirthDate()),
+                escape(dto.getAge()),
+                escape(dto.getStatus()),
+                escape(dto.getId()));
+    }
+
+    private static String escape(final Object value) {
+        if (value == null) {
+            return "";
+        }
+        final String text = String.valueOf(value);
+        if (text.indexOf(',') < 0 && text.indexOf('"') < 0 && text.indexOf('\n') < 0 && text.indexOf('\r') < 0) {
+            return text;
+        }
+        return '"' + text.replace("\"", "\"\"") + '"';
+    }
+}
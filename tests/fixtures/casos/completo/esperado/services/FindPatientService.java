@@ -0,0 +1,29 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.exceptions.CwsException;
+import com.inycom.cws.mappers.PatientMapper;
+import com.inycom.cws.models.dtos.PatientDto;
+import com.inycom.cws.models.entities.PatientEntity;
+import com.inycom.cws.repositories.PatientRepository;
+import lombok.RequiredArgsConstructor;
+import org.springframework.cache.annotation.Cacheable;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+@RequiredArgsConstructor
+@Service
+public class FindPatientService {
+    private final PatientRepository repository;
+
+    @Transactional(readOnly = true)
+    public PatientEntity find(final Long patientId) {
+        return repository.findById(patientId)
+                         .orElseThrow(() -> new CwsException("Not found " + patientId));
+    }
+
+    @Cacheable(cacheNames = "patients", key = "#p0")
+    @Transactional(readOnly = true)
+    public PatientDto findDto(final Long patientId) {
+        return PatientMapper.toDto(find(patientId));
+    }
+}
@@ -0,0 +1,66 @@
+package com.inycom.cws.specifications;
+
+import com.inycom.cws.models.entities.PatientEntity;
+import com.inycom.cws.models.entities.PatientStatus;
+import lombok.experimental.UtilityClass;
+import org.springframework.data.jpa.domain.Specification;
+
+import java.time.LocalDate;
+import java.util.List;
+
+
+@UtilityClass
+public class PatientSpecifications {
+
+    public static Specification<PatientEntity> empty() {
+        return (root, query, builder) -> builder.conjunction();
+    }
+
+    public static Specification<PatientEntity> id(final Long id) {
+        return (root, query, builder) -> builder.equal(root.get("id"), id);
+    }
+    public static Specification<PatientEntity> idFrom(final Long idFrom) {
+        return (root, query, builder) -> builder.greaterThanOrEqualTo(root.<Long>get("id"), idFrom);
+    }
+    public static Specification<PatientEntity> idTo(final Long idTo) {
+        return (root, query, builder) -> builder.lessThanOrEqualTo(root.<Long>get("id"), idTo);
+    }
+    public static Specification<PatientEntity> idIn(final List<Long> idIn) {
+        return (root, query, builder) -> root.get("id").in(idIn);
+    }
+    public static Specification<PatientEntity> name(final String name) {
+        return (root, query, builder) -> builder.equal(root.get("name"), name);
+    }
+    public static Specification<PatientEntity> nameStartsWith(final String nameStartsWith) {
+        return (root, query, builder) -> builder.like(root.<String>get("name"), escapeLike(nameStartsWith) + "%", '\\');
+    }
+    public static Specification<PatientEntity> birthDate(final LocalDate birthDate) {
+        return (root, query, builder) -> builder.equal(root.get("birthDate"), birthDate);
+    }
+    public static Specification<PatientEntity> birthDateFrom(final LocalDate birthDateFrom) {
+        return (root, query, builder) -> builder.greaterThanOrEqualTo(root.<LocalDate>get("birthDate"), birthDateFrom);
+    }
+    public static Specification<PatientEntity> birthDateTo(final LocalDate birthDateTo) {
+        return (root, query, builder) -> builder.lessThanOrEqualTo(root.<LocalDate>get("birthDate"), birthDateTo);
+    }
+    public static Specification<PatientEntity> age(final Integer age) {
+        return (root, query, builder) -> builder.equal(root.get("age"), age);
+    }
+    public static Specification<PatientEntity> ageFrom(final Integer ageFrom) {
+        return (root, query, builder) -> builder.greaterThanOrEqualTo(root.<Integer>get("age"), ageFrom);
+    }
+    public static Specification<PatientEntity> ageTo(final Integer ageTo) {
+        return (root, query, builder) -> builder.lessThanOrEqualTo(root.<Integer>get("age"), ageTo);
+    }
+    public static Specification<PatientEntity> status(final PatientStatus status) {
+        return (root, query, builder) -> builder.equal(root.get("status"), status);
+    }
+    public static Specification<PatientEntity> statusIn(final List<PatientStatus> statusIn) {
+        return (root, query, builder) -> root.get("status").in(statusIn);
+    }
+
+    private static String escapeLike(final String value) {
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_");
+    }
+}
+
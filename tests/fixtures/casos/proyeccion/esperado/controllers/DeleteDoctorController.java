@@ -0,0 +1,26 @@
+package com.inycom.cws.controllers;
+
+import com.inycom.cws.annotations.Audit;
+import com.inycom.cws.enums.AuditAction;
+import com.inycom.cws.services.DeleteDoctorService;
+import lombok.RequiredArgsConstructor;
+import org.springframework.http.ResponseEntity;
+import org.springframework.web.bind.annotation.DeleteMapping;
+import org.springframework.web.bind.annotation.PathVariable;
+import org.springframework.web.bind.annotation.RequestMapping;
+import org.springframework.web.bind.annotation.RestController;
+
+@RequiredArgsConstructor
+@RestController
+@RequestMapping("/1.0/doctors")
+public class DeleteDoctorController {
+    private static final long CON_DOCTOR = 42;
+    private final DeleteDoctorService service;
+
+    @Audit(controllerId = CON_DOCTOR, action = AuditAction.DELETE)
+    @DeleteMapping("/{doctorId}")
+    public ResponseEntity<Void> delete(@PathVariable final Long doctorId) {
+        service.delete(doctorId);
+        return ResponseEntity.noContent().build();
+    }
+}
@@ -0,0 +1,22 @@
+package com.inycom.cws.mappers;
+
+import com.fasterxml.jackson.databind.ObjectMapper;
+import com.inycom.cws.factories.ObjectMapperFactory;
+import com.inycom.cws.models.dtos.DoctorDto;
+import com.inycom.cws.models.entities.DoctorEntity;
+import com.inycom.cws.models.pojos.Doctor;
+import lombok.experimental.UtilityClass;
+
+
+@UtilityClass
+public class DoctorMapper {
+    private static final ObjectMapper OBJECT_MAPPER = ObjectMapperFactory.create();
+
+    public static DoctorDto toDto(final DoctorEntity entity) {
+        return OBJECT_MAPPER.convertValue(entity, DoctorDto.class);
+    }
+
+    public static DoctorEntity toEntity(final Doctor pojo) {
+        return OBJECT_MAPPER.convertValue(pojo, DoctorEntity.class);
+    }
+}
@@ -0,0 +1,22 @@
+package com.inycom.cws.mappers;
+
+import com.fasterxml.jackson.databind.ObjectMapper;
+import com.inycom.cws.factories.ObjectMapperFactory;
+import com.inycom.cws.models.dtos.PatientDto;
+import com.inycom.cws.models.entities.PatientEntity;
+import com.inycom.cws.models.pojos.Patient;
+import lombok.experimental.UtilityClass;
+
+
+@UtilityClass
+public class PatientMapper {
+    private static final ObjectMapper OBJECT_MAPPER = ObjectMapperFactory.create();
+
+    public static PatientDto toDto(final PatientEntity entity) {
+        return OBJECT_MAPPER.convertValue(entity, PatientDto.class);
+    }
+
+    public static PatientEntity toEntity(final Patient pojo) {
+        return OBJECT_MAPPER.convertValue(pojo, PatientEntity.class);
+    }
+}
@@ -0,0 +1,26 @@
+package com.inycom.cws.models.dtos;
+
+import com.inycom.cws.models.entities.AddressEmbeddable;
+import com.inycom.cws.models.entities.DoctorEntity;
+import com.inycom.cws.models.pojos.Patient;
+import jakarta.persistence.Embedded;
+import jakarta.validation.constraints.NotNull;
+import lombok.AllArgsConstructor;
+import lombok.Data;
+import lombok.EqualsAndHashCode;
+import lombok.RequiredArgsConstructor;
+import lombok.experimental.SuperBuilder;
+
+@EqualsAndHashCode(callSuper = true)
+@SuperBuilder
+@AllArgsConstructor
+@RequiredArgsConstructor
+@Data
+public class PatientDto extends Patient {
+
+	@NotNull
+	private Long id;
+	private DoctorEntity doctor;
+	@Embedded
+	private AddressEmbeddable address;
+}
@@ -0,0 +1,23 @@
+package com.inycom.cws.models.pojos;
+
+import com.inycom.cws.models.entities.PatientStatus;
+import jakarta.validation.constraints.Size;
+import java.time.LocalDate;
+import lombok.AllArgsConstructor;
+import lombok.Data;
+import lombok.NoArgsConstructor;
+import lombok.experimental.SuperBuilder;
+
+@SuperBuilder
+@Data
+@AllArgsConstructor
+@NoArgsConstructor
+public class Patient {
+
+    private static final int MAX_NAME = 100;
+
+    @Size(max = MAX_NAME)
+    private String name;
+    private LocalDate birthDate;
+    private PatientStatus status;
+}
\ No newline at end of file
@@ -0,0 +1,29 @@
+package com.inycom.cws.models.projections;
+
+import com.inycom.cws.models.dtos.PatientDto;
+import com.inycom.cws.models.entities.AddressEmbeddable;
+import com.inycom.cws.models.entities.DoctorEntity;
+import com.inycom.cws.models.entities.PatientStatus;
+
+import java.time.LocalDate;
+
+public record PatientProjection(
+        String name,
+        LocalDate birthDate,
+        PatientStatus status,
+        Long id,
+        AddressEmbeddable address,
+        DoctorEntity doctor
+) {
+
+    public PatientDto toDto() {
+        return PatientDto.builder()
+                .name(name)
+                .birthDate(birthDate)
+                .status(status)
+                .id(id)
+                .address(address)
+                .doctor(doctor)
+                .build();
+    }
+}
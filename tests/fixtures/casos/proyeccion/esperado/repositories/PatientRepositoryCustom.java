@@ -0,0 +1,15 @@
+package com.inycom.cws.repositories;
+
+import com.inycom.cws.models.entities.PatientEntity;
+import com.inycom.cws.models.pojos.Patient;
+import com.inycom.cws.models.projections.PatientProjection;
+import org.springframework.data.domain.Pageable;
+import org.springframework.data.domain.Slice;
+import org.springframework.data.jpa.domain.Specification;
+
+public interface PatientRepositoryCustom {
+
+    Slice<PatientProjection> findProjected(Specification<PatientEntity> specification, Pageable pageable);
+
+    int patchById(Long id, Patient patch);
+}
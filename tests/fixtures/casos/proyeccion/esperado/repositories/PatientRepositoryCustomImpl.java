@@ -0,0 +1,92 @@
+package com.inycom.cws.repositories;
+
+import com.inycom.cws.models.entities.DoctorEntity;
+import com.inycom.cws.models.entities.PatientEntity;
+import com.inycom.cws.models.entities.PatientStatus;
+import com.inycom.cws.models.pojos.Patient;
+import com.inycom.cws.models.projections.PatientProjection;
+import jakarta.persistence.EntityManager;
+import jakarta.persistence.PersistenceContext;
+import jakarta.persistence.TypedQuery;
+import jakarta.persistence.criteria.CriteriaBuilder;
+import jakarta.persistence.criteria.CriteriaQuery;
+import jakarta.persistence.criteria.CriteriaUpdate;
+import jakarta.persistence.criteria.Join;
+import jakarta.persistence.criteria.JoinType;
+import jakarta.persistence.criteria.Predicate;
+import jakarta.persistence.criteria.Root;
+import org.hibernate.jpa.HibernateHints;
+import org.springframework.data.domain.Pageable;
+import org.springframework.data.domain.Slice;
+import org.springframework.data.domain.SliceImpl;
+import org.springframework.data.jpa.domain.Specification;
+import org.springframework.data.jpa.repository.query.QueryUtils;
+
+import java.time.LocalDate;
+import java.util.List;
+
+public class PatientRepositoryCustomImpl implements PatientRepositoryCustom {
+
+    @PersistenceContext
+    private EntityManager entityManager;
+
+    @Override
+    public Slice<PatientProjection> findProjected(final Specification<PatientEntity> specification, final Pageable pageable) {
+        final CriteriaBuilder builder = entityManager.getCriteriaBuilder();
+        final CriteriaQuery<PatientProjection> query = builder.createQuery(PatientProjection.class);
+        final Root<PatientEntity> root = query.from(PatientEntity.class);
+        final Join<PatientEntity, DoctorEntity> doctorJoin = root.join("doctor", JoinType.LEFT);
+        final Predicate predicate = specification.toPredicate(root, query, builder);
+        if (predicate != null) {
+            query.where(predicate);
+        }
+        query.select(builder.construct(PatientProjection.class,
+                root.get("name"),
+                root.get("birthDate"),
+                root.get("status"),
+                root.get("id"),
+                root.get("address"),
+                doctorJoin));
+        if (pageable.getSort().isSorted()) {
+            query.orderBy(QueryUtils.toOrders(pageable.getSort(), root, builder));
+        }
+
+        final TypedQuery<PatientProjection> typedQuery = entityManager.createQuery(query);
+        typedQuery.setHint(HibernateHints.HINT_FETCH_SIZE, 100);
+        typedQuery.setHint(HibernateHints.HINT_READ_ONLY, true);
+        if (pageable.isUnpaged()) {
+            return new SliceImpl<>(typedQuery.getResultList(), pageable, false);
+        }
+        typedQuery.setFirstResult((int) pageable.getOffset());
+        typedQuery.setMaxResults(pageable.getPageSize() + 1);
+
+        final List<PatientProjection> content = typedQuery.getResultList();
+        final boolean hasNext = content.size() > pageable.getPageSize();
+        return new SliceImpl<>(hasNext ? content.subList(0, pageable.getPageSize()) : content, pageable, hasNext);
+    }
+
+    @Override
+    public int patchById(final Long id, final Patient patch) {
+        final CriteriaBuilder builder = entityManager.getCriteriaBuilder();
+        final CriteriaUpdate<PatientEntity> update = builder.createCriteriaUpdate(PatientEntity.class);
+        final Root<PatientEntity> root = update.from(PatientEntity.class);
+        boolean changed = false;
+        if (patch.getName() != null) {
+            update.set(root.<String>get("name"), patch.getName());
+            changed = true;
+        }
+        if (patch.getBirthDate() != null) {
+            update.set(root.<LocalDate>get("birthDate"), patch.getBirthDate());
+            changed = true;
+        }
+        if (patch.getStatus() != null) {
+            update.set(root.<PatientStatus>get("status"), patch.getStatus());
+            changed = true;
+        }
+        if (!changed) {
+            return entityManager.find(PatientEntity.class, id) != null ? 1 : 0;
+        }
+        update.where(builder.equal(root.get("id"), id));
+        return entityManager.createQuery(update).executeUpdate();
+    }
+}
@@ -0,0 +1,18 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.models.entities.PatientEntity;
+import com.inycom.cws.repositories.PatientRepository;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+
+@RequiredArgsConstructor
+@Service
+public class DeletePatientService {
+    private final FindPatientService service;
+    private final PatientRepository repository;
+
+    public void delete(final Long id) {
+        final PatientEntity entity = service.find(id);
+        repository.delete(entity);
+    }
+}
@@ -0,0 +1,21 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.exceptions.CwsException;
+import com.inycom.cws.models.pojos.Patient;
+import com.inycom.cws.repositories.PatientRepository;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+@RequiredArgsConstructor
+@Service
+public class PatchPatientService {
+    private final PatientRepository repository;
+
+    @Transactional
+    public void patch(final Long patientId, final Patient patientPatch) {
+        if (repository.patchById(patientId, patientPatch) == 0) {
+            throw new CwsException("Not found " + patientId);
+        }
+    }
+}
@@ -0,0 +1,29 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.factories.PatientSpecificationFactory;
+import com.inycom.cws.models.dtos.PatientDto;
+import com.inycom.cws.models.entities.PatientEntity;
+import com.inycom.cws.models.projections.PatientProjection;
+import com.inycom.cws.repositories.PatientRepository;
+import com.inycom.cws.search.PatientSearchModel;
+import lombok.RequiredArgsConstructor;
+import org.springframework.data.domain.Pageable;
+import org.springframework.data.jpa.domain.Specification;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+import java.util.Collection;
+
+@RequiredArgsConstructor
+@Service
+public class SearchPatientService {
+    private final PatientRepository repository;
+
+    @Transactional(readOnly = true)
+    public Collection<PatientDto> search(final PatientSearchModel searchModel, final Pageable pageable) {
+        final Specification<PatientEntity> specification =
+                PatientSpecificationFactory.mapToSpecification(searchModel);
+
+        return repository.findProjected(specification, pageable).map(PatientProjection::toDto).getContent();
+    }
+}
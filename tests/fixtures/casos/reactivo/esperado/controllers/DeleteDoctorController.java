@@ -0,0 +1,27 @@
+package com.inycom.cws.controllers;
+
+import com.inycom.cws.annotations.Audit;
+import com.inycom.cws.enums.AuditAction;
+import com.inycom.cws.services.DeleteDoctorService;
+import lombok.RequiredArgsConstructor;
+import org.springframework.http.ResponseEntity;
+import org.springframework.web.bind.annotation.DeleteMapping;
+import org.springframework.web.bind.annotation.PathVariable;
+import org.springframework.web.bind.annotation.RequestMapping;
+import org.springframework.web.bind.annotation.RestController;
+import reactor.core.publisher.Mono;
+
+@RequiredArgsConstructor
+@RestController
+@RequestMapping("/1.0/doctors")
+public class DeleteDoctorController {
+    private static final long CON_DOCTOR = 42;
+    private final DeleteDoctorService service;
+
+    @Audit(controllerId = CON_DOCTOR, action = AuditAction.DELETE)
+    @DeleteMapping("/{doctorId}")
+    public Mono<ResponseEntity<Void>> delete(@PathVariable final Long doctorId) {
+        return service.delete(doctorId)
+                .then(Mono.fromSupplier(() -> ResponseEntity.noContent().<Void>build()));
+    }
+}
@@ -0,0 +1,27 @@
+package com.inycom.cws.controllers;
+
+import com.inycom.cws.annotations.Audit;
+import com.inycom.cws.enums.AuditAction;
+import com.inycom.cws.services.DeletePatientService;
+import lombok.RequiredArgsConstructor;
+import org.springframework.http.ResponseEntity;
+import org.springframework.web.bind.annotation.DeleteMapping;
+import org.springframework.web.bind.annotation.PathVariable;
+import org.springframework.web.bind.annotation.RequestMapping;
+import org.springframework.web.bind.annotation.RestController;
+import reactor.core.publisher.Mono;
+
+@RequiredArgsConstructor
+@RestController
+@RequestMapping("/1.0/patients")
+public class DeletePatientController {
+    private static final long CON_PATIENT = 41;
+    private final DeletePatientService service;
+
+    @Audit(controllerId = CON_PATIENT, action = AuditAction.DELETE)
+    @DeleteMapping("/{patientId}")
+    public Mono<ResponseEntity<Void>> delete(@PathVariable final Long patientId) {
+        return service.delete(patientId)
+                .then(Mono.fromSupplier(() -> ResponseEntity.noContent().<Void>build()));
+    }
+}
@@ -0,0 +1,24 @@
+package com.inycom.cws.controllers;
+
+import com.inycom.cws.models.dtos.DoctorDto;
+import com.inycom.cws.search.DoctorSearchModel;
+import com.inycom.cws.services.SearchDoctorService;
+import lombok.RequiredArgsConstructor;
+import org.springframework.data.domain.Pageable;
+import org.springframework.web.bind.annotation.GetMapping;
+import org.springframework.web.bind.annotation.RequestMapping;
+import org.springframework.web.bind.annotation.RestController;
+import reactor.core.publisher.Flux;
+
+@RequiredArgsConstructor
+@RestController
+@RequestMapping("/1.0/doctors")
+public class GetDoctorController {
+
+    private final SearchDoctorService service;
+
+    @GetMapping
+    public Flux<DoctorDto> get(final DoctorSearchModel searchModel, final Pageable pageable) {
+        return service.search(searchModel, pageable);
+    }
+}
@@ -0,0 +1,24 @@
+package com.inycom.cws.controllers;
+
+import com.inycom.cws.models.dtos.PatientDto;
+import com.inycom.cws.search.PatientSearchModel;
+import com.inycom.cws.services.SearchPatientService;
+import lombok.RequiredArgsConstructor;
+import org.springframework.data.domain.Pageable;
+import org.springframework.web.bind.annotation.GetMapping;
+import org.springframework.web.bind.annotation.RequestMapping;
+import org.springframework.web.bind.annotation.RestController;
+import reactor.core.publisher.Flux;
+
+@RequiredArgsConstructor
+@RestController
+@RequestMapping("/1.0/patients")
+public class GetPatientController {
+
+    private final SearchPatientService service;
+
+    @GetMapping
+    public Flux<PatientDto> get(final PatientSearchModel searchModel, final Pageable pageable) {
+        return service.search(searchModel, pageable);
+    }
+}
@@ -0,0 +1,28 @@
+package com.inycom.cws.controllers;
+
+import com.inycom.cws.annotations.Audit;
+import com.inycom.cws.enums.AuditAction;
+import com.inycom.cws.models.dtos.DoctorDto;
+import com.inycom.cws.models.pojos.Doctor;
+import com.inycom.cws.services.CreateDoctorService;
+import jakarta.validation.Valid;
+import lombok.RequiredArgsConstructor;
+import org.springframework.http.HttpStatus;
+import org.springframework.http.ResponseEntity;
+import org.springframework.web.bind.annotation.*;
+import reactor.core.publisher.Mono;
+
+@RequiredArgsConstructor
+@RestController
+@RequestMapping("/1.0/doctors")
+public class PostDoctorController {
+    private static final long CON_DOCTOR = 42;
+
+    private final CreateDoctorService service;
+
+    @Audit(controllerId = CON_DOCTOR, action = AuditAction.POST)
+    @PostMapping
+    public Mono<ResponseEntity<DoctorDto>> create(@Valid @RequestBody Doctor newObject) {
+        return service.create(newObject).map(dto -> new ResponseEntity<>(dto, HttpStatus.CREATED));
+    }
+}
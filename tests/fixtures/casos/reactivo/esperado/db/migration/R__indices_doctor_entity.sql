@@ -0,0 +1,7 @@
+-- Índices para los filtros de búsqueda de DoctorEntity (generado).
+-- Equivalente en la entidad:
+-- @Table(name = "doctor_entity", indexes = {
+--     @Index(name = "idx_doctor_entity_full_name", columnList = "full_name")
+-- })
+
+CREATE INDEX IF NOT EXISTS idx_doctor_entity_full_name ON doctor_entity (full_name);
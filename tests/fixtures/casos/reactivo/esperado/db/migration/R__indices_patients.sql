@@ -0,0 +1,9 @@
+-- Índices para los filtros de búsqueda de PatientEntity (generado).
+-- Equivalente en la entidad:
+-- @Table(name = "patients", indexes = {
+--     @Index(name = "idx_patients_birth_date", columnList = "birth_date"),
+--     @Index(name = "idx_patients_status", columnList = "status")
+-- })
+
+CREATE INDEX IF NOT EXISTS idx_patients_birth_date ON patients (birth_date);
+CREATE INDEX IF NOT EXISTS idx_patients_status ON patients (status);
@@ -0,0 +1,31 @@
+package com.inycom.cws.factories;
+
+import com.inycom.cws.search.DoctorSearchModel;
+import lombok.experimental.UtilityClass;
+import org.springframework.data.relational.core.query.Criteria;
+
+import java.util.LinkedList;
+import java.util.List;
+import java.util.Optional;
+
+@UtilityClass
+public class DoctorCriteriaFactory {
+
+    public Criteria mapToCriteria(final DoctorSearchModel searchModel) {
+
+        final List<Criteria> criteria = new LinkedList<>();
+
+        Optional.ofNullable(searchModel.getFullName())
+                .map(value -> Criteria.where("fullName").is(value))
+                .ifPresent(criteria::add);
+        Optional.ofNullable(searchModel.getFullNameStartsWith())
+                .map(value -> Criteria.where("fullName").like(escapeLike(value) + "%"))
+                .ifPresent(criteria::add);
+
+        return Criteria.from(criteria);
+    }
+
+    private static String escapeLike(final String value) {
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_");
+    }
+}
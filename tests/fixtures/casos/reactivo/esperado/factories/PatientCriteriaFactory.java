@@ -0,0 +1,47 @@
+package com.inycom.cws.factories;
+
+import com.inycom.cws.search.PatientSearchModel;
+import lombok.experimental.UtilityClass;
+import org.springframework.data.relational.core.query.Criteria;
+
+import java.util.LinkedList;
+import java.util.List;
+import java.util.Optional;
+
+@UtilityClass
+public class PatientCriteriaFactory {
+
+    public Criteria mapToCriteria(final PatientSearchModel searchModel) {
+
+        final List<Criteria> criteria = new LinkedList<>();
+
+        Optional.ofNullable(searchModel.getName())
+                .map(value -> Criteria.where("name").is(value))
+                .ifPresent(criteria::add);
+        Optional.ofNullable(searchModel.getNameStartsWith())
+                .map(value -> Criteria.where("name").like(escapeLike(value) + "%"))
+                .ifPresent(criteria::add);
+        Optional.ofNullable(searchModel.getBirthDate())
+                .map(value -> Criteria.where("birthDate").is(value))
+                .ifPresent(criteria::add);
+        Optional.ofNullable(searchModel.getBirthDateFrom())
+                .map(value -> Criteria.where("birthDate").greaterThanOrEquals(value))
+                .ifPresent(criteria::add);
+        Optional.ofNullable(searchModel.getBirthDateTo())
+                .map(value -> Criteria.where("birthDate").lessThanOrEquals(value))
+                .ifPresent(criteria::add);
+        Optional.ofNullable(searchModel.getStatus())
+                .map(value -> Criteria.where("status").is(value))
+                .ifPresent(criteria::add);
+        Optional.ofNullable(searchModel.getStatusIn())
+                .filter(values -> !values.isEmpty())
+                .map(value -> Criteria.where("status").in(value))
+                .ifPresent(criteria::add);
+
+        return Criteria.from(criteria);
+    }
+
+    private static String escapeLike(final String value) {
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_");
+    }
+}
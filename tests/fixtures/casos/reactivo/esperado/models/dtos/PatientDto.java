@@ -0,0 +1,28 @@
+package com.inycom.cws.models.dtos;
+
+import com.inycom.cws.models.entities.PatientStatus;
+import com.inycom.cws.models.pojos.Patient;
+import jakarta.validation.constraints.NotNull;
+import java.time.LocalDate;
+import lombok.AllArgsConstructor;
+import lombok.Data;
+import lombok.EqualsAndHashCode;
+import lombok.RequiredArgsConstructor;
+import lombok.experimental.SuperBuilder;
+
+@EqualsAndHashCode(callSuper = true)
+@SuperBuilder
+@AllArgsConstructor
+@RequiredArgsConstructor
+@Data
+public class PatientDto extends Patient {
+
+	@NotNull
+	private Long id;
+	private String name;
+	private String code;
+	private LocalDate birthDate;
+	private Integer age;
+	private PatientStatus status;
+
+}
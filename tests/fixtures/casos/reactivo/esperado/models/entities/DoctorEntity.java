@@ -0,0 +1,18 @@
+package com.inycom.cws.models.entities;
+
+import lombok.Data;
+import org.springframework.data.annotation.Id;
+import org.springframework.data.relational.core.mapping.Column;
+import org.springframework.data.relational.core.mapping.Table;
+
+@Data
+@Table("doctor_entity")
+public class DoctorEntity {
+
+    @Id
+    @Column("id")
+    private Long id;
+
+    @Column("full_name")
+    private String fullName;
+}
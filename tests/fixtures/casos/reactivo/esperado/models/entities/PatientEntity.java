@@ -0,0 +1,32 @@
+package com.inycom.cws.models.entities;
+
+import lombok.Data;
+import org.springframework.data.annotation.Id;
+import org.springframework.data.relational.core.mapping.Column;
+import org.springframework.data.relational.core.mapping.Table;
+
+import java.time.LocalDate;
+
+@Data
+@Table("patients")
+public class PatientEntity {
+
+    @Id
+    @Column("id")
+    private Long id;
+
+    @Column("name")
+    private String name;
+
+    @Column("patient_code")
+    private String code;
+
+    @Column("birth_date")
+    private LocalDate birthDate;
+
+    @Column("age")
+    private Integer age;
+
+    @Column("status")
+    private PatientStatus status;
+}
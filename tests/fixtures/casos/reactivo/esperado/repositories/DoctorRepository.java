@@ -0,0 +1,7 @@
+package com.inycom.cws.repositories;
+
+import com.inycom.cws.models.entities.DoctorEntity;
+import org.springframework.data.r2dbc.repository.R2dbcRepository;
+
+public interface DoctorRepository extends R2dbcRepository<DoctorEntity, Long> {
+}
@@ -0,0 +1,7 @@
+package com.inycom.cws.repositories;
+
+import com.inycom.cws.models.entities.PatientEntity;
+import org.springframework.data.r2dbc.repository.R2dbcRepository;
+
+public interface PatientRepository extends R2dbcRepository<PatientEntity, Long> {
+}
@@ -0,0 +1,21 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.mappers.DoctorMapper;
+import com.inycom.cws.models.dtos.DoctorDto;
+import com.inycom.cws.models.pojos.Doctor;
+import com.inycom.cws.repositories.DoctorRepository;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+import reactor.core.publisher.Mono;
+
+@RequiredArgsConstructor
+@Service
+public class CreateDoctorService {
+    private final DoctorRepository repository;
+
+    @Transactional
+    public Mono<DoctorDto> create(final Doctor doctor) {
+        return repository.save(DoctorMapper.toEntity(doctor)).map(DoctorMapper::toDto);
+    }
+}
@@ -0,0 +1,21 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.mappers.PatientMapper;
+import com.inycom.cws.models.dtos.PatientDto;
+import com.inycom.cws.models.pojos.Patient;
+import com.inycom.cws.repositories.PatientRepository;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+import reactor.core.publisher.Mono;
+
+@RequiredArgsConstructor
+@Service
+public class CreatePatientService {
+    private final PatientRepository repository;
+
+    @Transactional
+    public Mono<PatientDto> create(final Patient patient) {
+        return repository.save(PatientMapper.toEntity(patient)).map(PatientMapper::toDto);
+    }
+}
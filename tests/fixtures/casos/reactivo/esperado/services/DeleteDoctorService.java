@@ -0,0 +1,19 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.repositories.DoctorRepository;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+import reactor.core.publisher.Mono;
+
+@RequiredArgsConstructor
+@Service
+public class DeleteDoctorService {
+    private final FindDoctorService service;
+    private final DoctorRepository repository;
+
+    @Transactional
+    public Mono<Void> delete(final Long id) {
+        return service.find(id).flatMap(repository::delete);
+    }
+}
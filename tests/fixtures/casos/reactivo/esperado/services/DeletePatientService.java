@@ -0,0 +1,19 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.repositories.PatientRepository;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+import reactor.core.publisher.Mono;
+
+@RequiredArgsConstructor
+@Service
+public class DeletePatientService {
+    private final FindPatientService service;
+    private final PatientRepository repository;
+
+    @Transactional
+    public Mono<Void> delete(final Long id) {
+        return service.find(id).flatMap(repository::delete);
+    }
+}
@@ -0,0 +1,21 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.exceptions.CwsException;
+import com.inycom.cws.models.entities.DoctorEntity;
+import com.inycom.cws.repositories.DoctorRepository;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+import reactor.core.publisher.Mono;
+
+@RequiredArgsConstructor
+@Service
+public class FindDoctorService {
+    private final DoctorRepository repository;
+
+    @Transactional(readOnly = true)
+    public Mono<DoctorEntity> find(final Long doctorId) {
+        return repository.findById(doctorId)
+                         .switchIfEmpty(Mono.error(() -> new CwsException("Not found " + doctorId)));
+    }
+}
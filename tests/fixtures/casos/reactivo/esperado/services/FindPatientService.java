@@ -0,0 +1,21 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.exceptions.CwsException;
+import com.inycom.cws.models.entities.PatientEntity;
+import com.inycom.cws.repositories.PatientRepository;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+import reactor.core.publisher.Mono;
+
+@RequiredArgsConstructor
+@Service
+public class FindPatientService {
+    private final PatientRepository repository;
+
+    @Transactional(readOnly = true)
+    public Mono<PatientEntity> find(final Long patientId) {
+        return repository.findById(patientId)
+                         .switchIfEmpty(Mono.error(() -> new CwsException("Not found " + patientId)));
+    }
+}
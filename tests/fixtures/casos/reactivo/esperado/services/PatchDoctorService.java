@@ -0,0 +1,27 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.mappers.DoctorMapper;
+import com.inycom.cws.models.entities.DoctorEntity;
+import com.inycom.cws.models.pojos.Doctor;
+import com.inycom.cws.repositories.DoctorRepository;
+import com.inycom.cws.utils.PatchUtils;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+import reactor.core.publisher.Mono;
+
+@RequiredArgsConstructor
+@Service
+public class PatchDoctorService {
+    private final FindDoctorService service;
+    private final DoctorRepository repository;
+
+    @Transactional
+    public Mono<Void> patch(final Long doctorId, final Doctor doctorPatch) {
+        final DoctorEntity patchedEntity = DoctorMapper.toEntity(doctorPatch);
+        return service.find(doctorId)
+                .map(existingEntity -> PatchUtils.merge(existingEntity, patchedEntity))
+                .flatMap(repository::save)
+                .then();
+    }
+}
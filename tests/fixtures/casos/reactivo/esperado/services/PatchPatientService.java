@@ -0,0 +1,27 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.mappers.PatientMapper;
+import com.inycom.cws.models.entities.PatientEntity;
+import com.inycom.cws.models.pojos.Patient;
+import com.inycom.cws.repositories.PatientRepository;
+import com.inycom.cws.utils.PatchUtils;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+import reactor.core.publisher.Mono;
+
+@RequiredArgsConstructor
+@Service
+public class PatchPatientService {
+    private final FindPatientService service;
+    private final PatientRepository repository;
+
+    @Transactional
+    public Mono<Void> patch(final Long patientId, final Patient patientPatch) {
+        final PatientEntity patchedEntity = PatientMapper.toEntity(patientPatch);
+        return service.find(patientId)
+                .map(existingEntity -> PatchUtils.merge(existingEntity, patchedEntity))
+                .flatMap(repository::save)
+                .then();
+    }
+}
@@ -0,0 +1,28 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.factories.DoctorCriteriaFactory;
+import com.inycom.cws.mappers.DoctorMapper;
+import com.inycom.cws.models.dtos.DoctorDto;
+import com.inycom.cws.models.entities.DoctorEntity;
+import com.inycom.cws.search.DoctorSearchModel;
+import lombok.RequiredArgsConstructor;
+import org.springframework.data.domain.Pageable;
+import org.springframework.data.r2dbc.core.R2dbcEntityTemplate;
+import org.springframework.data.relational.core.query.Query;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+import reactor.core.publisher.Flux;
+
+@RequiredArgsConstructor
+@Service
+public class SearchDoctorService {
+    private final R2dbcEntityTemplate template;
+
+    @Transactional(readOnly = true)
+    public Flux<DoctorDto> search(final DoctorSearchModel searchModel, final Pageable pageable) {
+        return template.select(DoctorEntity.class)
+                .matching(Query.query(DoctorCriteriaFactory.mapToCriteria(searchModel)).with(pageable))
+                .all()
+                .map(DoctorMapper::toDto);
+    }
+}
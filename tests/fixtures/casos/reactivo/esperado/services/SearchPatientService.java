@@ -0,0 +1,28 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.factories.PatientCriteriaFactory;
+import com.inycom.cws.mappers.PatientMapper;
+import com.inycom.cws.models.dtos.PatientDto;
+import com.inycom.cws.models.entities.PatientEntity;
+import com.inycom.cws.search.PatientSearchModel;
+import lombok.RequiredArgsConstructor;
+import org.springframework.data.domain.Pageable;
+import org.springframework.data.r2dbc.core.R2dbcEntityTemplate;
+import org.springframework.data.relational.core.query.Query;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+import reactor.core.publisher.Flux;
+
+@RequiredArgsConstructor
+@Service
+public class SearchPatientService {
+    private final R2dbcEntityTemplate template;
+
+    @Transactional(readOnly = true)
+    public Flux<PatientDto> search(final PatientSearchModel searchModel, final Pageable pageable) {
+        return template.select(PatientEntity.class)
+                .matching(Query.query(PatientCriteriaFactory.mapToCriteria(searchModel)).with(pageable))
+                .all()
+                .map(PatientMapper::toDto);
+    }
+}
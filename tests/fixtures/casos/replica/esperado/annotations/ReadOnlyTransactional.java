@@ -0,0 +1,16 @@
+package com.inycom.cws.annotations;
+
+import org.springframework.transaction.annotation.Transactional;
+
+import java.lang.annotation.Documented;
+import java.lang.annotation.ElementType;
+import java.lang.annotation.Retention;
+import java.lang.annotation.RetentionPolicy;
+import java.lang.annotation.Target;
+
+@Target({ElementType.METHOD, ElementType.TYPE})
+@Retention(RetentionPolicy.RUNTIME)
+@Documented
+@Transactional(readOnly = true)
+public @interface ReadOnlyTransactional {
+}
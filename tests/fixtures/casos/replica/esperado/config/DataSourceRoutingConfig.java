@@ -0,0 +1,55 @@
+package com.inycom.cws.config;
+
+import com.inycom.cws.config.ReadOnlyRoutingDataSource.Target;
+import com.zaxxer.hikari.HikariDataSource;
+import org.springframework.beans.factory.annotation.Qualifier;
+import org.springframework.boot.autoconfigure.jdbc.DataSourceProperties;
+import org.springframework.boot.context.properties.ConfigurationProperties;
+import org.springframework.context.annotation.Bean;
+import org.springframework.context.annotation.Configuration;
+import org.springframework.context.annotation.Primary;
+import org.springframework.jdbc.datasource.LazyConnectionDataSourceProxy;
+
+import javax.sql.DataSource;
+import java.util.Map;
+
+@Configuration
+public class DataSourceRoutingConfig {
+
+    @Bean
+    @ConfigurationProperties("app.datasource.primary")
+    public DataSourceProperties primaryDataSourceProperties() {
+        return new DataSourceProperties();
+    }
+
+    @Bean
+    @ConfigurationProperties("app.datasource.replica")
+    public DataSourceProperties replicaDataSourceProperties() {
+        return new DataSourceProperties();
+    }
+
+    @Bean
+    @ConfigurationProperties("app.datasource.primary.hikari")
+    public HikariDataSource primaryDataSource(@Qualifier("primaryDataSourceProperties") final DataSourceProperties properties) {
+        return properties.initializeDataSourceBuilder().type(HikariDataSource.class).build();
+    }
+
+    @Bean
+    @ConfigurationProperties("app.datasource.replica.hikari")
+    public HikariDataSource replicaDataSource(@Qualifier("replicaDataSourceProperties") final DataSourceProperties properties) {
+        final HikariDataSource dataSource = properties.initializeDataSourceBuilder().type(HikariDataSource.class).build();
+        dataSource.setReadOnly(true);
+        return dataSource;
+    }
+
+    @Bean
+    @Primary
+    public DataSource dataSource(@Qualifier("primaryDataSource") final DataSource primary,
+                                 @Qualifier("replicaDataSource") final DataSource replica) {
+        final ReadOnlyRoutingDataSource routing = new ReadOnlyRoutingDataSource();
+        routing.setTargetDataSources(Map.of(Target.PRIMARY, primary, Target.REPLICA, replica));
+        routing.setDefaultTargetDataSource(primary);
+        routing.afterPropertiesSet();
+        return new LazyConnectionDataSourceProxy(routing);
+    }
+}
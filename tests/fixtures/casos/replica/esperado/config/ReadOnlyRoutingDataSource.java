@@ -0,0 +1,17 @@
+package com.inycom.cws.config;
+
+import org.springframework.jdbc.datasource.lookup.AbstractRoutingDataSource;
+import org.springframework.transaction.support.TransactionSynchronizationManager;
+
+public class ReadOnlyRoutingDataSource extends AbstractRoutingDataSource {
+
+    public enum Target {
+        PRIMARY,
+        REPLICA
+    }
+
+    @Override
+    protected Object determineCurrentLookupKey() {
+        return TransactionSynchronizationManager.isCurrentTransactionReadOnly() ? Target.REPLICA : Target.PRIMARY;
+    }
+}
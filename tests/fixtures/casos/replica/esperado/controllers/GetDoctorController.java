@@ -0,0 +1,27 @@
+package com.inycom.cws.controllers;
+
+import com.inycom.cws.models.dtos.DoctorDto;
+import com.inycom.cws.search.DoctorSearchModel;
+import com.inycom.cws.services.SearchDoctorService;
+import lombok.RequiredArgsConstructor;
+import org.springframework.data.domain.Pageable;
+import org.springframework.http.ResponseEntity;
+import org.springframework.web.bind.annotation.GetMapping;
+import org.springframework.web.bind.annotation.RequestMapping;
+import org.springframework.web.bind.annotation.RestController;
+
+import java.util.Collection;
+
+@RequiredArgsConstructor
+@RestController
+@RequestMapping("/1.0/doctors")
+public class GetDoctorController {
+
+    private final SearchDoctorService service;
+
+    @GetMapping
+    public ResponseEntity<Collection<DoctorDto>> get(final DoctorSearchModel searchModel,
+                                                              final Pageable pageable) {
+        return ResponseEntity.ok(service.search(searchModel, pageable));
+    }
+}
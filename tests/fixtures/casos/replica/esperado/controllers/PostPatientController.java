@@ -0,0 +1,27 @@
+package com.inycom.cws.controllers;
+
+import com.inycom.cws.annotations.Audit;
+import com.inycom.cws.enums.AuditAction;
+import com.inycom.cws.models.dtos.PatientDto;
+import com.inycom.cws.models.pojos.Patient;
+import com.inycom.cws.services.CreatePatientService;
+import jakarta.validation.Valid;
+import lombok.RequiredArgsConstructor;
+import org.springframework.http.HttpStatus;
+import org.springframework.http.ResponseEntity;
+import org.springframework.web.bind.annotation.*;
+
+@RequiredArgsConstructor
+@RestController
+@RequestMapping("/1.0/patients")
+public class PostPatientController {
+    private static final long CON_PATIENT = 41;
+
+    private final CreatePatientService service;
+
+    @Audit(controllerId = CON_PATIENT, action = AuditAction.POST)
+    @PostMapping
+    public ResponseEntity<PatientDto> create(@Valid @RequestBody Patient newObject) {
+        return new ResponseEntity<>(service.create(newObject), HttpStatus.CREATED);
+    }
+}
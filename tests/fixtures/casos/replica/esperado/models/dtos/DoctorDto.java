@@ -0,0 +1,22 @@
+package com.inycom.cws.models.dtos;
+
+import com.inycom.cws.models.pojos.Doctor;
+import jakarta.validation.constraints.NotNull;
+import lombok.AllArgsConstructor;
+import lombok.Data;
+import lombok.EqualsAndHashCode;
+import lombok.RequiredArgsConstructor;
+import lombok.experimental.SuperBuilder;
+
+@EqualsAndHashCode(callSuper = true)
+@SuperBuilder
+@AllArgsConstructor
+@RequiredArgsConstructor
+@Data
+public class DoctorDto extends Doctor {
+
+	@NotNull
+	private Long id;
+	private String fullName;
+
+}
@@ -0,0 +1,28 @@
+package com.inycom.cws.repositories;
+
+import com.inycom.cws.models.entities.PatientEntity;
+import jakarta.persistence.QueryHint;
+import org.hibernate.jpa.HibernateHints;
+import org.springframework.data.domain.Page;
+import org.springframework.data.domain.Pageable;
+import org.springframework.data.jpa.domain.Specification;
+import org.springframework.data.jpa.repository.EntityGraph;
+import org.springframework.data.jpa.repository.JpaSpecificationExecutor;
+import org.springframework.data.jpa.repository.QueryHints;
+import org.springframework.data.repository.CrudRepository;
+import org.springframework.stereotype.Repository;
+
+import java.util.Optional;
+
+@Repository
+public interface PatientRepository extends CrudRepository<PatientEntity, Long>, JpaSpecificationExecutor<PatientEntity> {
+    @EntityGraph(attributePaths = {"doctor"})
+    Optional<PatientEntity> findById(Long id);
+
+    @EntityGraph(attributePaths = {"doctor"})
+    @QueryHints({
+        @QueryHint(name = HibernateHints.HINT_FETCH_SIZE, value = "250"),
+        @QueryHint(name = HibernateHints.HINT_READ_ONLY, value = "true")
+    })
+    Page<PatientEntity> findAll(Specification<PatientEntity> specification, Pageable pageable);
+}
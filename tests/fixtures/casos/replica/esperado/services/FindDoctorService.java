@@ -0,0 +1,18 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.exceptions.CwsException;
+import com.inycom.cws.models.entities.DoctorEntity;
+import com.inycom.cws.repositories.DoctorRepository;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+
+@RequiredArgsConstructor
+@Service
+public class FindDoctorService {
+    private final DoctorRepository repository;
+
+    public DoctorEntity find(final Long doctorId) {
+        return repository.findById(doctorId)
+                         .orElseThrow(() -> new CwsException("Not found " + doctorId));
+    }
+}
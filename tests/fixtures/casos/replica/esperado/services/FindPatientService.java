@@ -0,0 +1,20 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.annotations.ReadOnlyTransactional;
+import com.inycom.cws.exceptions.CwsException;
+import com.inycom.cws.models.entities.PatientEntity;
+import com.inycom.cws.repositories.PatientRepository;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+
+@RequiredArgsConstructor
+@Service
+public class FindPatientService {
+    private final PatientRepository repository;
+
+    @ReadOnlyTransactional
+    public PatientEntity find(final Long patientId) {
+        return repository.findById(patientId)
+                         .orElseThrow(() -> new CwsException("Not found " + patientId));
+    }
+}
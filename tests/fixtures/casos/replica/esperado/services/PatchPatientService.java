@@ -0,0 +1,25 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.exceptions.CwsException;
+import com.inycom.cws.mappers.PatientMapper;
+import com.inycom.cws.models.entities.PatientEntity;
+import com.inycom.cws.models.pojos.Patient;
+import com.inycom.cws.repositories.PatientRepository;
+import com.inycom.cws.utils.PatchUtils;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+@RequiredArgsConstructor
+@Service
+public class PatchPatientService {
+    private final PatientRepository repository;
+
+    @Transactional
+    public void patch(final Long patientId, final Patient patientPatch) {
+        final PatientEntity existingEntity = repository.findById(patientId)
+                .orElseThrow(() -> new CwsException("Not found " + patientId));
+        final PatientEntity patchedEntity = PatientMapper.toEntity(patientPatch);
+        repository.save(PatchUtils.merge(existingEntity, patchedEntity));
+    }
+}
@@ -0,0 +1,28 @@
+package com.inycom.cws.controllers;
+
+import com.inycom.cws.annotations.Audit;
+import com.inycom.cws.enums.AuditAction;
+import com.inycom.cws.models.pojos.Doctor;
+import com.inycom.cws.services.PatchDoctorService;
+import lombok.RequiredArgsConstructor;
+import org.springframework.http.ResponseEntity;
+import org.springframework.web.bind.annotation.PatchMapping;
+import org.springframework.web.bind.annotation.PathVariable;
+import org.springframework.web.bind.annotation.RequestBody;
+import org.springframework.web.bind.annotation.RequestMapping;
+import org.springframework.web.bind.annotation.RestController;
+
+@RequiredArgsConstructor
+@RestController
+@RequestMapping("/1.0/doctors")
+public class PatchDoctorController {
+    private static final long CON_DOCTOR = 42;
+    private final PatchDoctorService service;
+
+    @Audit(controllerId = CON_DOCTOR, action = AuditAction.PATCH)
+    @PatchMapping("/{doctorId}")
+    public ResponseEntity<Void> patch(@PathVariable final Long doctorId, @RequestBody final Doctor doctor) {
+        service.patch(doctorId, doctor);
+        return ResponseEntity.noContent().build();
+    }
+}
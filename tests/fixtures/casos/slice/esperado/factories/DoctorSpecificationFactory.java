@@ -0,0 +1,32 @@
+package com.inycom.cws.factories;
+
+import com.inycom.cws.models.entities.DoctorEntity;
+import com.inycom.cws.search.DoctorSearchModel;
+import com.inycom.cws.specifications.DoctorSpecifications;
+import lombok.experimental.UtilityClass;
+import org.springframework.data.jpa.domain.Specification;
+
+import java.util.LinkedList;
+import java.util.List;
+import java.util.Optional;
+
+
+@UtilityClass
+public class DoctorSpecificationFactory {
+
+    public Specification<DoctorEntity> mapToSpecification(final DoctorSearchModel searchModel) {
+
+        final List<Specification<DoctorEntity>> specifications = new LinkedList<>();
+
+        Optional.ofNullable(searchModel.getFullName())
+                .map(DoctorSpecifications::fullName)
+                .ifPresent(specifications::add);
+        Optional.ofNullable(searchModel.getFullNameStartsWith())
+                .map(DoctorSpecifications::fullNameStartsWith)
+                .ifPresent(specifications::add);
+
+        return specifications.stream()
+                .reduce(Specification::and)
+                .orElse(DoctorSpecifications.empty());
+    }
+}
@@ -0,0 +1,10 @@
+package com.inycom.cws.models.entities;
+
+import jakarta.persistence.*;
+
+@Entity
+public class DoctorEntity {
+    @Id
+    private Long id;
+    private String fullName;
+}
@@ -0,0 +1,10 @@
+package com.inycom.cws.repositories;
+
+import com.inycom.cws.models.entities.DoctorEntity;
+import org.springframework.data.jpa.repository.JpaSpecificationExecutor;
+import org.springframework.data.repository.CrudRepository;
+import org.springframework.stereotype.Repository;
+
+@Repository
+public interface DoctorRepository extends CrudRepository<DoctorEntity, Long>, JpaSpecificationExecutor<DoctorEntity>, DoctorRepositoryCustom {
+}
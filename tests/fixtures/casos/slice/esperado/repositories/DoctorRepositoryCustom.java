@@ -0,0 +1,11 @@
+package com.inycom.cws.repositories;
+
+import com.inycom.cws.models.entities.DoctorEntity;
+import org.springframework.data.domain.Pageable;
+import org.springframework.data.domain.Slice;
+import org.springframework.data.jpa.domain.Specification;
+
+public interface DoctorRepositoryCustom {
+
+    Slice<DoctorEntity> findSlice(Specification<DoctorEntity> specification, Pageable pageable);
+}
@@ -0,0 +1,49 @@
+package com.inycom.cws.repositories;
+
+import com.inycom.cws.models.entities.DoctorEntity;
+import jakarta.persistence.EntityManager;
+import jakarta.persistence.PersistenceContext;
+import jakarta.persistence.TypedQuery;
+import jakarta.persistence.criteria.CriteriaBuilder;
+import jakarta.persistence.criteria.CriteriaQuery;
+import jakarta.persistence.criteria.Predicate;
+import jakarta.persistence.criteria.Root;
+import org.springframework.data.domain.Pageable;
+import org.springframework.data.domain.Slice;
+import org.springframework.data.domain.SliceImpl;
+import org.springframework.data.jpa.domain.Specification;
+import org.springframework.data.jpa.repository.query.QueryUtils;
+
+import java.util.List;
+
+public class DoctorRepositoryCustomImpl implements DoctorRepositoryCustom {
+
+    @PersistenceContext
+    private EntityManager entityManager;
+
+    @Override
+    public Slice<DoctorEntity> findSlice(final Specification<DoctorEntity> specification, final Pageable pageable) {
+        final CriteriaBuilder builder = entityManager.getCriteriaBuilder();
+        final CriteriaQuery<DoctorEntity> query = builder.createQuery(DoctorEntity.class);
+        final Root<DoctorEntity> root = query.from(DoctorEntity.class);
+        final Predicate predicate = specification.toPredicate(root, query, builder);
+        if (predicate != null) {
+            query.where(predicate);
+        }
+        query.select(root);
+        if (pageable.getSort().isSorted()) {
+            query.orderBy(QueryUtils.toOrders(pageable.getSort(), root, builder));
+        }
+
+        final TypedQuery<DoctorEntity> typedQuery = entityManager.createQuery(query);
+        if (pageable.isUnpaged()) {
+            return new SliceImpl<>(typedQuery.getResultList(), pageable, false);
+        }
+        typedQuery.setFirstResult((int) pageable.getOffset());
+        typedQuery.setMaxResults(pageable.getPageSize() + 1);
+
+        final List<DoctorEntity> content = typedQuery.getResultList();
+        final boolean hasNext = content.size() > pageable.getPageSize();
+        return new SliceImpl<>(hasNext ? content.subList(0, pageable.getPageSize()) : content, pageable, hasNext);
+    }
+}
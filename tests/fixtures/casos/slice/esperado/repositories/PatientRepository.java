@@ -0,0 +1,15 @@
+package com.inycom.cws.repositories;
+
+import com.inycom.cws.models.entities.PatientEntity;
+import org.springframework.data.jpa.repository.EntityGraph;
+import org.springframework.data.jpa.repository.JpaSpecificationExecutor;
+import org.springframework.data.repository.CrudRepository;
+import org.springframework.stereotype.Repository;
+
+import java.util.Optional;
+
+@Repository
+public interface PatientRepository extends CrudRepository<PatientEntity, Long>, JpaSpecificationExecutor<PatientEntity>, PatientRepositoryCustom {
+    @EntityGraph(attributePaths = {"doctor"})
+    Optional<PatientEntity> findById(Long id);
+}
@@ -0,0 +1,57 @@
+package com.inycom.cws.repositories;
+
+import com.inycom.cws.models.entities.PatientEntity;
+import jakarta.persistence.EntityGraph;
+import jakarta.persistence.EntityManager;
+import jakarta.persistence.PersistenceContext;
+import jakarta.persistence.TypedQuery;
+import jakarta.persistence.criteria.CriteriaBuilder;
+import jakarta.persistence.criteria.CriteriaQuery;
+import jakarta.persistence.criteria.Predicate;
+import jakarta.persistence.criteria.Root;
+import org.hibernate.jpa.HibernateHints;
+import org.hibernate.jpa.SpecHints;
+import org.springframework.data.domain.Pageable;
+import org.springframework.data.domain.Slice;
+import org.springframework.data.domain.SliceImpl;
+import org.springframework.data.jpa.domain.Specification;
+import org.springframework.data.jpa.repository.query.QueryUtils;
+
+import java.util.List;
+
+public class PatientRepositoryCustomImpl implements PatientRepositoryCustom {
+
+    @PersistenceContext
+    private EntityManager entityManager;
+
+    @Override
+    public Slice<PatientEntity> findSlice(final Specification<PatientEntity> specification, final Pageable pageable) {
+        final CriteriaBuilder builder = entityManager.getCriteriaBuilder();
+        final CriteriaQuery<PatientEntity> query = builder.createQuery(PatientEntity.class);
+        final Root<PatientEntity> root = query.from(PatientEntity.class);
+        final Predicate predicate = specification.toPredicate(root, query, builder);
+        if (predicate != null) {
+            query.where(predicate);
+        }
+        query.select(root);
+        if (pageable.getSort().isSorted()) {
+            query.orderBy(QueryUtils.toOrders(pageable.getSort(), root, builder));
+        }
+
+        final TypedQuery<PatientEntity> typedQuery = entityManager.createQuery(query);
+        typedQuery.setHint(HibernateHints.HINT_FETCH_SIZE, 100);
+        typedQuery.setHint(HibernateHints.HINT_READ_ONLY, true);
+        final EntityGraph<PatientEntity> graph = entityManager.createEntityGraph(PatientEntity.class);
+        graph.addAttributeNodes("doctor");
+        typedQuery.setHint(SpecHints.HINT_SPEC_FETCH_GRAPH, graph);
+        if (pageable.isUnpaged()) {
+            return new SliceImpl<>(typedQuery.getResultList(), pageable, false);
+        }
+        typedQuery.setFirstResult((int) pageable.getOffset());
+        typedQuery.setMaxResults(pageable.getPageSize() + 1);
+
+        final List<PatientEntity> content = typedQuery.getResultList();
+        final boolean hasNext = content.size() > pageable.getPageSize();
+        return new SliceImpl<>(hasNext ? content.subList(0, pageable.getPageSize()) : content, pageable, hasNext);
+    }
+}
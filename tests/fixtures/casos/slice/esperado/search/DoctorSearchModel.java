@@ -0,0 +1,11 @@
+package com.inycom.cws.search;
+
+import lombok.Data;
+
+
+@Data
+public class DoctorSearchModel {
+
+    private String fullName;
+    private String fullNameStartsWith;
+}
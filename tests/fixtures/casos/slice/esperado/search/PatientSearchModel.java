@@ -0,0 +1,20 @@
+package com.inycom.cws.search;
+
+import com.inycom.cws.models.entities.PatientStatus;
+import lombok.Data;
+
+import java.time.LocalDate;
+import java.util.List;
+
+
+@Data
+public class PatientSearchModel {
+
+    private String name;
+    private String nameStartsWith;
+    private LocalDate birthDate;
+    private LocalDate birthDateFrom;
+    private LocalDate birthDateTo;
+    private PatientStatus status;
+    private List<PatientStatus> statusIn;
+}
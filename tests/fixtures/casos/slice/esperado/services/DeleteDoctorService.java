@@ -0,0 +1,18 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.models.entities.DoctorEntity;
+import com.inycom.cws.repositories.DoctorRepository;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+
+@RequiredArgsConstructor
+@Service
+public class DeleteDoctorService {
+    private final FindDoctorService service;
+    private final DoctorRepository repository;
+
+    public void delete(final Long id) {
+        final DoctorEntity entity = service.find(id);
+        repository.delete(entity);
+    }
+}
@@ -0,0 +1,25 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.exceptions.CwsException;
+import com.inycom.cws.mappers.DoctorMapper;
+import com.inycom.cws.models.entities.DoctorEntity;
+import com.inycom.cws.models.pojos.Doctor;
+import com.inycom.cws.repositories.DoctorRepository;
+import com.inycom.cws.utils.PatchUtils;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+@RequiredArgsConstructor
+@Service
+public class PatchDoctorService {
+    private final DoctorRepository repository;
+
+    @Transactional
+    public void patch(final Long doctorId, final Doctor doctorPatch) {
+        final DoctorEntity existingEntity = repository.findById(doctorId)
+                .orElseThrow(() -> new CwsException("Not found " + doctorId));
+        final DoctorEntity patchedEntity = DoctorMapper.toEntity(doctorPatch);
+        repository.save(PatchUtils.merge(existingEntity, patchedEntity));
+    }
+}
@@ -0,0 +1,26 @@
+package com.inycom.cws.services;
+
+import com.inycom.cws.factories.DoctorSpecificationFactory;
+import com.inycom.cws.mappers.DoctorMapper;
+import com.inycom.cws.models.dtos.DoctorDto;
+import com.inycom.cws.models.entities.DoctorEntity;
+import com.inycom.cws.repositories.DoctorRepository;
+import com.inycom.cws.search.DoctorSearchModel;
+import lombok.RequiredArgsConstructor;
+import org.springframework.data.domain.Pageable;
+import org.springframework.data.domain.Slice;
+import org.springframework.data.jpa.domain.Specification;
+import org.springframework.stereotype.Service;
+
+@RequiredArgsConstructor
+@Service
+public class SearchDoctorService {
+    private final DoctorRepository repository;
+
+    public Slice<DoctorDto> search(final DoctorSearchModel searchModel, final Pageable pageable) {
+        final Specification<DoctorEntity> specification =
+                DoctorSpecificationFactory.mapToSpecification(searchModel);
+
+        return repository.findSlice(specification, pageable).map(DoctorMapper::toDto);
+    }
+}
@@ -0,0 +1,26 @@
+package com.inycom.cws.specifications;
+
+import com.inycom.cws.models.entities.DoctorEntity;
+import lombok.experimental.UtilityClass;
+import org.springframework.data.jpa.domain.Specification;
+
+
+@UtilityClass
+public class DoctorSpecifications {
+
+    public static Specification<DoctorEntity> empty() {
+        return (root, query, builder) -> builder.conjunction();
+    }
+
+    public static Specification<DoctorEntity> fullName(final String fullName) {
+        return (root, query, builder) -> builder.equal(root.get("fullName"), fullName);
+    }
+    public static Specification<DoctorEntity> fullNameStartsWith(final String fullNameStartsWith) {
+        return (root, query, builder) -> builder.like(root.<String>get("fullName"), escapeLike(fullNameStartsWith) + "%", '\\');
+    }
+
+    private static String escapeLike(final String value) {
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_");
+    }
+}
+
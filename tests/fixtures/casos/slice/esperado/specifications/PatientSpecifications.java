@@ -0,0 +1,45 @@
+package com.inycom.cws.specifications;
+
+import com.inycom.cws.models.entities.PatientEntity;
+import com.inycom.cws.models.entities.PatientStatus;
+import lombok.experimental.UtilityClass;
+import org.springframework.data.jpa.domain.Specification;
+
+import java.time.LocalDate;
+import java.util.List;
+
+
+@UtilityClass
+public class PatientSpecifications {
+
+    public static Specification<PatientEntity> empty() {
+        return (root, query, builder) -> builder.conjunction();
+    }
+
+    public static Specification<PatientEntity> name(final String name) {
+        return (root, query, builder) -> builder.equal(root.get("name"), name);
+    }
+    public static Specification<PatientEntity> nameStartsWith(final String nameStartsWith) {
+        return (root, query, builder) -> builder.like(root.<String>get("name"), escapeLike(nameStartsWith) + "%", '\\');
+    }
+    public static Specification<PatientEntity> birthDate(final LocalDate birthDate) {
+        return (root, query, builder) -> builder.equal(root.get("birthDate"), birthDate);
+    }
+    public static Specification<PatientEntity> birthDateFrom(final LocalDate birthDateFrom) {
+        return (root, query, builder) -> builder.greaterThanOrEqualTo(root.<LocalDate>get("birthDate"), birthDateFrom);
+    }
+    public static Specification<PatientEntity> birthDateTo(final LocalDate birthDateTo) {
+        return (root, query, builder) -> builder.lessThanOrEqualTo(root.<LocalDate>get("birthDate"), birthDateTo);
+    }
+    public static Specification<PatientEntity> status(final PatientStatus status) {
+        return (root, query, builder) -> builder.equal(root.get("status"), status);
+    }
+    public static Specification<PatientEntity> statusIn(final List<PatientStatus> statusIn) {
+        return (root, query, builder) -> root.get("status").in(statusIn);
+    }
+
+    private static String escapeLike(final String value) {
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_");
+    }
+}
+
@@ -0,0 +1,9 @@
+package com.inycom.cws.models.entities;
+
+import jakarta.persistence.Embeddable;
+
+@Embeddable
+public class AddressEmbeddable {
+    private String street;
+    private String city;
+}
@@ -0,0 +1,6 @@
+package com.inycom.cws.models.entities;
+
+public enum PatientStatus {
+    ACTIVE,
+    DISCHARGED
+}
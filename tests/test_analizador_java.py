@@ -0,0 +1,163 @@
+from analizador_java import parsear_java
+from extract_data import extraer_tabla, parsear_entidad
+
+
+def campos(codigo_java):
+    return {campo.nombre: campo for campo in parsear_java(codigo_java).campos}
+
+
+def test_inicializadores_con_comas_y_punto_y_coma():
+    resultado = campos("""
+        public class X {
+            private String texto = "a, b; c";
+            private String llamada = String.format("%s, %s", uno, dos);
+            private Runnable tarea = () -> { int z = 1; };
+            private char separador = ',';
+        }
+    """)
+    assert list(resultado) == ["texto", "llamada", "tarea", "separador"]
+    assert resultado["texto"].inicializador == '"a, b; c"'
+    assert resultado["llamada"].tipo == "String"
+    assert resultado["tarea"].tipo == "Runnable"
+    assert resultado["separador"].inicializador == "','"
+
+
+def test_genericos_anidados():
+    resultado = campos("""
+        public class X {
+            private Map<String, List<Map<Integer, Set<String>>>> mapa = new HashMap<>();
+            private Optional<List<? extends Number>> numeros;
+        }
+    """)
+    assert resultado["mapa"].tipo == "Map<String, List<Map<Integer, Set<String>>>>"
+    assert resultado["mapa"].inicializador == "new HashMap<>()"
+    assert resultado["numeros"].tipo == "Optional<List<? extends Number>>"
+
+
+def test_arrays_en_el_tipo_y_en_el_declarador():
+    resultado = campos("""
+        public class X {
+            private int[] numeros = {1, 2, 3};
+            private byte datos[];
+            private String[][] tabla;
+        }
+    """)
+    assert resultado["numeros"].tipo == "int[]"
+    assert resultado["numeros"].inicializador == "{1, 2, 3}"
+    assert resultado["datos"].tipo == "byte[]"
+    assert resultado["tabla"].tipo == "String[][]"
+
+
+def test_varios_declaradores_en_una_linea():
+    resultado = campos("""
+        public class X {
+            @Column(length = 10)
+            private String a = "x", b, c = f(1, 2);
+            private int[] d, e[];
+        }
+    """)
+    assert list(resultado) == ["a", "b", "c", "d", "e"]
+    assert [resultado[nombre].inicializador for nombre in "abc"] == ['"x"', None, "f(1, 2)"]
+    assert all(resultado[nombre].anotacion("Column") for nombre in "abc")
+    assert resultado["d"].tipo == "int[]"
+    assert resultado["e"].tipo == "int[][]"
+
+
+def test_metodos_y_tipos_anidados_no_aportan_campos():
+    clase = parsear_java("""
+        public class X {
+            private Long id;
+            public void metodo() { int local = 1; }
+            static class Interna { private int oculto; }
+        }
+        class Otra { private int nada; }
+    """)
+    assert [campo.nombre for campo in clase.campos] == ["id"]
+    assert clase.tipos_anidados == [("class", "Interna")]
+
+
+def test_table_con_index_anidados():
+    codigo_java = """
+        package com.inycom.cws.models.entities;
+
+        @Entity
+        @Table(name = "patients", indexes = {
+            @Index(name = "idx_name", columnList = "name, birth_date DESC"),
+            @Index(columnList = "status")
+        })
+        public class PatientEntity {
+            @Id
+            private Long id;
+        }
+    """
+    table = parsear_java(codigo_java).anotacion("Table")
+    assert table.argumentos["name"] == "patients"
+    assert [index.nombre for index in table.anidadas] == ["Index", "Index"]
+    assert table.anidadas[0].argumentos == {"name": "idx_name", "columnList": "name, birth_date DESC"}
+    assert extraer_tabla(codigo_java) == ("patients", [["name", "birth_date"], ["status"]])
+
+
+def test_parsear_entidad():
+    entidad = parsear_entidad("""
+        package com.inycom.cws.models.entities;
+
+        public class PatientEntity {
+            private static final int MAX_NAME = 100;
+
+            @Id
+            @GeneratedValue(strategy = GenerationType.IDENTITY)
+            private Long id;
+
+            @Column(name = "patient_name", length = MAX_NAME)
+            private String name;
+
+            @ManyToOne
+            private DoctorEntity doctor;
+        }
+    """)
+    assert entidad.nombre == "PatientEntity"
+    assert entidad.paquete == "com.inycom.cws.models.entities"
+    assert entidad.id_atributo == ("Long", "id")
+    assert entidad.constantes == {"MAX_NAME": 100}
+    assert entidad.atributos_pojo[0] == ("String", "name", "MAX_NAME")
+    assert entidad.columnas == {"name": "patient_name"}
+    assert entidad.relaciones == {"doctor": ("ManyToOne", "EAGER")}
+
+
+def test_non_sealed_es_un_modificador():
+    clase = parsear_java("""
+        public sealed class Base permits Hija {
+            non-sealed class Hija extends Base { private int oculto; }
+            private Long id;
+            private int diferencia = 5 - 3;
+        }
+    """)
+    assert [campo.nombre for campo in clase.campos] == ["id", "diferencia"]
+    assert clase.tipos_anidados == [("class", "Hija")]
+
+
+def test_enum_sin_punto_y_coma_termina_en_su_llave():
+    clase = parsear_java("""
+        enum Estado { ACTIVO, INACTIVO }
+
+        public class Real {
+            private Estado estado;
+        }
+    """)
+    assert clase.nombre == "Real"
+    assert [(campo.tipo, campo.nombre) for campo in clase.campos] == [("Estado", "estado")]
+
+
+def test_enum_con_argumentos_cuerpos_y_miembros():
+    clase = parsear_java("""
+        public enum Estado {
+            ACTIVO("a") { @Override public String toString() { return "x;"; } },
+            INACTIVO("i");
+
+            private final String codigo;
+
+            Estado(String codigo) { this.codigo = codigo; }
+        }
+    """)
+    assert clase.tipo == "enum"
+    assert [(campo.tipo, campo.nombre) for campo in clase.campos] == [("String", "codigo")]
@@ -0,0 +1,103 @@
+import os
+import shutil
+
+import pytest
+
+from batch import cargar_seleccion, procesar_lote, renderizar_entidad, seleccion_entidad
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+ENTIDADES = os.path.join(FIXTURES, "entidades")
+CASOS = os.path.join(FIXTURES, "casos")
+
+# Archivos de estado de la generación incremental, que dependen de rutas y fechas
+ARCHIVOS_ESTADO = {".generador-manifest.json", ".generador-indice.json"}
+
+
+def leer_arbol(directorio):
+    """
+    Retorna {ruta relativa: contenido} de los archivos generados en el directorio.
+    """
+    arbol = {}
+    for raiz, _, archivos in os.walk(directorio):
+        for archivo in archivos:
+            if archivo in ARCHIVOS_ESTADO:
+                continue
+            ruta = os.path.join(raiz, archivo)
+            with open(ruta, "r", encoding="utf-8") as f:
+                arbol[os.path.relpath(ruta, directorio).replace(os.sep, "/")] = f.read()
+    return arbol
+
+
+def escribir_arbol(directorio, arbol):
+    shutil.rmtree(directorio, ignore_errors=True)
+    for ruta, contenido in arbol.items():
+        os.makedirs(os.path.dirname(os.path.join(directorio, ruta)), exist_ok=True)
+        with open(os.path.join(directorio, ruta), "w", encoding="utf-8") as f:
+            f.write(contenido)
+
+
+def generar_caso(caso, salida_dir, jobs=1):
+    """
+    Genera las entidades de tests/fixtures/entidades con la selección del caso.
+    Retorna el árbol generado.
+    """
+    seleccion = cargar_seleccion(os.path.join(CASOS, caso, "seleccion.json"))
+    errores, _ = procesar_lote(ENTIDADES, seleccion, salida_dir, jobs)
+    assert errores == 0
+    return leer_arbol(salida_dir)
+
+
+@pytest.mark.parametrize("caso", sorted(os.listdir(CASOS)))
+def test_salida_coincide_con_la_esperada(tmp_path, caso):
+    """
+    Cada caso de tests/fixtures/casos tiene una selección y la salida esperada. Para regenerarla
+    tras un cambio intencionado en los generadores:
+        ACTUALIZAR_ESPERADO=1 python -m pytest tests/test_batch.py
+    """
+    generado = generar_caso(caso, str(tmp_path / "output"))
+    esperado_dir = os.path.join(CASOS, caso, "esperado")
+    if os.environ.get("ACTUALIZAR_ESPERADO"):
+        escribir_arbol(esperado_dir, generado)
+    esperado = leer_arbol(esperado_dir)
+    assert sorted(generado) == sorted(esperado)
+    for ruta, contenido in esperado.items():
+        assert generado[ruta] == contenido, ruta
+
+
+def test_avisos_se_devuelven_con_los_artefactos(capsys):
+    seleccion = cargar_seleccion(os.path.join(CASOS, "completo", "seleccion.json"))
+    config = seleccion_entidad(seleccion, "PatientEntity")
+    artefactos, avisos = renderizar_entidad(os.path.join(ENTIDADES, "PatientEntity.java"), config)
+    assert capsys.readouterr() == ("", "")
+    assert os.path.join("controllers", "BulkPatientController.java") in artefactos
+    assert avisos[:2] == [
+        "la proyección no admite paginación keyset. Se busca con la entidad completa.",
+        "usa GenerationType.IDENTITY; Hibernate no agrupará los INSERT de createAll.",
+    ]
+
+
+def test_keyset_no_ordena_por_columnas_que_admiten_nulos():
+    config = {"con": 41, "pojo": "*", "dto": "*", "search": [], "paginacion": "keyset", "orden_keyset": "name"}
+    artefactos, avisos = renderizar_entidad(os.path.join(ENTIDADES, "PatientEntity.java"), config)
+    assert "la columna de orden keyset 'name' admite nulos y el cursor no puede compararlos. Se ordena solo por el @Id." in avisos
+    assert 'Sort.by("id")' in artefactos[os.path.join("search", "PatientCursor.java")]
+
+
+def test_pool_de_procesos_genera_la_misma_salida(tmp_path):
+    secuencial = generar_caso("completo", str(tmp_path / "secuencial"))
+    assert generar_caso("completo", str(tmp_path / "paralelo"), jobs=2) == secuencial
+
+
+def test_regeneracion_incremental(tmp_path, capsys):
+    seleccion = cargar_seleccion(os.path.join(CASOS, "completo", "seleccion.json"))
+    salida_dir = str(tmp_path / "output")
+    procesar_lote(ENTIDADES, seleccion, salida_dir)
+    resumen = capsys.readouterr().err.splitlines()[-1]
+    archivos = len(leer_arbol(salida_dir))
+    assert f"2 entidades, {archivos} archivos ({archivos} modificados)" in resumen
+
+    procesar_lote(ENTIDADES, seleccion, salida_dir)
+    assert "Sin cambios: 2." in capsys.readouterr().err.splitlines()[-1]
+
+    procesar_lote(ENTIDADES, seleccion, salida_dir, forzar=True)
+    assert f"{archivos} archivos (0 modificados)" in capsys.readouterr().err.splitlines()[-1]
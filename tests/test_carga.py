@@ -0,0 +1,19 @@
+from gen.carga import IMPORTACION_UUID_JS, configurar_carga, generar_script_k6
+
+
+def test_script_solo_incluye_las_funciones_que_usa():
+    opciones = configurar_carga(True)
+    script = generar_script_k6("PatientEntity", ("Long", "id"), [("age", "entero(1, 1000)")], [], opciones)
+    assert IMPORTACION_UUID_JS not in script
+    for funcion in ("decimal", "texto", "fecha", "fechaHora"):
+        assert f"function {funcion}(" not in script
+    assert "function entero(" in script
+
+
+def test_script_importa_uuidv4_y_define_fecha_hora_si_los_usa():
+    opciones = configurar_carga(True)
+    campos = [("externalId", "uuidv4()"), ("createdAt", "fechaHora() + 'Z'")]
+    script = generar_script_k6("PatientEntity", ("Long", "id"), campos, [], opciones)
+    assert IMPORTACION_UUID_JS in script
+    assert "function fechaHora(" in script
+    assert "function fecha(" not in script
@@ -0,0 +1,41 @@
+from gen.indice import cargar_indice
+from gen.nombres import importaciones_tipos
+
+
+def escribir(directorio, ruta, codigo_java):
+    archivo = directorio / ruta
+    archivo.parent.mkdir(parents=True, exist_ok=True)
+    archivo.write_text(codigo_java, encoding="utf-8")
+
+
+def test_importaciones_de_los_tipos_del_proyecto(tmp_path):
+    escribir(tmp_path, "entities/OrderEntity.java", """
+        package com.acme.models.entities;
+
+        @Entity
+        public class OrderEntity {
+            private Long id;
+            private Status status;
+            private List<LineEntity> lines;
+            private OrderEntity.Kind kind;
+            private String note;
+
+            public enum Kind { A, B }
+        }
+    """)
+    escribir(tmp_path, "shared/Status.java", "package com.acme.shared;\n\npublic enum Status { NEW, DONE }\n")
+    escribir(tmp_path, "entities/LineEntity.java", "package com.acme.models.entities;\n\n@Entity\npublic class LineEntity { private Long id; }\n")
+    indice = cargar_indice(str(tmp_path))
+
+    assert indice.importacion_para("Status") == "import com.acme.shared.Status;"
+    assert indice.importacion_para("Kind") == "import com.acme.models.entities.OrderEntity.Kind;"
+    assert indice.importacion_para("String") is None
+    importaciones = indice.importaciones_entidad("OrderEntity")
+    assert importaciones == {
+        "Status": "import com.acme.shared.Status;",
+        "LineEntity": "import com.acme.models.entities.LineEntity;",
+        "OrderEntity": "import com.acme.models.entities.OrderEntity;",
+    }
+    assert importaciones_tipos(["List<Status>", "LocalDate"], importaciones) == {
+        "import com.acme.shared.Status;", "import java.util.List;", "import java.time.LocalDate;",
+    }
@@ -0,0 +1,140 @@
+# Comparativa de rendimiento entre la extracción anterior con expresiones regulares y el
+# analizador de analizador_java.py. Se ejecuta desde la raíz del repositorio:
+#     python -m tools.benchmark_parser
+# En archivos normales el analizador es unas 8 veces más lento que las expresiones regulares
+# (a cambio encuentra todos los atributos), pero es lineal y no sufre el retroceso exponencial
+# del patrón de @Id.
+import argparse
+import re
+import time
+
+from analizador_java import parsear_java
+from extract_data import parsear_entidad
+
+# Extracción anterior basada en expresiones regulares, conservada solo para comparar
+PATRON_CLASE = re.compile(r'public\s+class\s+(\w+)')
+PATRON_PAQUETE = re.compile(r'package\s+([\w\.]+);')
+PATRON_ATRIBUTO = re.compile(r'private\s+([\w<>]+)\s+(\w+);')
+PATRON_ATRIBUTO_ANOTADO = re.compile(r'((?:@\w+(?:\([^)]*\))?\s*)*)private\s+([\w<>]+)\s+(\w+);')
+PATRON_ANOTACION = re.compile(r'@(\w+)')
+PATRON_CONSTANTE = re.compile(r'private\s+static\s+final\s+int\s+(\w+)\s*=\s*(\d+);')
+PATRON_COLUMN_LENGTH = re.compile(r'@Column\(.*?length\s*=\s*(\w+)\)\s*private\s+([\w<>]+)\s+(\w+);')
+PATRON_EMBEDDED = re.compile(r'@Embedded\s+private\s+([\w<>]+)\s+(\w+);')
+PATRON_ID = re.compile(r'@Id(?:\s*\n\s*@.*?)*\s*private\s+([\w<>]+)\s+(\w+);', re.DOTALL)
+PATRON_NOMBRE = re.compile(r'\bname\s*=\s*"([^"]+)"')
+PATRON_COLUMN_NAME = re.compile(r'@(?:Join)?Column\s*\(([^)]*)\)')
+PATRON_RELACION = re.compile(r'@(ManyToOne|OneToOne|OneToMany|ManyToMany)\b\s*(?:\(([^)]*)\))?')
+
+TAMANOS = (50, 200, 1000, 5000)
+ANOTACIONES_PATOLOGICAS = (12, 14, 16, 18)
+
+
+def extraccion_regex(codigo_java):
+    """
+    Las mismas consultas que hacía parsear_entidad con las expresiones regulares anteriores.
+    Retorna el número de atributos encontrados.
+    """
+    PATRON_CLASE.search(codigo_java)
+    PATRON_PAQUETE.search(codigo_java)
+    atributos = PATRON_ATRIBUTO.findall(codigo_java)
+    PATRON_CONSTANTE.findall(codigo_java)
+    PATRON_COLUMN_LENGTH.findall(codigo_java)
+    PATRON_EMBEDDED.findall(codigo_java)
+    PATRON_ID.search(codigo_java)
+    for bloque, _, _ in PATRON_ATRIBUTO_ANOTADO.findall(codigo_java):
+        PATRON_ANOTACION.findall(bloque)
+        for contenido in PATRON_COLUMN_NAME.findall(bloque):
+            PATRON_NOMBRE.search(contenido)
+        PATRON_RELACION.search(bloque)
+    return len(atributos)
+
+def extraccion_parser(codigo_java):
+    """
+    parsear_entidad sin caché, para medir el análisis completo del archivo.
+    Retorna el número de atributos encontrados.
+    """
+    parsear_java.cache_clear()
+    return len(parsear_entidad(codigo_java).atributos)
+
+def generar_entidad_grande(campos):
+    """
+    Entidad sintética con el número de atributos indicado, mezclando las variantes que la
+    extracción anterior no reconocía (inicializadores, genéricos anidados, arrays, protected,
+    anotaciones en varias líneas y @Column con length antes de otros argumentos).
+    """
+    lineas = [
+        "package com.inycom.cws.models.entities;",
+        "",
+        "import jakarta.persistence.*;",
+        "import java.util.*;",
+        "",
+        "@Entity",
+        '@Table(name = "big", indexes = {@Index(name = "idx_big_f0", columnList = "f0")})',
+        "public class BigEntity {",
+        "    private static final int MAX = 100;",
+        "",
+        "    @Id",
+        "    @GeneratedValue(strategy = GenerationType.IDENTITY)",
+        "    private Long id;",
+    ]
+    variantes = (
+        '    @Column(name = "f{i}", length = MAX)\n    private String f{i};',
+        '    @Column(length = 50, nullable = false)\n    private String f{i};',
+        "    private Integer f{i} = 0;",
+        "    protected Map<String, List<Long>> f{i} = new HashMap<>();",
+        "    private byte[] f{i};",
+        '    @ManyToOne(fetch = FetchType.LAZY)\n    @JoinColumn(\n        name = "f{i}_id",\n        nullable = false\n    )\n    private OtherEntity f{i};',
+    )
+    for i in range(campos):
+        lineas.append(variantes[i % len(variantes)].format(i=i))
+        lineas.append("")
+    lineas.append("}")
+    return "\n".join(lineas)
+
+def generar_id_patologico(anotaciones):
+    """
+    @Id seguido de varias anotaciones en líneas separadas y de un atributo no privado: el patrón
+    DOTALL anterior prueba todas las particiones posibles antes de fallar.
+    """
+    intermedias = "".join(f"    @Anotacion{i}\n" for i in range(anotaciones))
+    return f"""package com.inycom.cws.models.entities;
+
+public class PathologicalEntity {{
+    @Id
+{intermedias}    protected Long id;
+}}
+"""
+
+def medir(funcion, codigo_java, repeticiones):
+    """
+    Retorna (milisegundos por llamada, atributos encontrados) con la mejor de las repeticiones.
+    """
+    mejor = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        encontrados = funcion(codigo_java)
+        transcurrido = time.perf_counter() - inicio
+        mejor = transcurrido if mejor is None else min(mejor, transcurrido)
+    return mejor * 1000, encontrados
+
+def comparar(etiqueta, codigo_java, repeticiones):
+    ms_regex, atributos_regex = medir(extraccion_regex, codigo_java, repeticiones)
+    ms_parser, atributos_parser = medir(extraccion_parser, codigo_java, repeticiones)
+    kb = len(codigo_java) / 1024
+    print(f"{etiqueta:<24} {kb:>8.1f} KB | regex {ms_regex:>9.2f} ms ({atributos_regex:>5} atributos)"
+          f" | parser {ms_parser:>9.2f} ms ({atributos_parser:>5} atributos, {kb / (ms_parser / 1000):>8.0f} KB/s)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara la extracción con expresiones regulares y el analizador Java.")
+    parser.add_argument("--repeticiones", type=int, default=3, help="Repeticiones por medida (por defecto: 3)")
+    args = parser.parse_args()
+
+    print("📊 Entidades grandes generadas")
+    for campos in TAMANOS:
+        comparar(f"{campos} atributos", generar_entidad_grande(campos), args.repeticiones)
+    print("📊 @Id con anotaciones intermedias (retroceso del patrón DOTALL)")
+    for anotaciones in ANOTACIONES_PATOLOGICAS:
+        comparar(f"{anotaciones} anotaciones", generar_id_patologico(anotaciones), args.repeticiones)
+
+if __name__ == "__main__":
+    main()